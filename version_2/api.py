@@ -0,0 +1,308 @@
+"""
+다른 서비스에서 분석을 요청하고 결과를 조회할 수 있는 HTTP API 서버입니다. (Tornado 비동기 서버)
+
+분석 요청은 앱과 같은 SQLite 작업 큐에 등록되어 워커가 처리하고, 결과는 같은 검색 기록 CSV에서 조회합니다.
+저장소/작업 큐 조회는 크기가 제한된 스레드 풀에서 실행하여 이벤트 루프를 막지 않고, 결과/기록 응답은
+검색 기록 파일이 바뀔 때까지 재사용합니다.
+처리 중인 요청이 API_MAX_PENDING을 넘으면 503, 대기 작업이 API_MAX_QUEUED_JOBS를 넘으면 429로 거절합니다.
+같은 키워드/소스의 분석이 RESULT_REUSE_MINUTES 안에 저장되어 있으면 작업을 등록하지 않고 200으로 그 결과 경로를
+반환합니다. ("force": true이면 저장된 결과와 캐시된 API 응답을 쓰지 않고 항상 새로 분석)
+분석 마감 시간 안에 끝나지 않은 단계는 결과의 "pending"(예: ["insights"])에 표시되며, 워커가 채우면 같은 경로의
+결과가 갱신되고 ETag도 바뀝니다.
+
+엔드포인트:
+    POST /api/analyses              {"keyword": "생성형 AI", "sources": ["news", "insights"], "num_results": 5, "force": false}
+    GET  /api/jobs/<job_id>         작업 상태 (완료 시 결과 경로 포함)
+    GET  /api/results/<search_key>  저장된 분석 결과 (ETag / If-None-Match 지원)
+    GET  /api/history?offset=0&limit=20
+    GET  /healthz
+
+실행 (version_2 디렉터리에서):
+    python api.py --port 8502 --workers 2
+"""
+import argparse
+import json
+import logging
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Tuple
+from urllib.parse import quote
+import tornado.ioloop
+import tornado.web
+from config.settings import Settings
+from domain.analysis_job import AnalysisJob, JOB_DONE, JOB_QUEUED
+from repositories.job_repository import JobRepository
+from repositories.search_repository import SearchRepository
+from repositories.rollup_repository import RollupRepository
+from services.analysis_pipeline import SOURCE_ALIASES, estimate_api_calls, find_reusable_result
+from services.job_queue import JobWorkerPool
+from utils.input_handler import preprocess_keyword
+from utils.metrics import registry, start_metrics_server
+from utils.shared_cache import get_history_cache
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 검색 폼 슬라이더와 같은 기사 수 범위
+MAX_NUM_RESULTS = Settings.MAX_NUM_RESULTS
+MAX_PAGE_SIZE = 100
+# 검색 기록 파일 버전별로 보관할 조회 응답 수
+RESPONSE_CACHE_SIZE = 1024
+
+
+class ApiContext:
+    """핸들러가 공유하는 저장소, 블로킹 조회용 스레드 풀과 처리 중인 요청 수"""
+
+    def __init__(self, search_repository: SearchRepository, job_repository: JobRepository,
+                 pool: Optional[JobWorkerPool] = None):
+        self.search_repository = search_repository
+        self.job_repository = job_repository
+        self.pool = pool
+        self.executor = ThreadPoolExecutor(max_workers=Settings.API_MAX_WORKERS, thread_name_prefix="api")
+        # 이벤트 루프 스레드에서만 변경하므로 잠금이 필요 없음
+        self.pending = 0
+        # (경로, 인자) -> (검색 기록 파일 버전, 직렬화된 응답 본문)
+        self.responses: "OrderedDict[Tuple, Tuple[Tuple[int, int], str]]" = OrderedDict()
+
+
+class BaseHandler(tornado.web.RequestHandler):
+    """JSON 응답, 동시 처리 수 제한, 요청 지표 기록을 담당하는 공통 핸들러"""
+
+    def initialize(self, context: ApiContext):
+        self.context = context
+        self._admitted = False
+        self._started = time.perf_counter()
+
+    def prepare(self):
+        if self.context.pending >= Settings.API_MAX_PENDING:
+            self.set_header("Retry-After", "1")
+            self.send_json(503, {"error": "server_busy"})
+            return
+        self.context.pending += 1
+        self._admitted = True
+
+    def on_finish(self):
+        if self._admitted:
+            self.context.pending -= 1
+        labels = {"route": type(self).__name__, "status": str(self.get_status())}
+        registry.observe(
+            "trendtracker_api_request_seconds", time.perf_counter() - self._started, labels,
+            help_text="HTTP API request latency in seconds, by handler and status"
+        )
+
+    async def blocking(self, fn, *args):
+        """저장소 조회처럼 블로킹되는 호출을 제한된 스레드 풀에서 실행합니다."""
+        return await tornado.ioloop.IOLoop.current().run_in_executor(self.context.executor, fn, *args)
+
+    def send_json(self, status: int, data: dict):
+        self.send_body(status, json.dumps(data, ensure_ascii=False))
+
+    def send_body(self, status: int, body: str):
+        self.set_status(status)
+        self.set_header("Content-Type", "application/json; charset=utf-8")
+        self.finish(body)
+
+    async def cached_json(self, cache_key: Tuple, build: Callable[[], Optional[dict]]) -> Optional[str]:
+        """
+        검색 기록에서 만든 응답 본문을 파일 버전과 함께 보관하여, 파일이 바뀌지 않았으면 다시 조회하지 않습니다.
+        build()는 스레드 풀에서 실행되며 None을 반환하면(결과 없음) 보관하지 않습니다.
+        """
+        responses = self.context.responses
+        # 파일 버전 확인(os.stat)도 디스크 I/O이므로 이벤트 루프를 막지 않도록 스레드 풀에서 실행
+        version = await self.blocking(self.context.search_repository.version)
+        entry = responses.get(cache_key)
+        if entry is not None and entry[0] == version:
+            responses.move_to_end(cache_key)
+            return entry[1]
+
+        data = await self.blocking(build)
+        if data is None:
+            return None
+        body = json.dumps(data, ensure_ascii=False)
+        responses[cache_key] = (version, body)
+        if len(responses) > RESPONSE_CACHE_SIZE:
+            responses.popitem(last=False)
+        return body
+
+    def write_error(self, status_code: int, **kwargs):
+        self.send_json(status_code, {"error": self._reason})
+
+
+def job_to_dict(job: AnalysisJob) -> dict:
+    data = {
+        "job_id": job.job_id,
+        "keyword": job.keyword,
+        "status": job.status,
+        "progress": job.progress,
+        "stages": job.stages,
+        "error_type": job.error_type,
+        "created_at": job.created_at.isoformat(timespec="seconds") if job.created_at else None,
+        "finished_at": job.finished_at.isoformat(timespec="seconds") if job.finished_at else None,
+    }
+    if job.status == JOB_DONE and job.search_key:
+        data["search_key"] = job.search_key
+        data["result"] = f"/api/results/{quote(job.search_key)}"
+    return data
+
+
+class AnalysesHandler(BaseHandler):
+    async def post(self):
+        try:
+            body = json.loads(self.request.body or b"{}")
+        except json.JSONDecodeError:
+            return self.send_json(400, {"error": "invalid_json"})
+        if not isinstance(body, dict):
+            return self.send_json(400, {"error": "invalid_json"})
+
+        keyword = preprocess_keyword(str(body.get("keyword") or ""))
+        if not keyword:
+            return self.send_json(400, {"error": "empty_input"})
+        names = body.get("sources") or ["news", "insights"]
+        if not isinstance(names, list) or any(name not in SOURCE_ALIASES for name in names):
+            return self.send_json(400, {"error": "invalid_sources", "allowed": list(SOURCE_ALIASES)})
+        num_results = body.get("num_results", 5)
+        # JSON true/false는 파이썬에서 int의 하위 타입이므로 따로 거절
+        if isinstance(num_results, bool) or not isinstance(num_results, int) or not 1 <= num_results <= MAX_NUM_RESULTS:
+            return self.send_json(400, {"error": "invalid_num_results", "max": MAX_NUM_RESULTS})
+        force = body.get("force", False)
+        if not isinstance(force, bool):
+            return self.send_json(400, {"error": "invalid_force"})
+
+        sources = [SOURCE_ALIASES[name] for name in names]
+        if not force:
+            found = await self.blocking(
+                find_reusable_result, self.context.search_repository, keyword, sources, num_results
+            )
+            if found:
+                search_key, search_time = found
+                return self.send_json(200, {
+                    "reused": True,
+                    "search_key": search_key,
+                    "search_time": search_time.isoformat(),
+                    "api_calls_avoided": estimate_api_calls(sources, num_results),
+                    "result_url": f"/api/results/{quote(search_key)}",
+                })
+
+        counts = await self.blocking(self.context.job_repository.count_by_status)
+        if counts[JOB_QUEUED] >= Settings.API_MAX_QUEUED_JOBS:
+            self.set_header("Retry-After", "5")
+            return self.send_json(429, {"error": "queue_full"})
+
+        job = await self.blocking(self.context.job_repository.enqueue, keyword, sources, num_results, force)
+        if self.context.pool is not None:
+            self.context.pool.notify()
+        self.set_header("Location", f"/api/jobs/{job.job_id}")
+        self.send_json(202, job_to_dict(job))
+
+
+class JobHandler(BaseHandler):
+    async def get(self, job_id: str):
+        job = await self.blocking(self.context.job_repository.get, job_id)
+        if job is None:
+            return self.send_json(404, {"error": "job_not_found"})
+        self.send_json(200, job_to_dict(job))
+
+
+class ResultHandler(BaseHandler):
+    async def get(self, search_key: str):
+        def build():
+            result = self.context.search_repository.find_by_key(search_key)
+            return result.to_dict() if result else None
+
+        body = await self.cached_json(("result", search_key), build)
+        if body is None:
+            return self.send_json(404, {"error": "result_not_found"})
+        # 응답 본문의 해시로 ETag를 붙이며, If-None-Match가 같으면 finish()에서 304로 응답
+        self.send_body(200, body)
+
+
+class HistoryHandler(BaseHandler):
+    async def get(self):
+        try:
+            offset = int(self.get_argument("offset", "0"))
+            limit = int(self.get_argument("limit", "20"))
+        except ValueError:
+            return self.send_json(400, {"error": "invalid_page"})
+        if offset < 0 or not 1 <= limit <= MAX_PAGE_SIZE:
+            return self.send_json(400, {"error": "invalid_page", "max_limit": MAX_PAGE_SIZE})
+
+        def build():
+            total, items = self.context.search_repository.get_history_page(offset, limit)
+            for item in items:
+                item["result"] = f"/api/results/{quote(item['search_key'])}"
+            data = {"total": total, "offset": offset, "limit": limit, "items": items}
+            if offset + limit < total:
+                data["next"] = f"/api/history?offset={offset + limit}&limit={limit}"
+            return data
+
+        self.send_body(200, await self.cached_json(("history", offset, limit), build))
+
+
+class HealthHandler(BaseHandler):
+    def get(self):
+        self.send_json(200, {"status": "ok", "pending": self.context.pending})
+
+
+class NotFoundHandler(BaseHandler):
+    def prepare(self):
+        self.send_json(404, {"error": "not_found"})
+
+
+def make_app(context: ApiContext) -> tornado.web.Application:
+    """HTTP API 라우팅을 구성합니다."""
+    args = {"context": context}
+    return tornado.web.Application(
+        [
+            (r"/api/analyses", AnalysesHandler, args),
+            (r"/api/jobs/([0-9a-f]+)", JobHandler, args),
+            (r"/api/results/(.+)", ResultHandler, args),
+            (r"/api/history", HistoryHandler, args),
+            (r"/healthz", HealthHandler, args),
+        ],
+        default_handler_class=NotFoundHandler,
+        default_handler_args=args
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TrendTracker HTTP API 서버")
+    parser.add_argument("--port", type=int, default=Settings.API_PORT, help="API 포트")
+    parser.add_argument(
+        "--workers", type=int, default=Settings.JOB_WORKERS,
+        help="이 프로세스에서 실행할 분석 워커 수 (0이면 worker.py가 처리)"
+    )
+    parser.add_argument("--metrics-port", type=int, default=0, help="Prometheus 지표 포트 (0이면 비활성화)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    try:
+        Settings.validate()
+    except ValueError as e:
+        raise SystemExit(str(e))
+
+    if args.metrics_port:
+        start_metrics_server(args.metrics_port)
+
+    search_repository = SearchRepository(
+        Settings.CSV_PATH, RollupRepository(Settings.ROLLUP_DB_PATH), Settings.HISTORY_COMPRESSION, get_history_cache()
+    )
+    job_repository = JobRepository(Settings.JOB_DB_PATH)
+    pool = None
+    if args.workers > 0:
+        pool = JobWorkerPool(job_repository, search_repository, args.workers, Settings.JOB_POLL_SECONDS, name="api")
+        pool.start()
+
+    app = make_app(ApiContext(search_repository, job_repository, pool))
+    app.listen(args.port)
+    logger.info(f"HTTP API 서버 시작: http://localhost:{args.port}")
+    try:
+        tornado.ioloop.IOLoop.current().start()
+    except KeyboardInterrupt:
+        logger.info("종료 요청을 받았습니다. 실행 중인 작업을 마무리합니다...")
+        if pool is not None:
+            pool.stop()
+
+
+if __name__ == "__main__":
+    main()
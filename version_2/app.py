@@ -1,22 +1,36 @@
 import streamlit as st
-from datetime import datetime
+from datetime import datetime, timedelta
 from config.settings import Settings
-from domain.search_result import SearchResult
-from repositories.search_repository import SearchRepository
 from components.search_form import render_search_form
 from components.sidebar import (
     render_sidebar_header, render_settings, render_info, 
     render_history_list, render_download_button
 )
-from components.result_section import render_summary, render_news_list
-from components.loading import show_loading
-from services.search_service import search_news, get_google_trends_url
-from services.ai_service import summarize_news, get_ai_insights
-from components.result_section import render_summary, render_news_list, render_ai_insights, render_trends_link
-from utils.key_generator import generate_search_key
+from components.loading import render_stage_breakdown
+from components.watchlist import render_watchlist_form, render_watchlist_items
+from components.dashboard import GRANULARITY_OPTIONS, render_dashboard_controls, render_keyword_charts
+from services.client_pool import warm_up_in_background
+from services.job_queue import update_queue_gauges
+from services.analysis_pipeline import SOURCE_NEWS, estimate_api_calls, find_reusable_result, find_stale_result
+from domain.analysis_job import JOB_QUEUED, JOB_FAILED
+from domain.search_result import STAGE_NEWS, STAGE_SUMMARY, STAGE_INSIGHTS
+from components.result_section import (
+    render_summary, render_summary_lineage, render_news_list, render_ai_insights, render_trends_link,
+    render_article_volume, render_result_tabs, render_reuse_notice, render_stale_notice, render_refreshed_notice,
+    render_pending_notice, render_pending_section
+)
 from utils.exceptions import AppError
 from utils.ui_helper import apply_custom_css
+from repositories.search_repository import SearchRepository
+from repositories.job_repository import JobRepository
+from repositories.watchlist_repository import WatchlistRepository
+from repositories.rollup_repository import parse_bucket, recent_buckets
+from utils.cache import (
+    get_repository, get_job_repository, start_job_workers, get_watchlist_repository,
+    start_watchlist_scheduler, load_search_keys, load_search_result, load_lineage, load_article_volume
+)
 from utils.error_handler import handle_error
+from utils.metrics import registry, span, start_metrics_server
 
 def init_session_state():
     """애플리케이션 명시적 상태 관리를 위한 session_state 초기화"""
@@ -26,6 +40,225 @@ def init_session_state():
         st.session_state.selected_key = None
     if "last_result" not in st.session_state:
         st.session_state.last_result = None
+    if "active_job_id" not in st.session_state:
+        # 새로고침 후에도 진행 중인 작업을 이어서 표시하도록 URL에서 복원
+        st.session_state.active_job_id = st.query_params.get("job")
+
+@st.fragment
+def settings_panel():
+    """
+    검색 건수 슬라이더 영역입니다.
+    슬라이더를 움직이면 이 fragment만 다시 실행되며, 값은 session_state["num_results"]로 전달됩니다.
+    """
+    render_settings()
+
+@st.fragment
+def history_panel(repository: SearchRepository):
+    """
+    사이드바의 검색 기록 목록과 CSV 다운로드 영역입니다.
+    이 영역의 조작(다운로드 등)은 검색 폼과 결과 영역을 다시 실행하지 않습니다.
+    """
+    # 검색 기록 목록 조회 (저장이 없으면 캐시된 목록 재사용)
+    with span("history_load"):
+        search_keys = load_search_keys(repository, Settings.CSV_PATH, repository.version())
+    history_key = render_history_list(search_keys, {})
+
+    # CSV 다운로드 (버튼 클릭 시에만 내보내기 생성)
+    render_download_button(repository.get_all_as_csv, len(search_keys) == 0)
+
+    # 모드 전환 감지 (기록 선택 시 결과 영역이 바뀌므로 앱 전체를 다시 실행)
+    if history_key and history_key != st.session_state.selected_key:
+        st.session_state.current_mode = "history"
+        st.session_state.selected_key = history_key
+        st.session_state.last_result = None 
+        st.session_state.pop("reused", None)
+        st.session_state.pop("refreshed", None)
+        st.rerun(scope="app")
+
+@st.fragment
+def watchlist_panel(watch_repository: WatchlistRepository):
+    """
+    사이드바의 워치리스트 영역입니다. 등록된 키워드는 백그라운드 스케줄러가 주기마다
+    새 기사만 수집하여 검색 기록에 저장하며, 새 기사가 없으면 AI 호출을 건너뜁니다.
+    """
+    with st.expander("👀 워치리스트"):
+        added = render_watchlist_form()
+        if added:
+            keyword, interval = added
+            watch_repository.add(keyword, interval, [SOURCE_NEWS], st.session_state.num_results)
+
+        render_watchlist_items(watch_repository.list_all(), on_remove=watch_repository.remove)
+
+@st.fragment
+def result_panel(repository: SearchRepository):
+    """
+    검색 결과(탭) 영역입니다.
+    결과 영역 안의 조작은 사이드바 기록 조회와 검색 폼을 다시 실행하지 않습니다.
+    """
+    if st.session_state.current_mode == "history":
+        with span("history_load"):
+            res = load_search_result(
+                repository, Settings.CSV_PATH, st.session_state.selected_key, repository.version()
+            )
+    else:
+        res = st.session_state.last_result
+        
+    if not res:
+        st.error("해당 기록을 불러올 수 없습니다.")
+        return
+
+    with span("render"):
+        st.divider()
+        st.markdown(f"## 🏷️ 검색 키워드: **{res.keyword}**")
+
+        # 최근 분석 결과를 재사용한 경우 분석 시각 배지와 새로 분석 버튼 표시
+        reused = st.session_state.get("reused")
+        if reused and reused["search_key"] == res.search_key:
+            if render_reuse_notice(reused["analyzed_at"], reused["calls"]):
+                st.session_state.refresh_request = reused["request"]
+                st.session_state.pop("reused")
+                st.rerun(scope="app")
+
+        # 분석하는 동안 이전 결과를 보여주는 중이면 배지 표시, 새 결과로 교체되었으면 새 기사 수 표시
+        stale = st.session_state.get("stale")
+        new_urls = frozenset()
+        if stale and stale["search_key"] == res.search_key and stale["job_id"] == st.session_state.active_job_id:
+            render_stale_notice(stale["analyzed_at"])
+        refreshed = st.session_state.get("refreshed")
+        if refreshed and refreshed["search_key"] == res.search_key:
+            previous = load_search_result(
+                repository, Settings.CSV_PATH, refreshed["previous_key"], repository.version()
+            )
+            if previous:
+                new_urls = frozenset(article.url for article in res.articles) - {
+                    article.url for article in previous.articles
+                }
+            render_refreshed_notice(refreshed["previous_at"], len(new_urls))
+
+        # 마감 시간 안에 끝나지 않은 단계가 있으면 표시하고, 채우는 동안 저장소 변경을 주기적으로 확인
+        if res.pending:
+            filling = datetime.now() - res.search_time <= timedelta(seconds=Settings.PENDING_FILL_DEADLINE_SECONDS)
+            render_pending_notice(res.pending, filling)
+            if filling:
+                pending_panel(repository, repository.version())
+        
+        # 탭을 사용하여 결과 분리 표시 (선택한 탭만 렌더링하므로 과거 기록의 기사/AI 텍스트도 이때 처음 읽음)
+        tab = render_result_tabs()
+        
+        if tab == "report":
+            if STAGE_SUMMARY in res.pending or STAGE_NEWS in res.pending:
+                render_pending_section(STAGE_SUMMARY)
+            else:
+                render_summary(res.keyword, res.ai_summary)
+            if res.parent_key:
+                render_summary_lineage(
+                    load_lineage(repository, Settings.CSV_PATH, res.search_key, repository.version())
+                )
+            render_article_volume(
+                res.keyword,
+                load_article_volume(repository, Settings.CSV_PATH, res.keyword, repository.version())
+            )
+            if res.trends_url:
+                render_trends_link(res.keyword, res.trends_url)
+        
+        elif tab == "news":
+            if STAGE_NEWS in res.pending:
+                render_pending_section(STAGE_NEWS)
+            else:
+                render_news_list(res.articles, res.search_key, new_urls)
+        
+        elif STAGE_INSIGHTS in res.pending:
+            render_pending_section(STAGE_INSIGHTS)
+        else:
+            render_ai_insights(res.keyword, res.ai_insights)
+
+@st.fragment(run_every=Settings.JOB_POLL_SECONDS)
+def pending_panel(repository: SearchRepository, version):
+    """
+    대기 중인 단계를 채우는 동안 검색 기록 파일이 바뀌었는지 주기적으로 확인합니다.
+    바뀌면(채운 결과로 교체되면) 결과 영역을 다시 그리도록 앱 전체를 다시 실행합니다.
+    """
+    if repository.version() != version:
+        st.rerun(scope="app")
+
+@st.fragment
+def dashboard_panel(repository: SearchRepository):
+    """
+    키워드별 검색 횟수 대시보드입니다. 저장 시 갱신되는 시간/일/주 단위 집계만 읽으므로
+    전체 검색 기록의 크기와 관계없이 빠르게 표시됩니다.
+    """
+    rollups = repository.rollups
+    st.divider()
+    st.markdown("## 📊 키워드 검색 통계")
+    granularity, top_n = render_dashboard_controls()
+
+    with span("dashboard_load"):
+        latest = rollups.latest_bucket(granularity)
+        if latest is None:
+            st.info("아직 집계된 검색 기록이 없습니다.")
+            # 집계 도입 전에 쌓인 기록이 있으면 한 번 다시 계산
+            if repository.version() != (0, 0):
+                st.button("🔄 기존 검색 기록으로 집계 만들기", on_click=repository.rebuild_rollups)
+            return
+        # 가장 최근 기록이 있는 구간까지 표시
+        buckets = recent_buckets(granularity, GRANULARITY_OPTIONS[granularity][1], parse_bucket(latest))
+        top = rollups.top_keywords(granularity, buckets[0], top_n)
+        rows = rollups.series(granularity, buckets[0], [keyword for keyword, _ in top])
+        totals = rollups.totals(granularity, buckets[0])
+
+    with span("render"):
+        render_keyword_charts(buckets, rows, top, totals)
+
+@st.fragment(run_every=Settings.JOB_POLL_SECONDS)
+def job_panel(job_repository: JobRepository):
+    """
+    진행 중인 분석 작업의 상태를 주기적으로 조회하여 완료된 단계를 표시합니다.
+    작업이 끝나면 결과(또는 에러)를 표시하도록 앱 전체를 다시 실행합니다.
+    """
+    job = job_repository.get(st.session_state.active_job_id)
+    if job is None:
+        finish_job()
+        st.rerun(scope="app")
+
+    stale = st.session_state.get("stale")
+    if stale and stale["job_id"] != job.job_id:
+        stale = None
+
+    if job.is_finished:
+        finish_job()
+        st.session_state.pop("stale", None)
+        if stale and job.status != JOB_FAILED:
+            # 보여주던 이전 결과를 새 결과로 교체하고 새 기사를 표시
+            st.session_state.refreshed = {
+                "search_key": job.search_key, "previous_key": stale["search_key"], "previous_at": stale["analyzed_at"]
+            }
+        if job.status == JOB_FAILED:
+            st.session_state.job_error = job.error_type
+        else:
+            st.session_state.current_mode = "history"
+            st.session_state.selected_key = job.search_key
+            st.session_state.job_notice = f"'{job.keyword}' 트렌드 분석이 완료되었습니다!"
+        st.rerun(scope="app")
+
+    update_queue_gauges(job_repository)
+    if job.status == JOB_QUEUED:
+        waiting = job_repository.count_by_status()[JOB_QUEUED]
+        label = f"⏳ 분석 대기 중... (대기 작업 {waiting}건)"
+    else:
+        label = "🚀 통합 트렌드 분석 중..."
+    if stale:
+        label += " (아래는 이전 분석 결과입니다)"
+    with st.status(label, expanded=not stale, state="running") as status:
+        if job.progress:
+            status.write(job.progress)
+        if job.stages:
+            render_stage_breakdown(status, job.stages)
+
+def finish_job():
+    """진행 중인 작업 표시를 종료합니다."""
+    st.session_state.active_job_id = None
+    if "job" in st.query_params:
+        del st.query_params["job"]
 
 def main():
     """
@@ -47,123 +280,103 @@ def main():
         st.error(str(e))
         st.stop()
 
+    # 클라이언트 워밍업 (최초 실행 시 한 번만 백그라운드에서 수행)
+    if Settings.WARMUP_ON_START:
+        warm_up_in_background()
+
     # 3. 초기화
     init_session_state()
-    repository = SearchRepository(Settings.CSV_PATH)
+    repository = get_repository(Settings.CSV_PATH)
+    job_repository = get_job_repository(Settings.JOB_DB_PATH)
+    pool = None
+    if Settings.JOB_WORKERS > 0:
+        pool = start_job_workers(
+            job_repository, repository, Settings.JOB_DB_PATH, Settings.CSV_PATH, Settings.JOB_WORKERS
+        )
+    watch_repository = get_watchlist_repository(Settings.WATCHLIST_DB_PATH)
+    if Settings.WATCHLIST_SCHEDULER:
+        start_watchlist_scheduler(watch_repository, repository, Settings.WATCHLIST_DB_PATH, Settings.CSV_PATH)
+    if Settings.METRICS_PORT:
+        start_metrics_server(Settings.METRICS_PORT)
 
-    # 4. 사이드바 영역
+    # 4. 사이드바 영역 (설정/기록 영역은 각각 독립적으로 다시 실행되는 fragment)
     with st.sidebar:
         render_sidebar_header()
-        num_results = render_settings()
+        settings_panel()
         render_info()
         st.divider()
-        
-        # 검색 기록 목록 조회
-        search_keys = repository.get_all_keys()
-        history_key = render_history_list(search_keys, {})
-        
-        # 모드 전환 감지 (기록 선택 시)
-        if history_key and history_key != st.session_state.selected_key:
-            st.session_state.current_mode = "history"
-            st.session_state.selected_key = history_key
-            st.session_state.last_result = None 
-            st.rerun()
-
-        # CSV 다운로드
-        csv_data = repository.get_all_as_csv()
-        render_download_button(csv_data, len(search_keys) == 0)
+        history_panel(repository)
+        watchlist_panel(watch_repository)
+        if st.button("📊 키워드 검색 통계", use_container_width=True):
+            st.session_state.current_mode = "dashboard"
 
     # 5. 메인 영역
     
     # 5.1 검색 폼
     keyword, selected_sources = render_search_form()
 
-    # 5.2 검색 버튼 클릭 처리
+    # 5.2 검색 버튼 클릭 처리 (분석은 작업 큐에 등록되어 백그라운드 워커가 수행)
+    request = None
+    force = False
     if keyword:
-        try:
-            st.session_state.current_mode = "new_search"
-            st.session_state.selected_key = None 
-            
-            articles = []
-            summary = ""
-            insights = ""
-            trends_url = ""
-
-            with st.status("🚀 통합 트렌드 분석 중...", expanded=True) as status:
-                # 1. 뉴스 검색 및 요약
-                if "최신 뉴스 (Tavily)" in selected_sources:
-                    status.write(f"🔍 '{keyword}' 관련 뉴스 검색 중...")
-                    articles = search_news(keyword, num_results)
-                    if articles:
-                        status.write("🤖 AI 뉴스 요약 생성 중...")
-                        summary = summarize_news(articles)
-                
-                # 2. Gemini 인사이트
-                if "AI 심층 분석 (Gemini)" in selected_sources:
-                    status.write("🧠 Gemini AI 심층 트렌드 분석 중...")
-                    insights = get_ai_insights(keyword)
-                
-                # 3. Google Trends
-                if "트렌드 지표 (Google Trends)" in selected_sources:
-                    status.write(f"📈 Google Trends '{keyword}' 데이터 분석 중...")
-                    trends_url = get_google_trends_url(keyword)
-                
-                status.update(label="✅ 분석 완료!", state="complete", expanded=False)
-
-            # 결과 객체 생성 및 저장
-            search_time = datetime.now()
-            search_key = generate_search_key(keyword)
-            
-            result = SearchResult(
-                search_key=search_key,
-                search_time=search_time,
-                keyword=keyword,
-                articles=articles,
-                ai_summary=summary,
-                ai_insights=insights,
-                trends_url=trends_url
-            )
-            
-            # 데이터베이스(CSV) 저장
-            repository.save(result)
-            st.session_state.last_result = result
-                
-            st.success(f"'{keyword}' 트렌드 분석이 완료되었습니다!")
-                
-        except AppError as e:
-            handle_error(e.error_type)
-        except Exception as e:
-            st.error(f"예기치 못한 에러가 발생했습니다: {e}")
-
-    # 5.3 결과 표시 영역
-    if (st.session_state.current_mode == "new_search" and st.session_state.last_result) or \
-       (st.session_state.current_mode == "history" and st.session_state.selected_key):
-        
-        if st.session_state.current_mode == "history":
-            res = repository.find_by_key(st.session_state.selected_key)
-        else:
-            res = st.session_state.last_result
-            
-        if res:
-            st.divider()
-            st.markdown(f"## 🏷️ 검색 키워드: **{res.keyword}**")
-            
-            # 탭을 사용하여 결과 분리 표시
-            tab1, tab2, tab3 = st.tabs(["📊 통합 리포트", "📰 관련 뉴스", "🧠 AI 인사이트"])
-            
-            with tab1:
-                render_summary(res.keyword, res.ai_summary)
-                if res.trends_url:
-                    render_trends_link(res.keyword, res.trends_url)
-            
-            with tab2:
-                render_news_list(res.articles)
-            
-            with tab3:
-                render_ai_insights(res.keyword, res.ai_insights)
+        request = (keyword, selected_sources, st.session_state.num_results)
+        st.session_state.pop("reused", None)
+        st.session_state.pop("refreshed", None)
+        # 같은 분석을 최근에 저장했다면 API를 호출하지 않고 저장된 결과를 표시
+        found = find_reusable_result(repository, *request)
+        if found:
+            st.session_state.reused = {
+                "search_key": found[0], "analyzed_at": found[1], "request": request,
+                "calls": estimate_api_calls(selected_sources, st.session_state.num_results)
+            }
+            st.session_state.current_mode = "history"
+            st.session_state.selected_key = found[0]
+            st.session_state.last_result = None
+            request = None
+    elif st.session_state.get("refresh_request"):
+        # 재사용한 결과에서 '새로 분석'을 누르면 저장된 결과와 캐시된 API 응답과 관계없이 분석
+        request = st.session_state.pop("refresh_request")
+        force = True
+        registry.inc("trendtracker_result_reuse_total", {"outcome": "refresh"})
+
+    if request:
+        job = job_repository.enqueue(*request, force=force)
+        if pool is not None:
+            pool.notify()
+        st.session_state.active_job_id = job.job_id
+        st.query_params["job"] = job.job_id
+        st.session_state.current_mode = "new_search"
+        st.session_state.selected_key = None 
+        st.session_state.last_result = None
+        st.session_state.pop("refreshed", None)
+        # 분석하는 동안 같은 키워드/분석 소스로 가장 최근에 저장된 결과를 먼저 표시
+        stale = find_stale_result(repository, request[0], request[1])
+        if stale:
+            st.session_state.stale = {"job_id": job.job_id, "search_key": stale[0], "analyzed_at": stale[1]}
+            st.session_state.current_mode = "history"
+            st.session_state.selected_key = stale[0]
         else:
-            st.error("해당 기록을 불러올 수 없습니다.")
-    
+            st.session_state.pop("stale", None)
+
+    if st.session_state.get("job_error"):
+        handle_error(st.session_state.pop("job_error"))
+    if st.session_state.get("job_notice"):
+        st.success(st.session_state.pop("job_notice"))
+
+    # 5.3 진행 중인 작업 / 결과 표시 영역
+    if st.session_state.active_job_id:
+        job_panel(job_repository)
+        stale = st.session_state.get("stale")
+        if stale and stale["job_id"] == st.session_state.active_job_id:
+            result_panel(repository)
+
+    elif st.session_state.current_mode == "dashboard":
+        dashboard_panel(repository)
+
+    elif (st.session_state.current_mode == "new_search" and st.session_state.last_result) or \
+       (st.session_state.current_mode == "history" and st.session_state.selected_key):
+        result_panel(repository)
+
     elif st.session_state.current_mode == "new_search" and not st.session_state.last_result:
         # Boutique Style Landing Page
         st.markdown(f"""
@@ -177,4 +390,11 @@ def main():
         st.info("💡 위 입력창에 키워드를 입력하고 분석할 소스를 선택한 뒤 '통합 트렌드 검색'을 누르세요.")
 
 if __name__ == "__main__":
-    main()
+    if Settings.PROFILE_RERUNS:
+        # 프로파일링 모드: rerun 전체를 측정하고 결과를 디버그 패널에 표시
+        from utils.profiler import profile_call
+        from components.debug_panel import render_profile_panel
+        report = profile_call(main, Settings.PROFILE_DIR, Settings.PROFILE_TOP_N)
+        render_profile_panel(report)
+    else:
+        main()
@@ -0,0 +1,193 @@
+"""
+HTTP API 서버(api.py)에 동시 요청을 보내는 부하 테스트입니다.
+
+로컬 대체 서버와 임시 저장소로 API 서버를 별도 프로세스로 띄운 뒤 두 단계로 측정합니다.
+1. 조회: --concurrency개의 클라이언트가 --duration초 동안 결과 조회(절반은 If-None-Match 포함)와
+   기록 페이지 조회를 섞어 보내며 처리량, 지연, 상태 코드(200/304/503) 분포를 기록
+2. 분석 요청: --jobs건을 한꺼번에 등록하고 완료될 때까지 폴링하여 등록→완료 지연과 거절(429) 수를 기록
+
+실행 (version_2 디렉터리에서):
+    python -m benchmarks.api_bench --concurrency 64 --duration 10 --jobs 20
+    python -m benchmarks.api_bench --csv /tmp/history_100000.csv --max-pending 16
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from urllib.parse import quote
+
+from benchmarks.fake_backends import add_backend_arguments, config_from_args, start_fake_backends
+from benchmarks.stats import summarize_latencies
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def wait_ready(client, base: str, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            response = await client.fetch(base + "/healthz", raise_error=False)
+            if response.code == 200:
+                return
+        except OSError:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError("API 서버가 시작되지 않았습니다.")
+
+
+async def read_phase(client, base: str, keys: list, pages: int, concurrency: int, duration: float) -> dict:
+    """결과/기록 조회를 duration초 동안 concurrency개 클라이언트로 반복합니다."""
+    latencies = defaultdict(list)
+    statuses = Counter()
+    etags = {}
+    deadline = time.monotonic() + duration
+
+    async def client_loop():
+        while time.monotonic() < deadline:
+            if random.random() < 0.7:
+                key = random.choice(keys)
+                headers = {}
+                kind = "result"
+                if key in etags and random.random() < 0.5:
+                    headers["If-None-Match"] = etags[key]
+                    kind = "result_conditional"
+                url = f"{base}/api/results/{quote(key)}"
+            else:
+                headers = {}
+                kind = "history"
+                url = f"{base}/api/history?offset={random.randrange(pages) * 20}&limit=20"
+            started = time.perf_counter()
+            response = await client.fetch(url, headers=headers, raise_error=False)
+            latencies[kind].append(time.perf_counter() - started)
+            statuses[f"{kind}:{response.code}"] += 1
+            if kind == "result" and response.code == 200:
+                etags[key] = response.headers.get("Etag")
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client_loop() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    total = sum(statuses.values())
+    return {
+        "requests": total,
+        "rps": round(total / elapsed, 1),
+        "status": dict(sorted(statuses.items())),
+        "latency": {kind: summarize_latencies(values) for kind, values in latencies.items()},
+    }
+
+
+async def submit_phase(client, base: str, jobs: int, poll_seconds: float = 0.2) -> dict:
+    """jobs건의 분석을 동시에 등록하고 모두 끝날 때까지 폴링합니다."""
+    statuses = Counter()
+    end_to_end = []
+    submit_latency = []
+
+    async def one(i: int):
+        body = json.dumps({"keyword": f"부하 테스트 {i}", "sources": ["news", "insights"]})
+        started = time.perf_counter()
+        response = await client.fetch(f"{base}/api/analyses", method="POST", body=body, raise_error=False)
+        submit_latency.append(time.perf_counter() - started)
+        statuses[f"submit:{response.code}"] += 1
+        if response.code != 202:
+            return
+        location = response.headers["Location"]
+        while True:
+            await asyncio.sleep(poll_seconds)
+            job = json.loads((await client.fetch(base + location)).body)
+            if job["status"] in ("done", "failed"):
+                statuses[f"job:{job['status']}"] += 1
+                end_to_end.append(time.perf_counter() - started)
+                return
+
+    await asyncio.gather(*(one(i) for i in range(jobs)))
+    return {
+        "status": dict(sorted(statuses.items())),
+        "submit_latency": summarize_latencies(submit_latency),
+        "end_to_end": summarize_latencies(end_to_end),
+    }
+
+
+async def run(args, base: str) -> dict:
+    from tornado.httpclient import AsyncHTTPClient
+
+    client = AsyncHTTPClient(max_clients=args.concurrency)
+    await wait_ready(client, base)
+    first = json.loads((await client.fetch(f"{base}/api/history?limit=100")).body)
+    keys = [item["search_key"] for item in first["items"]]
+    if not keys:
+        raise RuntimeError("조회할 검색 기록이 없습니다. --csv로 기록이 있는 파일을 지정하세요.")
+    pages = max(1, (first["total"] + 19) // 20)
+
+    report = {"history_total": first["total"]}
+    report["read"] = await read_phase(client, base, keys, pages, args.concurrency, args.duration)
+    if args.jobs:
+        report["submit"] = await submit_phase(client, base, args.jobs)
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="HTTP API 부하 테스트")
+    parser.add_argument("--csv", default="data/search_history.csv", help="조회에 사용할 검색 기록 CSV (복사본 사용)")
+    parser.add_argument("--concurrency", type=int, default=64, help="동시 클라이언트 수")
+    parser.add_argument("--duration", type=float, default=10.0, help="조회 단계 지속 시간(초)")
+    parser.add_argument("--jobs", type=int, default=20, help="분석 요청 단계에서 등록할 작업 수 (0이면 생략)")
+    parser.add_argument("--workers", type=int, default=4, help="API 서버의 분석 워커 수")
+    parser.add_argument("--max-workers", type=int, default=8, help="API_MAX_WORKERS (조회 스레드 수)")
+    parser.add_argument("--max-pending", type=int, default=64, help="API_MAX_PENDING (초과 시 503)")
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+    add_backend_arguments(parser)
+    parser.set_defaults(tavily_latency="constant:200", gemini_latency="constant:500")
+    args = parser.parse_args()
+
+    server, base_url, _ = start_fake_backends(config_from_args(args))
+    workdir = tempfile.mkdtemp(prefix="trendtracker-api-")
+    csv_path = os.path.join(workdir, "search_history.csv")
+    shutil.copy(args.csv, csv_path)
+    port = free_port()
+    env = dict(
+        os.environ,
+        TAVILY_API_KEY="tvly-fake", GEMINI_API_KEY="fake-gemini-key",
+        TAVILY_BASE_URL=base_url, GEMINI_BASE_URL=base_url + "/",
+        CSV_PATH=csv_path, JOB_DB_PATH=os.path.join(workdir, "jobs.sqlite3"),
+        METRICS_LOG_PATH=os.path.join(workdir, "metrics.jsonl"),
+        # 모든 요청이 대체 서버까지 가도록 공유 캐시를 끔 (앱의 캐시 파일에 대체 서버 응답을 남기지 않음)
+        SHARED_CACHE_PATH="", SEARCH_CACHE_SECONDS="0", GEMINI_CACHE_SECONDS="0",
+        API_MAX_WORKERS=str(args.max_workers), API_MAX_PENDING=str(args.max_pending),
+    )
+    process = subprocess.Popen(
+        [sys.executable, "api.py", "--port", str(port), "--workers", str(args.workers)],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        report = asyncio.run(run(args, f"http://127.0.0.1:{port}"))
+    finally:
+        process.terminate()
+        process.wait(10)
+        server.shutdown()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        "config": {key: getattr(args, key) for key in ("concurrency", "duration", "jobs", "workers", "max_workers", "max_pending")},
+        **report,
+    }
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""
+Tavily 클라이언트 커넥션 풀/워밍업 효과를 로컬 TLS 대체 서버로 측정합니다.
+
+실행 (version_2 디렉터리에서):
+    python -m benchmarks.client_pool_bench --sessions 20 --requests 25
+
+측정 항목:
+    - 첫 검색 지연: 클라이언트 생성 + TLS 핸드셰이크 + 요청 (워밍업 유무 비교)
+    - 동시 세션 부하: N개 스레드가 하나의 클라이언트를 공유할 때 p50/p95/p99
+"""
+import argparse
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler
+from typing import Callable, List
+
+from benchmarks.stats import summarize_latencies
+from benchmarks.tls_standin import start_server
+
+
+class _SearchHandler(BaseHTTPRequestHandler):
+    """Tavily /search 응답을 흉내 내는 keep-alive 지원 핸들러"""
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    latency_seconds = 0.02
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        time.sleep(self.latency_seconds)
+        body = json.dumps({
+            "query": "bench",
+            "results": [
+                {"title": f"기사 {i}", "url": f"https://example.com/{i}",
+                 "content": "본문 " * 50, "published_date": "2026-02-12"}
+                for i in range(20)
+            ]
+        }).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def _first_search(factory: Callable, warm: bool) -> float:
+    """클라이언트 생성부터 첫 검색 응답까지의 시간을 측정합니다."""
+    if warm:
+        client = factory()
+        client.session.head(client.base_url, timeout=5)
+        start = time.perf_counter()
+    else:
+        start = time.perf_counter()
+        client = factory()
+    client.search(query="벤치마크", max_results=20, topic="news")
+    elapsed = time.perf_counter() - start
+    client.close()
+    return elapsed
+
+
+def _concurrent_load(factory: Callable, sessions: int, requests_per_session: int) -> List[float]:
+    """여러 세션이 하나의 공유 클라이언트로 동시에 검색하는 상황을 재현합니다."""
+    client = factory()
+    latencies: List[float] = []
+    lock = threading.Lock()
+
+    def session_worker():
+        for _ in range(requests_per_session):
+            start = time.perf_counter()
+            client.search(query="벤치마크", max_results=20, topic="news")
+            elapsed = time.perf_counter() - start
+            with lock:
+                latencies.append(elapsed)
+
+    with ThreadPoolExecutor(max_workers=sessions) as executor:
+        for future in [executor.submit(session_worker) for _ in range(sessions)]:
+            future.result()
+    client.close()
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tavily 클라이언트 풀 벤치마크")
+    parser.add_argument("--sessions", type=int, default=20, help="동시 세션 수")
+    parser.add_argument("--requests", type=int, default=25, help="세션당 요청 수")
+    parser.add_argument("--server-latency-ms", type=float, default=20, help="대체 서버 응답 지연")
+    parser.add_argument("--trials", type=int, default=5, help="첫 검색 측정 반복 횟수")
+    args = parser.parse_args()
+
+    _SearchHandler.latency_seconds = args.server_latency_ms / 1000
+    server, base_url, cert_path = start_server(_SearchHandler, tls=True)
+
+    # 설정 모듈이 로드되기 전에 대체 서버를 가리키도록 환경변수를 지정
+    os.environ["TAVILY_API_KEY"] = "tvly-bench"
+    os.environ["TAVILY_BASE_URL"] = base_url
+    os.environ["HTTP_POOL_SIZE"] = str(args.sessions)
+    os.environ["REQUESTS_CA_BUNDLE"] = cert_path
+
+    from tavily import TavilyClient
+    from config.settings import Settings
+    from services.client_pool import _mount_pool
+
+    def unpooled():
+        return TavilyClient(api_key=Settings.TAVILY_API_KEY, api_base_url=Settings.TAVILY_BASE_URL)
+
+    def pooled():
+        client = unpooled()
+        _mount_pool(client.session)
+        return client
+
+    report = {
+        "server": base_url,
+        "sessions": args.sessions,
+        "requests_per_session": args.requests,
+        "first_search": {
+            "cold": summarize_latencies([_first_search(unpooled, warm=False) for _ in range(args.trials)]),
+            "warmed": summarize_latencies([_first_search(pooled, warm=True) for _ in range(args.trials)]),
+        },
+        "concurrent": {
+            "default_pool": summarize_latencies(_concurrent_load(unpooled, args.sessions, args.requests)),
+            "managed_pool": summarize_latencies(_concurrent_load(pooled, args.sessions, args.requests)),
+        },
+    }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
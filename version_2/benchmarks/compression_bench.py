@@ -0,0 +1,155 @@
+"""
+검색 기록 텍스트 열(기사 스니펫, AI 요약/인사이트) 압축 벤치마크이자 압축 사전 학습 도구입니다.
+
+- ratio: 열별 UTF-8 원문 바이트 / 저장 바이트 (압축 + base64, 더 길어지면 원문 저장)
+    - no_dictionary: 사전 없는 raw deflate
+    - holdout: 검색 절반(짝수 번째)으로 학습한 사전으로 나머지 절반을 압축 (처음 보는 기록에 대한 추정치)
+    - shipped: 배포된 사전(repositories/dictionaries)으로 전체를 압축
+- file_kb: 원본 CSV, compact-history 변환 후(AI 텍스트 1회 저장 + 압축), 압축 없이 변환한 경우의 파일 크기
+- find_by_key_ms: 모든 search_key를 한 번씩 조회한 시간의 중앙값 (원문 파일 vs 압축 파일) 및 복원(decode_text) 비용
+
+실행 (version_2 디렉터리에서):
+    python -m benchmarks.compression_bench --csv data/search_history.csv
+    python -m benchmarks.compression_bench --csv data/search_history.csv --train-output repositories/dictionaries/history_v2.txt
+"""
+import argparse
+import base64
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import zlib
+
+import pandas as pd
+
+from repositories.search_repository import SearchRepository
+from repositories.text_codec import (
+    CURRENT_DICTIONARY, TEXT_COLUMNS, decode_text, load_dictionary, train_dictionary
+)
+
+
+def unique_texts(df: pd.DataFrame, keys=None) -> dict:
+    """열별 고유 텍스트 (keys가 있으면 해당 검색만)"""
+    if keys is not None:
+        df = df[df["search_key"].isin(keys)]
+    return {
+        name: sorted({decode_text(value) for value in df[name].dropna() if isinstance(value, str) and value})
+        for name in TEXT_COLUMNS if name in df.columns
+    }
+
+
+def stored_bytes(text: str, dictionary: bytes) -> int:
+    """encode_text와 같은 규칙(압축 + base64, 원문보다 길면 원문)으로 저장했을 때의 바이트 수"""
+    raw = len(text.encode("utf-8"))
+    if dictionary:
+        compressor = zlib.compressobj(9, zlib.DEFLATED, -15, 9, zlib.Z_DEFAULT_STRATEGY, dictionary)
+    else:
+        compressor = zlib.compressobj(9, zlib.DEFLATED, -15)
+    packed = compressor.compress(text.encode("utf-8")) + compressor.flush()
+    return min(raw, len("z1:") + len(base64.b64encode(packed)))
+
+
+def ratio(texts: list, dictionary: bytes) -> float:
+    raw = sum(len(text.encode("utf-8")) for text in texts)
+    stored = sum(stored_bytes(text, dictionary) for text in texts)
+    return round(raw / stored, 2) if stored else 1.0
+
+
+def find_by_key_ms(csv_path: str, repeat: int) -> float:
+    """모든 search_key를 한 번씩 find_by_key로 조회할 때 1회당 시간의 중앙값(ms) (DataFrame은 미리 로드)"""
+    repository = SearchRepository(csv_path)
+    keys = repository.get_all_keys()
+    samples = []
+    for _ in range(repeat):
+        for key in keys:
+            started = time.perf_counter()
+            repository.find_by_key(key)
+            samples.append(time.perf_counter() - started)
+    return round(statistics.median(samples) * 1000, 3)
+
+
+def decode_ms(csv_path: str, repeat: int) -> float:
+    """검색 1건의 압축 텍스트(스니펫 + AI 요약/인사이트)를 모두 복원하는 시간의 중앙값(ms)"""
+    df = pd.read_csv(csv_path)
+    samples = []
+    for _ in range(repeat):
+        for _, rows in df.groupby("search_key", sort=False):
+            values = [value for name in TEXT_COLUMNS for value in rows[name].dropna()]
+            started = time.perf_counter()
+            for value in values:
+                decode_text(value)
+            samples.append(time.perf_counter() - started)
+    return round(statistics.median(samples) * 1000, 3)
+
+
+def bench(csv_path: str, repeat: int) -> dict:
+    df = pd.read_csv(csv_path)
+    keys = sorted(df["search_key"].unique())
+    texts = unique_texts(df)
+    train, test = unique_texts(df, keys[0::2]), unique_texts(df, keys[1::2])
+    holdout_dictionary = train_dictionary(text for values in train.values() for text in values).encode("utf-8")
+    shipped = load_dictionary(CURRENT_DICTIONARY)
+
+    workdir = tempfile.mkdtemp(prefix="trendtracker-compression-")
+    try:
+        compressed_path = os.path.join(workdir, "compressed.csv")
+        plain_path = os.path.join(workdir, "plain.csv")
+        shutil.copy(csv_path, compressed_path)
+        shutil.copy(csv_path, plain_path)
+        SearchRepository(compressed_path).compact()
+        SearchRepository(plain_path, compress_texts=False).compact()
+
+        report = {
+            "csv": csv_path,
+            "searches": len(keys),
+            "rows": len(df),
+            "ratio": {
+                name: {
+                    "texts": len(values),
+                    "no_dictionary": ratio(values, b""),
+                    "holdout": ratio(test[name], holdout_dictionary),
+                    "shipped": ratio(values, shipped),
+                }
+                for name, values in texts.items()
+            },
+            "file_kb": {
+                "original": round(os.path.getsize(csv_path) / 1024, 1),
+                "compact_plain": round(os.path.getsize(plain_path) / 1024, 1),
+                "compact_compressed": round(os.path.getsize(compressed_path) / 1024, 1),
+            },
+            "find_by_key_ms": {
+                "original": find_by_key_ms(csv_path, repeat),
+                "compact_plain": find_by_key_ms(plain_path, repeat),
+                "compact_compressed": find_by_key_ms(compressed_path, repeat),
+            },
+            "decode_ms_per_search": decode_ms(compressed_path, repeat),
+        }
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="검색 기록 텍스트 압축 벤치마크 / 사전 학습")
+    parser.add_argument("--csv", default="data/search_history.csv", help="검색 기록 CSV")
+    parser.add_argument("--repeat", type=int, default=20, help="반복 횟수 (중앙값 보고)")
+    parser.add_argument("--train-output", default=None, help="이 경로에 CSV로 학습한 새 압축 사전을 저장하고 종료")
+    args = parser.parse_args()
+
+    if args.train_output:
+        texts = unique_texts(pd.read_csv(args.csv))
+        dictionary = train_dictionary(text for values in texts.values() for text in values)
+        with open(args.train_output, "w", encoding="utf-8") as f:
+            f.write(dictionary)
+        print(f"사전 {len(dictionary.encode('utf-8')):,}바이트를 {args.train_output}에 저장했습니다.", file=sys.stderr)
+        return 0
+
+    print(json.dumps(bench(args.csv, args.repeat), ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""
+분석 마감 시간(ANALYSIS_DEADLINE_SECONDS)이 분석 1회의 지연 꼬리를 얼마나 줄이는지 측정하는 벤치마크입니다.
+
+로컬 대체 서버의 Gemini 지연을 꼬리가 긴 분포(기본 lognormal:3000:1.0)로 두고 뉴스 + AI 인사이트 분석을
+--analyses회 실행하여, 마감 시간이 없을 때(SDK 시간 제한도 사실상 없음)와 --deadline초일 때의
+분석 지연 p50/p95/p99/최댓값과 "대기 중" 단계가 남은 결과의 비율을 비교합니다.
+대기 중 단계는 실제 앱에서는 결과를 먼저 표시한 뒤 워커가 이어서 채웁니다. (services.analysis_pipeline.fill_pending)
+
+실행 (version_2 디렉터리에서):
+    python -m benchmarks.deadline_bench --analyses 60 --deadline 8
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.fake_backends import add_backend_arguments, config_from_args, start_fake_backends
+from benchmarks.stats import summarize_latencies
+
+
+def run_mode(label: str, deadline: float, timeout_cap: float, analyses: int, concurrency: int) -> dict:
+    from config.settings import Settings
+    from services.analysis_pipeline import SOURCE_NEWS, SOURCE_AI_INSIGHTS, run_analysis
+
+    Settings.ANALYSIS_DEADLINE_SECONDS = deadline
+    Settings.TAVILY_TIMEOUT_SECONDS = timeout_cap
+    Settings.GEMINI_TIMEOUT_SECONDS = timeout_cap
+
+    def analyze(i: int):
+        # 키워드마다 프롬프트가 달라 공유 캐시에 걸리지 않음
+        started = time.perf_counter()
+        result = run_analysis(f"{label} 키워드 {i}", [SOURCE_NEWS, SOURCE_AI_INSIGHTS], 5)
+        return time.perf_counter() - started, result.pending
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        outcomes = list(executor.map(analyze, range(analyses)))
+    latencies = [seconds for seconds, _ in outcomes]
+    return {
+        "deadline_seconds": deadline or None,
+        "latency": {**summarize_latencies(latencies), "max_ms": round(max(latencies) * 1000, 2)},
+        "partial_results": sum(1 for _, pending in outcomes if pending),
+        "pending_stages": sum(len(pending) for _, pending in outcomes),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="분석 마감 시간 벤치마크")
+    parser.add_argument("--analyses", type=int, default=60, help="모드별 분석 횟수")
+    parser.add_argument("--concurrency", type=int, default=8, help="동시에 실행할 분석 수")
+    parser.add_argument("--deadline", type=float, default=8.0, help="비교할 분석 마감 시간(초)")
+    add_backend_arguments(parser)
+    parser.set_defaults(gemini_latency="lognormal:3000:1.0")
+    args = parser.parse_args()
+
+    server, base_url, _ = start_fake_backends(config_from_args(args))
+    os.environ.update(
+        TAVILY_API_KEY="fake-tavily-key", GEMINI_API_KEY="fake-gemini-key",
+        TAVILY_BASE_URL=base_url, GEMINI_BASE_URL=base_url + "/", SHARED_CACHE_PATH=""
+    )
+    try:
+        report = {
+            "gemini_latency": args.gemini_latency,
+            "no_deadline": run_mode("no-deadline", 0, 600, args.analyses, args.concurrency),
+            "deadline": run_mode("deadline", args.deadline, 20, args.analyses, args.concurrency),
+        }
+    finally:
+        server.shutdown()
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,414 @@
+"""
+Tavily / Gemini API를 대신하는 로컬 대체 서버입니다.
+
+오프라인 벤치마크를 위해 실제 API와 같은 경로/응답 형식을 제공하며,
+지연 분포, 오류율(500), 속도 제한(429) 비율과 API 키별 분당 허용 요청 수를 설정할 수 있습니다.
+
+실행 (version_2 디렉터리에서):
+    # 합성 응답
+    python -m benchmarks.fake_backends --port 8765 \\
+        --tavily-latency lognormal:800:0.4 --gemini-latency lognormal:3000:0.5 \\
+        --error-rate 0.01 --rate-limit-rate 0.02
+
+    # 실제 API 응답 녹화 (TAVILY_API_KEY / GEMINI_API_KEY 필요)
+    python -m benchmarks.fake_backends --mode record --cassette benchmarks/cassettes/news.json
+
+    # 녹화된 응답 재생
+    python -m benchmarks.fake_backends --mode replay --cassette benchmarks/cassettes/news.json
+
+앱/서비스는 다음 환경변수로 대체 서버를 사용합니다:
+    TAVILY_BASE_URL=http://localhost:8765
+    GEMINI_BASE_URL=http://localhost:8765/
+"""
+import argparse
+import itertools
+import json
+import os
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler
+from typing import Dict, List, Optional
+from urllib import request as urlrequest
+from urllib.error import HTTPError
+
+from benchmarks.tls_standin import start_server
+
+# 녹화 모드에서 요청을 전달할 실제 API 주소
+UPSTREAM_TAVILY = "https://api.tavily.com"
+UPSTREAM_GEMINI = "https://generativelanguage.googleapis.com"
+
+_GEMINI_PATH = re.compile(r"^/v1beta/models/(?P<model>[^:/]+):generateContent$")
+
+
+@dataclass
+class LatencyDistribution:
+    """
+    응답 지연 분포를 표현합니다.
+    "constant:50", "uniform:20:80", "lognormal:200:0.5"(중앙값 ms, sigma) 형식을 지원합니다.
+    """
+    kind: str = "constant"
+    params: List[float] = field(default_factory=lambda: [0.0])
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyDistribution":
+        kind, *params = spec.split(":")
+        if kind not in ("constant", "uniform", "lognormal"):
+            raise ValueError(f"지원하지 않는 지연 분포입니다: {spec}")
+        return cls(kind=kind, params=[float(p) for p in params] or [0.0])
+
+    def sample_seconds(self) -> float:
+        if self.kind == "uniform":
+            low, high = self.params[0], self.params[1]
+            millis = random.uniform(low, high)
+        elif self.kind == "lognormal":
+            median, sigma = self.params[0], self.params[1] if len(self.params) > 1 else 0.5
+            millis = median * random.lognormvariate(0, sigma)
+        else:
+            millis = self.params[0]
+        return max(0.0, millis) / 1000
+
+
+@dataclass
+class FakeBackendConfig:
+    """대체 서버 동작 설정"""
+    tavily_latency: LatencyDistribution = field(default_factory=LatencyDistribution)
+    gemini_latency: LatencyDistribution = field(default_factory=LatencyDistribution)
+    # 모델별 Gemini 지연 (없는 모델은 gemini_latency 사용) - 모델 라우팅/헤지 측정용
+    gemini_model_latency: Dict[str, LatencyDistribution] = field(default_factory=dict)
+    error_rate: float = 0.0        # 500 응답 비율
+    rate_limit_rate: float = 0.0   # 429 응답 비율
+    # API 키별 분당 허용 요청 수 (넘으면 429, 0이면 제한 없음) - 키 풀 측정용
+    key_rate_per_minute: float = 0.0
+    mode: str = "synth"            # synth | replay | record
+    # 프롬프트 길이에 비례하는 Gemini 추가 지연 (입력 토큰 1,000개당 ms, 0이면 비활성화)
+    gemini_ms_per_1k_prompt_tokens: float = 0.0
+    cassette_path: Optional[str] = None
+
+
+class Cassette:
+    """
+    녹화된 실제 응답을 저장/재생합니다.
+    Tavily 응답은 검색어별로, Gemini 응답은 순서대로 재생합니다.
+    """
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self.tavily: Dict[str, dict] = {}
+        self.gemini: List[dict] = []
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self.tavily = data.get("tavily", {})
+            self.gemini = data.get("gemini", [])
+        self._gemini_cycle = itertools.cycle(self.gemini) if self.gemini else None
+
+    def tavily_response(self, query: str) -> Optional[dict]:
+        if query in self.tavily:
+            return self.tavily[query]
+        if self.tavily:
+            return random.choice(list(self.tavily.values()))
+        return None
+
+    def gemini_response(self) -> Optional[dict]:
+        with self._lock:
+            return next(self._gemini_cycle) if self._gemini_cycle else None
+
+    def record_tavily(self, query: str, response: dict):
+        with self._lock:
+            self.tavily[query] = response
+            self._flush()
+
+    def record_gemini(self, response: dict):
+        with self._lock:
+            self.gemini.append(response)
+            self._flush()
+
+    def _flush(self):
+        if not self.path:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"tavily": self.tavily, "gemini": self.gemini}, f, ensure_ascii=False, indent=2)
+
+
+def synth_tavily_response(query: str, max_results: int, include_domains: Optional[List[str]] = None) -> dict:
+    """
+    Tavily /search 형식의 합성 응답을 생성합니다.
+    실제 API처럼 최대 20건까지만 반환하며, include_domains가 있으면 기사 URL을 그 도메인들에 나누어 만듭니다.
+    """
+    domains = include_domains or ["news.example.com"]
+    results = []
+    for i in range(min(max_results, 20)):
+        day = 1 + (i % 28)
+        results.append({
+            "title": f"{query} 관련 기사 {i + 1}",
+            "url": f"https://{domains[i % len(domains)]}/{abs(hash(query)) % 100000}/{i}",
+            "content": f"{query}에 대한 최신 동향을 다룬 기사입니다. " * 8,
+            "score": round(1 - i / max(max_results, 1), 3),
+            "published_date": f"Mon, {day:02d} Feb 2026 09:00:00 GMT",
+        })
+    return {"query": query, "results": results, "response_time": 0.0}
+
+
+def estimate_prompt_tokens(prompt: str) -> int:
+    """합성 응답에서 사용하는 입력 토큰 수 추정치 (한국어 기준 약 2자당 1토큰)"""
+    return max(1, len(prompt) // 2)
+
+
+def _prompt_text(payload: dict) -> str:
+    """generateContent 요청 본문에서 프롬프트 텍스트를 추출합니다."""
+    prompt = ""
+    for content in payload.get("contents", []):
+        for part in content.get("parts", []):
+            prompt += part.get("text", "")
+    return prompt
+
+
+def synth_gemini_response(prompt: str) -> dict:
+    """Gemini generateContent 형식의 합성 응답을 생성합니다."""
+    text = "\n".join(f"*   합성 요약 항목 {i + 1}: 로컬 대체 서버가 생성한 응답입니다." for i in range(5))
+    prompt_tokens = estimate_prompt_tokens(prompt)
+    output_tokens = max(1, len(text) // 2)
+    return {
+        "candidates": [{
+            "content": {"parts": [{"text": text}], "role": "model"},
+            "finishReason": "STOP",
+            "index": 0,
+        }],
+        "usageMetadata": {
+            "promptTokenCount": prompt_tokens,
+            "candidatesTokenCount": output_tokens,
+            "totalTokenCount": prompt_tokens + output_tokens,
+        },
+        "modelVersion": "fake-gemini",
+    }
+
+
+def _forward(url: str, body: bytes, headers: Dict[str, str]) -> dict:
+    """녹화 모드에서 실제 API로 요청을 전달합니다."""
+    req = urlrequest.Request(url, data=body, headers=headers, method="POST")
+    with urlrequest.urlopen(req, timeout=120) as resp:
+        return json.loads(resp.read().decode("utf-8"))
+
+
+def make_handler(config: FakeBackendConfig):
+    """설정을 공유하는 요청 핸들러 클래스를 생성합니다."""
+    cassette = Cassette(config.cassette_path)
+    counters = {"tavily": 0, "gemini": 0, "errors": 0, "rate_limited": 0}
+    counters_lock = threading.Lock()
+    # API 키 → (남은 토큰, 마지막 갱신 시각), 최대 1초 분량 + 1건까지 몰아서 허용
+    key_buckets: Dict[str, List[float]] = {}
+    key_capacity = config.key_rate_per_minute / 60.0 + 1.0
+
+    class FakeBackendHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def log_message(self, format, *args):
+            pass
+
+        def _send_json(self, status: int, payload: dict):
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _count(self, name: str):
+            with counters_lock:
+                counters[name] += 1
+
+        def _over_key_quota(self) -> bool:
+            """요청한 API 키의 분당 허용 요청 수를 넘었으면 True를 반환합니다."""
+            if config.key_rate_per_minute <= 0:
+                return False
+            api_key = self.headers.get("x-goog-api-key") or self.headers.get("Authorization", "")
+            now = time.monotonic()
+            with counters_lock:
+                tokens, updated = key_buckets.get(api_key, (key_capacity, now))
+                tokens = min(key_capacity, tokens + (now - updated) * config.key_rate_per_minute / 60.0)
+                allowed = tokens >= 1.0
+                key_buckets[api_key] = [tokens - 1.0 if allowed else tokens, now]
+            return not allowed
+
+        def _inject_failure(self, over_quota: bool) -> bool:
+            """설정된 비율과 API 키별 허용 요청 수 초과 여부(over_quota)에 따라 429/500 응답을 주입합니다."""
+            roll = random.random()
+            if over_quota or roll < config.rate_limit_rate:
+                self._count("rate_limited")
+                self._send_json(429, {
+                    "detail": {"error": "rate limit exceeded (fake)"},
+                    "error": {"code": 429, "message": "Resource has been exhausted (fake quota)", "status": "RESOURCE_EXHAUSTED"},
+                })
+                return True
+            if roll < config.rate_limit_rate + config.error_rate:
+                self._count("errors")
+                self._send_json(500, {
+                    "detail": {"error": "internal error (fake)"},
+                    "error": {"code": 500, "message": "Internal error (fake)", "status": "INTERNAL"},
+                })
+                return True
+            return False
+
+        def do_HEAD(self):
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def do_GET(self):
+            if self.path == "/stats":
+                with counters_lock:
+                    self._send_json(200, dict(counters))
+            else:
+                self._send_json(404, {"error": "not found"})
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            raw = self.rfile.read(length)
+            try:
+                payload = json.loads(raw.decode("utf-8")) if raw else {}
+            except ValueError:
+                self._send_json(400, {"detail": {"error": "invalid json"}})
+                return
+
+            path = self.path.split("?", 1)[0]
+            # 키별 허용 요청 수는 응답 지연과 관계없이 요청이 도착한 시각 기준으로 계산
+            over_quota = self._over_key_quota()
+            if path == "/search":
+                self._count("tavily")
+                time.sleep(config.tavily_latency.sample_seconds())
+                if config.mode != "record" and self._inject_failure(over_quota):
+                    return
+                self._handle_tavily(payload, raw)
+                return
+
+            match = _GEMINI_PATH.match(path)
+            if match:
+                self._count("gemini")
+                delay = config.gemini_model_latency.get(
+                    match.group("model"), config.gemini_latency
+                ).sample_seconds()
+                if config.gemini_ms_per_1k_prompt_tokens:
+                    prompt_tokens = estimate_prompt_tokens(_prompt_text(payload))
+                    delay += prompt_tokens / 1000 * config.gemini_ms_per_1k_prompt_tokens / 1000
+                time.sleep(delay)
+                if config.mode != "record" and self._inject_failure(over_quota):
+                    return
+                self._handle_gemini(match.group("model"), payload, raw)
+                return
+
+            self._send_json(404, {"error": f"unknown path {path}"})
+
+        def _handle_tavily(self, payload: dict, raw: bytes):
+            query = payload.get("query", "")
+            if config.mode == "record":
+                headers = {"Content-Type": "application/json"}
+                if self.headers.get("Authorization"):
+                    headers["Authorization"] = self.headers["Authorization"]
+                try:
+                    response = _forward(UPSTREAM_TAVILY + "/search", raw, headers)
+                except HTTPError as e:
+                    self._send_json(e.code, {"detail": {"error": str(e)}})
+                    return
+                cassette.record_tavily(query, response)
+            else:
+                response = cassette.tavily_response(query) if config.mode == "replay" else None
+                if response is None:
+                    response = synth_tavily_response(
+                        query, int(payload.get("max_results") or 5), payload.get("include_domains")
+                    )
+            self._send_json(200, response)
+
+        def _handle_gemini(self, model: str, payload: dict, raw: bytes):
+            if config.mode == "record":
+                headers = {"Content-Type": "application/json"}
+                if self.headers.get("x-goog-api-key"):
+                    headers["x-goog-api-key"] = self.headers["x-goog-api-key"]
+                try:
+                    response = _forward(f"{UPSTREAM_GEMINI}/v1beta/models/{model}:generateContent", raw, headers)
+                except HTTPError as e:
+                    self._send_json(e.code, {"error": {"code": e.code, "message": str(e)}})
+                    return
+                cassette.record_gemini(response)
+            else:
+                response = cassette.gemini_response() if config.mode == "replay" else None
+                if response is None:
+                    response = synth_gemini_response(_prompt_text(payload))
+            self._send_json(200, response)
+
+    FakeBackendHandler.counters = counters
+    return FakeBackendHandler
+
+
+def start_fake_backends(config: FakeBackendConfig, port: int = 0, tls: bool = False):
+    """
+    대체 서버를 백그라운드 스레드에서 시작합니다.
+
+    Returns:
+        Tuple[ThreadingHTTPServer, str, Optional[str]]: (서버, 기본 URL, 인증서 경로)
+    """
+    return start_server(make_handler(config), port=port, tls=tls)
+
+
+def add_backend_arguments(parser: argparse.ArgumentParser):
+    """대체 서버 설정용 CLI 인자를 추가합니다. (부하 생성기와 공유)"""
+    parser.add_argument("--tavily-latency", default="lognormal:800:0.4", help="Tavily 지연 분포")
+    parser.add_argument("--gemini-latency", default="lognormal:3000:0.5", help="Gemini 지연 분포")
+    parser.add_argument("--gemini-model-latency", action="append", default=[], metavar="MODEL=SPEC",
+                        help="모델별 Gemini 지연 분포 (여러 번 지정 가능, 예: gemini-2.5-flash=lognormal:3000:1.0)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 응답 비율 (0~1)")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="429 응답 비율 (0~1)")
+    parser.add_argument("--key-rpm", type=float, default=0.0,
+                        help="API 키별 분당 허용 요청 수 (넘으면 429, 0이면 제한 없음)")
+    parser.add_argument("--gemini-ms-per-1k-tokens", type=float, default=0.0,
+                        help="입력 토큰 1,000개당 추가 Gemini 지연(ms) - 프롬프트 길이에 따른 지연 모델")
+    parser.add_argument("--mode", choices=["synth", "replay", "record"], default="synth")
+    parser.add_argument("--cassette", default=None, help="녹화/재생 파일 경로 (JSON)")
+
+
+def config_from_args(args: argparse.Namespace) -> FakeBackendConfig:
+    return FakeBackendConfig(
+        tavily_latency=LatencyDistribution.parse(args.tavily_latency),
+        gemini_latency=LatencyDistribution.parse(args.gemini_latency),
+        gemini_model_latency={
+            model: LatencyDistribution.parse(spec)
+            for model, spec in (item.split("=", 1) for item in args.gemini_model_latency)
+        },
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        key_rate_per_minute=args.key_rpm,
+        gemini_ms_per_1k_prompt_tokens=args.gemini_ms_per_1k_tokens,
+        mode=args.mode,
+        cassette_path=args.cassette,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tavily/Gemini 로컬 대체 서버")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--tls", action="store_true", help="자체 서명 인증서로 HTTPS 제공")
+    add_backend_arguments(parser)
+    args = parser.parse_args()
+
+    server, base_url, cert_path = start_fake_backends(config_from_args(args), port=args.port, tls=args.tls)
+    print(f"대체 서버 실행 중: {base_url} (mode={args.mode})")
+    print(f"  TAVILY_BASE_URL={base_url}")
+    print(f"  GEMINI_BASE_URL={base_url}/")
+    if cert_path:
+        print(f"  REQUESTS_CA_BUNDLE={cert_path}  SSL_CERT_FILE={cert_path}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
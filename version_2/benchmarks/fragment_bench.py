@@ -0,0 +1,202 @@
+"""
+fragment 단위 부분 rerun으로 절약되는 저장소 조회 수와 렌더링 시간을 측정하는 벤치마크입니다.
+
+streamlit.testing의 AppTest는 fragment 단독 rerun을 지원하지 않고 항상 앱 전체를 실행합니다.
+따라서 전형적인 세션(기록 열기 → 슬라이더 조작 → 다른 기록 열기 → 슬라이더 조작)을 전체 rerun으로
+재생하면서 fragment(settings_panel / history_panel / result_panel)별 실행 시간과 저장소 호출 수를
+따로 기록하고, 각 상호작용에서 실제로 다시 실행되는 범위만 합산하여 두 방식을 비교합니다.
+
+    - 전체 rerun 방식: 모든 상호작용이 앱 전체를 실행 (fragment 도입 전 동작)
+    - fragment 방식: 슬라이더 조작은 settings_panel만, 기록 선택은 앱 전체를 실행
+
+실행 (version_2 디렉터리에서):
+    python -m benchmarks.fragment_bench --rows 20000 --slider-moves 5
+"""
+import argparse
+import functools
+import json
+import os
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from contextvars import ContextVar
+from typing import Dict, List
+
+# 현재 실행 중인 fragment 이름 (fragment 밖은 "main")
+_block: ContextVar[str] = ContextVar("bench_block", default="main")
+
+REPOSITORY_OPS = ["version", "load", "get_all_keys", "find_by_key", "get_all_as_csv"]
+
+
+class RunRecorder:
+    """rerun 1회 동안 블록별 실행 시간과 저장소 호출 수를 수집합니다."""
+
+    def __init__(self):
+        self.seconds: Dict[str, float] = defaultdict(float)
+        self.reads: Dict[str, Counter] = defaultdict(Counter)
+
+    def reset(self):
+        self.seconds.clear()
+        self.reads.clear()
+
+
+recorder = RunRecorder()
+
+
+def _instrument():
+    """st.fragment와 SearchRepository 메서드를 측정용 래퍼로 교체합니다."""
+    import streamlit
+    from repositories.search_repository import SearchRepository
+
+    real_fragment = streamlit.fragment
+
+    def tracking_fragment(func=None, **kwargs):
+        if func is None:
+            return lambda f: tracking_fragment(f, **kwargs)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kw):
+            token = _block.set(func.__name__)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kw)
+            finally:
+                recorder.seconds[func.__name__] += time.perf_counter() - start
+                _block.reset(token)
+
+        return real_fragment(wrapper, **kwargs)
+
+    streamlit.fragment = tracking_fragment
+
+    for op in REPOSITORY_OPS:
+        method = getattr(SearchRepository, op)
+
+        def counted(self, *args, _method=method, _op=op, **kw):
+            recorder.reads[_block.get()][_op] += 1
+            return _method(self, *args, **kw)
+
+        setattr(SearchRepository, op, counted)
+
+
+def _run(app, action=None) -> dict:
+    """상호작용 1회를 실행하고 전체 시간과 블록별 측정값을 반환합니다."""
+    recorder.reset()
+    start = time.perf_counter()
+    if action is not None:
+        action(app)
+    app.run()
+    total = time.perf_counter() - start
+    if app.exception:
+        raise RuntimeError(f"앱 실행 중 예외: {app.exception}")
+    return {
+        "total_s": total,
+        "blocks_s": dict(recorder.seconds),
+        "reads": {block: sum(ops.values()) for block, ops in recorder.reads.items()},
+        "ops": {block: dict(ops) for block, ops in recorder.reads.items()},
+    }
+
+
+def _summarize(interactions: List[dict]) -> dict:
+    """두 방식의 세션 전체 저장소 호출 수와 실행 시간을 합산합니다."""
+    full = {"reads": 0, "ms": 0.0}
+    scoped = {"reads": 0, "ms": 0.0}
+    for item in interactions:
+        run = item["run"]
+        reads = sum(run["reads"].values())
+        full["reads"] += reads
+        full["ms"] += run["total_s"] * 1000
+        if item["scope"] == "settings_panel":
+            scoped["reads"] += run["reads"].get("settings_panel", 0)
+            scoped["ms"] += run["blocks_s"].get("settings_panel", 0.0) * 1000
+        else:
+            scoped["reads"] += reads
+            scoped["ms"] += run["total_s"] * 1000
+    return {
+        "full_rerun": {"repository_reads": full["reads"], "rerun_ms": round(full["ms"], 1)},
+        "fragment_scoped": {"repository_reads": scoped["reads"], "rerun_ms": round(scoped["ms"], 1)},
+        "saved": {
+            "repository_reads": full["reads"] - scoped["reads"],
+            "rerun_ms": round(full["ms"] - scoped["ms"], 1),
+        },
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="fragment 부분 rerun 절감 효과 벤치마크")
+    parser.add_argument("--rows", type=int, default=20_000, help="합성 기록 CSV 행 수")
+    parser.add_argument("--slider-moves", type=int, default=5, help="기록을 열 때마다 이어지는 슬라이더 조작 횟수")
+    parser.add_argument("--data-dir", default=None, help="합성 데이터 저장 경로 (기존 파일 재사용)")
+    parser.add_argument("--timeout", type=float, default=600, help="rerun 1회 최대 대기 시간(초)")
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    from benchmarks.repository_bench import generate_history
+
+    data_dir = args.data_dir or tempfile.mkdtemp(prefix="trendtracker-fragment-bench-")
+    os.makedirs(data_dir, exist_ok=True)
+    csv_path = os.path.join(data_dir, f"history_{args.rows}.csv")
+    if not os.path.exists(csv_path):
+        print(f"▶ {args.rows:,}행 합성 기록 생성 중...", file=sys.stderr)
+        generate_history(csv_path, args.rows)
+
+    # 설정 모듈이 로드되기 전에 지정 (API는 호출되지 않음)
+    os.environ.update({
+        "TAVILY_API_KEY": os.environ.get("TAVILY_API_KEY", "tvly-bench"),
+        "GEMINI_API_KEY": os.environ.get("GEMINI_API_KEY", "bench"),
+        "CSV_PATH": csv_path,
+        "METRICS_PORT": "0",
+        "METRICS_LOG_PATH": os.path.join(data_dir, "metrics.jsonl"),
+        "JOB_DB_PATH": os.path.join(data_dir, "jobs.sqlite3"),
+        "JOB_WORKERS": "0",
+        "WARMUP_ON_START": "false",
+    })
+
+    _instrument()
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file("app.py", default_timeout=args.timeout)
+
+    # 전형적인 세션: 첫 화면 → (기록 열기 → 슬라이더 N회) × 2
+    session = [("open_app", "app", None)]
+    for history_index in (0, 1):
+        session.append((
+            f"select_history[{history_index}]", "app",
+            lambda a, i=history_index: a.selectbox[0].select_index(i)
+        ))
+        for move in range(args.slider_moves):
+            session.append((
+                "move_slider", "settings_panel",
+                lambda a, v=1 + (move % 10): a.slider[0].set_value(v)
+            ))
+
+    interactions = []
+    for name, scope, action in session:
+        interactions.append({"name": name, "scope": scope, "run": _run(app, action)})
+
+    slider_runs = [item["run"] for item in interactions if item["scope"] == "settings_panel"]
+    per_slider = {}
+    if slider_runs:
+        last = slider_runs[-1]
+        per_slider = {
+            "full_rerun_ms": round(last["total_s"] * 1000, 1),
+            "blocks_ms": {block: round(s * 1000, 1) for block, s in last["blocks_s"].items()},
+            "repository_ops": last["ops"],
+        }
+
+    report = {
+        "rows": args.rows,
+        "interactions": len(interactions),
+        "slider_interaction": per_slider,
+        "session": _summarize(interactions),
+    }
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+"""
+앱 모듈 임포트 시간(`python -X importtime`)을 측정하는 벤치마크입니다.
+
+Streamlit은 rerun마다 app.py를 실행하며, 첫 화면 요소(st.set_page_config)는
+app.py의 임포트가 끝난 직후 전송됩니다. 따라서 `import app`의 누적 임포트 시간을
+서버 시작 후 첫 화면 표시(time-to-first-paint)까지의 지연 지표로 사용합니다.
+
+실행 (version_2 디렉터리에서):
+    python -m benchmarks.import_time --runs 5 --budget-ms 600
+
+예산을 초과하거나, 첫 화면 전에 로드되면 안 되는 무거운 SDK가 임포트되면 종료 코드 1을 반환합니다.
+"""
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# 첫 화면 전에는 로드되지 않아야 하는 무거운 모듈
+DEFAULT_FORBIDDEN = ["google.genai", "tavily", "pandas", "httpx", "requests"]
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+
+def measure_once(module: str) -> Tuple[float, Dict[str, int], List[str]]:
+    """
+    새 인터프리터에서 module을 임포트하고 importtime 결과를 파싱합니다.
+
+    Returns:
+        Tuple[float, Dict[str, int], List[str]]:
+            (module 누적 임포트 시간 ms, 상위 두 단계 모듈별 누적 시간 us, 임포트된 전체 모듈 목록)
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    top_level: Dict[str, int] = {}
+    imported: List[str] = []
+    total_us = 0
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if not match:
+            continue
+        cumulative, indent, name = int(match.group(2)), match.group(3), match.group(4)
+        imported.append(name)
+        # 들여쓰기 1칸은 최상위, 3칸은 그 직속 하위 임포트를 의미
+        if len(indent) <= 3 and name != module:
+            top_level[name] = cumulative
+        if name == module:
+            total_us = cumulative
+    return total_us / 1000, top_level, imported
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="앱 임포트 시간 벤치마크")
+    parser.add_argument("--module", default="app", help="측정할 모듈 (기본: app)")
+    parser.add_argument("--runs", type=int, default=5, help="반복 횟수 (중앙값 사용, 첫 실행은 .pyc 생성으로 제외)")
+    parser.add_argument("--budget-ms", type=float, default=600.0, help="time-to-first-paint 목표 (ms)")
+    parser.add_argument("--forbid", default=",".join(DEFAULT_FORBIDDEN),
+                        help="첫 화면 전에 임포트되면 안 되는 모듈 (쉼표 구분)")
+    parser.add_argument("--top", type=int, default=10, help="출력할 상위 모듈 수")
+    args = parser.parse_args()
+
+    # 워밍업 실행 (.pyc 생성)
+    measure_once(args.module)
+
+    totals = []
+    top_level: Dict[str, List[int]] = {}
+    imported: List[str] = []
+    for _ in range(args.runs):
+        total_ms, modules, imported = measure_once(args.module)
+        totals.append(total_ms)
+        for name, cumulative in modules.items():
+            top_level.setdefault(name, []).append(cumulative)
+
+    median_ms = statistics.median(totals)
+    heaviest = sorted(
+        ((name, statistics.median(values) / 1000) for name, values in top_level.items()),
+        key=lambda item: item[1],
+        reverse=True
+    )[:args.top]
+    forbidden = [m.strip() for m in args.forbid.split(",") if m.strip()]
+    leaked = [m for m in forbidden if m in imported]
+
+    report = {
+        "module": args.module,
+        "runs": args.runs,
+        "import_ms_median": round(median_ms, 1),
+        "import_ms_all": [round(t, 1) for t in totals],
+        "budget_ms": args.budget_ms,
+        "heaviest_imports_ms": {name: round(ms, 1) for name, ms in heaviest},
+        "forbidden_imported": leaked,
+    }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+    failed = False
+    if median_ms > args.budget_ms:
+        print(f"❌ 임포트 시간 {median_ms:.1f}ms가 목표 {args.budget_ms:.0f}ms를 초과했습니다.", file=sys.stderr)
+        failed = True
+    if leaked:
+        print(f"❌ 첫 화면 전에 무거운 모듈이 임포트되었습니다: {', '.join(leaked)}", file=sys.stderr)
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""
+API 키 풀(services.key_pool.ApiKeyPool)로 키 수에 따라 전체 처리량이 늘어나는지 측정하는 벤치마크입니다.
+
+로컬 대체 서버가 API 키마다 분당 --key-rpm건까지만 허용하고(넘으면 429), 뉴스 요약 --requests건을
+--concurrency개씩 동시에 보내 키 수(--keys)별 처리량(초당 성공 요청 수), 실패 수, 429 응답 수와 키별 사용량을 비교합니다.
+- limited: 키마다 클라이언트 제한기(키당 --key-rpm)를 두어 할당량 안에서 보냄 (main.py batch와 같음)
+- unlimited: 클라이언트 제한 없이 보내고 429를 받은 키를 --cooldown초 동안 쉬게 함
+
+실행 (version_2 디렉터리에서):
+    python -m benchmarks.key_pool_bench --requests 120 --keys 1 2 4
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.fake_backends import FakeBackendConfig, LatencyDistribution, start_fake_backends
+
+MODEL = "gemini-2.5-flash"
+
+
+def run_mode(keys: int, limited: bool, args: argparse.Namespace, counters: dict) -> dict:
+    from domain.news_article import NewsArticle
+    from services.ai_service import AIService
+    from services.client_pool import get_genai_client
+    from services.key_pool import ApiKeyPool
+    from services.model_router import ModelRouter
+    from utils.exceptions import AppError
+
+    service = AIService()
+    service.router = ModelRouter(MODEL, {}, [])
+    api_keys = [f"fake-gemini-key-{i + 1}" for i in range(keys)]
+    service.keys = ApiKeyPool(
+        "gemini", [(api_key, 1.0) for api_key in api_keys],
+        per_minute=args.key_rpm if limited else 0, cooldown_seconds=args.cooldown
+    )
+    # 클라이언트 생성 시간이 첫 요청들을 늦춰 몰리지 않도록 미리 생성하고, 이전 모드의 키별 허용량이 다시 찰 때까지 대기
+    for api_key in api_keys:
+        get_genai_client(api_key)
+    time.sleep(2)
+    rate_limited_before = counters["rate_limited"]
+
+    def summarize(i: int) -> bool:
+        # 요청마다 프롬프트가 달라 공유 캐시에 걸리지 않음
+        articles = [NewsArticle(f"키 {keys}개 기사 {i}", f"https://example.com/{i}", "최신 동향", "")]
+        try:
+            service.summarize_news(articles)
+            return True
+        except AppError:
+            return False
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        outcomes = list(executor.map(summarize, range(args.requests)))
+    seconds = time.perf_counter() - started
+    return {
+        "seconds": round(seconds, 2),
+        "throughput_per_second": round(sum(outcomes) / seconds, 2),
+        "failed": outcomes.count(False),
+        "rate_limited_responses": counters["rate_limited"] - rate_limited_before,
+        "uses": {label: stats["uses"] for label, stats in service.keys.snapshot().items()},
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="API 키 풀 처리량 벤치마크")
+    parser.add_argument("--requests", type=int, default=120, help="모드별 요약 요청 수")
+    parser.add_argument("--concurrency", type=int, default=16, help="동시에 보낼 요청 수")
+    parser.add_argument("--keys", type=int, nargs="+", default=[1, 2, 4], help="비교할 키 수")
+    parser.add_argument("--key-rpm", type=float, default=600, help="대체 서버가 키마다 허용하는 분당 요청 수")
+    parser.add_argument("--cooldown", type=float, default=1.0, help="unlimited 모드에서 429를 받은 키를 쉬게 하는 시간(초)")
+    parser.add_argument("--gemini-latency", default="lognormal:200:0.3", help="Gemini 지연 분포")
+    args = parser.parse_args()
+
+    server, base_url, _ = start_fake_backends(FakeBackendConfig(
+        gemini_latency=LatencyDistribution.parse(args.gemini_latency), key_rate_per_minute=args.key_rpm
+    ))
+    os.environ.update(
+        GEMINI_API_KEY="fake-gemini-key-1", GEMINI_BASE_URL=base_url + "/", SHARED_CACHE_PATH="",
+        GEMINI_CACHE_SECONDS="0", ANALYSIS_DEADLINE_SECONDS="0"
+    )
+    try:
+        report = {"key_rpm": args.key_rpm, "gemini_latency": args.gemini_latency}
+        for keys in args.keys:
+            report[f"{keys}_keys"] = {
+                mode: run_mode(keys, mode == "limited", args, server.RequestHandlerClass.counters)
+                for mode in ("limited", "unlimited")
+            }
+    finally:
+        server.shutdown()
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+"""
+검색 → 요약 → 인사이트 → 저장 파이프라인을 목표 QPS로 구동하는 부하 생성기입니다.
+
+기본적으로 로컬 대체 서버(benchmarks.fake_backends)를 함께 띄워 오프라인으로 실행되며,
+처리량과 단계별 p50/p95/p99 지연을 보고합니다. 모든 성능 개선 작업의 기준선으로 사용합니다.
+
+실행 (version_2 디렉터리에서):
+    python -m benchmarks.load_generator --qps 5 --duration 30 \\
+        --tavily-latency lognormal:800:0.4 --gemini-latency lognormal:3000:0.5 \\
+        --rate-limit-rate 0.02 --output bench_output.json
+
+    # 이미 실행 중인 대체 서버(또는 실제 API) 사용
+    python -m benchmarks.load_generator --no-fakes --qps 1 --duration 10
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+from benchmarks.fake_backends import add_backend_arguments, config_from_args, start_fake_backends
+from benchmarks.stats import summarize_latencies
+
+DEFAULT_KEYWORDS = [
+    "바이브코딩 피로감", "생성형 AI", "반도체 수출", "전기차 배터리",
+    "K-콘텐츠", "금리 인하", "저출산 대책", "기후 위기",
+]
+
+STAGES = ["tavily_search", "sort_convert", "summarize", "insights", "repository_save", "total"]
+
+
+class LoadRecorder:
+    """단계별 지연과 오류를 스레드 안전하게 수집합니다."""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.completed = 0
+        self.failed = 0
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, seconds: float):
+        with self._lock:
+            self.latencies[stage].append(seconds)
+
+    def record_error(self, stage: str, error_type: str):
+        with self._lock:
+            self.errors[f"{stage}:{error_type}"] += 1
+
+    def finish(self, ok: bool):
+        with self._lock:
+            if ok:
+                self.completed += 1
+            else:
+                self.failed += 1
+
+
+def run_pipeline_once(keyword: str, num_results: int, repository, save_lock: threading.Lock, recorder: LoadRecorder):
+    """파이프라인을 한 번 실행하며 단계별 소요 시간(span)을 기록합니다."""
+    from services.analysis_pipeline import run_analysis, SOURCE_NEWS, SOURCE_AI_INSIGHTS, SOURCE_TRENDS
+    from utils.exceptions import AppError
+    from utils.metrics import StageTimer, span
+
+    started = time.perf_counter()
+    timer = StageTimer()
+    try:
+        with timer:
+            result = run_analysis(keyword, [SOURCE_NEWS, SOURCE_AI_INSIGHTS, SOURCE_TRENDS], num_results)
+            # CSV 저장소는 읽기-수정-쓰기 방식이므로 동시 저장을 직렬화
+            with save_lock:
+                with span("repository_save"):
+                    repository.save(result)
+        recorder.record("total", time.perf_counter() - started)
+        recorder.finish(True)
+    except AppError as e:
+        recorder.record_error(_failed_stage(timer), e.error_type)
+        recorder.finish(False)
+    except Exception as e:
+        recorder.record_error(_failed_stage(timer), type(e).__name__)
+        recorder.finish(False)
+    finally:
+        for stage, seconds, ok in timer.spans:
+            if ok:
+                recorder.record(stage, seconds)
+
+
+def _failed_stage(timer) -> str:
+    failed = [stage for stage, _, ok in timer.spans if not ok]
+    return failed[-1] if failed else "unknown"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TrendTracker 파이프라인 부하 생성기")
+    parser.add_argument("--qps", type=float, default=2.0, help="초당 시작할 분석 수")
+    parser.add_argument("--duration", type=float, default=30.0, help="부하 지속 시간(초)")
+    parser.add_argument("--concurrency", type=int, default=32, help="최대 동시 실행 파이프라인 수")
+    parser.add_argument("--num-results", type=int, default=5, help="분석당 뉴스 건수")
+    parser.add_argument("--keywords", default=None, help="키워드 목록 파일 (한 줄에 하나)")
+    parser.add_argument("--csv-path", default=None, help="저장소 CSV 경로 (기본: 임시 파일)")
+    parser.add_argument("--no-fakes", action="store_true", help="대체 서버를 띄우지 않고 현재 환경변수 설정 사용")
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+    parser.add_argument("--seed", type=int, default=None)
+    add_backend_arguments(parser)
+    args = parser.parse_args()
+
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    server = None
+    if not args.no_fakes:
+        server, base_url, _ = start_fake_backends(config_from_args(args))
+        # 설정 모듈이 로드되기 전에 대체 서버를 가리키도록 지정
+        os.environ["TAVILY_BASE_URL"] = base_url
+        os.environ["GEMINI_BASE_URL"] = base_url + "/"
+        os.environ.setdefault("TAVILY_API_KEY", "tvly-fake")
+        os.environ.setdefault("GEMINI_API_KEY", "fake-gemini-key")
+    os.environ.setdefault("HTTP_POOL_SIZE", str(args.concurrency))
+    # 모든 요청이 API(대체 서버)까지 가도록 공유 캐시를 끔 (앱의 캐시 파일에 벤치마크 응답을 남기지 않음)
+    os.environ.update(SHARED_CACHE_PATH="", SEARCH_CACHE_SECONDS="0", GEMINI_CACHE_SECONDS="0")
+
+    from repositories.search_repository import SearchRepository
+
+    keywords = DEFAULT_KEYWORDS
+    if args.keywords:
+        with open(args.keywords, "r", encoding="utf-8") as f:
+            keywords = [line.strip() for line in f if line.strip()]
+
+    csv_path = args.csv_path or os.path.join(tempfile.mkdtemp(prefix="trendtracker-load-"), "search_history.csv")
+    repository = SearchRepository(csv_path)
+    save_lock = threading.Lock()
+    recorder = LoadRecorder()
+
+    # 개방 루프(open-loop) 스케줄: 응답 지연과 무관하게 일정 간격으로 작업을 시작
+    interval = 1.0 / args.qps
+    total_jobs = int(args.duration * args.qps)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        for i in range(total_jobs):
+            target = started + i * interval
+            delay = target - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            executor.submit(
+                run_pipeline_once, random.choice(keywords), args.num_results,
+                repository, save_lock, recorder
+            )
+    elapsed = time.perf_counter() - started
+
+    report = {
+        "target_qps": args.qps,
+        "duration_s": round(elapsed, 2),
+        "submitted": total_jobs,
+        "completed": recorder.completed,
+        "failed": recorder.failed,
+        "throughput_qps": round(recorder.completed / elapsed, 3) if elapsed else 0.0,
+        "stages": {stage: summarize_latencies(recorder.latencies.get(stage, [])) for stage in STAGES},
+        "errors": dict(recorder.errors),
+        "csv_path": csv_path,
+    }
+    if server is not None:
+        report["backend_requests"] = dict(server.RequestHandlerClass.counters)
+        server.shutdown()
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+
+
+if __name__ == "__main__":
+    main()
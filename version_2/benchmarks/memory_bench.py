@@ -0,0 +1,210 @@
+"""
+검색 기록 전체를 SearchResult/NewsArticle 객체로 불러올 때의 메모리 사용량을 비교하는 벤치마크입니다.
+
+- before: 변경 전 방식 - iterrows로 기사마다 발행일 문자열을 새로 만들고, __dict__가 있는 일반 dataclass 사용
+- after: SearchRepository.find_all - 열 단위 순회, 같은 시각의 발행일 문자열 공유, 슬롯 dataclass
+
+tracemalloc으로 DataFrame과 객체 생성 후 남아 있는 메모리를 측정하여 기사 1건당 바이트로 보고합니다.
+--csv를 주지 않으면 실제 기록과 비슷한 길이(스니펫 약 900자, 요약 약 740자, 인사이트 약 1300자)의
+합성 기록을 --searches건 만듭니다.
+
+실행 (version_2 디렉터리에서):
+    python -m benchmarks.memory_bench --searches 100000
+    python -m benchmarks.memory_bench --csv data/search_history.csv
+"""
+import argparse
+import csv
+import dataclasses
+import gc
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from domain.news_article import NewsArticle
+from domain.search_result import SearchResult
+from repositories.search_repository import SearchRepository
+
+SENTENCES = [
+    "관련 업계에 따르면 올해 들어 시장 규모가 빠르게 커지고 있습니다.",
+    "전문가들은 규제 환경의 변화가 향후 성장의 핵심 변수가 될 것이라고 분석했습니다.",
+    "주요 기업들은 신규 서비스 출시와 함께 투자 확대 계획을 잇따라 발표했습니다.",
+    "소비자들의 관심이 높아지면서 관련 서비스 이용자 수가 꾸준히 늘고 있습니다.",
+    "정부는 산업 경쟁력 강화를 위한 지원 방안을 마련하겠다고 밝혔습니다.",
+    "일각에서는 과열 양상에 대한 우려의 목소리도 나오고 있습니다.",
+]
+KEYWORDS = ["생성형 AI", "바이브코딩 피로감", "디지털 헬스케어", "전기차 배터리", "반도체 수출", "기후테크"]
+
+
+def legacy_class(cls):
+    """슬롯 도입 전과 같은 (인스턴스마다 __dict__가 있는) dataclass 사본을 만듭니다."""
+    return dataclasses.make_dataclass(
+        f"Legacy{cls.__name__}",
+        [
+            (f.name, f.type, dataclasses.field(default=f.default, default_factory=f.default_factory))
+            for f in dataclasses.fields(cls)
+        ],
+    )
+
+
+LegacyNewsArticle = legacy_class(NewsArticle)
+LegacySearchResult = legacy_class(SearchResult)
+
+
+def text(rng: random.Random, length: int, suffix: str) -> str:
+    parts = []
+    while sum(len(part) for part in parts) < length:
+        parts.append(rng.choice(SENTENCES))
+    return " ".join(parts) + f" ({suffix})"
+
+
+def write_history(path: str, searches: int, articles: int, seed: int = 0):
+    """검색 searches건 × 기사 articles건의 합성 기록 CSV를 만듭니다."""
+    rng = random.Random(seed)
+    started = datetime(2025, 1, 1)
+    with open(path, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow([
+            "search_key", "search_time", "keyword", "article_index", "title", "url", "snippet",
+            "ai_summary", "ai_insights", "trends_url", "parent_key", "summary_mode", "pub_date"
+        ])
+        for i in range(searches):
+            keyword = KEYWORDS[i % len(KEYWORDS)]
+            search_time = started + timedelta(minutes=i)
+            search_key = f"{keyword}-{search_time:%Y%m%d%H%M}"
+            summary = text(rng, 740, f"요약 {i}")
+            insights = text(rng, 1300, f"인사이트 {i}")
+            trends_url = f"https://trends.google.com/trends/explore?q={keyword}&geo=KR"
+            for index in range(1, articles + 1):
+                writer.writerow([
+                    search_key, search_time.isoformat(sep=" "), keyword, index,
+                    text(rng, 35, f"{i}-{index}"), f"https://news.example.co.kr/article/{i}/{index}",
+                    text(rng, 900, f"{i}-{index}"), summary, insights, trends_url, "", "full",
+                    (search_time - timedelta(hours=index)).isoformat() + "+00:00",
+                ])
+
+
+def legacy_frame(csv_path: str):
+    """변경 전 load()와 같이 문자열 공유 없이 읽습니다."""
+    import pandas as pd
+
+    df = pd.read_csv(csv_path)
+    published = df["pub_date"] if "pub_date" in df.columns else pd.Series(pd.NaT, index=df.index)
+    df["pub_date"] = pd.to_datetime(published, utc=True, errors="coerce", format="ISO8601")
+    return df
+
+
+def legacy_results(df) -> list:
+    """변경 전 find_by_key와 같은 방식(iterrows, 기사마다 발행일 문자열 생성)으로 전체 객체를 만듭니다."""
+    import pandas as pd
+
+    results = []
+    for _, result_df in df.groupby("search_key", sort=False):
+        first_row = result_df.iloc[0]
+        articles = []
+        for _, row in result_df.sort_values("article_index").iterrows():
+            if row["article_index"] > 0:
+                pub_date = row["pub_date"]
+                articles.append(LegacyNewsArticle(
+                    title=str(row["title"]),
+                    url=str(row["url"]),
+                    snippet=str(row["snippet"]),
+                    pub_date="" if pd.isna(pub_date) else pub_date.isoformat()
+                ))
+        parent_key, summary_mode = first_row.get("parent_key"), first_row.get("summary_mode")
+        results.append(LegacySearchResult(
+            search_key=str(first_row["search_key"]),
+            search_time=pd.to_datetime(first_row["search_time"]).to_pydatetime(),
+            keyword=str(first_row["keyword"]),
+            articles=articles,
+            ai_summary=str(first_row["ai_summary"]),
+            ai_insights=str(first_row.get("ai_insights", "")),
+            trends_url=str(first_row.get("trends_url", "")),
+            parent_key="" if pd.isna(parent_key) else str(parent_key),
+            summary_mode="full" if pd.isna(summary_mode) else str(summary_mode)
+        ))
+    return results
+
+
+def measure(load_frame, build_objects) -> dict:
+    """DataFrame 로드와 객체 생성 후 남아 있는 메모리(바이트)를 측정합니다."""
+    gc.collect()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    started = time.perf_counter()
+    frame = load_frame()
+    load_seconds = time.perf_counter() - started
+    gc.collect()
+    frame_bytes = tracemalloc.get_traced_memory()[0] - base
+
+    started = time.perf_counter()
+    objects = build_objects(frame)
+    build_seconds = time.perf_counter() - started
+    gc.collect()
+    object_bytes = tracemalloc.get_traced_memory()[0] - base - frame_bytes
+    tracemalloc.stop()
+
+    articles = sum(len(result.articles) for result in objects)
+    report = {
+        "searches": len(objects),
+        "articles": articles,
+        "frame_bytes_per_article": round(frame_bytes / articles),
+        "object_bytes_per_article": round(object_bytes / articles),
+        "total_bytes_per_article": round((frame_bytes + object_bytes) / articles),
+        "total_mb": round((frame_bytes + object_bytes) / 1e6, 1),
+        "load_s": round(load_seconds, 2),
+        "build_s": round(build_seconds, 2),
+    }
+    del frame, objects
+    gc.collect()
+    return report
+
+
+def bench(csv_path: str) -> dict:
+    # pandas 하위 모듈 임포트 등 일회성 할당이 첫 측정에 섞이지 않도록 작은 기록으로 먼저 실행
+    warmup = os.path.join(tempfile.mkdtemp(prefix="trendtracker-memory-"), "warmup.csv")
+    write_history(warmup, 2, 2)
+    legacy_results(legacy_frame(warmup))
+    SearchRepository(warmup).find_all()
+    shutil.rmtree(os.path.dirname(warmup), ignore_errors=True)
+
+    repository = SearchRepository(csv_path)
+    before = measure(lambda: legacy_frame(csv_path), legacy_results)
+    after = measure(repository.load, lambda df: repository.find_all())
+    return {
+        "csv_mb": round(os.path.getsize(csv_path) / 1e6, 1),
+        "before": before,
+        "after": after,
+        "total_reduction": round(1 - after["total_bytes_per_article"] / before["total_bytes_per_article"], 3),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="검색 기록 객체 메모리 벤치마크")
+    parser.add_argument("--csv", default=None, help="측정할 검색 기록 CSV (없으면 합성 기록 생성)")
+    parser.add_argument("--searches", type=int, default=100000, help="합성 기록의 검색 수")
+    parser.add_argument("--articles", type=int, default=5, help="합성 기록의 검색당 기사 수")
+    args = parser.parse_args()
+
+    workdir = None
+    csv_path = args.csv
+    if csv_path is None:
+        workdir = tempfile.mkdtemp(prefix="trendtracker-memory-")
+        csv_path = os.path.join(workdir, "search_history.csv")
+        write_history(csv_path, args.searches, args.articles)
+    try:
+        report = bench(csv_path)
+    finally:
+        if workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
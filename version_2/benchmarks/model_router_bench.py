@@ -0,0 +1,110 @@
+"""
+Gemini 모델 라우팅(services.model_router.ModelRouter)과 헤지 요청의 효과를 측정하는 벤치마크입니다.
+
+로컬 대체 서버에서 모델별 지연을 다르게 두고 뉴스 요약 --requests건을 --concurrency개씩 동시에 보내,
+모드별 요약 지연 p50/p95/p99와 모델별 호출 수, 헤지 요청 수를 비교합니다.
+- single: 한 모델만 호출 (변경 전과 같음)
+- routed: 느리거나 실패하는 모델을 대체 모델로 우회 (헤지 없음)
+- hedged: routed + 첫 모델이 최근 p95 안에 응답하지 않으면 대체 모델에도 요청
+
+시나리오:
+- tail: 기본 모델의 지연 꼬리가 김 (lognormal:3000:1.0), 대체 모델은 빠르고 안정적 (lognormal:1200:0.3)
+- degraded: 기본 모델이 계속 느림 (constant:6000, --slow-seconds 초과)
+
+실행 (version_2 디렉터리에서):
+    python -m benchmarks.model_router_bench --requests 120 --concurrency 8
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.fake_backends import FakeBackendConfig, LatencyDistribution, start_fake_backends
+from benchmarks.stats import summarize_latencies
+
+PRIMARY = "gemini-2.5-flash"
+FALLBACK = "gemini-2.5-flash-lite"
+
+SCENARIOS = {
+    "tail": {PRIMARY: "lognormal:3000:1.0", FALLBACK: "lognormal:1200:0.3"},
+    "degraded": {PRIMARY: "constant:6000", FALLBACK: "lognormal:1200:0.3"},
+}
+MODES = {
+    "single": {"fallbacks": [], "hedge": False},
+    "routed": {"fallbacks": [FALLBACK], "hedge": False},
+    "hedged": {"fallbacks": [FALLBACK], "hedge": True},
+}
+
+
+def run_mode(scenario: str, mode: str, args: argparse.Namespace) -> dict:
+    from config.settings import Settings
+    from domain.news_article import NewsArticle
+    from services.ai_service import AIService
+    from services.model_router import ModelRouter
+    from utils.metrics import registry
+
+    Settings.GEMINI_HEDGE_REQUESTS = MODES[mode]["hedge"]
+    service = AIService()
+    service.router = ModelRouter(
+        PRIMARY, {}, MODES[mode]["fallbacks"], min_samples=args.min_samples, slow_seconds=args.slow_seconds
+    )
+    hedged_before = registry.get_counter("trendtracker_gemini_hedged_total", {"task": "summarize", "model": FALLBACK})
+
+    def summarize(i: int) -> float:
+        # 요청마다 프롬프트가 달라 공유 캐시에 걸리지 않음
+        articles = [NewsArticle(f"{scenario} {mode} 기사 {i}", f"https://example.com/{i}", "최신 동향", "")]
+        started = time.perf_counter()
+        service.summarize_news(articles)
+        return time.perf_counter() - started
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        latencies = list(executor.map(summarize, range(args.requests)))
+    snapshot = service.router.snapshot()
+    return {
+        "latency": {**summarize_latencies(latencies), "max_ms": round(max(latencies) * 1000, 2)},
+        "calls": {model: stats["calls"] for model, stats in snapshot.items()},
+        "hedged": int(registry.get_counter(
+            "trendtracker_gemini_hedged_total", {"task": "summarize", "model": FALLBACK}
+        ) - hedged_before),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Gemini 모델 라우팅/헤지 벤치마크")
+    parser.add_argument("--requests", type=int, default=120, help="모드별 요약 요청 수")
+    parser.add_argument("--concurrency", type=int, default=8, help="동시에 보낼 요청 수")
+    parser.add_argument("--min-samples", type=int, default=10, help="라우팅/헤지 판단에 필요한 최소 호출 수")
+    parser.add_argument("--slow-seconds", type=float, default=5.0, help="이 p95 지연(초)을 넘는 모델을 뒤로 미룸")
+    parser.add_argument("--scenario", choices=list(SCENARIOS), nargs="+", default=list(SCENARIOS))
+    args = parser.parse_args()
+
+    os.environ.update(
+        GEMINI_API_KEY="fake-gemini-key", SHARED_CACHE_PATH="", GEMINI_CACHE_SECONDS="0",
+        ANALYSIS_DEADLINE_SECONDS="0", GEMINI_TIMEOUT_SECONDS="60"
+    )
+    from config.settings import Settings
+    from services import client_pool
+
+    report = {}
+    for scenario in args.scenario:
+        server, base_url, _ = start_fake_backends(FakeBackendConfig(gemini_model_latency={
+            model: LatencyDistribution.parse(spec) for model, spec in SCENARIOS[scenario].items()
+        }))
+        # 시나리오마다 새 대체 서버 주소로 클라이언트를 다시 만듦
+        Settings.GEMINI_BASE_URL = base_url + "/"
+        client_pool._genai_clients.clear()
+        try:
+            report[scenario] = {
+                "latency_ms": SCENARIOS[scenario],
+                **{mode: run_mode(scenario, mode, args) for mode in MODES},
+            }
+        finally:
+            server.shutdown()
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
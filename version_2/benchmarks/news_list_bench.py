@@ -0,0 +1,161 @@
+"""
+기사 수가 많은 검색 결과(기본 100건)의 관련 뉴스 탭 rerun 시간과 저장 비용을 비교하는 벤치마크입니다.
+
+- rerun: AppTest로 관련 뉴스 목록을 표시한 상태에서 다른 위젯을 눌러 rerun하는 시간
+    - all: 변경 전 방식 - 기사마다 Expander를 모두 렌더링
+    - page_N: components.result_section.render_news_list - 페이지당 N건만 렌더링
+- csv_kb_per_search: 검색 1건을 저장한 CSV 크기 (변경 전: AI 요약/인사이트를 기사 행마다 반복, 변경 후: 첫 행에만)
+- save_ms: 기존 기록(--rows행)에 검색 1건을 저장하는 시간 (변경 전: 파일 전체 다시 쓰기, 변경 후: 덧붙이기)
+
+실행 (version_2 디렉터리에서):
+    python -m benchmarks.news_list_bench --articles 100 --rows 20000
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import pandas as pd
+
+from benchmarks.repository_bench import _insights, _paragraph, _summary, generate_history
+from domain.news_article import NewsArticle
+from domain.search_result import SearchResult
+from repositories.search_repository import SearchRepository
+
+# AppTest로 실행할 스크립트 - 결과를 저장소에서 읽어 관련 뉴스 목록만 표시
+SCRIPT = """
+import streamlit as st
+from repositories.search_repository import SearchRepository
+from components.result_section import render_news_list
+
+res = SearchRepository({csv_path!r}).find_by_key({search_key!r})
+st.button("rerun")
+if {paginate!r}:
+    st.session_state.setdefault("news_page_size", {page_size!r})
+    render_news_list(res.articles, res.search_key)
+else:
+    st.subheader("📰 관련 뉴스 기사")
+    for i, article in enumerate(res.articles, 1):
+        with st.expander(f"{{i}}. {{article.title}}"):
+            st.markdown(f"**[기사 원문 보기]({{article.url}})**")
+            st.write(article.snippet)
+            if article.pub_date and article.pub_date != "날짜 정보 없음":
+                st.caption(f"발행일: {{article.pub_date}}")
+"""
+
+
+def make_result(articles: int, seed: int = 0) -> SearchResult:
+    """실제 기록과 비슷한 길이의 텍스트를 가진 기사 articles건의 검색 결과를 만듭니다."""
+    rng = random.Random(seed)
+    return SearchResult(
+        search_key="벤치마크-209901010000",
+        search_time=datetime(2099, 1, 1),
+        keyword="벤치마크",
+        articles=[
+            NewsArticle(title=f"벤치마크 기사 {i}", url=f"https://example.com/{i}",
+                        snippet=_paragraph(rng, 900), pub_date="Mon, 02 Feb 2026 09:00:00 GMT")
+            for i in range(articles)
+        ],
+        ai_summary=_summary(rng, "벤치마크"),
+        ai_insights=_insights(rng, "벤치마크"),
+        trends_url="https://trends.google.com/trends/explore?q=%EB%B2%A4%EC%B9%98%EB%A7%88%ED%81%AC"
+    )
+
+
+def legacy_records(result: SearchResult) -> list:
+    """변경 전 to_records와 같이 AI 요약/인사이트를 기사 행마다 반복합니다."""
+    return [
+        dict(record, ai_summary=result.ai_summary, ai_insights=result.ai_insights)
+        for record in result.to_records()
+    ]
+
+
+def rerun_ms(csv_path: str, search_key: str, paginate: bool, page_size: int, repeat: int) -> dict:
+    from streamlit.testing.v1 import AppTest
+
+    script = SCRIPT.format(csv_path=csv_path, search_key=search_key, paginate=paginate, page_size=page_size)
+    at = AppTest.from_string(script, default_timeout=120)
+    at.run()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        at.button[0].click().run()
+        samples.append(time.perf_counter() - started)
+    assert not at.exception, at.exception
+    return {"expanders": len(at.expander), "rerun_ms_median": round(statistics.median(samples) * 1000, 1)}
+
+
+def save_ms(history_path: str, workdir: str, result: SearchResult, legacy: bool, repeat: int) -> float:
+    """기존 기록 사본에 결과 1건을 저장하는 시간의 중앙값(ms)"""
+    samples = []
+    for i in range(repeat):
+        path = os.path.join(workdir, f"save_{i}.csv")
+        shutil.copy(history_path, path)
+        repository = SearchRepository(path)
+        repository.load()
+        started = time.perf_counter()
+        if legacy:
+            # 변경 전 save_many: 캐시된 기록과 새 행을 합쳐 파일 전체를 다시 씀
+            new_df = pd.DataFrame(legacy_records(result), columns=repository.columns)
+            new_df["pub_date"] = pd.to_datetime(new_df["pub_date"], utc=True, errors="coerce", format="mixed")
+            final_df = pd.concat([repository.load(), new_df], ignore_index=True)
+            final_df.to_csv(path, index=False, encoding="utf-8-sig")
+        else:
+            repository.save(result)
+        samples.append(time.perf_counter() - started)
+        os.remove(path)
+    return round(statistics.median(samples) * 1000, 1)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="관련 뉴스 목록 페이지 나누기 벤치마크")
+    parser.add_argument("--articles", type=int, default=100, help="검색 1건의 기사 수")
+    parser.add_argument("--rows", type=int, default=20000, help="저장 시간 측정용 기존 기록 행 수")
+    parser.add_argument("--repeat", type=int, default=10, help="반복 횟수 (중앙값 보고)")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="trendtracker-news-list-")
+    try:
+        result = make_result(args.articles)
+        csv_path = os.path.join(workdir, "search_history.csv")
+        SearchRepository(csv_path).save(result)
+
+        legacy_path = os.path.join(workdir, "legacy.csv")
+        pd.DataFrame(legacy_records(result)).to_csv(legacy_path, index=False, encoding="utf-8-sig")
+
+        rerun = {"all": rerun_ms(csv_path, result.search_key, False, 0, args.repeat)}
+        for page_size in (10, 20, 50):
+            rerun[f"page_{page_size}"] = rerun_ms(csv_path, result.search_key, True, page_size, args.repeat)
+
+        history_path = os.path.join(workdir, "history.csv")
+        generate_history(history_path, args.rows)
+        # 합성 기록을 현재 열 구성으로 변환 (이전 형식이면 저장할 때마다 전체를 다시 쓰므로)
+        repository = SearchRepository(history_path)
+        repository.load().reindex(columns=repository.columns).to_csv(history_path, index=False, encoding="utf-8-sig")
+        report = {
+            "articles": args.articles,
+            "rerun": rerun,
+            "csv_kb_per_search": {
+                "before": round(os.path.getsize(legacy_path) / 1024, 1),
+                "after": round(os.path.getsize(csv_path) / 1024, 1),
+            },
+            "save_ms": {
+                "history_rows": args.rows,
+                "before": save_ms(history_path, workdir, result, True, args.repeat),
+                "after": save_ms(history_path, workdir, result, False, args.repeat),
+            },
+        }
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
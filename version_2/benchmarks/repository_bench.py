@@ -0,0 +1,284 @@
+"""
+SearchRepository 벤치마크입니다.
+
+data/search_history.csv와 같은 형태(한국어 텍스트, 여러 줄 AI 요약, 검색당 1~10개 기사)의
+합성 기록을 여러 규모로 생성하고 save / load / get_all_keys / find_by_key / get_all_as_csv의
+소요 시간과 최대 메모리를 측정합니다. load는 매번 새 리포지토리로 CSV를 파싱하는 경우(load)와
+파일 버전별 DataFrame 캐시에 걸리는 경우(load_warm)를 따로 측정하며, 나머지 조회는 캐시된 DataFrame을 사용합니다. 결과는 JSON으로 저장되며, 기준 결과와 비교해
+임계값 이상 느려지거나 메모리가 늘어난 항목을 회귀로 표시합니다.
+
+실행 (version_2 디렉터리에서):
+    python -m benchmarks.repository_bench --scales 1000,100000,1000000 --output bench_repo.json
+    python -m benchmarks.repository_bench --scales 1000,100000 --baseline bench_repo.json --threshold 0.2
+    python -m benchmarks.repository_bench --compare-only new.json bench_repo.json
+
+회귀가 발견되면 종료 코드 1을 반환하므로 CI 게이트로 사용할 수 있습니다.
+행당 약 7.5KB이므로 1,000,000행 규모는 약 7GB의 디스크와 그 이상의 메모리가 필요합니다.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List
+
+import pandas as pd
+
+OPERATIONS = ["load", "load_warm", "get_all_keys", "find_by_key", "get_all_as_csv", "save"]
+CHUNK_ROWS = 50_000
+
+_KEYWORDS = [
+    "바이브코딩 피로감", "생성형 AI", "반도체 수출", "전기차 배터리", "K-콘텐츠",
+    "금리 인하", "저출산 대책", "기후 위기", "부동산 시장", "AI 반도체",
+    "디지털 헬스케어", "우주 산업", "탄소 중립", "로봇 자동화", "메타버스",
+]
+_SENTENCES = [
+    "인공지능 기술이 산업 전반으로 빠르게 확산되면서 기업들의 대응 전략이 주목받고 있습니다.",
+    "전문가들은 관련 규제와 제도 정비가 시급하다고 지적했습니다.",
+    "시장 조사 기관에 따르면 관련 시장 규모는 내년까지 두 배 이상 성장할 전망입니다.",
+    "정부는 연구 개발 지원과 인재 양성을 위한 예산을 확대하기로 했습니다.",
+    "일부에서는 과열 양상과 피로감을 우려하는 목소리도 나오고 있습니다.",
+    "소비자들의 관심이 높아지면서 관련 서비스 이용자 수가 꾸준히 늘고 있습니다.",
+    "업계는 글로벌 경쟁 심화에 대비해 협력 체계를 강화하고 있습니다.",
+    "이번 발표는 향후 정책 방향을 가늠할 수 있는 계기가 될 것으로 보입니다.",
+]
+
+
+def _paragraph(rng: random.Random, target_chars: int) -> str:
+    parts: List[str] = []
+    length = 0
+    while length < target_chars:
+        sentence = rng.choice(_SENTENCES)
+        parts.append(sentence)
+        length += len(sentence) + 1
+    return " ".join(parts)
+
+
+def _summary(rng: random.Random, keyword: str) -> str:
+    """실제 데이터처럼 불릿 포인트가 있는 여러 줄 마크다운 요약을 생성합니다."""
+    bullets = [f"*   '{keyword}' 관련: {_paragraph(rng, 120)}" for _ in range(5)]
+    return "다음 뉴스 기사들의 핵심 내용은 다음과 같습니다:\n\n" + "\n".join(bullets)
+
+
+def _insights(rng: random.Random, keyword: str) -> str:
+    sections = ["1. 🌟 현재 위상", "2. 💡 핵심 동력", "3. 🚀 미래 전망", "4. ⚠️ 주의점"]
+    return "\n\n".join(f"**{title}**\n{keyword}: {_paragraph(rng, 300)}" for title in sections)
+
+
+def generate_history(csv_path: str, total_rows: int, seed: int = 42) -> int:
+    """
+    약 total_rows개의 행을 가진 합성 검색 기록 CSV를 생성합니다.
+    메모리 사용을 제한하기 위해 청크 단위로 이어 씁니다.
+
+    Returns:
+        int: 생성된 고유 검색(search_key) 수
+    """
+    rng = random.Random(seed)
+    start_time = datetime(2025, 1, 1)
+    rows: List[dict] = []
+    written = 0
+    searches = 0
+    first_chunk = True
+
+    def flush():
+        nonlocal rows, first_chunk
+        if not rows:
+            return
+        df = pd.DataFrame(rows)
+        df.to_csv(
+            csv_path,
+            index=False,
+            mode="w" if first_chunk else "a",
+            header=first_chunk,
+            encoding="utf-8-sig" if first_chunk else "utf-8"
+        )
+        first_chunk = False
+        rows = []
+
+    while written < total_rows:
+        keyword = rng.choice(_KEYWORDS)
+        search_time = start_time + timedelta(minutes=searches * 7, seconds=rng.random())
+        search_key = f"{keyword}-{search_time.strftime('%Y%m%d%H%M')}"
+        summary = _summary(rng, keyword)
+        insights = _insights(rng, keyword)
+        trends_url = f"https://trends.google.com/trends/explore?q={keyword}&geo=KR&date=now%207-d"
+        num_articles = min(rng.randint(1, 10), total_rows - written)
+        for index in range(1, num_articles + 1):
+            rows.append({
+                "search_key": search_key,
+                "search_time": search_time.isoformat(sep=" "),
+                "keyword": keyword,
+                "article_index": index,
+                "title": f"{keyword} {_paragraph(rng, 30)[:40]}",
+                "url": f"https://www.news.example.co.kr/article/{searches}/{index}",
+                "snippet": _paragraph(rng, 900),
+                "ai_summary": summary,
+                "ai_insights": insights,
+                "trends_url": trends_url,
+            })
+        written += num_articles
+        searches += 1
+        if len(rows) >= CHUNK_ROWS:
+            flush()
+    flush()
+    return searches
+
+
+def _measure(func: Callable, repeat: int) -> Dict[str, float]:
+    """함수의 소요 시간(중앙값)과 tracemalloc 기준 최대 메모리를 측정합니다."""
+    timings = []
+    peak = 0
+    for _ in range(repeat):
+        tracemalloc.start()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return {
+        "seconds": round(statistics.median(timings), 5),
+        "peak_mb": round(peak / (1024 * 1024), 2),
+    }
+
+
+def bench_scale(total_rows: int, data_dir: str, repeat: int) -> dict:
+    """하나의 규모에 대해 모든 리포지토리 연산을 측정합니다."""
+    from domain.news_article import NewsArticle
+    from domain.search_result import SearchResult
+    from repositories.search_repository import SearchRepository
+
+    csv_path = os.path.join(data_dir, f"history_{total_rows}.csv")
+    gen_start = time.perf_counter()
+    searches = generate_history(csv_path, total_rows)
+    gen_seconds = time.perf_counter() - gen_start
+
+    repository = SearchRepository(csv_path)
+    keys = repository.get_all_keys()
+    rng = random.Random(7)
+    probe_key = rng.choice(keys)
+
+    rng_text = random.Random(11)
+    new_result = SearchResult(
+        search_key="벤치마크-209901010000",
+        search_time=datetime(2099, 1, 1),
+        keyword="벤치마크",
+        articles=[
+            NewsArticle(title=f"벤치마크 기사 {i}", url=f"https://example.com/{i}",
+                        snippet=_paragraph(rng_text, 900), pub_date="")
+            for i in range(5)
+        ],
+        ai_summary=_summary(rng_text, "벤치마크"),
+        ai_insights=_insights(rng_text, "벤치마크"),
+        trends_url=""
+    )
+
+    operations = {
+        # 캐시가 없는 새 인스턴스로 CSV 파싱 시간을 측정 (회귀 게이트의 기준)
+        "load": lambda: SearchRepository(csv_path).load(),
+        "load_warm": repository.load,
+        "get_all_keys": repository.get_all_keys,
+        "find_by_key": lambda: repository.find_by_key(probe_key),
+        "get_all_as_csv": repository.get_all_as_csv,
+        "save": lambda: repository.save(new_result),
+    }
+    results = {name: _measure(operations[name], repeat) for name in OPERATIONS}
+    return {
+        "rows": total_rows,
+        "searches": searches,
+        "file_mb": round(os.path.getsize(csv_path) / (1024 * 1024), 2),
+        "generate_seconds": round(gen_seconds, 2),
+        "operations": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> List[str]:
+    """
+    기준 결과 대비 시간 또는 메모리가 threshold 비율 이상 증가한 항목을 반환합니다.
+    """
+    regressions = []
+    for scale, base_entry in baseline.get("scales", {}).items():
+        cur_entry = current.get("scales", {}).get(scale)
+        if not cur_entry:
+            continue
+        for op, base_metrics in base_entry["operations"].items():
+            cur_metrics = cur_entry["operations"].get(op)
+            if not cur_metrics:
+                continue
+            for metric in ("seconds", "peak_mb"):
+                base_value = base_metrics[metric]
+                cur_value = cur_metrics[metric]
+                if base_value > 0 and cur_value > base_value * (1 + threshold):
+                    regressions.append(
+                        f"[{scale} rows] {op}.{metric}: {base_value} -> {cur_value} "
+                        f"(+{(cur_value / base_value - 1) * 100:.1f}%)"
+                    )
+    return regressions
+
+
+def _load_json(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _report_regressions(regressions: List[str], threshold: float) -> int:
+    if regressions:
+        print(f"\n❌ 회귀 감지 (임계값 {threshold * 100:.0f}%):")
+        for line in regressions:
+            print(f"  - {line}")
+        return 1
+    print(f"\n✅ 임계값 {threshold * 100:.0f}% 이내 (회귀 없음)")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="SearchRepository 벤치마크")
+    parser.add_argument("--scales", default="1000,100000,1000000", help="쉼표로 구분한 CSV 행 수")
+    parser.add_argument("--repeat", type=int, default=3, help="연산별 반복 횟수 (중앙값 사용)")
+    parser.add_argument("--data-dir", default=None, help="합성 데이터 저장 경로 (기본: 임시 디렉터리)")
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", default=None, help="비교할 기준 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=0.2, help="회귀 판정 임계값 (0.2 = 20%%)")
+    parser.add_argument("--compare-only", nargs=2, metavar=("CURRENT", "BASELINE"),
+                        help="측정 없이 두 결과 파일만 비교")
+    args = parser.parse_args()
+
+    if args.compare_only:
+        current, baseline = (_load_json(p) for p in args.compare_only)
+        return _report_regressions(compare(current, baseline, args.threshold), args.threshold)
+
+    data_dir = args.data_dir or tempfile.mkdtemp(prefix="trendtracker-repo-bench-")
+    os.makedirs(data_dir, exist_ok=True)
+
+    report = {
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "pandas": pd.__version__,
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+        },
+        "scales": {},
+    }
+    for scale in (int(s) for s in args.scales.split(",") if s.strip()):
+        print(f"▶ {scale:,} rows 측정 중...", file=sys.stderr)
+        report["scales"][str(scale)] = bench_scale(scale, data_dir, args.repeat)
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+
+    if args.baseline:
+        return _report_regressions(compare(report, _load_json(args.baseline), args.threshold), args.threshold)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+"""
+Streamlit rerun 지연 벤치마크입니다.
+
+합성 검색 기록(기본 100,000행)을 만든 뒤 streamlit.testing의 AppTest로 app.py를 실행하고,
+사이드바의 검색 건수 슬라이더를 움직이는 단순한 위젯 상호작용의 rerun 시간을 측정합니다.
+API 호출은 일어나지 않으므로 실제 키 없이 실행됩니다.
+
+실행 (version_2 디렉터리에서):
+    python -m benchmarks.rerun_bench --rows 100000 --interactions 10
+    python -m benchmarks.rerun_bench --rows 100000 --select-history   # 과거 기록을 연 상태에서 측정
+    python -m benchmarks.rerun_bench --rows 100000 --open-history 10  # 과거 기록 열기/탭 전환 시간도 측정
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Streamlit rerun 지연 벤치마크")
+    parser.add_argument("--rows", type=int, default=100_000, help="합성 기록 CSV 행 수")
+    parser.add_argument("--interactions", type=int, default=10, help="슬라이더 조작 횟수")
+    parser.add_argument("--data-dir", default=None, help="합성 데이터 저장 경로 (기존 파일 재사용)")
+    parser.add_argument("--select-history", action="store_true", help="과거 기록을 선택한 상태에서 측정")
+    parser.add_argument("--open-history", type=int, default=0, help="서로 다른 과거 기록을 여는 횟수 (0이면 생략)")
+    parser.add_argument("--timeout", type=float, default=600, help="rerun 1회 최대 대기 시간(초)")
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    from benchmarks.repository_bench import generate_history
+
+    data_dir = args.data_dir or tempfile.mkdtemp(prefix="trendtracker-rerun-bench-")
+    os.makedirs(data_dir, exist_ok=True)
+    csv_path = os.path.join(data_dir, f"history_{args.rows}.csv")
+    if not os.path.exists(csv_path):
+        print(f"▶ {args.rows:,}행 합성 기록 생성 중...", file=sys.stderr)
+        generate_history(csv_path, args.rows)
+
+    # 설정 모듈이 로드되기 전에 지정 (API는 호출되지 않음)
+    os.environ.update({
+        "TAVILY_API_KEY": os.environ.get("TAVILY_API_KEY", "tvly-bench"),
+        "GEMINI_API_KEY": os.environ.get("GEMINI_API_KEY", "bench"),
+        "CSV_PATH": csv_path,
+        "METRICS_PORT": "0",
+        "METRICS_LOG_PATH": os.path.join(data_dir, "metrics.jsonl"),
+        "JOB_DB_PATH": os.path.join(data_dir, "jobs.sqlite3"),
+        "JOB_WORKERS": "0",
+    })
+
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file("app.py", default_timeout=args.timeout)
+    start = time.perf_counter()
+    app.run()
+    first_run = time.perf_counter() - start
+    if app.exception:
+        print(f"❌ 앱 실행 중 예외: {app.exception}", file=sys.stderr)
+        return 1
+
+    if args.select_history:
+        app.selectbox[0].select_index(0)
+        app.run()
+
+    timings = []
+    for i in range(args.interactions):
+        start = time.perf_counter()
+        app.slider[0].set_value(1 + (i % 10)).run()
+        timings.append(time.perf_counter() - start)
+
+    from utils.metrics import registry
+
+    def span_totals() -> dict:
+        # 결과 영역(result_panel)의 기록 조회와 렌더링 구간만 따로 합산
+        return {
+            stage: registry.get_histogram("trendtracker_stage_seconds", {"stage": stage})
+            for stage in ("history_load", "render")
+        }
+
+    history = {}
+    if args.open_history:
+        open_spans = {"history_load": [0.0, 0], "render": [0.0, 0]}
+        open_timings, tab_timings = [], []
+        options = len(app.selectbox[0].options)
+        for i in range(args.open_history):
+            spans_before = span_totals()
+            start = time.perf_counter()
+            app.selectbox[0].select_index((i + 1) % options).run()
+            open_timings.append(time.perf_counter() - start)
+            for stage, (total, count) in span_totals().items():
+                open_spans[stage][0] += total - spans_before[stage][0]
+                open_spans[stage][1] += count - spans_before[stage][1]
+            tabs = [radio for radio in app.radio if radio.key == "result_tab"]
+            for tab in ("news", "insights", "report") if tabs else ():
+                start = time.perf_counter()
+                [radio for radio in app.radio if radio.key == "result_tab"][0].set_value(tab).run()
+                tab_timings.append(time.perf_counter() - start)
+        history["open_history_ms_median"] = round(statistics.median(open_timings) * 1000, 1)
+        if tab_timings:
+            history["tab_switch_ms_median"] = round(statistics.median(tab_timings) * 1000, 1)
+        # 기록을 열 때 result_panel의 조회/렌더링 구간 평균 (앱의 나머지 부분 제외)
+        for stage, (total, count) in open_spans.items():
+            history[f"open_{stage}_ms_mean"] = round(total / count * 1000, 2) if count else None
+
+    report = {
+        "rows": args.rows,
+        "file_mb": round(os.path.getsize(csv_path) / (1024 * 1024), 1),
+        "select_history": args.select_history,
+        "first_run_s": round(first_run, 3),
+        "slider_rerun_ms_median": round(statistics.median(timings) * 1000, 1),
+        "slider_rerun_ms_max": round(max(timings) * 1000, 1),
+        "interactions": args.interactions,
+        **history,
+    }
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+"""
+최근 분석 결과 재사용(SearchRepository.find_recent / analysis_pipeline.find_reusable_result) 벤치마크입니다.
+
+- index: 검색 기록 --rows행에서 키워드 색인을 만드는 시간(파일이 바뀐 뒤 첫 조회)과 이후 조회 1회 시간의 중앙값
+- workload: 키워드 인기도가 Zipf 분포를 따르는 요청 --requests건(띄어쓰기/대소문자만 다른 입력 포함)을
+  --hours시간에 고르게 보냈을 때, 재사용 창(--window분) 안의 같은 분석을 재사용하여 줄어드는 외부 API 호출 수
+
+실행 (version_2 디렉터리에서):
+    python -m benchmarks.reuse_bench --rows 20000 100000
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import timedelta
+
+from benchmarks.repository_bench import generate_history
+from repositories.search_repository import SearchRepository
+from services.analysis_pipeline import estimate_api_calls, SOURCE_AI_INSIGHTS, SOURCE_NEWS
+from utils.input_handler import normalize_keyword
+
+KEYWORDS = [f"키워드 {i}" for i in range(200)]
+
+
+def index_ms(csv_path: str, repeat: int) -> dict:
+    repository = SearchRepository(csv_path)
+    repository.load()
+    keywords = sorted({str(keyword) for keyword in repository.load()["keyword"].unique()})
+    window = timedelta(days=3650)
+
+    started = time.perf_counter()
+    repository.find_recent(keywords[0], ["news", "insights"], window)
+    build = time.perf_counter() - started
+
+    samples = []
+    for _ in range(repeat):
+        for keyword in keywords:
+            started = time.perf_counter()
+            repository.find_recent(keyword, ["news", "insights"], window, min_articles=5)
+            samples.append(time.perf_counter() - started)
+    return {
+        "rows": len(repository.load()),
+        "keywords": len(keywords),
+        "build_ms": round(build * 1000, 1),
+        "lookup_us_median": round(statistics.median(samples) * 1e6, 1),
+    }
+
+
+def variant(rng: random.Random, keyword: str) -> str:
+    """띄어쓰기/대소문자만 다른 입력을 만듭니다."""
+    choice = rng.random()
+    if choice < 0.2:
+        return keyword.replace(" ", "")
+    if choice < 0.3:
+        return f" {keyword}  "
+    return keyword
+
+
+def workload(requests: int, hours: float, window_minutes: int, num_results: int, seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    weights = [1 / (rank + 1) for rank in range(len(KEYWORDS))]
+    sources = [SOURCE_NEWS, SOURCE_AI_INSIGHTS]
+    calls = estimate_api_calls(sources, num_results)
+    window = timedelta(minutes=window_minutes)
+    analyzed_at = {}
+    before = {provider: 0 for provider in calls}
+    after = {provider: 0 for provider in calls}
+    hits = 0
+    for i in range(requests):
+        now = timedelta(hours=hours * i / requests)
+        keyword = normalize_keyword(variant(rng, rng.choices(KEYWORDS, weights)[0]))
+        for provider, count in calls.items():
+            before[provider] += count
+        last = analyzed_at.get(keyword)
+        if window_minutes > 0 and last is not None and now - last <= window:
+            hits += 1
+            continue
+        analyzed_at[keyword] = now
+        for provider, count in calls.items():
+            after[provider] += count
+    return {
+        "requests": requests,
+        "window_minutes": window_minutes,
+        "hit_rate": round(hits / requests, 3),
+        "api_calls_before": before,
+        "api_calls_after": after,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="최근 분석 결과 재사용 벤치마크")
+    parser.add_argument("--rows", type=int, nargs="+", default=[20000, 100000], help="색인 측정용 검색 기록 행 수")
+    parser.add_argument("--repeat", type=int, default=5, help="조회 반복 횟수 (중앙값 보고)")
+    parser.add_argument("--requests", type=int, default=2000, help="모의 요청 수")
+    parser.add_argument("--hours", type=float, default=8, help="모의 요청을 보내는 시간")
+    parser.add_argument("--window", type=int, nargs="+", default=[0, 10, 30, 60], help="재사용 창(분)")
+    parser.add_argument("--num-results", type=int, default=5, help="요청당 기사 수")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="trendtracker-reuse-")
+    try:
+        index = []
+        for rows in args.rows:
+            csv_path = os.path.join(workdir, f"history_{rows}.csv")
+            generate_history(csv_path, rows)
+            index.append(index_ms(csv_path, args.repeat))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    report = {
+        "index": index,
+        "workload": [
+            workload(args.requests, args.hours, window, args.num_results) for window in args.window
+        ],
+    }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""
+키워드별 검색 횟수 대시보드의 조회 시간을 원본 기록 크기별로 비교하는 벤치마크입니다.
+
+- raw: 검색 기록 CSV를 읽어 search_time으로 그룹화 (집계 도입 전 방식, 파일을 처음 읽는 경우와 캐시된 경우)
+- rollup: 미리 집계된 SQLite 테이블에서 대시보드가 실행하는 조회 4개 (최근 구간, 상위 키워드, 추이, 합계)
+- add: 결과 1건 저장 시 집계 갱신에 추가되는 시간
+
+실행 (version_2 디렉터리에서):
+    python -m benchmarks.rollup_bench data/search_history.csv /tmp/history_20000.csv /tmp/history_100000.csv
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from components.dashboard import GRANULARITY_OPTIONS
+from domain.news_article import NewsArticle
+from domain.search_result import SearchResult
+from repositories.rollup_repository import RollupRepository, parse_bucket, recent_buckets
+from repositories.search_repository import SearchRepository
+
+
+def median_ms(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return round(statistics.median(samples) * 1000, 2)
+
+
+def raw_daily_counts(repository: SearchRepository):
+    """집계 없이 전체 기록에서 키워드별 일별 검색 수를 계산합니다."""
+    import pandas as pd
+
+    df = repository.load()
+    heads = df.drop_duplicates("search_key")
+    day = pd.to_datetime(heads["search_time"], format="mixed").dt.strftime("%Y-%m-%d")
+    return heads.assign(day=day).groupby(["day", "keyword"]).size()
+
+
+def dashboard_queries(rollups: RollupRepository, granularity: str = "day", top_n: int = 5):
+    """app.dashboard_panel과 같은 조회를 실행합니다."""
+    latest = rollups.latest_bucket(granularity)
+    buckets = recent_buckets(granularity, GRANULARITY_OPTIONS[granularity][1], parse_bucket(latest))
+    top = rollups.top_keywords(granularity, buckets[0], top_n)
+    rollups.series(granularity, buckets[0], [keyword for keyword, _ in top])
+    rollups.totals(granularity, buckets[0])
+
+
+def bench(csv_path: str, repeat: int) -> dict:
+    workdir = tempfile.mkdtemp(prefix="trendtracker-rollup-")
+    rollups = RollupRepository(os.path.join(workdir, "rollups.sqlite3"))
+
+    started = time.perf_counter()
+    repository = SearchRepository(csv_path, rollups)
+    raw_cold = raw_daily_counts(repository)
+    raw_cold_ms = round((time.perf_counter() - started) * 1000, 2)
+    raw_warm_ms = median_ms(lambda: raw_daily_counts(repository), repeat)
+
+    started = time.perf_counter()
+    rows = repository.rebuild_rollups()
+    rebuild_ms = round((time.perf_counter() - started) * 1000, 2)
+
+    result = SearchResult(
+        search_key="벤치마크-000000000000", search_time=datetime.now(), keyword="벤치마크",
+        articles=[NewsArticle(title="t", url=f"https://example.com/{i}", snippet="s", pub_date="") for i in range(5)]
+    )
+    return {
+        "csv": os.path.basename(csv_path),
+        "csv_mb": round(os.path.getsize(csv_path) / 1e6, 1),
+        "results": int(raw_cold.sum()),
+        "rollup_rows": rows,
+        "raw_cold_ms": raw_cold_ms,
+        "raw_warm_ms": raw_warm_ms,
+        "rebuild_ms": rebuild_ms,
+        "rollup_dashboard_ms": median_ms(lambda: dashboard_queries(rollups), repeat),
+        "rollup_add_ms": median_ms(lambda: rollups.add([result]), repeat),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="키워드 검색 횟수 집계 벤치마크")
+    parser.add_argument("csv", nargs="+", help="검색 기록 CSV 경로 (여러 개 가능)")
+    parser.add_argument("--repeat", type=int, default=20, help="조회 반복 횟수 (중앙값 보고)")
+    args = parser.parse_args()
+
+    report = [bench(path, args.repeat) for path in args.csv]
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+"""
+프로세스 간 공유 캐시(utils.shared_cache.SharedCache) 벤치마크입니다.
+
+- history: 새 프로세스가 검색 기록 --rows행을 처음 읽는 시간
+    - parse: 공유 캐시 없이 CSV 파싱 (변경 전, 프로세스마다/재시작마다 반복)
+    - shared: 다른 프로세스가 파싱해 저장한 DataFrame을 공유 캐시에서 읽음
+- concurrency: --processes개 프로세스가 동시에 get/set을 반복할 때의 처리량, 오류 수,
+  용량 상한(--max-kb)이 지켜졌는지와 제거(eviction) 수
+- lookup_us: 캐시된 API 응답(약 20KB JSON) 1건 조회 시간의 중앙값
+
+실행 (version_2 디렉터리에서):
+    python -m benchmarks.shared_cache_bench --rows 20000 100000
+"""
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+from benchmarks.repository_bench import generate_history
+from repositories.search_repository import SearchRepository
+from utils.shared_cache import SharedCache, make_key
+
+
+def first_load_ms(csv_path: str, cache_path: str, use_cache: bool, queue):
+    """새 프로세스에서 SearchRepository.load() 첫 호출 시간을 잽니다."""
+    cache = SharedCache(cache_path, 1024 * 1024 * 1024) if use_cache else None
+    started = time.perf_counter()
+    df = SearchRepository(csv_path, shared_cache=cache).load()
+    queue.put((round((time.perf_counter() - started) * 1000, 1), len(df)))
+
+
+def in_new_process(target, *args):
+    queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=target, args=args + (queue,))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def history(csv_path: str, cache_path: str, repeat: int) -> dict:
+    parse = [in_new_process(first_load_ms, csv_path, cache_path, False)[0] for _ in range(repeat)]
+    # 첫 프로세스가 파싱하여 공유 캐시에 저장하고, 이후 프로세스는 캐시에서 읽음
+    rows = in_new_process(first_load_ms, csv_path, cache_path, True)[1]
+    shared = [in_new_process(first_load_ms, csv_path, cache_path, True)[0] for _ in range(repeat)]
+    return {
+        "rows": rows,
+        "csv_mb": round(os.path.getsize(csv_path) / 1e6, 1),
+        "parse_ms": statistics.median(parse),
+        "shared_ms": statistics.median(shared),
+        "cache_mb": round(SharedCache(cache_path, 0).stats()["bytes"] / 1e6, 1),
+    }
+
+
+class WarningCounter(logging.Handler):
+    """공유 캐시가 남긴 경고(잠금 대기 초과 등 실패한 get/set) 수를 셉니다."""
+
+    def __init__(self):
+        super().__init__(logging.WARNING)
+        self.count = 0
+
+    def emit(self, record):
+        self.count += 1
+
+
+def hammer(cache_path: str, max_bytes: int, seconds: float, seed: int, queue):
+    """get/set을 무작위로 반복하며 (연산 수, 오류 수)를 보고합니다. (값은 1~8KB)"""
+    errors = WarningCounter()
+    logging.getLogger("utils.shared_cache").addHandler(errors)
+    cache = SharedCache(cache_path, max_bytes)
+    rng = random.Random(seed)
+    operations = 0
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        key = str(rng.randrange(2000))
+        if rng.random() < 0.7:
+            cache.get("bench", key)
+        else:
+            cache.set("bench", key, os.urandom(rng.randrange(1024, 8192)), ttl=60)
+        operations += 1
+    queue.put((operations, errors.count))
+
+
+def concurrency(workdir: str, processes: int, max_kb: int, seconds: float) -> dict:
+    cache_path = os.path.join(workdir, "concurrency.sqlite3")
+    max_bytes = max_kb * 1024
+    SharedCache(cache_path, max_bytes)
+    queue = multiprocessing.Queue()
+    workers = [
+        multiprocessing.Process(target=hammer, args=(cache_path, max_bytes, seconds, seed, queue))
+        for seed in range(processes)
+    ]
+    for worker in workers:
+        worker.start()
+    results = [queue.get() for _ in workers]
+    for worker in workers:
+        worker.join()
+    stats = SharedCache(cache_path, max_bytes).stats()
+    return {
+        "processes": processes,
+        "ops_per_second": round(sum(ops for ops, _ in results) / seconds),
+        "errors": sum(errors for _, errors in results),
+        "entries": stats["entries"],
+        "bytes": stats["bytes"],
+        "max_bytes": max_bytes,
+        "within_bound": stats["bytes"] <= max_bytes,
+    }
+
+
+def lookup_us(workdir: str, repeat: int) -> float:
+    cache = SharedCache(os.path.join(workdir, "lookup.sqlite3"), 64 * 1024 * 1024)
+    results = [
+        {"title": f"기사 {i}", "url": f"https://example.com/{i}", "content": "최신 동향을 다룬 기사입니다. " * 30}
+        for i in range(20)
+    ]
+    key = make_key("키워드", 20, None, [])
+    cache.set_json("tavily", key, results, 300)
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        cache.get_json("tavily", key)
+        samples.append(time.perf_counter() - started)
+    return round(statistics.median(samples) * 1e6, 1)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="프로세스 간 공유 캐시 벤치마크")
+    parser.add_argument("--rows", type=int, nargs="+", default=[20000, 100000], help="검색 기록 행 수")
+    parser.add_argument("--repeat", type=int, default=3, help="새 프로세스 측정 반복 횟수 (중앙값 보고)")
+    parser.add_argument("--processes", type=int, default=4, help="동시 접근 프로세스 수")
+    parser.add_argument("--max-kb", type=int, default=2048, help="동시 접근 측정의 캐시 용량 상한(KB)")
+    parser.add_argument("--seconds", type=float, default=5, help="동시 접근 측정 시간(초)")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="trendtracker-shared-cache-")
+    try:
+        report = {"history": [], "concurrency": None, "lookup_us": None}
+        for rows in args.rows:
+            csv_path = os.path.join(workdir, f"history_{rows}.csv")
+            generate_history(csv_path, rows)
+            report["history"].append(history(csv_path, os.path.join(workdir, f"history_{rows}.sqlite3"), args.repeat))
+        report["concurrency"] = concurrency(workdir, args.processes, args.max_kb, args.seconds)
+        report["lookup_us"] = lookup_us(workdir, 1000)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""
+증분 요약(이전 요약 + 새 기사)과 전체 재요약의 입력 토큰 수와 지연을 비교하는 벤치마크입니다.
+
+저장된 검색 기록(기본 data/search_history.csv)에서 같은 키워드로 연속해서 분석한 결과 쌍을 찾아,
+나중 분석의 기사 전체를 다시 요약하는 경우(full)와 이전 요약에 새 기사만 반영하는 경우(incremental)의
+프롬프트를 각각 Gemini에 보내 응답의 usage_metadata(입력 토큰 수)와 응답 시간을 기록합니다.
+
+기본적으로 로컬 대체 서버를 사용하며, 대체 서버는 입력 토큰 수를 약 2자당 1토큰으로 추정하고
+--gemini-ms-per-1k-tokens 만큼 프롬프트 길이에 비례하는 지연을 추가합니다.
+--live를 지정하면 환경변수의 실제 Gemini API를 사용합니다.
+
+실행 (version_2 디렉터리에서):
+    python -m benchmarks.summary_bench --gemini-latency constant:300 --gemini-ms-per-1k-tokens 200
+    python -m benchmarks.summary_bench --live
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from typing import List
+
+from benchmarks.fake_backends import add_backend_arguments, config_from_args, start_fake_backends
+from benchmarks.stats import summarize_latencies
+
+
+def find_pairs(repository) -> List[tuple]:
+    """같은 키워드의 연속된 (이전 결과, 다음 결과) 쌍을 시간순으로 반환합니다."""
+    df = repository.load()
+    if df.empty:
+        return []
+    heads = df.drop_duplicates("search_key").sort_values("search_time")
+    pairs = []
+    for _, group in heads.groupby("keyword"):
+        keys = group["search_key"].tolist()
+        for prev_key, next_key in zip(keys, keys[1:]):
+            prev = repository.find_by_key(prev_key)
+            nxt = repository.find_by_key(next_key)
+            if prev and nxt and prev.ai_summary and nxt.articles:
+                pairs.append((prev, nxt))
+    return pairs
+
+
+def measure(client, model: str, prompt: str) -> dict:
+    """프롬프트 1건을 보내고 입력 토큰 수와 응답 시간을 반환합니다."""
+    start = time.perf_counter()
+    response = client.models.generate_content(model=model, contents=prompt)
+    elapsed = time.perf_counter() - start
+    usage = response.usage_metadata
+    return {
+        "prompt_tokens": usage.prompt_token_count if usage else None,
+        "prompt_chars": len(prompt),
+        "seconds": elapsed,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="증분 요약 vs 전체 재요약 비교")
+    parser.add_argument("--csv", default="data/search_history.csv", help="녹화된 검색 기록 CSV")
+    parser.add_argument("--live", action="store_true", help="대체 서버 대신 실제 Gemini API 사용")
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+    add_backend_arguments(parser)
+    parser.set_defaults(gemini_latency="constant:300", gemini_ms_per_1k_tokens=200.0)
+    args = parser.parse_args()
+
+    server = None
+    if not args.live:
+        server, base_url, _ = start_fake_backends(config_from_args(args))
+        os.environ["GEMINI_BASE_URL"] = base_url + "/"
+        os.environ.setdefault("GEMINI_API_KEY", "fake-gemini-key")
+
+    from config.settings import Settings
+    from repositories.search_repository import SearchRepository
+    from services.ai_service import build_summary_prompt, build_update_prompt
+    from services.analysis_pipeline import prefer_incremental
+    from services.client_pool import get_genai_client
+
+    pairs = find_pairs(SearchRepository(args.csv))
+    if not pairs:
+        print("❌ 같은 키워드로 두 번 이상 분석한 기록이 없습니다.", file=sys.stderr)
+        return 1
+
+    client = get_genai_client()
+    rows = []
+    for prev, nxt in pairs:
+        seen_urls = {article.url for article in prev.articles}
+        new_articles = [article for article in nxt.articles if article.url not in seen_urls]
+        full = measure(client, Settings.GEMINI_MODEL, build_summary_prompt(nxt.articles))
+        if new_articles:
+            incremental = measure(client, Settings.GEMINI_MODEL, build_update_prompt(prev.ai_summary, new_articles))
+        else:
+            # 새 기사가 없으면 이전 요약을 재사용하므로 호출하지 않음
+            incremental = {"prompt_tokens": 0, "prompt_chars": 0, "seconds": 0.0}
+        # 앱의 실제 선택: 증분 프롬프트가 더 길면 전체 재요약
+        use_incremental = not new_articles or prefer_incremental(prev.ai_summary, nxt.articles, new_articles)
+        rows.append({
+            "keyword": nxt.keyword,
+            "articles": len(nxt.articles),
+            "new_articles": len(new_articles),
+            "full": full,
+            "incremental": incremental,
+            "auto": incremental if use_incremental else full,
+        })
+
+    def total(mode: str, field: str) -> float:
+        return sum(row[mode][field] or 0 for row in rows)
+
+    full_tokens = total("full", "prompt_tokens")
+
+    def mode_summary(mode: str) -> dict:
+        tokens = total(mode, "prompt_tokens")
+        called = [row[mode]["seconds"] for row in rows if row[mode]["prompt_tokens"]]
+        return {
+            "prompt_tokens": int(tokens),
+            "tokens_saved_pct": round((1 - tokens / full_tokens) * 100, 1) if full_tokens else 0.0,
+            "gemini_calls": len(called),
+            "total_seconds": round(total(mode, "seconds"), 3),
+            "latency_per_call": summarize_latencies(called),
+        }
+
+    report = {
+        "source": "live" if args.live else "fake",
+        "pairs": len(rows),
+        "articles": sum(row["articles"] for row in rows),
+        "new_articles": sum(row["new_articles"] for row in rows),
+        # full: 매번 전체 재요약 / incremental: 항상 증분 / auto: 앱의 선택 (증분이 더 짧을 때만 증분)
+        "modes": {mode: mode_summary(mode) for mode in ("full", "incremental", "auto")},
+        "per_pair": [
+            {
+                "keyword": row["keyword"],
+                "new/total": f"{row['new_articles']}/{row['articles']}",
+                "full_tokens": row["full"]["prompt_tokens"],
+                "incremental_tokens": row["incremental"]["prompt_tokens"],
+                "auto_tokens": row["auto"]["prompt_tokens"],
+            }
+            for row in rows
+        ],
+    }
+    if server is not None:
+        server.shutdown()
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
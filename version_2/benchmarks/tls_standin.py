@@ -0,0 +1,65 @@
+import os
+import ssl
+import subprocess
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Tuple, Type
+
+
+def generate_self_signed_cert(directory: Optional[str] = None) -> Tuple[str, str]:
+    """
+    openssl CLI로 localhost용 자체 서명 인증서를 생성합니다.
+
+    Returns:
+        Tuple[str, str]: (인증서 경로, 개인키 경로)
+    """
+    directory = directory or tempfile.mkdtemp(prefix="trendtracker-tls-")
+    cert_path = os.path.join(directory, "cert.pem")
+    key_path = os.path.join(directory, "key.pem")
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+            "-keyout", key_path, "-out", cert_path, "-days", "1",
+            "-subj", "/CN=localhost",
+            "-addext", "subjectAltName=DNS:localhost,IP:127.0.0.1",
+        ],
+        check=True,
+        capture_output=True
+    )
+    return cert_path, key_path
+
+
+def start_server(
+    handler_cls: Type[BaseHTTPRequestHandler],
+    port: int = 0,
+    tls: bool = False,
+    cert_dir: Optional[str] = None
+) -> Tuple[ThreadingHTTPServer, str, Optional[str]]:
+    """
+    로컬 대체 서버를 데몬 스레드에서 실행합니다.
+    tls=True이면 자체 서명 인증서로 HTTPS를 제공하며, TLS 핸드셰이크는
+    accept 스레드가 아닌 요청 처리 스레드에서 수행되어 동시 연결을 직렬화하지 않습니다.
+
+    Returns:
+        Tuple[ThreadingHTTPServer, str, Optional[str]]: (서버, 기본 URL, 인증서 경로)
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler_cls)
+    server.daemon_threads = True
+    cert_path = None
+    scheme = "http"
+
+    if tls:
+        cert_path, key_path = generate_self_signed_cert(cert_dir)
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(cert_path, key_path)
+        server.socket = context.wrap_socket(
+            server.socket, server_side=True, do_handshake_on_connect=False
+        )
+        scheme = "https"
+
+    thread = threading.Thread(target=server.serve_forever, name="standin-server", daemon=True)
+    thread.start()
+    host, bound_port = server.server_address[:2]
+    base_url = f"{scheme}://localhost:{bound_port}"
+    return server, base_url, cert_path
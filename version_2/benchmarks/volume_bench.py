@@ -0,0 +1,121 @@
+"""
+키워드별 기사량 추이 계산 시간을 기사 수별로 비교하는 벤치마크입니다.
+
+- loop: 발행일을 하나씩 KST 날짜로 바꿔 dict로 세고 이동평균을 직접 계산 (파이썬 반복문)
+- vectorized: services.trend_series.build_volume_report (resample/rolling)
+- keyword_dates: SearchRepository.get_article_dates로 기록에서 한 키워드의 발행일을 추리는 시간 (CSV는 미리 로드)
+
+실행 (version_2 디렉터리에서):
+    python -m benchmarks.volume_bench --articles 10000 50000 200000
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+
+from repositories.search_repository import SearchRepository
+from services.trend_series import VOLUME_FREQUENCIES, build_volume_report
+
+KST = timezone(timedelta(hours=9))
+
+
+def median_ms(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return round(statistics.median(samples) * 1000, 2)
+
+
+def synthetic_dates(count: int, days: int = 365, seed: int = 0) -> pd.Series:
+    """최근 days일 사이에 무작위로 흩어진 UTC 발행일 count개를 만듭니다."""
+    rng = np.random.default_rng(seed)
+    end = pd.Timestamp.now(tz="UTC").floor("s")
+    offsets = pd.to_timedelta(rng.integers(0, days * 86400, count), unit="s")
+    return pd.Series(end - offsets)
+
+
+def loop_daily(published: pd.Series) -> list:
+    """벡터화 이전 방식: 날짜별 개수를 세어 빈 날짜를 채운 뒤 이동평균을 직접 계산합니다."""
+    window, periods = VOLUME_FREQUENCIES["D"]
+    seconds = (published.astype("int64") // 10**9).tolist()
+    counts = Counter(datetime.fromtimestamp(second, KST).date() for second in seconds)
+    day, last = min(counts), max(counts)
+    values = []
+    while day <= last:
+        values.append(counts.get(day, 0))
+        day += timedelta(days=1)
+    averages = [
+        sum(values[max(0, i - window + 1):i + 1]) / (i + 1 - max(0, i - window + 1))
+        for i in range(len(values))
+    ]
+    return list(zip(values, averages))[-periods:]
+
+
+def write_history(path: str, published: pd.Series, keywords: int = 50):
+    """기사 수만큼의 행을 가진 검색 기록 CSV를 만듭니다. (키워드 keywords개, 검색당 기사 10건)"""
+    index = np.arange(len(published))
+    df = pd.DataFrame({
+        "search_key": [f"키워드{k}-{i // 10:012d}" for k, i in zip(index % keywords, index)],
+        "search_time": "2026-01-01 00:00:00",
+        "keyword": [f"키워드{k}" for k in index % keywords],
+        "article_index": index % 10 + 1,
+        "title": "제목",
+        "url": [f"https://example.com/{i}" for i in index],
+        "snippet": "요약",
+        "ai_summary": "",
+        "ai_insights": "",
+        "trends_url": "",
+        "parent_key": "",
+        "summary_mode": "",
+        "pub_date": published.map(pd.Timestamp.isoformat),
+    })
+    df.to_csv(path, index=False, encoding="utf-8-sig")
+
+
+def bench(count: int, repeat: int) -> dict:
+    published = synthetic_dates(count)
+    workdir = tempfile.mkdtemp(prefix="trendtracker-volume-")
+    csv_path = os.path.join(workdir, "search_history.csv")
+    write_history(csv_path, published)
+    repository = SearchRepository(csv_path)
+    repository.load()
+
+    vectorized = build_volume_report(published)["D"]
+    looped = loop_daily(published)
+    assert vectorized["articles"].tolist() == [value for value, _ in looped]
+
+    report = {
+        "articles": count,
+        "loop_ms": median_ms(lambda: loop_daily(published), max(1, repeat // 5)),
+        "vectorized_ms": median_ms(lambda: build_volume_report(published), repeat),
+        "keyword_dates_ms": median_ms(lambda: repository.get_article_dates("키워드7"), repeat),
+        "keyword_articles": int(len(repository.get_article_dates("키워드7"))),
+    }
+    shutil.rmtree(workdir, ignore_errors=True)
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="기사량 추이 계산 벤치마크")
+    parser.add_argument("--articles", type=int, nargs="+", default=[10000, 50000, 200000], help="기사 수 (여러 개 가능)")
+    parser.add_argument("--repeat", type=int, default=20, help="반복 횟수 (중앙값 보고)")
+    args = parser.parse_args()
+
+    report = [bench(count, args.repeat) for count in args.articles]
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
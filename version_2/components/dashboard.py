@@ -0,0 +1,72 @@
+import streamlit as st
+from typing import List, Tuple
+
+# 집계 단위별 (표시 이름, 차트에 표시할 구간 수)
+GRANULARITY_OPTIONS = {
+    "hour": ("시간별", 48),
+    "day": ("일별", 30),
+    "week": ("주별", 12),
+}
+
+def render_dashboard_controls() -> Tuple[str, int]:
+    """
+    대시보드의 집계 단위와 표시할 상위 키워드 수 선택 영역을 표시합니다.
+
+    Returns:
+        Tuple[str, int]: (집계 단위, 상위 키워드 수)
+    """
+    col1, col2 = st.columns([3, 2])
+    with col1:
+        granularity = st.radio(
+            "집계 단위",
+            options=list(GRANULARITY_OPTIONS.keys()),
+            index=1,
+            horizontal=True,
+            format_func=lambda key: GRANULARITY_OPTIONS[key][0],
+            key="dashboard_granularity"
+        )
+    with col2:
+        top_n = st.slider("상위 키워드 수", min_value=1, max_value=10, value=5, key="dashboard_top_n")
+    return granularity, top_n
+
+def render_keyword_charts(
+    buckets: List[str],
+    rows: List[dict],
+    top_keywords: List[Tuple[str, int]],
+    totals: Tuple[int, int]
+):
+    """
+    키워드별 검색 횟수 추이(선 그래프)와 기간 내 상위 키워드(막대 그래프)를 표시합니다.
+
+    Args:
+        buckets (List[str]): 표시할 구간 목록 (오래된 순, 검색이 없는 구간 포함)
+        rows (List[dict]): 구간별 집계 [{bucket, keyword, searches, articles}, ...]
+        top_keywords (List[Tuple[str, int]]): 기간 내 상위 키워드와 검색 수
+        totals (Tuple[int, int]): 기간 내 (전체 검색 수, 검색된 키워드 수)
+    """
+    import pandas as pd
+
+    searches, keywords = totals
+    col1, col2, col3 = st.columns(3)
+    col1.metric("검색 수", f"{searches:,}")
+    col2.metric("검색된 키워드", f"{keywords:,}")
+    col3.metric("기간", f"{buckets[0]} ~ {buckets[-1]}")
+
+    if not rows:
+        st.info("이 기간에 검색 기록이 없습니다.")
+        return
+
+    # 검색이 없는 구간도 0으로 표시되도록 전체 구간으로 맞춤
+    names = [keyword for keyword, _ in top_keywords]
+    trend = (
+        pd.DataFrame(rows)
+        .pivot_table(index="bucket", columns="keyword", values="searches", aggfunc="sum")
+        .reindex(index=buckets, columns=names)
+        .fillna(0)
+        .astype(int)
+    )
+    st.markdown("#### 📈 키워드별 검색 추이")
+    st.line_chart(trend)
+
+    st.markdown("#### 🏆 기간 내 상위 키워드")
+    st.bar_chart(pd.DataFrame({"검색 수": [total for _, total in top_keywords]}, index=names), horizontal=True)
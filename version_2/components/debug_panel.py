@@ -0,0 +1,36 @@
+import streamlit as st
+from utils.profiler import ProfileReport
+
+def render_profile_panel(report: ProfileReport):
+    """
+    프로파일링 모드에서 이번 rerun의 측정 요약을 접을 수 있는 디버그 패널로 표시합니다.
+    
+    Args:
+        report (ProfileReport): profile_call()이 반환한 측정 결과
+    """
+    with st.expander("🛠️ 디버그: rerun 프로파일", expanded=False):
+        col1, col2 = st.columns(2)
+        col1.metric("rerun 소요 시간", f"{report.elapsed_seconds:.3f}s")
+        col2.metric("최대 메모리", f"{report.peak_bytes / (1024 * 1024):.1f} MiB")
+
+        st.markdown("**누적 시간 상위 함수**")
+        st.dataframe(
+            [
+                {"함수": name, "호출 수": ncalls, "자체(s)": round(tottime, 4), "누적(s)": round(cumtime, 4)}
+                for name, ncalls, tottime, cumtime in report.top_functions
+            ],
+            use_container_width=True,
+            hide_index=True
+        )
+
+        st.markdown("**메모리 할당 상위 위치**")
+        st.dataframe(
+            [
+                {"위치": location, "크기(KiB)": round(size_kib, 1), "할당 수": count}
+                for location, size_kib, count in report.top_allocations
+            ],
+            use_container_width=True,
+            hide_index=True
+        )
+
+        st.caption(f"cProfile: `{report.pstats_path}` · 할당 보고서: `{report.allocations_path}`")
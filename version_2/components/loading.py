@@ -1,5 +1,6 @@
 import streamlit as st
 from contextlib import contextmanager
+from typing import Dict
 
 @contextmanager
 def show_loading(message: str):
@@ -16,3 +17,30 @@ def show_loading(message: str):
     """
     with st.spinner(message):
         yield
+
+# 단계 식별자별 화면 표시 이름
+STAGE_LABELS = {
+    "tavily_search": "🔍 Tavily 검색",
+    "sort_convert": "🗂️ 정렬/변환",
+    "summarize": "🤖 AI 요약",
+    "insights": "🧠 AI 인사이트",
+    "repository_save": "💾 기록 저장",
+    "history_load": "📜 기록 조회",
+    "render": "🖼️ 렌더링",
+}
+
+def render_stage_breakdown(container, stages: Dict[str, float]):
+    """
+    분석 단계별 소요 시간을 표 형식으로 표시합니다.
+    
+    Args:
+        container: 표를 출력할 Streamlit 컨테이너 (예: st.status 객체)
+        stages (Dict[str, float]): 단계 식별자별 소요 시간(ms)
+    """
+    if not stages:
+        return
+    lines = ["| 단계 | 소요 시간 |", "|---|---:|"]
+    for stage, millis in stages.items():
+        lines.append(f"| {STAGE_LABELS.get(stage, stage)} | {millis / 1000:.2f}s |")
+    lines.append(f"| **합계** | **{sum(stages.values()) / 1000:.2f}s** |")
+    container.markdown("\n".join(lines))
@@ -1,6 +1,103 @@
 import streamlit as st
-from typing import List
+from datetime import datetime
+from typing import TYPE_CHECKING, AbstractSet, Dict, List, Tuple
 from domain.news_article import NewsArticle
+from utils.key_generator import parse_search_key
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# 결과 탭 (키, 표시 이름) - 선택한 탭의 내용만 렌더링합니다.
+RESULT_TABS = {
+    "report": "📊 통합 리포트",
+    "news": "📰 관련 뉴스",
+    "insights": "🧠 AI 인사이트",
+}
+
+def render_result_tabs() -> str:
+    """
+    결과 영역의 탭 선택 바를 표시하고 선택된 탭 키를 반환합니다.
+    st.tabs는 보이지 않는 탭의 내용까지 매번 렌더링하므로, 선택 상태를 가진 라디오로 탭을 구성하여
+    선택된 탭의 내용(과 그 탭이 필요로 하는 기사/AI 텍스트 조회)만 실행되도록 합니다.
+
+    Returns:
+        str: 선택된 탭 키 ("report", "news", "insights")
+    """
+    return st.radio(
+        "결과 탭",
+        options=list(RESULT_TABS.keys()),
+        horizontal=True,
+        format_func=lambda key: RESULT_TABS[key],
+        key="result_tab",
+        label_visibility="collapsed"
+    )
+
+def render_reuse_notice(analyzed_at: datetime, calls_avoided: Dict[str, int]) -> bool:
+    """
+    새로 분석하지 않고 최근에 저장된 같은 분석 결과를 보여주고 있음을 배지로 표시합니다.
+
+    Args:
+        analyzed_at (datetime): 재사용한 결과의 분석 시각
+        calls_avoided (Dict[str, int]): 제공자별 절약한 API 호출 수
+
+    Returns:
+        bool: '새로 분석' 버튼을 눌렀는지 여부
+    """
+    minutes = max(0, int((datetime.now() - analyzed_at).total_seconds() // 60))
+    saved = ", ".join(f"{provider.capitalize()} {count}회" for provider, count in calls_avoided.items() if count)
+    col1, col2 = st.columns([4, 1], vertical_alignment="center")
+    with col1:
+        st.badge(f"⚡ 저장된 결과 · {analyzed_at:%m-%d %H:%M} 분석 ({minutes}분 전)", color="green")
+        if saved:
+            st.caption(f"최근 같은 분석 결과를 불러와 API 호출을 절약했습니다: {saved}")
+    return col2.button("🔄 새로 분석", key="force_refresh", use_container_width=True)
+
+def render_stale_notice(analyzed_at: datetime):
+    """
+    새로 분석하는 동안 가장 최근에 저장된 결과를 먼저 보여주고 있음을 배지로 표시합니다.
+
+    Args:
+        analyzed_at (datetime): 표시 중인 결과의 분석 시각
+    """
+    st.badge(f"🕒 이전 분석 결과 · {analyzed_at:%m-%d %H:%M} 분석", color="orange")
+    st.caption("최신 결과로 갱신하는 중입니다. 분석이 끝나면 새 결과로 자동으로 바뀝니다.")
+
+def render_refreshed_notice(previous_at: datetime, new_articles: int):
+    """
+    이전 결과를 보여주던 중 새 분석 결과로 교체되었음을 새 기사 수와 함께 표시합니다.
+
+    Args:
+        previous_at (datetime): 교체 전에 보여주던 결과의 분석 시각
+        new_articles (int): 이전 결과에 없던 기사 수
+    """
+    st.badge(f"🆕 새 기사 {new_articles}건", color="blue" if new_articles else "gray")
+    st.caption(f"{previous_at:%m-%d %H:%M} 분석 결과를 최신 분석 결과로 교체했습니다. 새 기사는 관련 뉴스 탭에 🆕로 표시됩니다.")
+
+# 나중에 채울 단계별 표시 이름 (SearchResult.pending)
+PENDING_STAGE_LABELS = {
+    "news": "관련 뉴스",
+    "summary": "AI 뉴스 요약",
+    "insights": "AI 심층 인사이트",
+}
+
+def render_pending_notice(pending: List[str], filling: bool):
+    """
+    분석 마감 시간 안에 끝나지 않은 단계가 있어 완료된 단계만 표시하고 있음을 배지로 표시합니다.
+
+    Args:
+        pending (List[str]): 나중에 채울 단계 목록
+        filling (bool): 백그라운드에서 채우는 중인지 여부 (False이면 main.py fill-pending 안내)
+    """
+    labels = ", ".join(PENDING_STAGE_LABELS.get(stage, stage) for stage in pending)
+    st.badge(f"⏳ 대기 중 · {labels}", color="orange")
+    if filling:
+        st.caption("마감 시간 안에 끝나지 않은 단계를 백그라운드에서 이어서 분석하고 있습니다. 완료되면 자동으로 표시됩니다.")
+    else:
+        st.caption("마감 시간 안에 끝나지 않은 단계가 있습니다. `python main.py fill-pending`으로 다시 채울 수 있습니다.")
+
+def render_pending_section(stage: str):
+    """마감 시간 안에 끝나지 않아 아직 결과가 없는 단계 자리에 '대기 중' 안내를 표시합니다."""
+    st.info(f"⏳ {PENDING_STAGE_LABELS.get(stage, stage)} 대기 중 - 분석이 끝나면 이 자리에 표시됩니다.")
 
 def render_summary(title: str, summary: str):
     """
@@ -16,6 +113,66 @@ def render_summary(title: str, summary: str):
     else:
         st.warning("요약 내용을 생성하지 못했습니다.")
 
+# 요약 방식별 표시 이름
+SUMMARY_MODE_LABELS = {
+    "full": "전체 요약",
+    "incremental": "증분 갱신",
+    "reused": "이전 요약 재사용",
+}
+
+def render_summary_lineage(chain: List[Tuple[str, str]]):
+    """
+    요약이 이전 분석 결과를 바탕으로 갱신된 경우, 기반이 된 분석들의 계보를 표시합니다.
+
+    Args:
+        chain (List[Tuple[str, str]]): 오래된 순 (search_key, 요약 방식) 리스트
+    """
+    if len(chain) < 2:
+        return
+    steps = []
+    for key, mode in chain:
+        _, analyzed_at = parse_search_key(key)
+        when = analyzed_at.strftime("%m-%d %H:%M") if analyzed_at else key
+        steps.append(f"{when} {SUMMARY_MODE_LABELS.get(mode, mode)}")
+    steps = " → ".join(steps)
+    st.caption(f"🔗 요약 계보 ({len(chain)}단계): {steps}")
+
+# 기사량 추이 집계 주기별 (표시 이름, 구간 단위)
+VOLUME_FREQUENCY_LABELS = {
+    "D": ("일별", "일"),
+    "W": ("주별", "주"),
+}
+
+def render_article_volume(keyword: str, volume: Dict[str, "pd.DataFrame"]):
+    """
+    저장된 기사들의 발행일로 계산한 키워드의 기사량 추이와 이동평균을 선 그래프로 표시합니다.
+
+    Args:
+        keyword (str): 검색 키워드
+        volume (Dict[str, pd.DataFrame]): 집계 주기("D", "W")별 [articles, moving_avg] 추이
+    """
+    st.subheader(f"📰 '{keyword}' 기사량 추이")
+    daily = volume.get("D")
+    if daily is None or daily.empty:
+        st.caption("발행일이 저장된 기사가 없어 기사량 추이를 표시할 수 없습니다.")
+        return
+
+    freq = st.radio(
+        "집계 주기",
+        options=list(VOLUME_FREQUENCY_LABELS.keys()),
+        horizontal=True,
+        format_func=lambda key: VOLUME_FREQUENCY_LABELS[key][0],
+        key="volume_freq",
+        label_visibility="collapsed"
+    )
+    unit = VOLUME_FREQUENCY_LABELS[freq][1]
+    series = volume[freq]
+    st.line_chart(series.rename(columns={"articles": "기사 수", "moving_avg": "이동평균"}))
+    st.caption(
+        f"최근 {len(series)}{unit} 동안 발행된 기사 {int(series['articles'].sum())}건 "
+        f"(검색 기록에 저장된 기사 기준, 같은 URL은 한 번만 집계)"
+    )
+
 def render_ai_insights(keyword: str, insights: str):
     """
     Gemini의 자체 지식을 바탕으로 한 심층 분석 결과를 렌더링합니다.
@@ -42,17 +199,46 @@ def render_trends_link(keyword: str, trends_url: str):
     </div>
     """, unsafe_allow_html=True)
 
-def render_news_list(articles: List[NewsArticle]):
+# 관련 뉴스 한 페이지에 표시할 기사 수 선택지 (첫 값보다 기사가 많을 때만 페이지를 나눔)
+NEWS_PAGE_SIZES = [10, 20, 50]
+
+def render_news_list(articles: List[NewsArticle], list_key: str = "", new_urls: AbstractSet[str] = frozenset()):
     """
     검색된 뉴스 기사 리스트를 각 기사별 Expander 형식으로 렌더링합니다.
+    기사가 한 페이지보다 많으면 페이지당 기사 수와 페이지 번호를 선택하게 하고 현재 페이지의 기사만 렌더링하므로,
+    검색 건수를 늘려도 rerun마다 만드는 Expander 수는 페이지 크기를 넘지 않습니다.
+
+    Args:
+        articles (List[NewsArticle]): 표시할 기사 리스트
+        list_key (str): 표시 중인 결과의 식별자 (다른 결과로 바뀌면 첫 페이지부터 표시)
+        new_urls (AbstractSet[str]): 이전 결과에 없던 기사의 URL (제목 앞에 🆕 표시)
     """
     st.subheader("📰 관련 뉴스 기사")
     if not articles:
         st.info("관련 뉴스 기사가 없습니다.")
         return
+    if new_urls:
+        st.caption(f"🆕 이전 분석 이후 새로 수집된 기사 {sum(article.url in new_urls for article in articles)}건")
+
+    start, end = 0, len(articles)
+    if len(articles) > NEWS_PAGE_SIZES[0]:
+        if st.session_state.get("news_list_key") != list_key:
+            st.session_state.news_list_key = list_key
+            st.session_state.news_page = 1
+        size_col, page_col, info_col = st.columns([1, 1, 2], vertical_alignment="bottom")
+        page_size = size_col.selectbox("페이지당 기사 수", NEWS_PAGE_SIZES, key="news_page_size")
+        pages = -(-len(articles) // page_size)
+        # 페이지 크기를 키워 페이지 수가 줄어든 경우 마지막 페이지로 이동 (위젯 생성 전에만 값 변경 가능)
+        if st.session_state.get("news_page", 1) > pages:
+            st.session_state.news_page = pages
+        page = page_col.number_input("페이지", min_value=1, max_value=pages, step=1, key="news_page")
+        start = (page - 1) * page_size
+        end = min(start + page_size, len(articles))
+        info_col.caption(f"전체 {len(articles)}건 중 {start + 1}~{end}번째 기사 ({page}/{pages} 페이지)")
 
-    for i, article in enumerate(articles, 1):
-        with st.expander(f"{i}. {article.title}"):
+    for i, article in enumerate(articles[start:end], start + 1):
+        marker = "🆕 " if article.url in new_urls else ""
+        with st.expander(f"{marker}{i}. {article.title}"):
             st.markdown(f"**[기사 원문 보기]({article.url})**")
             st.write(article.snippet)
             if article.pub_date and article.pub_date != "날짜 정보 없음":
@@ -1,6 +1,8 @@
 import streamlit as st
-from typing import List, Optional
+from typing import Callable, List, Optional, Union
 from datetime import datetime
+from config.settings import Settings
+from utils.key_generator import parse_search_key
 
 def render_sidebar_header():
     """애플리케이션 이름과 간단한 소개를 사이드바 최상단에 표시합니다."""
@@ -13,18 +15,24 @@ def render_sidebar_header():
 
 def render_settings() -> int:
     """
-    뉴스 검색 건수를 설정하는 슬라이더를 사이드바에 표시합니다.
+    뉴스 검색 건수를 설정하는 슬라이더를 표시합니다.
+    선택한 값은 session_state["num_results"]에도 저장되므로, 슬라이더를 fragment 안에 두고
+    다른 영역에서는 session_state로 읽을 수 있습니다. `with st.sidebar:` 안에서 호출해야 합니다.
     
     Returns:
-        int: 사용자가 선택한 검색 건수 (1~10)
+        int: 사용자가 선택한 검색 건수 (1~Settings.MAX_NUM_RESULTS, 검색 도메인 수 × 20건을 넘지 않음)
     """
-    st.sidebar.subheader("⚙️ 설정")
-    num_results = st.sidebar.slider(
+    st.subheader("⚙️ 설정")
+    num_results = st.slider(
         "검색 건수 설정",
         min_value=1,
-        max_value=10,
+        max_value=Settings.MAX_NUM_RESULTS,
         value=5,
-        help="검색할 뉴스 기사의 개수를 선택하세요."
+        key="num_results",
+        help=(
+            "검색할 뉴스 기사의 개수를 선택하세요. 10건을 넘기면 Tavily 요청이 20건당 1회씩 늘어납니다. "
+            "최대 건수는 검색 도메인(SEARCH_DOMAINS) 수 × 20건입니다."
+        )
     )
     return num_results
 
@@ -51,6 +59,7 @@ def render_info():
 def render_history_list(search_keys: List[str], keywords_map: dict) -> Optional[str]:
     """
     저장된 과거 검색 기록 리스트를 사이드바 셀렉트박스로 표시합니다.
+    fragment 안에서도 사용할 수 있도록 `with st.sidebar:` 안에서 호출해야 합니다.
     
     Args:
         search_keys (List[str]): 조회된 검색 키 리스트
@@ -59,31 +68,27 @@ def render_history_list(search_keys: List[str], keywords_map: dict) -> Optional[
     Returns:
         Optional[str]: 사용자가 선택한 고유 search_key
     """
-    st.sidebar.subheader("📜 검색 기록")
+    st.subheader("📜 검색 기록")
     
     if not search_keys:
-        st.sidebar.info("저장된 검색 기록이 없습니다")
+        st.info("저장된 검색 기록이 없습니다")
         return None
 
-    # 표시용 포맷 생성: "키워드 (yyyy-mm-dd HH:MM)"
+    # 표시용 포맷 생성: "키워드 (yyyy-mm-dd HH:MM:SS)"
     display_options = []
     key_to_display = {}
 
     for key in search_keys:
-        try:
-            # 키워드와 timestamp 분리
-            parts = key.rsplit('-', 1)
-            keyword = parts[0]
-            ts_str = parts[1]
-            dt = datetime.strptime(ts_str, "%Y%m%d%H%M")
-            display_name = f"{keyword} ({dt.strftime('%Y-%m-%d %H:%M')})"
-        except:
+        keyword, dt = parse_search_key(key)
+        display_name = f"{keyword} ({dt.strftime('%Y-%m-%d %H:%M:%S')})" if dt else key
+        # 같은 초에 저장된 결과도 따로 선택할 수 있도록 표시 이름이 겹치면 키를 그대로 사용
+        if display_name in key_to_display:
             display_name = key
         
         display_options.append(display_name)
         key_to_display[display_name] = key
 
-    selected_display = st.sidebar.selectbox(
+    selected_display = st.selectbox(
         "과거 기록 불러오기",
         options=display_options,
         index=None,
@@ -93,22 +98,24 @@ def render_history_list(search_keys: List[str], keywords_map: dict) -> Optional[
     
     return key_to_display.get(selected_display) if selected_display else None
 
-def render_download_button(csv_data: str, is_empty: bool):
+def render_download_button(csv_data: Union[str, Callable[[], str]], is_empty: bool):
     """
     저장된 전체 CSV 데이터를 다운로드할 수 있는 버튼을 사이드바에 표시합니다.
+    `with st.sidebar:` 안에서 호출해야 합니다.
     
     Args:
-        csv_data (str): 전체 CSV 데이터 문자열
+        csv_data (Union[str, Callable[[], str]]): 전체 CSV 데이터 문자열 또는
+            버튼을 눌렀을 때 CSV를 생성하는 함수 (rerun마다 내보내기를 만들지 않도록 지연 생성)
         is_empty (bool): 데이터 존재 여부 (비어 있으면 버튼 비활성화)
     """
-    st.sidebar.divider()
+    st.divider()
     filename = f"trendtracker_export_{datetime.now().strftime('%Y%m%d')}.csv"
     
     if is_empty:
-        st.sidebar.button("📥 CSV 다운로드", disabled=True, use_container_width=True)
-        st.sidebar.caption("저장된 데이터가 없어 다운로드할 수 없습니다.")
+        st.button("📥 CSV 다운로드", disabled=True, use_container_width=True)
+        st.caption("저장된 데이터가 없어 다운로드할 수 없습니다.")
     else:
-        st.sidebar.download_button(
+        st.download_button(
             label="📥 CSV 다운로드",
             data=csv_data,
             file_name=filename,
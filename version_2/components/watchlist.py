@@ -0,0 +1,69 @@
+import streamlit as st
+from typing import Callable, List, Optional, Tuple
+from domain.watch_item import WatchItem
+from utils.input_handler import preprocess_keyword
+
+# 워치리스트 갱신 주기 선택지 (분: 표시 이름)
+INTERVAL_OPTIONS = {
+    15: "15분",
+    60: "1시간",
+    180: "3시간",
+    360: "6시간",
+    1440: "하루",
+}
+
+def render_watchlist_form() -> Optional[Tuple[str, int]]:
+    """
+    워치리스트에 키워드를 추가하는 입력 폼을 표시합니다.
+    `with st.sidebar:` 안에서 호출해야 합니다.
+
+    Returns:
+        Optional[Tuple[str, int]]: 추가 버튼을 누른 경우 (정제된 키워드, 갱신 주기(분))
+    """
+    with st.form("watchlist_form", clear_on_submit=True):
+        keyword_input = st.text_input("감시할 키워드", placeholder="예: 생성형 AI")
+        interval = st.selectbox(
+            "갱신 주기",
+            options=list(INTERVAL_OPTIONS.keys()),
+            index=1,
+            format_func=lambda minutes: INTERVAL_OPTIONS[minutes]
+        )
+        submitted = st.form_submit_button("➕ 워치리스트에 추가", use_container_width=True)
+
+    if submitted:
+        keyword = preprocess_keyword(keyword_input)
+        if not keyword:
+            st.warning("검색어를 입력해주세요")
+            return None
+        return keyword, interval
+    return None
+
+def render_watchlist_items(items: List[WatchItem], on_remove: Callable[[str], None]):
+    """
+    워치리스트 키워드별 갱신 주기와 마지막 갱신 상태를 표시합니다.
+
+    Args:
+        items (List[WatchItem]): 워치리스트 항목 리스트
+        on_remove (Callable[[str], None]): 삭제 버튼을 누르면 rerun 전에 키워드와 함께 호출되는 콜백
+    """
+    if not items:
+        st.caption("등록된 키워드가 없습니다. 등록한 키워드는 주기마다 새 기사만 자동으로 수집됩니다.")
+        return
+
+    for item in items:
+        col1, col2 = st.columns([4, 1])
+        with col1:
+            interval = INTERVAL_OPTIONS.get(item.interval_minutes, f"{item.interval_minutes}분")
+            st.markdown(f"**{item.keyword}** · {interval}마다")
+            if item.last_run_at:
+                st.caption(
+                    f"마지막 갱신 {item.last_run_at.strftime('%m-%d %H:%M')} · "
+                    f"새 기사 {item.last_new_articles}건 · 변경 없음 {item.skipped_runs}/{item.runs}회"
+                )
+            else:
+                st.caption("첫 갱신 대기 중")
+        with col2:
+            st.button(
+                "✕", key=f"watch_remove_{item.keyword}", help="워치리스트에서 삭제",
+                on_click=on_remove, args=(item.keyword,)
+            )
@@ -1,9 +1,31 @@
 import os
+from typing import List, Tuple
 from dotenv import load_dotenv
 
 # .env 파일 로드
 load_dotenv()
 
+def parse_api_keys(raw: str) -> List[Tuple[str, float]]:
+    """
+    쉼표로 구분된 API 키 목록을 (키, 가중치) 리스트로 변환합니다.
+    각 항목은 "키" 또는 "키:가중치" 형식이며 가중치를 생략하면 1, 0 이하이면 그 키를 사용하지 않습니다. (예: "key-a:2,key-b")
+    """
+    keys = []
+    for item in raw.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        key, separator, weight = item.rpartition(":")
+        if separator and not key.strip():
+            continue
+        try:
+            parsed = (key.strip(), float(weight)) if separator and key else (item, 1.0)
+        except ValueError:
+            parsed = (item, 1.0)
+        if parsed[1] > 0:
+            keys.append(parsed)
+    return keys
+
 class Settings:
     """
     애플리케이션의 모든 환경 설정을 관리하는 클래스입니다.
@@ -12,17 +34,137 @@ class Settings:
     
     TAVILY_API_KEY = os.getenv("TAVILY_API_KEY")
     GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+    # 제공자별 API 키 풀 (쉼표로 구분, "키:가중치"로 할당량이 큰 키에 더 많이 분배)
+    # 지정하지 않으면 TAVILY_API_KEY / GEMINI_API_KEY 하나만 사용하고, 지정하면 첫 키가 대표 키가 됨
+    TAVILY_API_KEYS = parse_api_keys(os.getenv("TAVILY_API_KEYS", "")) or (
+        [(TAVILY_API_KEY, 1.0)] if TAVILY_API_KEY else []
+    )
+    GEMINI_API_KEYS = parse_api_keys(os.getenv("GEMINI_API_KEYS", "")) or (
+        [(GEMINI_API_KEY, 1.0)] if GEMINI_API_KEY else []
+    )
+    TAVILY_API_KEY = TAVILY_API_KEY or (TAVILY_API_KEYS[0][0] if TAVILY_API_KEYS else None)
+    GEMINI_API_KEY = GEMINI_API_KEY or (GEMINI_API_KEYS[0][0] if GEMINI_API_KEYS else None)
+    # 할당량 초과(429) 응답을 받은 키를 다른 키가 있는 동안 쉬게 하는 시간(초)
+    API_KEY_COOLDOWN_SECONDS = float(os.getenv("API_KEY_COOLDOWN_SECONDS", "60"))
     CSV_PATH = os.getenv("CSV_PATH", "data/search_history.csv")
+    # 검색 기록의 기사 스니펫과 AI 요약/인사이트를 압축하여 저장 (false면 원문 저장, 읽기는 두 형식 모두 지원)
+    HISTORY_COMPRESSION = os.getenv("HISTORY_COMPRESSION", "true").lower() == "true"
     GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
+    # 작업별 모델 (비우면 GEMINI_MODEL) - 예: 요약에는 가벼운 gemini-2.5-flash-lite
+    GEMINI_SUMMARY_MODEL = os.getenv("GEMINI_SUMMARY_MODEL", "").strip()
+    GEMINI_INSIGHTS_MODEL = os.getenv("GEMINI_INSIGHTS_MODEL", "").strip()
+    # 작업별 모델이 느리거나 할당량 초과/오류가 잦을 때 대신 호출할 모델 (쉼표로 구분, 앞쪽 우선)
+    _gemini_fallback_raw = os.getenv("GEMINI_FALLBACK_MODELS", "gemini-2.5-flash-lite")
+    GEMINI_FALLBACK_MODELS = [m.strip() for m in _gemini_fallback_raw.split(",") if m.strip()]
+    # 첫 모델이 최근 p95 지연 안에 응답하지 않으면 다음 모델에도 같은 요청을 보내 먼저 온 응답 사용
+    GEMINI_HEDGE_REQUESTS = os.getenv("GEMINI_HEDGE_REQUESTS", "true").lower() == "true"
+    # 모델 선택에 사용하는 최근 호출 기록 기간(초)과 판단에 필요한 최소 호출 수
+    GEMINI_ROUTER_WINDOW_SECONDS = float(os.getenv("GEMINI_ROUTER_WINDOW_SECONDS", "300"))
+    GEMINI_ROUTER_MIN_SAMPLES = int(os.getenv("GEMINI_ROUTER_MIN_SAMPLES", "10"))
+    # 최근 p95 지연이 이 시간(초)을 넘거나 오류율이 이 비율을 넘으면 다음 모델을 먼저 호출
+    GEMINI_SLOW_SECONDS = float(os.getenv("GEMINI_SLOW_SECONDS", "15"))
+    GEMINI_MAX_ERROR_RATE = float(os.getenv("GEMINI_MAX_ERROR_RATE", "0.5"))
+    # 할당량 초과(429) 응답을 받은 모델을 뒤로 미루는 시간(초)
+    GEMINI_RATE_LIMIT_COOLDOWN_SECONDS = float(os.getenv("GEMINI_RATE_LIMIT_COOLDOWN_SECONDS", "60"))
     
     # SEARCH_DOMAINS는 쉼표로 구분된 문자열을 리스트로 변환
     _search_domains_raw = os.getenv("SEARCH_DOMAINS", "")
     SEARCH_DOMAINS = [d.strip() for d in _search_domains_raw.split(",") if d.strip()]
 
+    # Tavily 검색이 요청 1회에 반환하는 최대 결과 수
+    TAVILY_MAX_RESULTS = 20
+    # 검색 1회에 가져올 수 있는 최대 기사 수 (검색 폼 슬라이더, HTTP API 상한)
+    # 20건을 넘기면 SEARCH_DOMAINS를 나누어 여러 번 요청하므로 도메인 수 × 20건(도메인이 없으면 20건)을 넘지 않음
+    MAX_NUM_RESULTS = min(
+        int(os.getenv("MAX_NUM_RESULTS", "100")), TAVILY_MAX_RESULTS * max(len(SEARCH_DOMAINS), 1)
+    )
+
+    # 같은 키워드(띄어쓰기/대소문자 무시)와 분석 소스로 이 시간(분) 안에 저장된 결과가 있으면
+    # 새로 분석하지 않고 저장된 결과를 보여줌 (0이면 항상 새로 분석)
+    RESULT_REUSE_MINUTES = float(os.getenv("RESULT_REUSE_MINUTES", "30"))
+    # 재사용 기간이 지난 결과라도 분석하는 동안 가장 최근에 저장된 결과를 먼저 보여주고, 분석이 끝나면 새 결과로 교체
+    STALE_WHILE_REVALIDATE = os.getenv("STALE_WHILE_REVALIDATE", "true").lower() == "true"
+
+    # 여러 프로세스(Streamlit 서버, 워커, API 서버)가 공유하는 디스크 캐시 (SQLite, 비우면 프로세스 내부 캐시)
+    SHARED_CACHE_PATH = os.getenv("SHARED_CACHE_PATH", "data/shared_cache.sqlite3")
+    # 캐시 전체 크기 상한 (MB, 넘으면 오래 사용하지 않은 항목부터 삭제)
+    SHARED_CACHE_MAX_MB = float(os.getenv("SHARED_CACHE_MAX_MB", "256"))
+    # 같은 요청의 Tavily 검색/Gemini 응답을 재사용하는 시간 (초, 0이면 캐시하지 않음)
+    SEARCH_CACHE_SECONDS = float(os.getenv("SEARCH_CACHE_SECONDS", "300"))
+    GEMINI_CACHE_SECONDS = float(os.getenv("GEMINI_CACHE_SECONDS", "3600"))
+    # 파싱한 검색 기록을 공유 캐시에 저장하여 다른 프로세스와 재시작 후 첫 조회에서 CSV 파싱을 건너뜀
+    SHARED_CACHE_HISTORY = os.getenv("SHARED_CACHE_HISTORY", "true").lower() == "true"
+
+    # 분석 1건의 전체 마감 시간(초, 0이면 제한 없음). 시간 안에 끝나지 않은 단계(요약/인사이트 등)는 "대기 중"으로
+    # 저장하고 끝난 결과를 먼저 보여주며, 남은 단계는 워커가 이어서 채움
+    ANALYSIS_DEADLINE_SECONDS = float(os.getenv("ANALYSIS_DEADLINE_SECONDS", "45"))
+    # API 호출 1회의 최대 대기 시간(초, 남은 마감 시간이 더 짧으면 그 시간까지)
+    TAVILY_TIMEOUT_SECONDS = float(os.getenv("TAVILY_TIMEOUT_SECONDS", "20"))
+    GEMINI_TIMEOUT_SECONDS = float(os.getenv("GEMINI_TIMEOUT_SECONDS", "30"))
+    # 대기 중인 단계를 채울 때의 마감 시간(초, 0이면 제한 없음)
+    PENDING_FILL_DEADLINE_SECONDS = float(os.getenv("PENDING_FILL_DEADLINE_SECONDS", "120"))
+
+    # 재분석 시 요약 방식: incremental(이전 요약 + 새 기사만 전송) 또는 full(매번 전체 재요약)
+    SUMMARY_MODE = os.getenv("SUMMARY_MODE", "incremental").lower()
+
+    # API 엔드포인트 (로컬 대체 서버 사용 시 변경)
+    TAVILY_BASE_URL = os.getenv("TAVILY_BASE_URL", "https://api.tavily.com")
+    GEMINI_BASE_URL = os.getenv("GEMINI_BASE_URL") or None
+
+    # HTTP 커넥션 풀 설정 (동시 접속 세션 수에 맞춰 조정)
+    HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "20"))
+    HTTP_KEEPALIVE_SECONDS = float(os.getenv("HTTP_KEEPALIVE_SECONDS", "60"))
+    # 서버 시작 시 클라이언트 생성 및 TLS 연결을 미리 수행할지 여부
+    WARMUP_ON_START = os.getenv("WARMUP_ON_START", "false").lower() == "true"
+
+    # 제공자별 API 키 1개당 분당 요청 수 제한 (가중치를 곱한 값, 0이면 제한 없음, main.py batch는 지정하지 않으면 기본값을 사용)
+    # 키 풀의 키마다 따로 적용되므로 키를 늘리면 전체 처리량도 늘어남
+    TAVILY_RATE_PER_MINUTE = float(os.getenv("TAVILY_RATE_PER_MINUTE", "0"))
+    GEMINI_RATE_PER_MINUTE = float(os.getenv("GEMINI_RATE_PER_MINUTE", "0"))
+
+    # 키워드별 검색 횟수 집계 (시간/일/주 단위, 대시보드용)
+    ROLLUP_DB_PATH = os.getenv("ROLLUP_DB_PATH", "data/rollups.sqlite3")
+
+    # 일괄 분석(main.py batch) 진행 기록 - 중단 후 다시 실행하면 완료된 키워드는 건너뜀
+    BATCH_CHECKPOINT_PATH = os.getenv("BATCH_CHECKPOINT_PATH", "data/batch_checkpoint.jsonl")
+
+    # 단계별 소요 시간 측정 기록 (JSON Lines) 및 Prometheus 엔드포인트 포트 (0이면 비활성화)
+    METRICS_LOG_PATH = os.getenv("METRICS_LOG_PATH", "data/metrics.jsonl")
+    METRICS_PORT = int(os.getenv("METRICS_PORT", "9464"))
+
+    # 분석 작업 큐 (SQLite) 및 워커 설정
+    # JOB_WORKERS=0이면 앱은 작업 등록만 하고, 별도 워커 프로세스(worker.py)가 처리
+    JOB_DB_PATH = os.getenv("JOB_DB_PATH", "data/jobs.sqlite3")
+    JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+    JOB_POLL_SECONDS = float(os.getenv("JOB_POLL_SECONDS", "1.0"))
+    # 실행 상태로 이 시간(초)보다 오래 남은 작업은 워커 시작 시 다시 대기열에 넣음
+    JOB_STALE_SECONDS = float(os.getenv("JOB_STALE_SECONDS", "600"))
+
+    # HTTP API 서버 (api.py)
+    API_PORT = int(os.getenv("API_PORT", "8502"))
+    # 저장소/작업 큐 조회를 처리하는 스레드 수와, 이를 넘어 대기할 수 있는 요청 수 (초과 시 503)
+    API_MAX_WORKERS = int(os.getenv("API_MAX_WORKERS", "8"))
+    API_MAX_PENDING = int(os.getenv("API_MAX_PENDING", "64"))
+    # 대기 중인 분석 작업이 이 수 이상이면 새 분석 요청을 거절 (429)
+    API_MAX_QUEUED_JOBS = int(os.getenv("API_MAX_QUEUED_JOBS", "100"))
+
+    # 워치리스트 자동 갱신 (키워드별 주기에 따라 새 기사만 수집)
+    WATCHLIST_DB_PATH = os.getenv("WATCHLIST_DB_PATH", "data/watchlist.sqlite3")
+    # 앱 프로세스에서 스케줄러를 실행할지 여부 (worker.py --watchlist로 별도 실행 가능)
+    WATCHLIST_SCHEDULER = os.getenv("WATCHLIST_SCHEDULER", "true").lower() == "true"
+    WATCHLIST_TICK_SECONDS = float(os.getenv("WATCHLIST_TICK_SECONDS", "30"))
+    # 키워드별로 기억할 최근 기사 URL 수 (중복 기사 판별용)
+    WATCHLIST_SEEN_URLS_MAX = int(os.getenv("WATCHLIST_SEEN_URLS_MAX", "500"))
+
+    # rerun 프로파일링 모드 (cProfile + tracemalloc 결과를 PROFILE_DIR에 저장)
+    PROFILE_RERUNS = os.getenv("PROFILE_RERUNS", "false").lower() == "true"
+    PROFILE_DIR = os.getenv("PROFILE_DIR", "profiles")
+    PROFILE_TOP_N = int(os.getenv("PROFILE_TOP_N", "20"))
+
     @classmethod
     def validate(cls):
         """
-        필수 환경변수($TAVILY_API_KEY, $GEMINI_API_KEY)가 설정되어 있는지 확인합니다.
+        필수 환경변수($TAVILY_API_KEY, $GEMINI_API_KEY 또는 키 풀 $TAVILY_API_KEYS, $GEMINI_API_KEYS)가 설정되어 있는지 확인합니다.
         설정되지 않은 경우 사용자에게 친절한 안내 메시지를 포함한 ValueError를 발생시킵니다.
         """
         missing_vars = []
@@ -0,0 +1,32 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+
+# 작업 상태
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+
+@dataclass
+class AnalysisJob:
+    """
+    작업 큐에 등록된 분석 요청 1건의 상태를 관리합니다.
+    """
+    job_id: str                   # PK, uuid4 hex
+    keyword: str                  # 분석할 키워드
+    sources: List[str]            # 선택된 분석 소스
+    num_results: int              # 검색할 뉴스 기사 수
+    force: bool = False           # True면 캐시된 API 응답을 쓰지 않고 새로 분석 ('새로 분석', API "force")
+    status: str = JOB_QUEUED      # queued / running / done / failed
+    progress: str = ""            # 현재 진행 중인 단계 안내 문구
+    stages: Dict[str, float] = field(default_factory=dict)  # 완료된 단계별 소요 시간(ms)
+    search_key: Optional[str] = None   # 완료 시 저장된 검색 결과 키
+    error_type: Optional[str] = None   # 실패 시 에러 식별자
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (JOB_DONE, JOB_FAILED)
@@ -1,9 +1,10 @@
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class NewsArticle:
     """
     개별 뉴스 기사의 정보를 담는 데이터 클래스입니다.
+    기록 전체를 객체로 불러올 때 기사 수만큼 생성되므로 __dict__ 없이 슬롯으로 속성을 저장합니다.
     
     Attributes:
         title (str): 기사 제목
@@ -1,25 +1,40 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, asdict, fields
 from datetime import datetime
-from typing import List
-import pandas as pd
+from typing import Callable, List, Tuple
 from .news_article import NewsArticle
 
-@dataclass
+# 요약 생성 방식 (검색 결과 간 요약 계보 표시에 사용)
+SUMMARY_FULL = "full"                # 전체 기사를 처음부터 요약
+SUMMARY_INCREMENTAL = "incremental"  # 이전 요약 + 새 기사만으로 갱신
+SUMMARY_REUSED = "reused"            # 새 기사가 없어 이전 요약을 그대로 사용
+
+# 분석 마감 시간 안에 끝나지 않아 나중에 채울 단계 (SearchResult.pending)
+STAGE_NEWS = "news"            # 뉴스 검색 (검색되면 요약도 이어서 수행)
+STAGE_SUMMARY = "summary"      # 뉴스 요약
+STAGE_INSIGHTS = "insights"    # AI 심층 인사이트
+
+@dataclass(slots=True)
 class SearchResult:
     """
     한 번의 검색 수행 결과(키워드, 기사 리스트, AI 요약, AI 인사이트, 트렌드 URL)를 관리합니다.
+    인스턴스별 __dict__가 없는 슬롯 클래스이므로 선언되지 않은 속성은 추가할 수 없습니다.
     """
-    search_key: str              # PK, "키워드-yyyymmddhhmm" 형식
+    search_key: str              # PK, "키워드-yyyymmddHHMMSS-xxxxxx" 형식 (이전 기록은 "키워드-yyyymmddHHMM")
     search_time: datetime         # 검색 실행 시간
     keyword: str                  # 검색 키워드
     articles: List[NewsArticle] = field(default_factory=list)
     ai_summary: str = ""          # AI 요약 결과
     ai_insights: str = ""         # AI 심층 인사이트
     trends_url: str = ""          # Google Trends URL
+    parent_key: str = ""          # 요약의 기반이 된 이전 검색 결과 키 (없으면 빈 문자열)
+    summary_mode: str = SUMMARY_FULL   # 요약 생성 방식 (full / incremental / reused)
+    pending: List[str] = field(default_factory=list)   # 마감 시간 안에 끝나지 않아 나중에 채울 단계
 
-    def to_dataframe(self) -> pd.DataFrame:
+    def to_records(self) -> List[dict]:
         """
-        검색 결과를 pandas DataFrame으로 변환합니다. 
+        검색 결과를 저장소의 행(row) 형식 딕셔너리 리스트로 변환합니다.
+        기사 1건당 1행이며, pandas에 의존하지 않도록 DataFrame 생성은 저장소에서 수행합니다.
+        AI 요약/인사이트는 검색 1건에 하나이므로 첫 기사 행에만 기록합니다. (기사 수만큼 반복 저장하지 않음)
         """
         data = []
         # 기사가 있는 경우
@@ -33,9 +48,13 @@ class SearchResult:
                     "title": article.title,
                     "url": article.url,
                     "snippet": article.snippet,
-                    "ai_summary": self.ai_summary,
-                    "ai_insights": self.ai_insights,
-                    "trends_url": self.trends_url
+                    "pub_date": article.pub_date,
+                    "ai_summary": self.ai_summary if i == 1 else "",
+                    "ai_insights": self.ai_insights if i == 1 else "",
+                    "trends_url": self.trends_url,
+                    "parent_key": self.parent_key,
+                    "summary_mode": self.summary_mode,
+                    "pending": ",".join(self.pending) if i == 1 else ""
                 })
         else:
             # 기사가 없는 경우에도 정보를 저장하기 위해 1행 생성
@@ -47,9 +66,105 @@ class SearchResult:
                 "title": "No Articles",
                 "url": "",
                 "snippet": "",
+                "pub_date": "",
                 "ai_summary": self.ai_summary,
                 "ai_insights": self.ai_insights,
-                "trends_url": self.trends_url
+                "trends_url": self.trends_url,
+                "parent_key": self.parent_key,
+                "summary_mode": self.summary_mode,
+                "pending": ",".join(self.pending)
             })
             
-        return pd.DataFrame(data)
+        return data
+
+    def to_dict(self) -> dict:
+        """
+        검색 결과를 JSON으로 직렬화할 수 있는 딕셔너리로 변환합니다. (HTTP API 응답용)
+        """
+        data = asdict(self)
+        data["search_time"] = self.search_time.isoformat(timespec="seconds")
+        return data
+
+
+def _deferred(name: str, loader: str) -> property:
+    """
+    SearchResult의 슬롯(name)을 처음 읽을 때 loader 메서드로 채우는 프로퍼티를 만듭니다.
+    값을 직접 대입하면 불러오지 않고 그 값을 사용합니다.
+    """
+    slot = SearchResult.__dict__[name]
+
+    def get(self):
+        try:
+            return slot.__get__(self)
+        except AttributeError:
+            getattr(self, loader)()
+            return slot.__get__(self)
+
+    def set(self, value):
+        slot.__set__(self, value)
+
+    return property(get, set, doc=f"{name} (처음 접근할 때 저장소에서 불러옴)")
+
+
+class LazySearchResult(SearchResult):
+    """
+    헤더(키, 시각, 키워드, 트렌드 URL, 요약 계보)만 먼저 채우고, 기사 목록과 AI 요약/인사이트는
+    처음 접근할 때 저장소에서 읽어오는 SearchResult입니다.
+    기사와 긴 텍스트는 따로 불러오므로 통합 리포트만 보면 기사 객체는 만들어지지 않습니다.
+
+    SearchResult의 하위 클래스이며 필드 접근, to_records/to_dict, 비교 결과가 같습니다.
+    pickle하면 모든 필드를 불러온 일반 SearchResult로 직렬화됩니다.
+    """
+    __slots__ = ("_load_articles", "_load_texts")
+
+    articles = _deferred("articles", "_fill_articles")
+    ai_summary = _deferred("ai_summary", "_fill_texts")
+    ai_insights = _deferred("ai_insights", "_fill_texts")
+
+    def __init__(
+        self,
+        search_key: str,
+        search_time: datetime,
+        keyword: str,
+        trends_url: str,
+        parent_key: str,
+        summary_mode: str,
+        pending: List[str],
+        load_articles: Callable[[], List[NewsArticle]],
+        load_texts: Callable[[], Tuple[str, str]],
+    ):
+        """
+        Args:
+            load_articles: 기사 목록을 반환하는 함수 (articles에 처음 접근할 때 한 번 호출)
+            load_texts: (AI 요약, AI 인사이트)를 반환하는 함수 (둘 중 하나에 처음 접근할 때 한 번 호출)
+        """
+        self.search_key = search_key
+        self.search_time = search_time
+        self.keyword = keyword
+        self.trends_url = trends_url
+        self.parent_key = parent_key
+        self.summary_mode = summary_mode
+        self.pending = pending
+        self._load_articles = load_articles
+        self._load_texts = load_texts
+
+    def _fill_articles(self):
+        self.articles = self._load_articles()
+
+    def _fill_texts(self):
+        ai_summary, ai_insights = self._load_texts()
+        # 이미 대입된 값은 덮어쓰지 않음
+        for name, value in (("ai_summary", ai_summary), ("ai_insights", ai_insights)):
+            slot = SearchResult.__dict__[name]
+            try:
+                slot.__get__(self)
+            except AttributeError:
+                slot.__set__(self, value)
+
+    def __eq__(self, other):
+        if not isinstance(other, SearchResult):
+            return NotImplemented
+        return all(getattr(self, f.name) == getattr(other, f.name) for f in fields(SearchResult))
+
+    def __reduce__(self):
+        return (SearchResult, tuple(getattr(self, f.name) for f in fields(SearchResult)))
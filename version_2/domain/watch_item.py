@@ -0,0 +1,22 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+@dataclass
+class WatchItem:
+    """
+    주기적으로 자동 갱신되는 워치리스트 키워드 1건과 마지막 갱신 상태를 관리합니다.
+    """
+    keyword: str                  # PK, 감시할 키워드
+    interval_minutes: int         # 갱신 주기 (분)
+    sources: List[str] = field(default_factory=list)   # 분석 소스
+    num_results: int = 5          # 갱신 1회당 최대 새 기사 수
+    enabled: bool = True
+    next_run_at: Optional[datetime] = None
+    last_run_at: Optional[datetime] = None
+    last_published_at: Optional[datetime] = None       # 확인한 가장 최근 기사 발행 시각 (UTC)
+    seen_urls: List[str] = field(default_factory=list)  # 이미 저장한 기사 URL (최근 순)
+    last_search_key: Optional[str] = None              # 마지막으로 저장된 검색 결과 키
+    last_new_articles: int = 0    # 마지막 갱신에서 찾은 새 기사 수
+    runs: int = 0                 # 누적 갱신 횟수
+    skipped_runs: int = 0         # 새 기사가 없어 AI 호출을 건너뛴 횟수
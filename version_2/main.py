@@ -1,5 +1,202 @@
+"""
+브라우저 없이 트렌드 분석을 실행하는 명령줄 도구입니다.
+
+batch: 파일(또는 표준입력)의 키워드 목록을 동시에 여러 개씩 분석하여 검색 기록 CSV에 저장합니다.
+중단(Ctrl+C)하면 진행 중인 분석을 마치고 저장한 뒤 종료하며, 같은 명령을 다시 실행하면
+저장까지 끝난 키워드는 건너뛰고 이어서 분석합니다.
+
+fill-pending: 마감 시간(ANALYSIS_DEADLINE_SECONDS) 안에 끝나지 않아 "대기 중"으로 저장된 단계(뉴스/요약/인사이트)를
+다시 실행하여 채웁니다. 분석 작업은 완료 직후 워커가 한 번 채우므로 그때도 끝나지 않은 결과나 일괄 분석 결과에만 필요합니다.
+
+clear-cache: 여러 프로세스가 공유하는 디스크 캐시(Tavily/Gemini 응답, 파싱한 검색 기록)를 비웁니다.
+
+rebuild-rollups: 전체 검색 기록으로 대시보드의 키워드별 검색 횟수 집계(시간/일/주)를 다시 만듭니다.
+저장 시 집계가 함께 갱신되므로 집계 파일이 없거나 손상되었을 때만 필요합니다.
+
+실행 (version_2 디렉터리에서):
+    python main.py batch keywords.txt --concurrency 4
+    cat keywords.txt | python main.py batch - --sources news --gemini-rpm 15
+    python main.py rebuild-rollups
+    python main.py fill-pending
+    python main.py clear-cache
+"""
+import argparse
+import logging
+import sys
+import time
+from config.settings import Settings
+from repositories.search_repository import SearchRepository
+from repositories.rollup_repository import RollupRepository
+from services.analysis_pipeline import SOURCE_NEWS, SOURCE_AI_INSIGHTS, SOURCE_ALIASES, fill_pending
+from services.batch_runner import BatchCheckpoint, BatchRunner, read_keywords
+from services.key_pool import get_key_pool
+from utils.exceptions import AppError
+from utils.shared_cache import get_history_cache, get_shared_cache
+
+# 환경변수로 지정하지 않았을 때 일괄 분석에 적용할 분당 요청 수
+DEFAULT_TAVILY_RPM = 100
+DEFAULT_GEMINI_RPM = 60
+
+
+def parse_sources(value: str) -> list:
+    names = [name.strip() for name in value.split(",") if name.strip()]
+    unknown = [name for name in names if name not in SOURCE_ALIASES]
+    if unknown or not names:
+        raise argparse.ArgumentTypeError(
+            f"알 수 없는 소스: {', '.join(unknown) or value} (사용 가능: {', '.join(SOURCE_ALIASES)})"
+        )
+    return [SOURCE_ALIASES[name] for name in names]
+
+
+def run_batch(args) -> int:
+    if args.input == "-":
+        keywords = read_keywords(sys.stdin)
+    else:
+        with open(args.input, encoding="utf-8") as f:
+            keywords = read_keywords(f)
+    if not keywords:
+        print("❌ 분석할 키워드가 없습니다.", file=sys.stderr)
+        return 1
+
+    get_key_pool("tavily").set_rate(args.tavily_rpm)
+    get_key_pool("gemini").set_rate(args.gemini_rpm)
+
+    checkpoint = BatchCheckpoint(args.checkpoint)
+    if args.restart:
+        checkpoint.clear()
+
+    runner = BatchRunner(
+        SearchRepository(
+            Settings.CSV_PATH, RollupRepository(Settings.ROLLUP_DB_PATH), Settings.HISTORY_COMPRESSION,
+            get_history_cache()
+        ),
+        checkpoint,
+        sources=args.sources,
+        num_results=args.num_results,
+        concurrency=args.concurrency,
+        batch_size=args.batch_size,
+        retries=args.retries,
+        progress=lambda message: print(message, file=sys.stderr, flush=True)
+    )
+    report = runner.run(keywords)
+
+    rate = report.succeeded / report.seconds * 60 if report.seconds else 0.0
+    print(
+        f"{'⏹️ 중단됨' if report.interrupted else '✅ 완료'} · 성공 {report.succeeded} · 실패 {report.failed} · "
+        f"건너뜀 {report.skipped} / 전체 {report.total} · {report.seconds:.1f}s ({rate:.1f}개/분)",
+        file=sys.stderr
+    )
+    if report.interrupted:
+        print("같은 명령을 다시 실행하면 남은 키워드부터 이어서 분석합니다.", file=sys.stderr)
+        return 130
+    return 1 if report.failed else 0
+
+
+def run_rebuild_rollups(args) -> int:
+    repository = SearchRepository(Settings.CSV_PATH, RollupRepository(Settings.ROLLUP_DB_PATH))
+    started = time.perf_counter()
+    rows = repository.rebuild_rollups()
+    print(f"✅ 검색 횟수 집계 {rows}행을 다시 만들었습니다. ({time.perf_counter() - started:.1f}s)", file=sys.stderr)
+    return 0
+
+
+def run_compact_history(args) -> int:
+    repository = SearchRepository(Settings.CSV_PATH, compress_texts=Settings.HISTORY_COMPRESSION)
+    started = time.perf_counter()
+    before, after = repository.compact()
+    print(
+        f"✅ 검색 기록을 변환했습니다: {before / 1e6:.2f}MB → {after / 1e6:.2f}MB "
+        f"({time.perf_counter() - started:.1f}s)",
+        file=sys.stderr
+    )
+    return 0
+
+
+def run_clear_cache(args) -> int:
+    cache = get_shared_cache()
+    before = cache.stats()
+    removed = cache.clear()
+    print(
+        f"✅ 공유 캐시 항목 {removed}개({before['bytes'] / 1e6:.2f}MB)를 지웠습니다. "
+        f"({Settings.SHARED_CACHE_PATH or '프로세스 내부 캐시'})",
+        file=sys.stderr
+    )
+    return 0
+
+
+def run_fill_pending(args) -> int:
+    repository = SearchRepository(
+        Settings.CSV_PATH, compress_texts=Settings.HISTORY_COMPRESSION, shared_cache=get_history_cache()
+    )
+    keys = repository.find_pending_keys()
+    filled, remaining, failed = 0, 0, 0
+    for search_key in keys:
+        try:
+            result = fill_pending(repository, search_key, args.num_results)
+        except AppError as e:
+            print(f"❌ {search_key}: {e.error_type}", file=sys.stderr)
+            failed += 1
+            continue
+        if result is not None and result.pending:
+            print(f"⏳ {search_key}: 아직 채우지 못한 단계 {', '.join(result.pending)}", file=sys.stderr)
+            remaining += 1
+        else:
+            filled += 1
+    print(
+        f"✅ 대기 중인 결과 {len(keys)}건 · 완료 {filled} · 남음 {remaining} · 실패 {failed}",
+        file=sys.stderr
+    )
+    return 1 if remaining or failed else 0
+
+
 def main():
-    print("Hello from initial-version!")
+    parser = argparse.ArgumentParser(description="TrendTracker 명령줄 도구")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    batch = subparsers.add_parser("batch", help="키워드 목록 일괄 분석")
+    batch.add_argument("input", help="한 줄에 하나씩 키워드가 적힌 파일 ('-'이면 표준입력)")
+    batch.add_argument(
+        "--sources", type=parse_sources, default=[SOURCE_NEWS, SOURCE_AI_INSIGHTS],
+        help="쉼표로 구분한 분석 소스: news, insights, trends (기본: news,insights)"
+    )
+    batch.add_argument("--num-results", type=int, default=5, help="키워드당 뉴스 기사 수")
+    batch.add_argument("--concurrency", type=int, default=4, help="동시에 분석할 키워드 수")
+    batch.add_argument("--batch-size", type=int, default=20, help="한 번에 모아서 저장할 결과 수")
+    batch.add_argument("--retries", type=int, default=3, help="할당량 초과/네트워크 오류 시 재시도 횟수")
+    batch.add_argument(
+        "--tavily-rpm", type=float, default=Settings.TAVILY_RATE_PER_MINUTE or DEFAULT_TAVILY_RPM,
+        help="Tavily API 키 1개당 분당 최대 요청 수 (0이면 제한 없음)"
+    )
+    batch.add_argument(
+        "--gemini-rpm", type=float, default=Settings.GEMINI_RATE_PER_MINUTE or DEFAULT_GEMINI_RPM,
+        help="Gemini API 키 1개당 분당 최대 요청 수 (0이면 제한 없음)"
+    )
+    batch.add_argument("--checkpoint", default=Settings.BATCH_CHECKPOINT_PATH, help="진행 기록 파일")
+    batch.add_argument("--restart", action="store_true", help="진행 기록을 지우고 처음부터 분석")
+    batch.set_defaults(handler=run_batch)
+
+    rebuild = subparsers.add_parser("rebuild-rollups", help="전체 검색 기록으로 키워드별 검색 횟수 집계를 다시 생성")
+    rebuild.set_defaults(handler=run_rebuild_rollups)
+
+    compact = subparsers.add_parser(
+        "compact-history", help="검색 기록 파일 전체를 현재 저장 형식(AI 텍스트 1회 저장, 텍스트 압축)으로 변환"
+    )
+    compact.set_defaults(handler=run_compact_history)
+
+    fill = subparsers.add_parser("fill-pending", help="마감 시간 안에 끝나지 않아 대기 중으로 저장된 분석 단계 채우기")
+    fill.add_argument("--num-results", type=int, default=5, help="뉴스 검색이 남은 결과에서 검색할 기사 수")
+    fill.set_defaults(handler=run_fill_pending)
+
+    clear_cache = subparsers.add_parser("clear-cache", help="프로세스 간 공유 캐시(API 응답, 파싱한 검색 기록) 비우기")
+    clear_cache.set_defaults(handler=run_clear_cache)
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    try:
+        Settings.validate()
+    except ValueError as e:
+        raise SystemExit(str(e))
+    sys.exit(args.handler(args))
 
 
 if __name__ == "__main__":
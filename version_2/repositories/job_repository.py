@@ -0,0 +1,189 @@
+import os
+import json
+import sqlite3
+import logging
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional
+from domain.analysis_job import AnalysisJob, JOB_QUEUED, JOB_RUNNING, JOB_DONE, JOB_FAILED
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    keyword TEXT NOT NULL,
+    sources TEXT NOT NULL,
+    num_results INTEGER NOT NULL,
+    force INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL,
+    progress TEXT NOT NULL DEFAULT '',
+    stages TEXT NOT NULL DEFAULT '{}',
+    search_key TEXT,
+    error_type TEXT,
+    worker TEXT,
+    created_at TEXT NOT NULL,
+    started_at TEXT,
+    finished_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status_created ON jobs (status, created_at);
+"""
+
+class JobRepository:
+    """
+    SQLite 파일을 사용하는 분석 작업 큐입니다.
+    앱 프로세스와 별도 워커 프로세스가 같은 파일을 공유할 수 있도록 호출마다 연결을 열고,
+    작업 할당(claim)은 쓰기 트랜잭션으로 원자적으로 처리합니다.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            # 여러 프로세스가 읽는 동안에도 쓰기가 막히지 않도록 WAL 모드 사용
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            # force 열이 없던 이전 작업 큐 파일에 열 추가
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(jobs)")}
+            if "force" not in columns:
+                conn.execute("ALTER TABLE jobs ADD COLUMN force INTEGER NOT NULL DEFAULT 0")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _to_job(row: sqlite3.Row) -> AnalysisJob:
+        def parse_time(value: Optional[str]) -> Optional[datetime]:
+            return datetime.fromisoformat(value) if value else None
+
+        return AnalysisJob(
+            job_id=row["job_id"],
+            keyword=row["keyword"],
+            sources=json.loads(row["sources"]),
+            num_results=row["num_results"],
+            force=bool(row["force"]),
+            status=row["status"],
+            progress=row["progress"],
+            stages=json.loads(row["stages"]),
+            search_key=row["search_key"],
+            error_type=row["error_type"],
+            created_at=parse_time(row["created_at"]),
+            started_at=parse_time(row["started_at"]),
+            finished_at=parse_time(row["finished_at"])
+        )
+
+    def enqueue(self, keyword: str, sources: List[str], num_results: int, force: bool = False) -> AnalysisJob:
+        """새 분석 작업을 대기(queued) 상태로 등록합니다. force면 캐시된 API 응답을 쓰지 않고 분석합니다."""
+        job = AnalysisJob(
+            job_id=uuid.uuid4().hex,
+            keyword=keyword,
+            sources=list(sources),
+            num_results=num_results,
+            force=force,
+            created_at=datetime.now()
+        )
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO jobs (job_id, keyword, sources, num_results, force, status, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (job.job_id, job.keyword, json.dumps(job.sources, ensure_ascii=False),
+                 job.num_results, int(job.force), JOB_QUEUED, job.created_at.isoformat())
+            )
+        return job
+
+    def claim(self, worker: str) -> Optional[AnalysisJob]:
+        """
+        가장 오래된 대기 작업 1건을 실행(running) 상태로 바꾸고 반환합니다.
+        여러 워커가 동시에 호출해도 같은 작업이 두 번 할당되지 않습니다.
+        """
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT * FROM jobs WHERE status = ? ORDER BY created_at LIMIT 1", (JOB_QUEUED,)
+                ).fetchone()
+                if row is None:
+                    conn.execute("COMMIT")
+                    return None
+                started_at = datetime.now().isoformat()
+                conn.execute(
+                    "UPDATE jobs SET status = ?, worker = ?, started_at = ? WHERE job_id = ?",
+                    (JOB_RUNNING, worker, started_at, row["job_id"])
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        job = self._to_job(row)
+        job.status = JOB_RUNNING
+        job.started_at = datetime.fromisoformat(started_at)
+        return job
+
+    def update_progress(self, job_id: str, progress: str, stages: Dict[str, float]):
+        """실행 중인 작업의 현재 단계 안내 문구와 완료된 단계별 소요 시간을 갱신합니다."""
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET progress = ?, stages = ? WHERE job_id = ?",
+                (progress, json.dumps(stages), job_id)
+            )
+
+    def complete(self, job_id: str, search_key: str, stages: Dict[str, float]):
+        """작업을 완료(done) 상태로 바꾸고 저장된 검색 결과 키를 기록합니다."""
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, search_key = ?, stages = ?, progress = '', finished_at = ? "
+                "WHERE job_id = ?",
+                (JOB_DONE, search_key, json.dumps(stages), datetime.now().isoformat(), job_id)
+            )
+
+    def fail(self, job_id: str, error_type: str, stages: Dict[str, float]):
+        """작업을 실패(failed) 상태로 바꾸고 에러 식별자를 기록합니다."""
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, error_type = ?, stages = ?, progress = '', finished_at = ? "
+                "WHERE job_id = ?",
+                (JOB_FAILED, error_type, json.dumps(stages), datetime.now().isoformat(), job_id)
+            )
+
+    def get(self, job_id: str) -> Optional[AnalysisJob]:
+        """job_id로 작업을 조회합니다."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return self._to_job(row) if row else None
+
+    def count_by_status(self) -> Dict[str, int]:
+        """상태별 작업 수를 반환합니다. (큐 깊이 지표용)"""
+        counts = {status: 0 for status in (JOB_QUEUED, JOB_RUNNING, JOB_DONE, JOB_FAILED)}
+        with self._connect() as conn:
+            for row in conn.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status"):
+                counts[row["status"]] = row["n"]
+        return counts
+
+    def requeue_stale(self, max_running_seconds: float) -> int:
+        """
+        워커 프로세스가 종료되어 실행(running) 상태로 남은 오래된 작업을 다시 대기 상태로 돌립니다.
+
+        Returns:
+            int: 다시 대기열에 넣은 작업 수
+        """
+        cutoff = (datetime.now() - timedelta(seconds=max_running_seconds)).isoformat()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, worker = NULL, started_at = NULL, progress = '' "
+                "WHERE status = ? AND started_at < ?",
+                (JOB_QUEUED, JOB_RUNNING, cutoff)
+            )
+            requeued = cursor.rowcount
+        if requeued:
+            logger.warning(f"중단된 작업 {requeued}건을 다시 대기열에 넣었습니다.")
+        return requeued
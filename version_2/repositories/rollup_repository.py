@@ -0,0 +1,164 @@
+import os
+import sqlite3
+import logging
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Iterable, Iterator, List, Optional, Tuple
+from domain.search_result import SearchResult
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 집계 단위 (시간 / 일 / 주 - 주는 월요일 날짜로 표시)
+GRANULARITIES = ("hour", "day", "week")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS keyword_rollups (
+    granularity TEXT NOT NULL,
+    bucket TEXT NOT NULL,
+    keyword TEXT NOT NULL,
+    searches INTEGER NOT NULL,
+    articles INTEGER NOT NULL,
+    PRIMARY KEY (granularity, bucket, keyword)
+);
+"""
+
+_UPSERT = """
+INSERT INTO keyword_rollups (granularity, bucket, keyword, searches, articles)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (granularity, bucket, keyword) DO UPDATE SET
+    searches = searches + excluded.searches,
+    articles = articles + excluded.articles
+"""
+
+
+def bucket_start(timestamp: datetime, granularity: str) -> str:
+    """검색 시각이 속한 집계 구간의 시작을 문자열로 반환합니다. (사전순 = 시간순)"""
+    if granularity == "hour":
+        return timestamp.strftime("%Y-%m-%d %H:00")
+    if granularity == "day":
+        return timestamp.strftime("%Y-%m-%d")
+    return (timestamp - timedelta(days=timestamp.weekday())).strftime("%Y-%m-%d")
+
+
+def parse_bucket(bucket: str) -> datetime:
+    """bucket_start()가 만든 구간 문자열을 구간 시작 시각으로 변환합니다."""
+    return datetime.strptime(bucket, "%Y-%m-%d %H:%M" if " " in bucket else "%Y-%m-%d")
+
+
+def recent_buckets(granularity: str, count: int, now: Optional[datetime] = None) -> List[str]:
+    """현재 구간을 포함한 최근 count개 구간을 오래된 순으로 반환합니다. (검색이 없는 구간 포함)"""
+    now = now or datetime.now()
+    step = {"hour": timedelta(hours=1), "day": timedelta(days=1), "week": timedelta(weeks=1)}[granularity]
+    return [bucket_start(now - step * i, granularity) for i in range(count - 1, -1, -1)]
+
+
+class RollupRepository:
+    """
+    키워드별 검색 횟수를 시간/일/주 단위로 미리 집계해 두는 SQLite 리포지토리입니다.
+    검색 기록이 저장될 때마다 해당 구간의 횟수만 증가시키므로, 대시보드는 원본 기록 크기와 관계없이
+    (키워드 수 × 구간 수)만큼만 읽습니다.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def add(self, search_results: List[SearchResult]):
+        """새로 저장된 검색 결과를 각 집계 단위의 해당 구간에 더합니다."""
+        rows = [
+            (granularity, bucket_start(result.search_time, granularity), result.keyword, 1, len(result.articles))
+            for result in search_results
+            for granularity in GRANULARITIES
+        ]
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany(_UPSERT, rows)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def replace_all(self, rows: Iterable[Tuple[str, str, str, int, int]]) -> int:
+        """
+        집계 전체를 주어진 (집계 단위, 구간, 키워드, 검색 수, 기사 수) 행으로 교체합니다.
+        하나의 트랜잭션으로 처리하므로 다른 프로세스는 교체 전 또는 후의 집계만 읽습니다.
+
+        Returns:
+            int: 기록한 행 수
+        """
+        rows = list(rows)
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute("DELETE FROM keyword_rollups")
+                conn.executemany(_UPSERT, rows)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return len(rows)
+
+    def is_empty(self) -> bool:
+        with self._connect() as conn:
+            return conn.execute("SELECT 1 FROM keyword_rollups LIMIT 1").fetchone() is None
+
+    def latest_bucket(self, granularity: str) -> Optional[str]:
+        """집계된 가장 최근 구간을 반환합니다. (기록이 없으면 None)"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT MAX(bucket) AS bucket FROM keyword_rollups WHERE granularity = ?", (granularity,)
+            ).fetchone()
+        return row["bucket"]
+
+    def top_keywords(self, granularity: str, since: str, limit: int = 5) -> List[Tuple[str, int]]:
+        """since 구간 이후 검색 횟수가 많은 키워드를 [(키워드, 검색 수), ...]로 반환합니다."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT keyword, SUM(searches) AS total FROM keyword_rollups "
+                "WHERE granularity = ? AND bucket >= ? GROUP BY keyword ORDER BY total DESC, keyword LIMIT ?",
+                (granularity, since, limit)
+            ).fetchall()
+        return [(row["keyword"], row["total"]) for row in rows]
+
+    def totals(self, granularity: str, since: str) -> Tuple[int, int]:
+        """since 구간 이후의 (전체 검색 수, 검색된 키워드 수)를 반환합니다."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT COALESCE(SUM(searches), 0) AS searches, COUNT(DISTINCT keyword) AS keywords "
+                "FROM keyword_rollups WHERE granularity = ? AND bucket >= ?",
+                (granularity, since)
+            ).fetchone()
+        return row["searches"], row["keywords"]
+
+    def series(self, granularity: str, since: str, keywords: Optional[List[str]] = None) -> List[dict]:
+        """
+        since 구간 이후의 구간별 집계를 오래된 순으로 반환합니다.
+
+        Returns:
+            List[dict]: [{bucket, keyword, searches, articles}, ...]
+        """
+        query = ("SELECT bucket, keyword, searches, articles FROM keyword_rollups "
+                 "WHERE granularity = ? AND bucket >= ?")
+        params: list = [granularity, since]
+        if keywords is not None:
+            query += f" AND keyword IN ({','.join('?' * len(keywords))})"
+            params.extend(keywords)
+        with self._connect() as conn:
+            rows = conn.execute(query + " ORDER BY bucket", params).fetchall()
+        return [dict(row) for row in rows]
@@ -1,59 +1,359 @@
+import io
 import os
-import pandas as pd
 import logging
-from typing import List, Optional
-from domain.search_result import SearchResult
+import struct
+import tempfile
+from typing import TYPE_CHECKING, Dict, FrozenSet, Iterable, List, Optional, Tuple
+from domain.search_result import LazySearchResult, SearchResult, SUMMARY_FULL
 from domain.news_article import NewsArticle
-from datetime import datetime
+from repositories.rollup_repository import GRANULARITIES, RollupRepository
+from repositories.text_codec import TEXT_COLUMNS, decode_text, encode_text
+from utils.input_handler import normalize_keyword
+from utils.file_lock import file_lock
+from utils.shared_cache import MemoryCache, make_key
+from datetime import datetime, timedelta
+
+# pandas는 첫 조회/저장 시점에 임포트하여 앱 첫 화면 렌더링을 지연시키지 않습니다.
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# 공유 캐시에 저장하는 검색 기록의 머리부분: 파싱한 CSV 파일의 버전 (수정 시각 ns, 크기), 뒤에는 Feather(Arrow IPC) 바이트
+_SHARED_HEADER = struct.Struct("<qq")
+
 class SearchRepository:
     """CSV 파일을 사용하여 검색 기록을 관리하는 리포지토리"""
 
-    def __init__(self, csv_path: str):
+    def __init__(
+        self, csv_path: str, rollups: Optional[RollupRepository] = None, compress_texts: bool = True,
+        shared_cache: Optional[MemoryCache] = None
+    ):
         self.csv_path = csv_path
+        # 저장 시 키워드별 검색 횟수 집계도 함께 갱신 (대시보드용, 없으면 생략)
+        self.rollups = rollups
+        # 기사 스니펫과 AI 요약/인사이트를 공유 사전으로 압축하여 저장 (읽기는 설정과 관계없이 두 형식 모두 지원)
+        self.compress_texts = compress_texts
+        # 파싱한 DataFrame을 다른 프로세스와 공유하는 캐시 (없으면 프로세스마다 CSV를 파싱)
+        self.shared_cache = shared_cache
         self.columns = [
             "search_key", "search_time", "keyword", "article_index",
-            "title", "url", "snippet", "ai_summary", "ai_insights", "trends_url"
+            "title", "url", "snippet", "ai_summary", "ai_insights", "trends_url",
+            "parent_key", "summary_mode", "pub_date", "pending"
         ]
         # data/ 폴더가 없으면 자동 생성
         directory = os.path.dirname(csv_path)
         if directory:
             os.makedirs(directory, exist_ok=True)
+        # 마지막으로 읽은 (파일 버전, DataFrame) - 파일이 바뀌지 않았으면 다시 읽지 않음
+        self._cache: Optional[Tuple[Tuple[int, int], "pd.DataFrame"]] = None
+        # 같은 기록 파일을 쓰는 스레드와 프로세스(앱 워커, worker.py, api.py, main.py)의 저장을 직렬화하는 잠금 파일
+        self.lock_path = f"{csv_path}.lock"
+        # 마지막으로 만든 (파일 버전, 정규화 키워드별 검색 결과 색인) - find_recent용
+        self._keyword_index_cache: Optional[Tuple[Tuple[int, int], Dict[str, list]]] = None
+
+    def version(self) -> Tuple[int, int]:
+        """
+        CSV 파일의 (수정 시각 ns, 크기)를 반환합니다.
+        저장(쓰기)이 일어나면 값이 바뀌므로 조회 결과 캐시의 무효화 키로 사용합니다.
+        """
+        try:
+            stat = os.stat(self.csv_path)
+            return (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            return (0, 0)
+
+    def _cached_frame(self) -> Optional["pd.DataFrame"]:
+        """파일이 마지막으로 읽은 이후 바뀌지 않았다면 캐시된 DataFrame을 반환"""
+        cache = self._cache
+        if cache is not None and cache[0] == self.version():
+            return cache[1]
+        return None
+
+    def load(self) -> "pd.DataFrame":
+        """
+        CSV 파일에서 데이터를 로드. 파일이 없으면 빈 데이터프레임 반환
+        파일이 바뀌지 않았다면 이전에 읽은 DataFrame을 그대로 반환하므로 호출자는 수정하지 않아야 합니다.
+        """
+        import pandas as pd
 
-    def load(self) -> pd.DataFrame:
-        """CSV 파일에서 데이터를 로드. 파일이 없으면 빈 데이터프레임 반환"""
         if not os.path.exists(self.csv_path):
             return pd.DataFrame(columns=self.columns)
+
+        cached = self._cached_frame()
+        if cached is not None:
+            return cached
         
         try:
-            df = pd.read_csv(self.csv_path)
-            if df.empty:
-                return pd.DataFrame(columns=self.columns)
+            version = self.version()
+            df = self._load_shared(version)
+            if df is None:
+                df = pd.read_csv(self.csv_path)
+                if df.empty:
+                    return pd.DataFrame(columns=self.columns)
+                df = self._coerce_types(df)
+                self._store_shared(version, df)
+            self._cache = (version, df)
             return df
         except Exception as e:
             logger.warning(f"CSV 로드 실패: {e}")
             return pd.DataFrame(columns=self.columns)
 
+    def _shared_key(self) -> str:
+        # 저장 형식이 바뀌면 이전 형식의 항목을 읽지 않도록 형식 이름도 키에 포함
+        return make_key(os.path.abspath(self.csv_path), "feather")
+
+    def _load_shared(self, version: Tuple[int, int]) -> Optional["pd.DataFrame"]:
+        """
+        다른 프로세스가 같은 파일 버전을 파싱해 공유 캐시에 저장한 DataFrame이 있으면 반환합니다.
+        캐시 파일은 같은 호스트의 다른 프로그램도 쓸 수 있으므로 코드를 실행할 수 있는 pickle 대신
+        데이터만 담는 Feather 형식으로 읽으며, 읽을 수 없는 항목은 무시하고 CSV를 다시 파싱합니다.
+        """
+        import numpy as np
+        import pandas as pd
+
+        if self.shared_cache is None:
+            return None
+        value = self.shared_cache.get("history", self._shared_key())
+        if value is None or len(value) < _SHARED_HEADER.size:
+            return None
+        if _SHARED_HEADER.unpack_from(value) != tuple(version):
+            return None
+        try:
+            df = pd.read_feather(io.BytesIO(value[_SHARED_HEADER.size:]))
+        except Exception as e:
+            logger.warning(f"공유 캐시의 검색 기록을 읽을 수 없습니다: {e}")
+            return None
+        # Arrow는 문자열 열의 빈 값을 None으로 돌려주므로 read_csv와 같이 NaN으로 맞춤
+        text_columns = df.select_dtypes("object").columns
+        df[text_columns] = df[text_columns].where(df[text_columns].notna(), np.nan)
+        return df
+
+    def _store_shared(self, version: Tuple[int, int], df: "pd.DataFrame"):
+        """파싱한 DataFrame을 파일 버전과 함께 공유 캐시에 저장합니다. (경로당 항목 1개, 이전 버전은 덮어씀)"""
+        if self.shared_cache is None:
+            return
+        buffer = io.BytesIO()
+        buffer.write(_SHARED_HEADER.pack(*version))
+        try:
+            df.to_feather(buffer)
+        except Exception as e:
+            # 한 열에 문자열과 숫자가 섞인 파일 등 Arrow로 변환할 수 없으면 공유하지 않음 (각 프로세스가 직접 파싱)
+            logger.warning(f"검색 기록을 공유 캐시에 저장할 수 없습니다: {e}")
+            return
+        self.shared_cache.set("history", self._shared_key(), buffer.getvalue())
+
+    @staticmethod
+    def _coerce_types(df: "pd.DataFrame") -> "pd.DataFrame":
+        """
+        기사 발행일(pub_date)을 UTC 기준 datetime64 열로 변환합니다.
+        발행일을 저장하지 않던 이전 버전 CSV는 모두 NaT로 채웁니다.
+        """
+        import pandas as pd
+
+        if "pub_date" in df.columns:
+            df["pub_date"] = pd.to_datetime(df["pub_date"], utc=True, errors="coerce", format="ISO8601")
+        else:
+            df["pub_date"] = pd.Series(pd.NaT, index=df.index, dtype="datetime64[ns, UTC]")
+        return df
+
     def save(self, search_result: SearchResult) -> bool:
         """SearchResult를 CSV 파일에 추가 저장"""
+        return self.save_many([search_result])
+
+    def _has_current_header(self) -> bool:
+        """CSV 파일의 머리글이 현재 열 구성과 같은지 확인합니다. (다르면 이전 버전 형식)"""
         try:
-            new_df = search_result.to_dataframe()
-            
-            if os.path.exists(self.csv_path):
-                existing_df = pd.read_csv(self.csv_path)
-                final_df = pd.concat([existing_df, new_df], ignore_index=True)
-            else:
-                final_df = new_df
-                
-            final_df.to_csv(self.csv_path, index=False, encoding='utf-8-sig')
-            return True
-        except Exception as e:
-            logger.error(f"CSV 저장 실패: {e}")
+            with open(self.csv_path, "r", encoding="utf-8-sig") as f:
+                return f.readline().rstrip("\r\n").split(",") == self.columns
+        except (OSError, UnicodeDecodeError):
             return False
 
+    def save_many(self, search_results: List[SearchResult]) -> bool:
+        """
+        여러 SearchResult를 CSV 파일에 추가 저장합니다.
+        파일이 현재 형식이면 새 행만 파일 끝에 덧붙이므로 저장 시간이 기록 크기와 관계없고,
+        이전 버전 형식(열 구성이 다름)이면 한 번 전체를 다시 써서 현재 형식으로 변환합니다.
+        """
+        import pandas as pd
+
+        if not search_results:
+            return True
+
+        with file_lock(self.lock_path):
+            try:
+                new_df = self._records_frame(search_results)
+                exists = os.path.exists(self.csv_path) and os.path.getsize(self.csv_path) > 0
+                if exists and self._has_current_header():
+                    # 기존 행은 다시 읽거나 쓰지 않고 새 행만 덧붙임
+                    new_df.to_csv(self.csv_path, mode="a", header=False, index=False, encoding="utf-8")
+                else:
+                    if exists:
+                        existing_df = self._cached_frame()
+                        if existing_df is None:
+                            existing_df = self._coerce_types(pd.read_csv(self.csv_path))
+                        final_df = pd.concat([existing_df, new_df], ignore_index=True)
+                    else:
+                        final_df = new_df
+                    # 현재 열 순서로 다시 써서 다음 저장부터는 덧붙이기로 처리
+                    self._write_replacing(final_df)
+            except Exception as e:
+                logger.error(f"CSV 저장 실패: {e}")
+                return False
+            finally:
+                # 파일이 바뀌었으므로 다음 조회 시 다시 읽음
+                self._cache = None
+
+            if self.rollups is not None:
+                try:
+                    self.rollups.add(search_results)
+                except Exception as e:
+                    # 기록 저장은 성공했으므로 실패로 처리하지 않음 (main.py rebuild-rollups로 복구)
+                    logger.warning(f"검색 횟수 집계 갱신 실패: {e}")
+            return True
+
+    def _write_replacing(self, df: "pd.DataFrame"):
+        """
+        df를 같은 폴더의 고유한 임시 파일에 쓴 뒤 기록 파일과 교체합니다. (잠금을 잡은 상태에서 호출)
+        쓰는 도중 실패해도 기존 파일은 그대로 남습니다.
+        """
+        directory = os.path.dirname(os.path.abspath(self.csv_path))
+        fd, temp_path = tempfile.mkstemp(prefix=f"{os.path.basename(self.csv_path)}.", suffix=".tmp", dir=directory)
+        os.close(fd)
+        try:
+            extra = [name for name in df.columns if name not in self.columns]
+            df.reindex(columns=self.columns + extra).to_csv(temp_path, index=False, encoding='utf-8-sig')
+            os.replace(temp_path, self.csv_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def _records_frame(self, search_results: List[SearchResult]) -> "pd.DataFrame":
+        """SearchResult 목록을 저장 형식의 DataFrame으로 변환합니다. (발행일 정규화, 텍스트 열 압축)"""
+        import pandas as pd
+
+        records = [record for result in search_results for record in result.to_records()]
+        new_df = pd.DataFrame(records, columns=self.columns)
+        # Tavily 발행일(RFC 2822 또는 ISO 8601)을 UTC 타임스탬프로 정규화하여 저장
+        new_df["pub_date"] = pd.to_datetime(new_df["pub_date"], utc=True, errors="coerce", format="mixed")
+        if self.compress_texts:
+            for name in TEXT_COLUMNS:
+                new_df[name] = new_df[name].map(encode_text)
+        return new_df
+
+    def replace(self, search_result: SearchResult) -> bool:
+        """
+        같은 search_key로 저장된 행을 search_result로 바꿉니다. (마감 시간 안에 끝나지 않은 단계를 나중에 채울 때 사용)
+        기록 파일 전체를 임시 파일에 다시 쓴 뒤 교체하므로 도중에 실패해도 기존 파일은 그대로 남습니다.
+        다른 프로세스의 저장(save_many)과 같은 잠금 파일로 직렬화하므로 교체하는 동안 덧붙인 행을 잃지 않습니다.
+        검색 횟수 집계는 키워드와 검색 시각이 바뀌지 않으므로 갱신하지 않습니다.
+        """
+        import pandas as pd
+
+        with file_lock(self.lock_path):
+            try:
+                df = self.load()
+                if df.empty or not (df["search_key"] == search_result.search_key).any():
+                    return False
+                kept = df[df["search_key"] != search_result.search_key]
+                self._write_replacing(pd.concat([kept, self._records_frame([search_result])], ignore_index=True))
+                return True
+            except Exception as e:
+                logger.error(f"CSV 저장 실패: {e}")
+                return False
+            finally:
+                self._cache = None
+
+    def find_pending_keys(self) -> List[str]:
+        """마감 시간 안에 끝나지 않아 채워야 할 단계가 남은 검색 결과의 search_key 목록을 반환합니다. (오래된 순)"""
+        df = self.load()
+        if df.empty or "pending" not in df.columns:
+            return []
+        pending = df[df["pending"].notna() & (df["pending"].astype(str) != "")]
+        return pending.sort_values("search_time", kind="stable")["search_key"].drop_duplicates().tolist()
+
+    def compact(self) -> Tuple[int, int]:
+        """
+        기록 파일 전체를 현재 저장 형식으로 다시 씁니다. (이전 버전 기록의 변환용)
+        AI 요약/인사이트는 검색별 첫 기사 행에만 남기고, 텍스트 열은 compress_texts 설정에 따라 압축하거나 원문으로 되돌립니다.
+        쓰기가 끝난 임시 파일로 교체하므로 도중에 실패해도 기존 파일은 그대로 남습니다.
+
+        Returns:
+            Tuple[int, int]: (변환 전 파일 크기, 변환 후 파일 크기) 바이트
+        """
+        import numpy as np
+
+        with file_lock(self.lock_path):
+            if not os.path.exists(self.csv_path):
+                return 0, 0
+            before = os.path.getsize(self.csv_path)
+            df = self.load()
+            if df.empty:
+                return before, before
+
+            df = df.copy()
+            # 검색별로 article_index가 가장 작은 행에만 AI 텍스트를 남김
+            order = np.lexsort((df["article_index"].to_numpy(), df["search_key"].to_numpy()))
+            keys = df["search_key"].to_numpy()[order]
+            first = np.zeros(len(df), dtype=bool)
+            first[order[np.r_[True, keys[1:] != keys[:-1]]]] = True
+            codec = encode_text if self.compress_texts else (lambda value: value)
+            for name in TEXT_COLUMNS:
+                if name not in df.columns:
+                    continue
+                column = df[name].map(decode_text, na_action="ignore")
+                if name != "snippet":
+                    column = column.where(first, "")
+                df[name] = column.map(codec, na_action="ignore")
+
+            try:
+                self._write_replacing(df)
+            finally:
+                self._cache = None
+            return before, os.path.getsize(self.csv_path)
+
+    def rebuild_rollups(self) -> int:
+        """
+        전체 검색 기록에서 키워드별 검색 횟수 집계를 다시 계산하여 교체합니다.
+        집계 파일이 없거나 저장 중 집계 갱신이 실패했을 때 사용합니다.
+
+        Returns:
+            int: 기록한 집계 행 수
+        """
+        import pandas as pd
+
+        if self.rollups is None:
+            return 0
+        with file_lock(self.lock_path):
+            df = self.load()
+            if df.empty:
+                return self.rollups.replace_all([])
+
+            heads = df.drop_duplicates("search_key")[["search_key", "keyword", "search_time"]].copy()
+            heads["articles"] = heads["search_key"].map(df.groupby("search_key")["article_index"].max()).clip(lower=0)
+            times = pd.to_datetime(heads["search_time"], format="mixed", errors="coerce")
+            heads = heads[times.notna()]
+            times = times[times.notna()]
+            buckets = {
+                "hour": times.dt.strftime("%Y-%m-%d %H:00"),
+                "day": times.dt.strftime("%Y-%m-%d"),
+                "week": (times.dt.normalize() - pd.to_timedelta(times.dt.weekday, unit="D")).dt.strftime("%Y-%m-%d"),
+            }
+            rows = []
+            for granularity in GRANULARITIES:
+                grouped = heads.assign(bucket=buckets[granularity]).groupby(["bucket", "keyword"]).agg(
+                    searches=("search_key", "size"), articles=("articles", "sum")
+                )
+                rows.extend(
+                    (granularity, bucket, str(keyword), int(searches), int(articles))
+                    for (bucket, keyword), searches, articles in zip(
+                        grouped.index, grouped["searches"], grouped["articles"]
+                    )
+                )
+            return self.rollups.replace_all(rows)
+
     def get_all_keys(self) -> List[str]:
         """모든 고유 search_key 리스트를 최신순으로 반환"""
         df = self.load()
@@ -64,55 +364,335 @@ class SearchRepository:
         keys = df_sorted["search_key"].unique().tolist()
         return keys
 
+    def get_history_page(self, offset: int = 0, limit: int = 20) -> Tuple[int, List[dict]]:
+        """
+        검색 기록을 최신순으로 한 페이지만큼 요약하여 반환합니다. (기사 본문과 AI 요약은 제외)
+
+        Returns:
+            Tuple[int, List[dict]]: (전체 검색 결과 수, [{search_key, keyword, search_time, article_count, summary_mode}, ...])
+        """
+        import pandas as pd
+
+        df = self.load()
+        if df.empty:
+            return 0, []
+
+        heads = df.drop_duplicates("search_key").sort_values(by="search_time", ascending=False)
+        page = heads.iloc[offset:offset + limit]
+        counts = df[df["search_key"].isin(page["search_key"])].groupby("search_key")["article_index"].max()
+        items = []
+        for row in page.itertuples(index=False):
+            mode = getattr(row, "summary_mode", None)
+            items.append({
+                "search_key": str(row.search_key),
+                "keyword": str(row.keyword),
+                "search_time": str(row.search_time),
+                "article_count": int(counts.get(row.search_key, 0)),
+                "summary_mode": SUMMARY_FULL if mode is None or pd.isna(mode) else str(mode),
+            })
+        return len(heads), items
+
     def find_by_key(self, search_key: str) -> Optional[SearchResult]:
         """search_key로 특정 검색 결과 조회"""
         df = self.load()
         if df.empty:
             return None
         
-        result_df = df[df["search_key"] == search_key]
-        if result_df.empty:
+        positions = self._key_positions(df, search_key)
+        if not len(positions):
             return None
-        
-        # 첫 번째 행에서 기본 정보 추출
-        first_row = result_df.iloc[0]
-        
-        # 안전한 가져오기 (이전 버전 CSV 호환성)
-        ai_insights = str(first_row.get("ai_insights", ""))
-        trends_url = str(first_row.get("trends_url", ""))
-        
-        # 날짜 포맷 변환
-        search_time_val = first_row["search_time"]
-        if isinstance(search_time_val, str):
-            try:
-                search_time = pd.to_datetime(search_time_val).to_pydatetime()
-            except:
-                search_time = datetime.now()
-        else:
-            search_time = search_time_val
-
-        # 기사 리스트 복구 (article_index가 0인 것은 기사가 없는 placeholder)
-        articles = []
-        for _, row in result_df.sort_values("article_index").iterrows():
-            if row["article_index"] > 0:
-                articles.append(NewsArticle(
-                    title=str(row["title"]),
-                    url=str(row["url"]),
-                    snippet=str(row["snippet"]),
-                    pub_date=""
-                ))
-            
-        return SearchResult(
-            search_key=str(first_row["search_key"]),
-            search_time=search_time,
-            keyword=str(first_row["keyword"]),
-            articles=articles,
-            ai_summary=str(first_row["ai_summary"]),
-            ai_insights=ai_insights,
-            trends_url=trends_url
+        return self._results_from_frame(df.iloc[positions])[0]
+
+    def find_lazy_by_key(self, search_key: str) -> Optional[LazySearchResult]:
+        """
+        search_key로 검색 결과의 헤더만 조회합니다.
+        기사 목록과 AI 요약/인사이트는 처음 접근할 때 기억해 둔 행 위치로 읽으므로 전체 기록을 다시 검색하지 않습니다.
+        """
+        df = self.load()
+        if df.empty:
+            return None
+
+        positions = self._key_positions(df, search_key)
+        if not len(positions):
+            return None
+        head = self._results_from_frame(df.iloc[positions[:1]], with_texts=False)[0]
+        return LazySearchResult(
+            search_key=head.search_key,
+            search_time=head.search_time,
+            keyword=head.keyword,
+            trends_url=head.trends_url,
+            parent_key=head.parent_key,
+            summary_mode=head.summary_mode,
+            pending=head.pending,
+            load_articles=lambda: self._results_from_frame(self._rows_at(search_key, positions))[0].articles,
+            load_texts=lambda: self._texts_at(search_key, positions),
+        )
+
+    @staticmethod
+    def _key_positions(df: "pd.DataFrame", search_key: str) -> "np.ndarray":
+        """search_key가 같은 행의 위치를 반환합니다. (object 열을 pandas 비교보다 빠른 NumPy 배열 비교로 검색)"""
+        import numpy as np
+
+        return np.flatnonzero(df["search_key"].to_numpy() == search_key)
+
+    def _rows_at(self, search_key: str, positions) -> "pd.DataFrame":
+        """
+        find_lazy_by_key가 기억한 행 위치의 행을 반환합니다.
+        기록은 뒤에 추가만 되므로 보통 위치가 그대로지만, 파일이 바뀌어 어긋나면 search_key로 다시 찾습니다.
+        """
+        df = self.load()
+        if positions[-1] < len(df):
+            rows = df.iloc[positions]
+            if (rows["search_key"] == search_key).all():
+                return rows
+        return df.iloc[self._key_positions(df, search_key)]
+
+    def _texts_at(self, search_key: str, positions) -> Tuple[str, str]:
+        """(AI 요약, AI 인사이트)를 반환합니다. (기사 객체는 만들지 않도록 텍스트가 저장된 첫 기사 행만 변환)"""
+        import numpy as np
+
+        rows = self._rows_at(search_key, positions)
+        if rows.empty:
+            return "", ""
+        first = int(np.argmin(rows["article_index"].to_numpy()))
+        head = self._results_from_frame(rows.iloc[first:first + 1])[0]
+        return head.ai_summary, head.ai_insights
+
+    def find_all(self) -> List[SearchResult]:
+        """
+        전체 검색 기록을 최신순 SearchResult 리스트로 반환합니다. (내보내기, 분석, 일괄 처리용)
+        """
+        df = self.load()
+        if df.empty:
+            return []
+        results = self._results_from_frame(df)
+        # 검색 시각을 읽지 못한 행(이전 버전 기록의 빈 값)은 가장 오래된 것으로 정렬
+        results.sort(
+            key=lambda result: result.search_time if isinstance(result.search_time, datetime) else datetime.min,
+            reverse=True
         )
+        return results
+
+    def _results_from_frame(self, df: "pd.DataFrame", with_texts: bool = True) -> List[SearchResult]:
+        """
+        검색 기록 행을 search_key별 SearchResult로 변환합니다. (기사는 article_index 순)
+        행마다 iterrows를 거치지 않고 열 단위 리스트를 한 번씩만 만들어 순회합니다.
+        압축 저장된 스니펫과 AI 텍스트는 변환하는 행의 값만 이때 복원하며,
+        with_texts=False이면 기사 목록과 AI 텍스트 없이 헤더만 만듭니다. (지연 조회용)
+
+        키워드, AI 요약/인사이트처럼 검색 1건의 기사 행마다 반복되는 값은 read_csv(C 파서)가 이미 같은 문자열
+        객체로 읽으므로 그대로 참조합니다. (pd.factorize 등으로 다시 공유시키면 한글 문자열마다 UTF-8 사본이
+        캐시되어 오히려 메모리가 늘어납니다.) 기사마다 새로 만들어지는 발행일 문자열만 같은 시각끼리 공유합니다.
+        """
+        import numpy as np
+        import pandas as pd
+
+        keys = df["search_key"].to_numpy()
+        if len(keys) and (keys == keys[0]).all():
+            # 검색 1건 조회는 기사 순서만 정렬 (작은 DataFrame에서는 sort_values의 고정 비용이 큼)
+            ordered = df.iloc[np.argsort(df["article_index"].to_numpy(), kind="stable")]
+        else:
+            ordered = df.sort_values(["search_key", "article_index"], kind="stable")
+
+        def column(name: str) -> list:
+            # 안전한 가져오기 (이전 버전 CSV 호환성)
+            if name in ordered.columns:
+                return ordered[name].tolist()
+            return [None] * len(ordered)
+
+        keys = ordered["search_key"].to_numpy()
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]]).tolist()
+        ends = starts[1:] + [len(keys)]
+
+        first_times = ordered["search_time"].iloc[starts].tolist()
+
+        keywords, indexes = column("keyword"), column("article_index")
+        titles, urls, snippets = column("title"), column("url"), column("snippet")
+        codes, published = pd.factorize(ordered["pub_date"])
+        labels = [timestamp.isoformat() for timestamp in published] + [""]  # 코드 -1(NaT)은 마지막 ""
+        pub_dates = [labels[code] for code in codes.tolist()]
+        summaries, insights, trends_urls = column("ai_summary"), column("ai_insights"), column("trends_url")
+        parent_keys, summary_modes, pendings = column("parent_key"), column("summary_mode"), column("pending")
+
+        results = []
+        for start, end, search_time in zip(starts, ends, first_times):
+            # 날짜 포맷 변환 (저장 형식인 ISO 8601이 아니면 pandas로 변환)
+            if isinstance(search_time, str):
+                try:
+                    search_time = datetime.fromisoformat(search_time)
+                except ValueError:
+                    try:
+                        search_time = pd.to_datetime(search_time).to_pydatetime()
+                    except:
+                        search_time = datetime.now()
+
+            if not with_texts:
+                articles, ai_summary, ai_insights = [], None, None
+            else:
+                # 기사 리스트 복구 (article_index가 0인 것은 기사가 없는 placeholder)
+                articles = [
+                    NewsArticle(
+                        title=str(titles[i]),
+                        url=str(urls[i]),
+                        snippet=str(decode_text(snippets[i])),
+                        pub_date=pub_dates[i]
+                    )
+                    for i in range(start, end) if indexes[i] > 0
+                ]
+                # AI 텍스트는 첫 기사 행에만 저장 (비어 있으면 NaN으로 읽힘)
+                ai_summary = decode_text(summaries[start])
+                ai_insights = decode_text(insights[start])
+            trends_url = trends_urls[start]
+            parent_key = parent_keys[start]
+            summary_mode = summary_modes[start]
+            pending = pendings[start]
+            results.append(SearchResult(
+                search_key=str(keys[start]),
+                search_time=search_time,
+                keyword=str(keywords[start]),
+                articles=articles,
+                ai_summary="" if pd.isna(ai_summary) else str(ai_summary),
+                ai_insights="" if pd.isna(ai_insights) else str(ai_insights),
+                trends_url="" if trends_url is None else str(trends_url),
+                parent_key="" if pd.isna(parent_key) else str(parent_key),
+                summary_mode=SUMMARY_FULL if pd.isna(summary_mode) else str(summary_mode),
+                pending=[] if pd.isna(pending) or not pending else str(pending).split(",")
+            ))
+        return results
+
+    def _keyword_index(self) -> Dict[str, List[Tuple[datetime, str, FrozenSet[str], int]]]:
+        """
+        정규화한 키워드별 검색 결과 목록(최신순)을 반환합니다. 파일이 바뀌지 않았다면 이전에 만든 색인을 재사용합니다.
+        분석 소스는 저장된 내용으로 판단합니다. (기사가 있으면 "news", AI 인사이트가 있으면 "insights",
+        트렌드 URL이 있으면 "trends" - analysis_pipeline.SOURCE_ALIASES의 짧은 이름)
+
+        Returns:
+            Dict[str, List[Tuple[datetime, str, FrozenSet[str], int]]]: 키워드 → [(검색 시각, search_key, 분석 소스, 기사 수), ...]
+        """
+        import pandas as pd
+
+        version = self.version()
+        cache = self._keyword_index_cache
+        if cache is not None and cache[0] == version:
+            return cache[1]
+
+        df = self.load()
+        index: Dict[str, list] = {}
+        if not df.empty:
+            grouped = df.groupby("search_key", sort=False)
+            heads = grouped.agg(
+                keyword=("keyword", "first"), search_time=("search_time", "first"), articles=("article_index", "max")
+            )
+            # 비어 있는 값은 NaN으로 읽히므로 검색별로 값이 있는 행 수를 셈
+            flags = {
+                source: grouped[column].count() > 0 if column in df.columns else pd.Series(False, index=heads.index)
+                for source, column in (("insights", "ai_insights"), ("trends", "trends_url"))
+            }
+            times = pd.to_datetime(heads["search_time"], format="mixed", errors="coerce")
+            for search_key, keyword, search_time, articles, insights, trends in zip(
+                heads.index, heads["keyword"], times, heads["articles"], flags["insights"], flags["trends"]
+            ):
+                if pd.isna(search_time):
+                    continue
+                sources = frozenset(
+                    name for name, present in (("news", articles > 0), ("insights", insights), ("trends", trends))
+                    if present
+                )
+                index.setdefault(normalize_keyword(str(keyword)), []).append(
+                    (search_time.to_pydatetime(), search_key, sources, int(articles))
+                )
+            for entries in index.values():
+                entries.sort(key=lambda entry: entry[0], reverse=True)
+        self._keyword_index_cache = (version, index)
+        return index
+
+    def find_recent(
+        self, keyword: str, sources: Iterable[str], max_age: Optional[timedelta], min_articles: int = 0
+    ) -> Optional[Tuple[str, datetime]]:
+        """
+        정규화한 키워드와 분석 소스 구성이 같은 검색 결과 중 max_age 이내에 저장된 가장 최근 결과를 찾습니다.
+
+        Args:
+            keyword (str): 검색 키워드 (띄어쓰기, 대소문자 차이는 무시)
+            sources (Iterable[str]): 분석 소스 짧은 이름 ("news", "insights", "trends")
+            max_age (Optional[timedelta]): 재사용할 수 있는 최대 경과 시간 (None이면 제한 없음)
+            min_articles (int): 뉴스 소스를 포함할 때 필요한 최소 기사 수
+
+        Returns:
+            Optional[Tuple[str, datetime]]: (search_key, 검색 시각) 또는 None
+        """
+        wanted = frozenset(sources)
+        cutoff = datetime.now() - max_age if max_age is not None else None
+        for search_time, search_key, stored, articles in self._keyword_index().get(normalize_keyword(keyword), []):
+            if cutoff is not None and search_time < cutoff:
+                break
+            if stored == wanted and ("news" not in wanted or articles >= min_articles):
+                return search_key, search_time
+        return None
+
+    def find_latest_by_keyword(self, keyword: str) -> Optional[SearchResult]:
+        """같은 키워드로 가장 최근에 저장된 검색 결과를 조회합니다. (증분 요약의 기준)"""
+        df = self.load()
+        if df.empty:
+            return None
+
+        matched = df[df["keyword"] == keyword]
+        if matched.empty:
+            return None
+        latest_key = matched.sort_values("search_time").iloc[-1]["search_key"]
+        return self.find_by_key(latest_key)
+
+    def get_lineage(self, search_key: str, max_depth: int = 10) -> List[Tuple[str, str]]:
+        """
+        검색 결과의 요약 계보를 오래된 순으로 반환합니다.
+        parent_key를 따라 최대 max_depth 단계까지 거슬러 올라갑니다.
+
+        Returns:
+            List[Tuple[str, str]]: [(search_key, summary_mode), ...] (마지막 항목이 search_key 자신)
+        """
+        import pandas as pd
+
+        df = self.load()
+        if df.empty or "parent_key" not in df.columns:
+            return []
+
+        heads = df.drop_duplicates("search_key").set_index("search_key")
+        chain = []
+        key = search_key
+        while key and key in heads.index and len(chain) < max_depth:
+            row = heads.loc[key]
+            mode = row["summary_mode"]
+            chain.append((key, SUMMARY_FULL if pd.isna(mode) else str(mode)))
+            parent = row["parent_key"]
+            key = "" if pd.isna(parent) else str(parent)
+        return list(reversed(chain))
+
+    def get_article_dates(self, keyword: str) -> "pd.Series":
+        """
+        키워드로 저장된 모든 기사의 발행일(UTC)을 반환합니다.
+        여러 번 검색되어 중복 저장된 기사는 URL 기준으로 한 번만 포함하며, 발행일이 없는 기사는 제외합니다.
+        """
+        import pandas as pd
+
+        df = self.load()
+        if df.empty:
+            return pd.Series([], dtype="datetime64[ns, UTC]")
+        articles = df.loc[(df["keyword"] == keyword) & (df["article_index"] > 0), ["url", "pub_date"]]
+        return articles.drop_duplicates("url")["pub_date"].dropna().reset_index(drop=True)
 
     def get_all_as_csv(self) -> str:
-        """전체 데이터를 CSV 문자열로 반환 (다운로드용)"""
+        """
+        전체 데이터를 CSV 문자열로 반환 (다운로드용)
+        첫 기사 행에만 저장된 AI 요약/인사이트는 행마다 채워서 내보내 기사 행 단위로 바로 사용할 수 있게 합니다.
+        """
         df = self.load()
-        return df.to_csv(index=False, encoding='utf-8-sig')
+        if df.empty:
+            return df.to_csv(index=False, encoding='utf-8-sig')
+        # 압축 저장된 텍스트는 원문으로 복원하여 내보냄
+        decoded = {
+            name: df[name].map(decode_text, na_action="ignore") for name in TEXT_COLUMNS if name in df.columns
+        }
+        df = df.assign(**decoded)
+        texts = [name for name in ("ai_summary", "ai_insights") if name in df.columns]
+        filled = df.groupby("search_key", sort=False)[texts].transform("first")
+        return df.assign(**{name: filled[name] for name in texts}).to_csv(index=False, encoding='utf-8-sig')
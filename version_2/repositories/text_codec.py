@@ -0,0 +1,113 @@
+import base64
+import os
+import re
+import zlib
+from collections import Counter
+from functools import lru_cache
+from typing import Iterable, List
+
+# 압축해서 저장하는 검색 기록 열 (행마다 길고 서로 다른 한국어 텍스트)
+TEXT_COLUMNS = ("snippet", "ai_summary", "ai_insights")
+
+# 압축 사전 버전 (dictionaries/history_v{버전}.txt). 저장된 값은 "z{버전}:"으로 시작하며,
+# 한 번 배포한 사전 파일은 바꾸지 않습니다. (다시 학습하면 새 버전을 추가하고 새로 저장하는 값에만 사용)
+DICTIONARY_VERSIONS = (1,)
+CURRENT_DICTIONARY = DICTIONARY_VERSIONS[-1]
+DICTIONARY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dictionaries")
+# zlib 사전은 압축 창(32KB) 안의 내용만 참조할 수 있음
+DICTIONARY_MAX_BYTES = 32 * 1024
+
+# 문장/줄 경계 (사전 학습 시 텍스트를 나누는 기준)
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+|\n+")
+
+
+def _prefix(version: int) -> str:
+    return f"z{version}:"
+
+
+_VERSION_BY_HEAD = {_prefix(version)[:-1]: version for version in DICTIONARY_VERSIONS}
+
+
+@lru_cache(maxsize=None)
+def load_dictionary(version: int) -> bytes:
+    """버전별 압축 사전(UTF-8 텍스트 파일)을 읽습니다."""
+    with open(os.path.join(DICTIONARY_DIR, f"history_v{version}.txt"), "rb") as f:
+        return f.read()
+
+
+def is_encoded(value) -> bool:
+    """압축된 형식("z{버전}:...")으로 저장된 값인지 확인합니다."""
+    if not isinstance(value, str) or not value.startswith("z"):
+        return False
+    head, sep, _ = value.partition(":")
+    return bool(sep) and head in _VERSION_BY_HEAD
+
+
+def encode_text(text: str, version: int = CURRENT_DICTIONARY) -> str:
+    """
+    텍스트를 공유 사전을 사용한 raw deflate로 압축하여 CSV에 그대로 쓸 수 있는 base64 문자열로 반환합니다.
+    압축해도 UTF-8 원문보다 짧지 않으면 원문을 그대로 반환합니다. (압축 형식처럼 보이는 원문은 항상 압축)
+    """
+    if not isinstance(text, str) or not text:
+        return text
+    compressor = zlib.compressobj(9, zlib.DEFLATED, -15, 9, zlib.Z_DEFAULT_STRATEGY, load_dictionary(version))
+    raw = text.encode("utf-8")
+    packed = compressor.compress(raw) + compressor.flush()
+    encoded = _prefix(version) + base64.b64encode(packed).decode("ascii")
+    if len(encoded) < len(raw) or is_encoded(text):
+        return encoded
+    return text
+
+
+def decode_text(value):
+    """encode_text로 압축된 값이면 원문으로 되돌리고, 아니면(이전 기록의 원문, NaN 등) 그대로 반환합니다."""
+    if not is_encoded(value):
+        return value
+    head, _, body = value.partition(":")
+    decompressor = zlib.decompressobj(-15, load_dictionary(_VERSION_BY_HEAD[head]))
+    return (decompressor.decompress(base64.b64decode(body)) + decompressor.flush()).decode("utf-8")
+
+
+def train_dictionary(texts: Iterable[str], max_bytes: int = DICTIONARY_MAX_BYTES) -> str:
+    """
+    여러 텍스트에 반복해서 나타나는 문장과 어절 묶음으로 zlib 압축 사전을 만듭니다.
+    (나타난 텍스트 수 - 1) × 길이가 큰 조각부터 고르고, 가장 유용한 조각이 사전 끝(가장 가까운 거리)에 오도록 배치합니다.
+
+    Args:
+        texts (Iterable[str]): 학습할 텍스트 (같은 텍스트는 한 번만 셈)
+        max_bytes (int): 사전 최대 크기 (UTF-8 바이트)
+
+    Returns:
+        str: 사전 내용 (UTF-8로 인코딩하여 사용)
+    """
+    document_counts: Counter = Counter()
+    for text in set(texts):
+        segments = set()
+        for sentence in _SENTENCE_BOUNDARY.split(text):
+            sentence = sentence.strip()
+            if not sentence:
+                continue
+            segments.add(sentence)
+            words = sentence.split()
+            for size in range(2, 7):
+                for start in range(len(words) - size + 1):
+                    segments.add(" ".join(words[start:start + size]))
+        document_counts.update(segments)
+
+    candidates = sorted(
+        ((count - 1) * len(segment.encode("utf-8")), segment)
+        for segment, count in document_counts.items() if count > 1
+    )
+    chosen: List[str] = []
+    joined = ""
+    used = 0
+    for _, segment in reversed(candidates):
+        size = len(segment.encode("utf-8")) + 1
+        # 이미 고른 조각에 포함된 조각은 사전에서 그대로 참조되므로 제외
+        if used + size > max_bytes or segment in joined:
+            continue
+        chosen.append(segment)
+        joined += segment + "\n"
+        used += size
+    # 점수가 높은 조각을 마지막에 두어 가장 짧은 거리로 참조되게 함
+    return "\n".join(reversed(chosen))
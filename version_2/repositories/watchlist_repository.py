@@ -0,0 +1,160 @@
+import os
+import json
+import sqlite3
+import logging
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Iterator, List, Optional
+from domain.watch_item import WatchItem
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS watchlist (
+    keyword TEXT PRIMARY KEY,
+    interval_minutes INTEGER NOT NULL,
+    sources TEXT NOT NULL,
+    num_results INTEGER NOT NULL,
+    enabled INTEGER NOT NULL DEFAULT 1,
+    next_run_at TEXT NOT NULL,
+    last_run_at TEXT,
+    last_published_at TEXT,
+    seen_urls TEXT NOT NULL DEFAULT '[]',
+    last_search_key TEXT,
+    last_new_articles INTEGER NOT NULL DEFAULT 0,
+    runs INTEGER NOT NULL DEFAULT 0,
+    skipped_runs INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+class WatchlistRepository:
+    """
+    SQLite 파일을 사용하여 워치리스트 키워드와 키워드별 마지막 갱신 상태를 관리하는 리포지토리입니다.
+    앱과 워커 프로세스가 같은 파일을 공유해도 같은 키워드가 동시에 두 번 갱신되지 않도록
+    실행 대상 선점(claim_due)을 쓰기 트랜잭션으로 처리합니다.
+    """
+
+    def __init__(self, db_path: str, seen_urls_max: int = 500):
+        self.db_path = db_path
+        self.seen_urls_max = seen_urls_max
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _to_item(row: sqlite3.Row) -> WatchItem:
+        def parse_time(value: Optional[str]) -> Optional[datetime]:
+            return datetime.fromisoformat(value) if value else None
+
+        return WatchItem(
+            keyword=row["keyword"],
+            interval_minutes=row["interval_minutes"],
+            sources=json.loads(row["sources"]),
+            num_results=row["num_results"],
+            enabled=bool(row["enabled"]),
+            next_run_at=parse_time(row["next_run_at"]),
+            last_run_at=parse_time(row["last_run_at"]),
+            last_published_at=parse_time(row["last_published_at"]),
+            seen_urls=json.loads(row["seen_urls"]),
+            last_search_key=row["last_search_key"],
+            last_new_articles=row["last_new_articles"],
+            runs=row["runs"],
+            skipped_runs=row["skipped_runs"]
+        )
+
+    def add(self, keyword: str, interval_minutes: int, sources: List[str], num_results: int) -> WatchItem:
+        """
+        키워드를 워치리스트에 추가합니다. 이미 있으면 주기와 소스만 갱신하고 수집 상태는 유지합니다.
+        새로 추가된 키워드는 다음 스케줄러 주기에 바로 실행됩니다.
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO watchlist (keyword, interval_minutes, sources, num_results, next_run_at) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(keyword) DO UPDATE SET interval_minutes = excluded.interval_minutes, "
+                "sources = excluded.sources, num_results = excluded.num_results, enabled = 1",
+                (keyword, interval_minutes, json.dumps(sources, ensure_ascii=False),
+                 num_results, datetime.now().isoformat())
+            )
+        return self.get(keyword)
+
+    def remove(self, keyword: str):
+        """키워드를 워치리스트에서 삭제합니다."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM watchlist WHERE keyword = ?", (keyword,))
+
+    def get(self, keyword: str) -> Optional[WatchItem]:
+        """키워드로 워치리스트 항목을 조회합니다."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM watchlist WHERE keyword = ?", (keyword,)).fetchone()
+        return self._to_item(row) if row else None
+
+    def list_all(self) -> List[WatchItem]:
+        """모든 워치리스트 항목을 다음 실행 시각 순으로 반환합니다."""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT * FROM watchlist ORDER BY next_run_at").fetchall()
+        return [self._to_item(row) for row in rows]
+
+    def claim_due(self, now: Optional[datetime] = None) -> List[WatchItem]:
+        """
+        실행 시각이 된 항목들을 반환하고, 다음 실행 시각을 주기만큼 미뤄 다른 스케줄러가 중복 실행하지 않게 합니다.
+        """
+        now = now or datetime.now()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = conn.execute(
+                    "SELECT * FROM watchlist WHERE enabled = 1 AND next_run_at <= ? ORDER BY next_run_at",
+                    (now.isoformat(),)
+                ).fetchall()
+                for row in rows:
+                    next_run_at = now + timedelta(minutes=row["interval_minutes"])
+                    conn.execute(
+                        "UPDATE watchlist SET next_run_at = ? WHERE keyword = ?",
+                        (next_run_at.isoformat(), row["keyword"])
+                    )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return [self._to_item(row) for row in rows]
+
+    def record_run(
+        self,
+        keyword: str,
+        new_urls: List[str],
+        last_published_at: Optional[datetime],
+        search_key: Optional[str]
+    ):
+        """
+        갱신 1회의 결과를 기록합니다. 새 기사가 없으면(new_urls가 비어 있으면) 건너뛴 실행으로 집계하고
+        기존 발행 시각/URL 상태와 마지막 검색 결과 키는 그대로 유지합니다.
+        """
+        item = self.get(keyword)
+        if item is None:
+            return
+        seen_urls = (new_urls + [url for url in item.seen_urls if url not in new_urls])[:self.seen_urls_max]
+        published = last_published_at or item.last_published_at
+        if item.last_published_at and published and published < item.last_published_at:
+            published = item.last_published_at
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE watchlist SET last_run_at = ?, last_published_at = ?, seen_urls = ?, "
+                "last_search_key = COALESCE(?, last_search_key), last_new_articles = ?, "
+                "runs = runs + 1, skipped_runs = skipped_runs + ? WHERE keyword = ?",
+                (datetime.now().isoformat(), published.isoformat() if published else None,
+                 json.dumps(seen_urls), search_key, len(new_urls), 0 if new_urls else 1, keyword)
+            )
@@ -1,24 +1,150 @@
-from typing import List
-from google import genai
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from typing import List, Optional, Tuple
 from domain.news_article import NewsArticle
 from config.settings import Settings
+from services.client_pool import get_genai_client
+from services.key_pool import KEY_ERRORS, get_key_pool
+from services.model_router import (
+    OUTCOME_ERROR, OUTCOME_OK, OUTCOME_RATE_LIMITED, OUTCOME_TIMEOUT, get_model_router
+)
+from utils.deadline import stage_timeout
 from utils.exceptions import AppError
+from utils.metrics import registry
+from utils.shared_cache import bypassing, get_shared_cache, make_key
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 헤지 요청을 함께 실행하는 스레드 수 (첫 모델과 다음 모델 요청을 동시에 보낼 수 있도록 풀 크기만큼)
+_hedge_executor = ThreadPoolExecutor(max_workers=max(Settings.HTTP_POOL_SIZE, 4), thread_name_prefix="gemini")
+
+# 해당 오류 다음에 다른 모델을 호출해도 소용없는 오류 (풀의 모든 API 키가 잘못된 경우, 키는 모든 모델에 공통)
+FATAL_ERRORS = ("api_key_invalid",)
+
+def _format_articles(articles: List[NewsArticle]) -> str:
+    news_context = ""
+    for i, article in enumerate(articles, 1):
+        news_context += f"{i}. 제목: {article.title}\n   내용: {article.snippet}\n\n"
+    return news_context
+
+def build_summary_prompt(articles: List[NewsArticle]) -> str:
+    """전체 기사를 처음부터 요약하는 프롬프트를 생성합니다."""
+    return f"""
+다음 뉴스 기사들의 핵심 내용을 한국어로 요약해주세요:
+- 불릿 포인트 형식으로 최대 5개 항목
+- 각 항목은 1~2문장
+
+[뉴스 목록]
+{_format_articles(articles)}
+""".strip()
+
+def build_update_prompt(previous_summary: str, new_articles: List[NewsArticle]) -> str:
+    """기존 요약에 새 기사만 반영하도록 요청하는 증분 요약 프롬프트를 생성합니다."""
+    return f"""
+아래는 같은 주제에 대한 기존 뉴스 요약과, 그 이후 새로 나온 뉴스 기사들입니다.
+새 기사의 내용을 반영하여 기존 요약을 한국어로 갱신해주세요:
+- 불릿 포인트 형식으로 최대 5개 항목
+- 각 항목은 1~2문장
+- 새 기사와 맞지 않거나 오래된 내용은 새 내용으로 교체하고, 여전히 유효한 내용은 유지
+
+[기존 요약]
+{previous_summary}
+
+[새 뉴스 목록]
+{_format_articles(new_articles)}
+""".strip()
+
+def _record_usage(response, task: str):
+    """응답의 토큰 사용량을 작업별 카운터(trendtracker_gemini_tokens_total)에 기록합니다."""
+    usage = getattr(response, "usage_metadata", None)
+    if usage is None:
+        return
+    for kind, value in (("prompt", usage.prompt_token_count), ("output", usage.candidates_token_count)):
+        if value:
+            registry.inc(
+                "trendtracker_gemini_tokens_total", {"task": task, "kind": kind}, value,
+                help_text="Gemini tokens used, by task and kind"
+            )
+
+def _request_config():
+    """
+    요청별 시간 제한(GEMINI_TIMEOUT_SECONDS와 분석 마감까지 남은 시간 중 짧은 값)을 담은 생성 설정을 만듭니다.
+    남은 시간이 없으면 AppError("timeout")를 발생시킵니다.
+    """
+    from google.genai import types
+
+    timeout_ms = int(stage_timeout(Settings.GEMINI_TIMEOUT_SECONDS) * 1000)
+    return types.GenerateContentConfig(http_options=types.HttpOptions(timeout=timeout_ms))
+
+def _is_timeout(error: Exception) -> bool:
+    import httpx
+
+    return isinstance(error, (httpx.TimeoutException, TimeoutError))
+
+def _error_type(error: Exception) -> str:
+    """
+    Gemini SDK 예외를 AppError의 에러 종류로 변환합니다.
+    키 풀이 키를 쉬게 하는 오류(api_key_invalid, rate_limit_exceeded)는 키 자체의 문제일 때만 반환하고,
+    그 밖의 잘못된 요청(예: 400 INVALID_ARGUMENT, 너무 긴 프롬프트)은 ai_error로 처리합니다.
+    """
+    if _is_timeout(error):
+        return "timeout"
+    error_str = str(error).lower()
+    code = getattr(error, "code", None)
+    # 잘못된 키는 401/403 또는 400 + API_KEY_INVALID("API key not valid") 응답으로 옴
+    if code in (401, 403) or "api_key_invalid" in error_str or "api key not valid" in error_str:
+        return "api_key_invalid"
+    elif code == 429 or "resource_exhausted" in error_str or "quota" in error_str:
+        # Gemini 무료 플랜은 분당 15회 제한이 있을 수 있음을 알림
+        return "rate_limit_exceeded"
+    return "ai_error"
+
+# 에러 종류 → 모델 라우터에 기록할 호출 결과
+_OUTCOMES = {"timeout": OUTCOME_TIMEOUT, "rate_limit_exceeded": OUTCOME_RATE_LIMITED}
+
+def _text_key(model: str, prompt: str) -> str:
+    """모델/프롬프트와 응답한 서버(실제 API/대체 서버)로 공유 캐시 키를 만듭니다."""
+    return make_key("gemini", Settings.GEMINI_BASE_URL, model, prompt)
+
+def _cached_text(model: str, prompt: str) -> Optional[str]:
+    """
+    같은 모델/프롬프트의 응답이 공유 캐시에 있으면 반환합니다.
+    GEMINI_CACHE_SECONDS가 0이거나 bypass_scope 안이면 None을 반환합니다.
+    """
+    if Settings.GEMINI_CACHE_SECONDS <= 0 or bypassing():
+        return None
+    value = get_shared_cache().get("gemini", _text_key(model, prompt))
+    return value.decode("utf-8") if value is not None else None
+
+def _store_text(model: str, prompt: str, text: str):
+    """성공한 응답을 응답한 모델의 키로 공유 캐시에 저장합니다."""
+    if Settings.GEMINI_CACHE_SECONDS > 0:
+        get_shared_cache().set(
+            "gemini", _text_key(model, prompt), text.encode("utf-8"), Settings.GEMINI_CACHE_SECONDS
+        )
 
 class AIService:
     """
     Google Gemini API를 사용하여 뉴스 기사들을 요약하는 서비스 클래스입니다.
     기사 내용을 바탕으로 핵심 포인트를 추출하여 한국어로 제공합니다.
+    호출할 모델은 ModelRouter가 작업별 설정과 모델별 최근 지연/오류율로 정하며,
+    첫 모델이 실패하면 다음 모델로, 최근 p95 안에 응답하지 않으면 다음 모델에도 요청(헤지)합니다.
     """
     
     def __init__(self):
         """
         AIService를 초기화합니다. API 키가 없으면 AppError를 발생시킵니다.
+        키 풀의 키마다 공유 커넥션 풀을 사용하는 Gemini 클라이언트를 따로 사용합니다.
         """
         if not Settings.GEMINI_API_KEY:
             raise AppError("api_key_invalid")
         
-        self.client = genai.Client(api_key=Settings.GEMINI_API_KEY)
-        self.model_name = Settings.GEMINI_MODEL
+        self.keys = get_key_pool("gemini")
+        self.router = get_model_router()
 
     def summarize_news(self, articles: List[NewsArticle]) -> str:
         """
@@ -36,44 +162,138 @@ class AIService:
         if not articles:
             return "요약할 기사가 없습니다."
 
-        # 뉴스 리스트 구성
-        news_context = ""
-        for i, article in enumerate(articles, 1):
-            news_context += f"{i}. 제목: {article.title}\n   내용: {article.snippet}\n\n"
+        return self._generate(build_summary_prompt(articles), "summarize")
 
-        prompt = f"""
-다음 뉴스 기사들의 핵심 내용을 한국어로 요약해주세요:
-- 불릿 포인트 형식으로 최대 5개 항목
-- 각 항목은 1~2문장
+    def update_summary(self, previous_summary: str, new_articles: List[NewsArticle]) -> str:
+        """
+        이전 요약문에 새 기사 내용만 반영하여 갱신된 요약문을 생성합니다.
+        이미 요약된 기사를 다시 보내지 않으므로 전체 재요약보다 입력 토큰이 적습니다.
 
-[뉴스 목록]
-{news_context}
-""".strip()
+        Args:
+            previous_summary (str): 이전 분석의 AI 요약 텍스트
+            new_articles (List[NewsArticle]): 이전 분석 이후 새로 수집된 기사 리스트
 
-        try:
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=prompt
+        Returns:
+            str: 갱신된 한국어 요약 텍스트 (새 기사가 없으면 이전 요약 그대로)
+
+        Raises:
+            AppError: API 키 오류, 할당량 초과, 서비스 장애 등 발생 시
+        """
+        if not new_articles:
+            return previous_summary
+
+        return self._generate(build_update_prompt(previous_summary, new_articles), "update_summary")
+
+    def _generate(self, prompt: str, task: str) -> str:
+        """
+        라우터가 정한 순서대로 모델을 호출하여 응답 텍스트를 반환합니다. (같은 프롬프트의 응답은 공유 캐시에서 재사용)
+        실패하면 다음 모델을 호출하며, 모든 모델이 실패하면 마지막 오류를 AppError로 발생시킵니다.
+        """
+        candidates = self.router.candidates(task)
+        for model in candidates:
+            cached = _cached_text(model, prompt)
+            if cached is not None:
+                return cached
+
+        remaining = list(candidates)
+        last_error = AppError("ai_error")
+        while remaining:
+            model = remaining.pop(0)
+            try:
+                delay = self.router.hedge_delay(model) if Settings.GEMINI_HEDGE_REQUESTS and remaining else None
+                if delay is not None:
+                    text, used = self._hedged(model, delay, remaining, prompt, task)
+                else:
+                    text, used = self._attempt(model, prompt, task), model
+            except AppError as e:
+                if e.error_type in FATAL_ERRORS:
+                    raise
+                last_error = e
+                continue
+            _store_text(used, prompt, text)
+            return text
+        raise last_error
+
+    def _hedged(
+        self, model: str, delay: float, remaining: List[str], prompt: str, task: str
+    ) -> Tuple[str, str]:
+        """
+        model에 요청하고, delay초(최근 p95 지연) 안에 응답하지 않으면 remaining의 첫 모델에도 같은 요청을 보내
+        먼저 성공한 응답을 (텍스트, 모델)로 반환합니다. 다음 모델에 요청했으면 remaining에서 뺍니다.
+        늦게 끝난 요청은 버리지만 소요 시간은 라우터에 기록됩니다.
+        """
+        # 단계별 소요 시간(span)과 분석 마감 시간이 요청 스레드에도 적용되도록 컨텍스트를 복사하여 실행
+        futures = {_hedge_executor.submit(copy_context().run, self._attempt, model, prompt, task): model}
+        done, _ = wait(futures, timeout=delay)
+        if not done:
+            backup = remaining.pop(0)
+            registry.inc(
+                "trendtracker_gemini_hedged_total", {"task": task, "model": backup},
+                help_text="Gemini requests hedged to another model after the first exceeded its p95, by task and model"
             )
-            
-            if not response or not response.text:
-                raise AppError("ai_error")
-                
-            return response.text
-
-        except Exception as e:
-            error_str = str(e).lower()
-            if "api_key" in error_str or "invalid" in error_str or "401" in error_str:
-                raise AppError("api_key_invalid")
-            elif "429" in error_str or "quota" in error_str or "limit" in error_str:
-                # Gemini 무료 플랜은 분당 15회 제한이 있을 수 있음을 알림
-                raise AppError("rate_limit_exceeded")
-            else:
-                raise AppError("ai_error")
+            futures[_hedge_executor.submit(copy_context().run, self._attempt, backup, prompt, task)] = backup
+
+        error = None
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    text = future.result()
+                except AppError as e:
+                    error = e
+                    continue
+                if futures[future] != model:
+                    registry.inc(
+                        "trendtracker_gemini_hedge_wins_total", {"task": task, "model": futures[future]},
+                        help_text="Hedged Gemini requests answered first by the second model, by task and model"
+                    )
+                return text, futures[future]
+        raise error
+
+    def _attempt(self, model: str, prompt: str, task: str) -> str:
+        """
+        모델 1개를 키 풀에서 가장 한가한 키로 호출하고 소요 시간과 결과를 라우터에 기록합니다. 오류는 AppError로 변환합니다.
+        키에만 해당하는 오류(할당량 초과, 잘못된 키)는 쉬는 중이 아닌 다른 키로 다시 호출하며,
+        다른 키가 없을 때만 모델의 결과로 기록합니다. (할당량 초과이면 라우터가 대체 모델로 우회)
+        """
+        tried = set()
+        while True:
+            with self.keys.lease(exclude=tried) as key:
+                config = _request_config()
+                started = time.perf_counter()
+                try:
+                    response = get_genai_client(key.api_key).models.generate_content(
+                        model=model,
+                        contents=prompt,
+                        config=config
+                    )
+                    if not response or not response.text:
+                        raise AppError("ai_error")
+                except AppError as e:
+                    error = e
+                except Exception as e:
+                    logger.warning(f"Gemini {model} 호출 실패 ({task}, {key.label}): {e}")
+                    error = AppError(_error_type(e))
+                else:
+                    self.keys.record(key)
+                    self.router.record(model, time.perf_counter() - started, OUTCOME_OK)
+                    _record_usage(response, task)
+                    return response.text
+                elapsed = time.perf_counter() - started
+                self.keys.record(key, error.error_type)
+            tried.add(key.label)
+            if error.error_type in KEY_ERRORS and self.keys.available(tried):
+                continue
+            self.router.record(model, elapsed, _OUTCOMES.get(error.error_type, OUTCOME_ERROR))
+            raise error
 
     def get_ai_insights(self, keyword: str) -> str:
         """
         특정 키워드에 대해 Gemini의 자체 지식을 바탕으로 깊이 있는 트렌드 분석을 수행합니다.
+
+        Raises:
+            AppError: 시간 제한을 넘긴 경우 ("timeout", 그 밖의 오류는 안내 문구를 반환)
         """
         prompt = f"""
 전문가적인 시각에서 '{keyword}'에 대한 현재 트렌드와 미래 전망을 분석해주세요.
@@ -87,33 +307,48 @@ class AIService:
 """.strip()
 
         try:
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=prompt
-            )
-            return response.text if response and response.text else "인사이트를 생성할 수 없습니다."
-        except Exception as e:
-            return f"AI 인사이트 로드 중 오류 발생: {str(e)}"
+            return self._generate(prompt, "insights")
+        except AppError as e:
+            # 시간 제한 초과는 분석 파이프라인이 "대기 중"으로 저장하고 나중에 다시 채우도록 전달
+            if e.error_type == "timeout":
+                raise
+            if e.error_type == "ai_error":
+                return "인사이트를 생성할 수 없습니다."
+            return f"AI 인사이트 로드 중 오류 발생: {e.error_type}"
 
 # 싱글톤 인스턴스 전역 변수
 _ai_service = None
+_ai_service_lock = threading.Lock()
+
+def get_ai_service() -> AIService:
+    """
+    AIService 싱글톤 인스턴스를 반환합니다.
+    여러 세션이 동시에 첫 요청을 보내도 인스턴스는 한 번만 생성됩니다.
+    """
+    global _ai_service
+    if _ai_service is None:
+        with _ai_service_lock:
+            if _ai_service is None:
+                _ai_service = AIService()
+    return _ai_service
 
 def summarize_news(articles: List[NewsArticle]) -> str:
     """
     편의를 위한 AIService 래퍼 함수입니다.
     싱글톤 인스턴스를 사용하여 뉴스 요약을 수행합니다.
     """
-    global _ai_service
-    if _ai_service is None:
-        _ai_service = AIService()
-    return _ai_service.summarize_news(articles)
+    return get_ai_service().summarize_news(articles)
+
+def update_summary(previous_summary: str, new_articles: List[NewsArticle]) -> str:
+    """
+    편의를 위한 AIService 래퍼 함수입니다.
+    이전 요약에 새 기사만 반영하는 증분 요약을 수행합니다.
+    """
+    return get_ai_service().update_summary(previous_summary, new_articles)
 
 def get_ai_insights(keyword: str) -> str:
     """
     편의를 위한 AIService 래퍼 함수입니다.
     Gemini의 자체 지식으로 트렌드 분석을 수행합니다.
     """
-    global _ai_service
-    if _ai_service is None:
-        _ai_service = AIService()
-    return _ai_service.get_ai_insights(keyword)
+    return get_ai_service().get_ai_insights(keyword)
@@ -0,0 +1,278 @@
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from config.settings import Settings
+from domain.news_article import NewsArticle
+from domain.search_result import (
+    SearchResult, SUMMARY_FULL, SUMMARY_INCREMENTAL, SUMMARY_REUSED, STAGE_NEWS, STAGE_SUMMARY, STAGE_INSIGHTS
+)
+from repositories.search_repository import SearchRepository
+from services.search_service import search_news, get_google_trends_url, count_search_requests
+from services.ai_service import (
+    summarize_news, update_summary, get_ai_insights, build_summary_prompt, build_update_prompt
+)
+from utils.deadline import deadline_scope
+from utils.shared_cache import bypass_scope
+from utils.exceptions import AppError
+from utils.key_generator import generate_search_key
+from utils.metrics import span, registry, append_metrics_record
+
+# 검색 폼에서 선택 가능한 분석 소스
+SOURCE_NEWS = "최신 뉴스 (Tavily)"
+SOURCE_AI_INSIGHTS = "AI 심층 분석 (Gemini)"
+SOURCE_TRENDS = "트렌드 지표 (Google Trends)"
+
+# 명령줄 도구와 HTTP API에서 사용하는 분석 소스의 짧은 이름
+SOURCE_ALIASES = {
+    "news": SOURCE_NEWS,
+    "insights": SOURCE_AI_INSIGHTS,
+    "trends": SOURCE_TRENDS,
+}
+# 분석 소스 표시 이름 → 짧은 이름
+SOURCE_NAMES = {source: name for name, source in SOURCE_ALIASES.items()}
+
+
+def estimate_api_calls(sources: List[str], num_results: int) -> Dict[str, int]:
+    """
+    선택된 소스로 분석 1회를 실행할 때의 외부 API 호출 수(최대)를 제공자별로 반환합니다.
+    (뉴스: Tavily 검색 요청 + Gemini 요약 1회, AI 인사이트: Gemini 1회, Google Trends: 호출 없음)
+    """
+    calls = {"tavily": 0, "gemini": 0}
+    if SOURCE_NEWS in sources:
+        calls["tavily"] += count_search_requests(num_results)
+        calls["gemini"] += 1
+    if SOURCE_AI_INSIGHTS in sources:
+        calls["gemini"] += 1
+    return calls
+
+
+def find_reusable_result(
+    repository: SearchRepository, keyword: str, sources: List[str], num_results: int
+) -> Optional[Tuple[str, datetime]]:
+    """
+    같은 키워드(띄어쓰기/대소문자 무시)와 분석 소스로 RESULT_REUSE_MINUTES 안에 저장된 결과를 찾습니다.
+    뉴스를 포함하면 저장된 기사가 num_results건(검색 1회에 가져올 수 있는 MAX_NUM_RESULTS건을 넘으면
+    MAX_NUM_RESULTS건) 이상인 결과만 재사용합니다.
+    찾으면 새 분석 대신 그 결과를 보여주며, 재사용 횟수와 절약한 API 호출 수를 지표로 기록합니다.
+
+    Returns:
+        Optional[Tuple[str, datetime]]: (search_key, 분석 시각) 또는 None
+    """
+    if Settings.RESULT_REUSE_MINUTES <= 0:
+        return None
+    with span("reuse_lookup"):
+        found = repository.find_recent(
+            keyword, [SOURCE_NAMES[source] for source in sources if source in SOURCE_NAMES],
+            timedelta(minutes=Settings.RESULT_REUSE_MINUTES),
+            min_articles=min(num_results, Settings.MAX_NUM_RESULTS)
+        )
+    registry.inc(
+        "trendtracker_result_reuse_total", {"outcome": "hit" if found else "miss"},
+        help_text="Analysis requests answered from a recent stored result, by outcome"
+    )
+    if found:
+        calls = estimate_api_calls(sources, num_results)
+        for provider, count in calls.items():
+            registry.inc(
+                "trendtracker_api_calls_avoided_total", {"provider": provider}, count,
+                help_text="External API calls avoided by reusing recent results, by provider"
+            )
+        append_metrics_record({
+            "keyword": keyword, "sources": sources, "num_results": num_results, "status": "reused",
+            "search_key": found[0], "api_calls_avoided": calls
+        }, Settings.METRICS_LOG_PATH)
+    return found
+
+
+def find_stale_result(
+    repository: SearchRepository, keyword: str, sources: List[str]
+) -> Optional[Tuple[str, datetime]]:
+    """
+    새로 분석하는 동안 먼저 보여줄, 같은 키워드와 분석 소스로 가장 최근에 저장된 결과를 찾습니다. (경과 시간 제한 없음)
+    STALE_WHILE_REVALIDATE가 꺼져 있으면 항상 None을 반환합니다.
+
+    Returns:
+        Optional[Tuple[str, datetime]]: (search_key, 분석 시각) 또는 None
+    """
+    if not Settings.STALE_WHILE_REVALIDATE:
+        return None
+    with span("stale_lookup"):
+        found = repository.find_recent(
+            keyword, [SOURCE_NAMES[source] for source in sources if source in SOURCE_NAMES], None
+        )
+    registry.inc(
+        "trendtracker_stale_result_total", {"outcome": "shown" if found else "none"},
+        help_text="Analysis requests that showed the latest stored result while refreshing, by outcome"
+    )
+    return found
+
+
+def summarize_with_previous(
+    articles: List[NewsArticle], previous: Optional[SearchResult] = None
+) -> Tuple[str, str, str]:
+    """
+    이전 분석 결과가 있으면 이미 요약된 기사(URL 기준)를 제외한 새 기사만 Gemini에 보내 요약을 갱신합니다.
+    새 기사가 없으면 이전 요약을 그대로 사용하고, 증분 요약이 더 길어지는 경우에는 전체를 새로 요약합니다.
+
+    Returns:
+        Tuple[str, str, str]: (요약 텍스트, 요약 방식, 기반이 된 이전 검색 결과 키)
+    """
+    if previous is None or not previous.ai_summary or not previous.articles:
+        return summarize_news(articles), SUMMARY_FULL, ""
+
+    seen_urls = {article.url for article in previous.articles}
+    new_articles = [article for article in articles if article.url not in seen_urls]
+    if not new_articles:
+        return previous.ai_summary, SUMMARY_REUSED, previous.search_key
+    if not prefer_incremental(previous.ai_summary, articles, new_articles):
+        return summarize_news(articles), SUMMARY_FULL, ""
+    return update_summary(previous.ai_summary, new_articles), SUMMARY_INCREMENTAL, previous.search_key
+
+
+def prefer_incremental(
+    previous_summary: str, articles: List[NewsArticle], new_articles: List[NewsArticle]
+) -> bool:
+    """
+    증분 요약 프롬프트가 전체 재요약 프롬프트보다 짧을 때만 증분 요약을 사용합니다.
+    대부분의 기사가 새 기사라면 이전 요약까지 보내는 쪽이 오히려 입력 토큰이 많기 때문입니다.
+    """
+    if len(new_articles) == len(articles):
+        return False
+    return len(build_update_prompt(previous_summary, new_articles)) < len(build_summary_prompt(articles))
+
+
+@contextmanager
+def defer_on_timeout(stage: str, pending: List[str]) -> Iterator[None]:
+    """
+    블록 안에서 마감 시간 또는 요청별 시간 제한을 넘기면(AppError("timeout")) 분석을 중단하지 않고
+    stage를 pending에 추가합니다. 그 밖의 오류는 그대로 전달합니다.
+    """
+    try:
+        yield
+    except AppError as e:
+        if e.error_type != "timeout":
+            raise
+        pending.append(stage)
+        registry.inc(
+            "trendtracker_pending_stage_total", {"stage": stage, "outcome": "deferred"},
+            help_text="Analysis stages deferred past the deadline or filled in later, by stage and outcome"
+        )
+
+
+def run_analysis(
+    keyword: str,
+    sources: List[str],
+    num_results: int,
+    on_progress: Optional[Callable[[str], None]] = None,
+    previous: Optional[SearchResult] = None,
+    bypass_cache: bool = False
+) -> SearchResult:
+    """
+    선택된 소스에 대해 뉴스 검색 → 요약 → 인사이트 → 트렌드 링크 생성을 수행하고
+    저장 전의 SearchResult를 반환합니다. 각 단계는 span()으로 측정됩니다.
+    모든 API 호출은 ANALYSIS_DEADLINE_SECONDS 안에 끝나도록 시간 제한을 받으며, 마감 시간 안에 끝나지 않은
+    단계는 건너뛰고 SearchResult.pending에 기록합니다. (완료된 단계만 담긴 결과를 먼저 저장하고 fill_pending으로 채움)
+
+    Args:
+        keyword (str): 분석할 키워드
+        sources (List[str]): 선택된 분석 소스 목록
+        num_results (int): 검색할 뉴스 기사 수
+        on_progress (Callable[[str], None], optional): 단계 시작 시 안내 문구를 받는 콜백
+        previous (SearchResult, optional): 같은 키워드의 이전 분석 결과 (주어지면 새 기사만 증분 요약)
+        bypass_cache (bool): True면 캐시된 API 응답을 읽지 않고 모두 새로 호출 ('새로 분석' 요청)
+
+    Raises:
+        AppError: 검색 또는 요약 단계에서 API 오류 발생 시 (시간 제한 초과 제외)
+    """
+    def notify(message: str):
+        if on_progress:
+            on_progress(message)
+
+    articles = []
+    summary = ""
+    summary_mode = SUMMARY_FULL
+    parent_key = ""
+    insights = ""
+    trends_url = ""
+    pending = []
+
+    with deadline_scope(Settings.ANALYSIS_DEADLINE_SECONDS), bypass_scope(bypass_cache):
+        # 1. 뉴스 검색 및 요약
+        if SOURCE_NEWS in sources:
+            notify(f"🔍 '{keyword}' 관련 뉴스 검색 중...")
+            with defer_on_timeout(STAGE_NEWS, pending):
+                articles = search_news(keyword, num_results)
+            if articles:
+                notify("🤖 AI 뉴스 요약 생성 중...")
+                with defer_on_timeout(STAGE_SUMMARY, pending), span("summarize"):
+                    summary, summary_mode, parent_key = summarize_with_previous(articles, previous)
+
+        # 2. Gemini 인사이트
+        if SOURCE_AI_INSIGHTS in sources:
+            notify("🧠 Gemini AI 심층 트렌드 분석 중...")
+            with defer_on_timeout(STAGE_INSIGHTS, pending), span("insights"):
+                insights = get_ai_insights(keyword)
+
+    # 3. Google Trends (API 호출이 없으므로 마감 시간과 관계없이 생성)
+    if SOURCE_TRENDS in sources:
+        notify(f"📈 Google Trends '{keyword}' 데이터 분석 중...")
+        trends_url = get_google_trends_url(keyword)
+
+    return SearchResult(
+        search_key=generate_search_key(keyword),
+        search_time=datetime.now(),
+        keyword=keyword,
+        articles=articles,
+        ai_summary=summary,
+        ai_insights=insights,
+        trends_url=trends_url,
+        parent_key=parent_key,
+        summary_mode=summary_mode,
+        pending=pending
+    )
+
+
+def fill_pending(
+    repository: SearchRepository, search_key: str, num_results: int = 5
+) -> Optional[SearchResult]:
+    """
+    마감 시간 안에 끝나지 않아 pending으로 저장된 단계를 PENDING_FILL_DEADLINE_SECONDS 안에서 다시 실행하고,
+    채운 결과로 저장된 행을 교체합니다. 이번에도 끝나지 않은 단계는 pending에 남습니다.
+    뉴스 검색이 남아 있으면 검색 후 요약까지 수행하며, 요약은 이전 결과 없이 전체 요약으로 만듭니다.
+
+    Args:
+        repository (SearchRepository): 검색 기록 저장소
+        search_key (str): 채울 검색 결과의 키
+        num_results (int): 뉴스 검색이 남아 있을 때 검색할 기사 수
+
+    Returns:
+        Optional[SearchResult]: 교체한 결과 (채울 단계가 없거나 결과가 없으면 None)
+
+    Raises:
+        AppError: API 오류 발생 시 (시간 제한 초과 제외)
+    """
+    result = repository.find_by_key(search_key)
+    if result is None or not result.pending:
+        return None
+
+    stages = result.pending
+    pending = []
+    with deadline_scope(Settings.PENDING_FILL_DEADLINE_SECONDS), span("fill_pending"):
+        if STAGE_NEWS in stages:
+            with defer_on_timeout(STAGE_NEWS, pending):
+                result.articles = search_news(result.keyword, num_results)
+        if result.articles and (STAGE_NEWS in stages or STAGE_SUMMARY in stages) and STAGE_NEWS not in pending:
+            with defer_on_timeout(STAGE_SUMMARY, pending):
+                result.ai_summary = summarize_news(result.articles)
+                result.summary_mode, result.parent_key = SUMMARY_FULL, ""
+        if STAGE_INSIGHTS in stages:
+            with defer_on_timeout(STAGE_INSIGHTS, pending):
+                result.ai_insights = get_ai_insights(result.keyword)
+
+    for stage in stages:
+        if stage not in pending:
+            registry.inc("trendtracker_pending_stage_total", {"stage": stage, "outcome": "filled"})
+    result.pending = pending
+    if not repository.replace(result):
+        raise AppError("file_error")
+    return result
@@ -0,0 +1,257 @@
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Set, TextIO, Tuple
+from config.settings import Settings
+from domain.search_result import SearchResult
+from repositories.search_repository import SearchRepository
+from services.analysis_pipeline import run_analysis
+from utils.exceptions import AppError
+from utils.input_handler import preprocess_keyword
+from utils.metrics import StageTimer, span, registry, append_metrics_record
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 잠시 후 다시 시도하면 성공할 수 있는 오류 유형
+RETRYABLE_ERRORS = ("rate_limit_exceeded", "network_error")
+
+CHECKPOINT_OK = "ok"
+CHECKPOINT_ERROR = "error"
+
+
+def read_keywords(stream: TextIO) -> List[str]:
+    """
+    한 줄에 하나씩 적힌 키워드를 읽습니다. 빈 줄과 '#'으로 시작하는 줄은 무시하고,
+    앱 검색 폼과 같은 방식으로 정제한 뒤 중복을 제거합니다. (처음 나온 순서 유지)
+    """
+    keywords: Dict[str, None] = {}
+    for line in stream:
+        if line.lstrip().startswith("#"):
+            continue
+        keyword = preprocess_keyword(line)
+        if keyword:
+            keywords.setdefault(keyword, None)
+    return list(keywords)
+
+
+class BatchCheckpoint:
+    """
+    일괄 분석의 키워드별 처리 결과를 JSON Lines 파일에 기록합니다.
+    성공 기록은 결과가 CSV에 저장된 뒤에만 남기므로, 중단 후 다시 실행하면
+    저장까지 끝난 키워드만 건너뛰고 실패하거나 저장 전에 중단된 키워드는 다시 분석합니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def completed(self) -> Set[str]:
+        """저장까지 완료된 키워드 집합을 반환합니다. (같은 키워드는 마지막 기록 기준)"""
+        status: Dict[str, str] = {}
+        if not os.path.exists(self.path):
+            return set()
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # 기록 도중 중단되어 잘린 마지막 줄
+                    continue
+                status[entry["keyword"]] = entry["status"]
+        return {keyword for keyword, value in status.items() if value == CHECKPOINT_OK}
+
+    def record(self, entries: List[dict]):
+        """처리 결과를 추가 기록하고 디스크에 반영합니다."""
+        if not entries:
+            return
+        ts = datetime.now().isoformat(timespec="seconds")
+        with open(self.path, "a", encoding="utf-8") as f:
+            for entry in entries:
+                f.write(json.dumps({"ts": ts, **entry}, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def clear(self):
+        """진행 기록을 삭제하여 처음부터 다시 분석하게 합니다."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+@dataclass
+class BatchReport:
+    """일괄 분석 실행 결과 집계"""
+    total: int = 0
+    skipped: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    saved: int = 0
+    interrupted: bool = False
+    seconds: float = 0.0
+
+
+class BatchRunner:
+    """
+    여러 키워드를 동시에 최대 concurrency개씩 분석하고, 결과를 batch_size개씩 모아 저장합니다.
+    API 키별 분당 요청 수는 서비스 계층의 공유 키 풀(services.key_pool)이 지키며,
+    할당량 초과나 네트워크 오류는 지수 백오프로 retries번까지 다시 시도합니다.
+    """
+
+    def __init__(
+        self,
+        search_repository: SearchRepository,
+        checkpoint: BatchCheckpoint,
+        sources: List[str],
+        num_results: int,
+        concurrency: int = 4,
+        batch_size: int = 20,
+        retries: int = 3,
+        progress: Optional[Callable[[str], None]] = None
+    ):
+        self.search_repository = search_repository
+        self.checkpoint = checkpoint
+        self.sources = sources
+        self.num_results = num_results
+        self.concurrency = max(concurrency, 1)
+        self.batch_size = max(batch_size, 1)
+        self.retries = retries
+        self.progress = progress or (lambda message: None)
+        self._stopping = threading.Event()
+
+    def stop(self):
+        """새 키워드 분석을 시작하지 않고, 진행 중인 분석을 마친 뒤 저장하고 종료하게 합니다."""
+        self._stopping.set()
+
+    def run(self, keywords: Iterable[str]) -> BatchReport:
+        """
+        키워드 목록을 분석합니다. 진행 기록에 완료로 남은 키워드는 건너뜁니다.
+        Ctrl+C(KeyboardInterrupt)를 받으면 진행 중인 분석을 마치고 저장한 뒤 반환합니다.
+        """
+        keywords = list(keywords)
+        done_keywords = self.checkpoint.completed()
+        todo = [keyword for keyword in keywords if keyword not in done_keywords]
+        report = BatchReport(total=len(keywords), skipped=len(keywords) - len(todo))
+        if report.skipped:
+            self.progress(f"⏭️ 이미 완료된 키워드 {report.skipped}개를 건너뜁니다.")
+
+        started = time.perf_counter()
+        pending: List[SearchResult] = []
+        in_flight: Dict[Future, str] = {}
+        queue = iter(todo)
+        finished = 0
+
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="batch") as executor:
+            def fill():
+                # 대기열이 너무 길어지지 않도록 동시 실행 수의 두 배까지만 미리 제출
+                while not self._stopping.is_set() and len(in_flight) < self.concurrency * 2:
+                    keyword = next(queue, None)
+                    if keyword is None:
+                        return
+                    in_flight[executor.submit(self._analyze, keyword)] = keyword
+
+            fill()
+            while in_flight:
+                try:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                except KeyboardInterrupt:
+                    self.stop()
+                    report.interrupted = True
+                    # 아직 시작하지 않은 분석은 취소 (다음 실행에서 다시 분석됨)
+                    for future in [future for future in in_flight if future.cancel()]:
+                        del in_flight[future]
+                    self.progress(f"⏹️ 중단 요청 - 진행 중인 {len(in_flight)}건을 마치고 저장합니다...")
+                    continue
+
+                failures = []
+                for future in done:
+                    keyword = in_flight.pop(future)
+                    finished += 1
+                    prefix = f"[{finished + report.skipped}/{report.total}]"
+                    try:
+                        result, seconds = future.result()
+                    except AppError as e:
+                        report.failed += 1
+                        failures.append({"keyword": keyword, "status": CHECKPOINT_ERROR, "error_type": e.error_type})
+                        self.progress(f"{prefix} ❌ {keyword} · {e.error_type}")
+                        continue
+                    except Exception as e:
+                        logger.exception(f"'{keyword}' 분석 중 예기치 못한 에러")
+                        report.failed += 1
+                        failures.append({"keyword": keyword, "status": CHECKPOINT_ERROR, "error_type": type(e).__name__})
+                        self.progress(f"{prefix} ❌ {keyword} · {type(e).__name__}")
+                        continue
+                    pending.append(result)
+                    self.progress(
+                        f"{prefix} ✅ {keyword} · 기사 {len(result.articles)}건 · "
+                        f"{result.summary_mode} · {seconds:.1f}s"
+                    )
+                self.checkpoint.record(failures)
+
+                if len(pending) >= self.batch_size:
+                    self._flush(pending, report)
+                    pending = []
+                fill()
+
+        self._flush(pending, report)
+        report.seconds = time.perf_counter() - started
+        return report
+
+    def _flush(self, results: List[SearchResult], report: BatchReport):
+        """모아 둔 결과를 한 번에 저장하고, 저장에 성공한 키워드만 완료로 기록합니다."""
+        if not results:
+            return
+        with span("repository_save"):
+            saved = self.search_repository.save_many(results)
+        if not saved:
+            # 완료로 기록하지 않으므로 다음 실행에서 다시 분석됨
+            report.failed += len(results)
+            self.checkpoint.record([
+                {"keyword": result.keyword, "status": CHECKPOINT_ERROR, "error_type": "file_error"}
+                for result in results
+            ])
+            self.progress(f"❌ {len(results)}건 저장 실패 - 다음 실행에서 다시 분석합니다.")
+            return
+        report.succeeded += len(results)
+        report.saved += len(results)
+        self.checkpoint.record([
+            {"keyword": result.keyword, "status": CHECKPOINT_OK, "search_key": result.search_key}
+            for result in results
+        ])
+        self.progress(f"💾 {len(results)}건 저장 (누적 {report.saved}건)")
+
+    def _analyze(self, keyword: str) -> Tuple[SearchResult, float]:
+        """키워드 1개를 분석합니다. 재시도 가능한 오류는 지수 백오프로 다시 시도합니다."""
+        started = time.perf_counter()
+        for attempt in range(self.retries + 1):
+            timer = StageTimer()
+            record = {"keyword": keyword, "sources": self.sources, "num_results": self.num_results,
+                      "batch": True, "attempt": attempt + 1, "status": "ok"}
+            try:
+                with timer:
+                    previous = None
+                    if Settings.SUMMARY_MODE == "incremental":
+                        with span("history_load"):
+                            previous = self.search_repository.find_latest_by_keyword(keyword)
+                    result = run_analysis(keyword, self.sources, self.num_results, previous=previous)
+                record.update(search_key=result.search_key, summary_mode=result.summary_mode)
+                return result, time.perf_counter() - started
+            except AppError as e:
+                record.update(status="error", error_type=e.error_type)
+                if e.error_type not in RETRYABLE_ERRORS or attempt >= self.retries or self._stopping.is_set():
+                    raise
+            finally:
+                append_metrics_record({**record, "stages": timer.as_dict()}, Settings.METRICS_LOG_PATH)
+                registry.inc(
+                    "trendtracker_analyses_total", {"status": record["status"]},
+                    help_text="Number of analyses run, by outcome"
+                )
+            delay = 2 ** attempt * 5
+            logger.info(f"'{keyword}' {record['error_type']} - {delay}초 후 다시 시도 ({attempt + 1}/{self.retries})")
+            self._stopping.wait(delay)
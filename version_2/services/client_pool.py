@@ -0,0 +1,134 @@
+import logging
+import threading
+from typing import TYPE_CHECKING, Dict, Optional
+from config.settings import Settings
+
+# 무거운 SDK(google-genai, tavily, httpx)는 클라이언트가 처음 필요할 때 임포트합니다.
+if TYPE_CHECKING:
+    import httpx
+    import requests
+    from google import genai
+    from tavily import TavilyClient
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 기본 Gemini 엔드포인트 (워밍업 요청 대상)
+DEFAULT_GEMINI_BASE_URL = "https://generativelanguage.googleapis.com/"
+
+# API 키별 클라이언트 저장소 (프로세스 전역에서 공유)
+_lock = threading.Lock()
+_tavily_clients: Dict[str, "TavilyClient"] = {}
+_genai_clients: Dict[str, "genai.Client"] = {}
+_genai_http_clients: Dict[str, "httpx.Client"] = {}
+_warmed_up = False
+
+
+def _mount_pool(session: "requests.Session"):
+    """
+    requests 세션에 설정된 크기의 keep-alive 커넥션 풀을 장착합니다.
+    """
+    from requests.adapters import HTTPAdapter
+
+    adapter = HTTPAdapter(
+        pool_connections=Settings.HTTP_POOL_SIZE,
+        pool_maxsize=Settings.HTTP_POOL_SIZE
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Connection"] = "keep-alive"
+
+
+def get_tavily_client(api_key: Optional[str] = None) -> "TavilyClient":
+    """
+    API 키에 해당하는 TavilyClient를 반환합니다.
+    처음 호출될 때 한 번만 생성되며, 여러 세션(스레드)이 동시에 호출해도 안전합니다.
+    """
+    api_key = api_key or Settings.TAVILY_API_KEY
+    client = _tavily_clients.get(api_key)
+    if client is not None:
+        return client
+
+    with _lock:
+        client = _tavily_clients.get(api_key)
+        if client is None:
+            from tavily import TavilyClient
+
+            client = TavilyClient(api_key=api_key, api_base_url=Settings.TAVILY_BASE_URL)
+            _mount_pool(client.session)
+            _tavily_clients[api_key] = client
+    return client
+
+
+def get_genai_client(api_key: Optional[str] = None) -> "genai.Client":
+    """
+    API 키에 해당하는 Gemini 클라이언트를 반환합니다.
+    커넥션 풀 크기와 keep-alive 시간이 지정된 httpx 클라이언트를 공유합니다.
+    """
+    api_key = api_key or Settings.GEMINI_API_KEY
+    client = _genai_clients.get(api_key)
+    if client is not None:
+        return client
+
+    with _lock:
+        client = _genai_clients.get(api_key)
+        if client is None:
+            import httpx
+            from google import genai
+            from google.genai import types
+
+            http_client = httpx.Client(
+                limits=httpx.Limits(
+                    max_connections=Settings.HTTP_POOL_SIZE,
+                    max_keepalive_connections=Settings.HTTP_POOL_SIZE,
+                    keepalive_expiry=Settings.HTTP_KEEPALIVE_SECONDS
+                )
+            )
+            client = genai.Client(
+                api_key=api_key,
+                http_options=types.HttpOptions(
+                    base_url=Settings.GEMINI_BASE_URL,
+                    httpx_client=http_client
+                )
+            )
+            _genai_http_clients[api_key] = http_client
+            _genai_clients[api_key] = client
+    return client
+
+
+def warm_up():
+    """
+    키 풀의 API 키마다 클라이언트를 미리 생성하고 각 API 호스트와 TLS 연결을 맺어 풀에 보관합니다.
+    첫 번째 사용자가 클라이언트 생성 및 핸드셰이크 비용을 부담하지 않도록 서버 시작 시 호출합니다.
+    여러 번 호출되어도 한 번만 수행되며, 네트워크 오류는 로그만 남기고 무시합니다.
+    """
+    global _warmed_up
+    with _lock:
+        if _warmed_up:
+            return
+        _warmed_up = True
+
+    # 커넥션 풀은 키별 클라이언트마다 따로 있으므로 키 풀의 모든 키를 워밍업
+    for api_key, _ in Settings.TAVILY_API_KEYS:
+        try:
+            client = get_tavily_client(api_key)
+            client.session.head(client.base_url, timeout=5)
+        except Exception as e:
+            logger.warning(f"Tavily 워밍업 실패: {e}")
+
+    for api_key, _ in Settings.GEMINI_API_KEYS:
+        try:
+            get_genai_client(api_key)
+            http_client = _genai_http_clients[api_key]
+            http_client.head(Settings.GEMINI_BASE_URL or DEFAULT_GEMINI_BASE_URL, timeout=5)
+        except Exception as e:
+            logger.warning(f"Gemini 워밍업 실패: {e}")
+
+
+def warm_up_in_background():
+    """
+    렌더링을 지연시키지 않도록 별도 데몬 스레드에서 워밍업을 수행합니다.
+    """
+    if _warmed_up:
+        return
+    threading.Thread(target=warm_up, name="client-warmup", daemon=True).start()
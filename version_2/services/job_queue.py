@@ -0,0 +1,158 @@
+import logging
+import os
+import threading
+import time
+from typing import List, Optional
+from config.settings import Settings
+from domain.analysis_job import AnalysisJob, JOB_QUEUED, JOB_RUNNING
+from repositories.job_repository import JobRepository
+from repositories.search_repository import SearchRepository
+from services.analysis_pipeline import run_analysis, fill_pending
+from utils.exceptions import AppError
+from utils.metrics import StageTimer, span, registry, append_metrics_record
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+
+def update_queue_gauges(job_repository: JobRepository):
+    """대기/실행 중인 작업 수를 큐 깊이 게이지(trendtracker_job_queue_depth)에 반영합니다."""
+    counts = job_repository.count_by_status()
+    for status in (JOB_QUEUED, JOB_RUNNING):
+        registry.set_gauge(
+            "trendtracker_job_queue_depth", counts[status], {"status": status},
+            help_text="Number of analysis jobs waiting or running"
+        )
+
+
+def process_job(job: AnalysisJob, job_repository: JobRepository, search_repository: SearchRepository):
+    """
+    할당된 작업 1건을 실행합니다. 분석 결과를 검색 기록 저장소에 저장하고,
+    진행 단계와 단계별 소요 시간을 작업 큐에 기록하여 UI가 조회할 수 있게 합니다.
+    마감 시간 안에 끝나지 않은 단계가 있으면 작업을 완료 처리한 뒤(완료된 단계를 먼저 표시) 같은 워커에서 이어서 채웁니다.
+    """
+    if job.created_at and job.started_at:
+        registry.observe(
+            "trendtracker_job_seconds", (job.started_at - job.created_at).total_seconds(),
+            {"phase": "queue_wait"}, help_text="Analysis job latency in seconds, by phase"
+        )
+
+    record = {
+        "job_id": job.job_id,
+        "keyword": job.keyword,
+        "sources": job.sources,
+        "num_results": job.num_results,
+        "status": "ok"
+    }
+    timer = StageTimer()
+    started = time.perf_counter()
+    try:
+        with timer:
+            # 같은 키워드의 이전 결과가 있으면 새 기사만 요약에 반영
+            previous = None
+            if Settings.SUMMARY_MODE == "incremental":
+                with span("history_load"):
+                    previous = search_repository.find_latest_by_keyword(job.keyword)
+            # 각 단계가 시작될 때 안내 문구와 지금까지 완료된 단계의 소요 시간을 기록
+            result = run_analysis(
+                job.keyword, job.sources, job.num_results,
+                on_progress=lambda message: job_repository.update_progress(job.job_id, message, timer.as_dict()),
+                previous=previous,
+                bypass_cache=job.force
+            )
+            job_repository.update_progress(job.job_id, "💾 분석 결과 저장 중...", timer.as_dict())
+            with span("repository_save"):
+                if not search_repository.save(result):
+                    raise AppError("file_error")
+        job_repository.complete(job.job_id, result.search_key, timer.as_dict())
+        record.update(search_key=result.search_key, summary_mode=result.summary_mode, pending=list(result.pending))
+    except AppError as e:
+        record.update(status="error", error_type=e.error_type)
+        job_repository.fail(job.job_id, e.error_type, timer.as_dict())
+    except Exception as e:
+        logger.exception(f"작업 {job.job_id} 실행 중 예기치 못한 에러")
+        record.update(status="error", error_type=type(e).__name__)
+        job_repository.fail(job.job_id, type(e).__name__, timer.as_dict())
+    finally:
+        registry.observe(
+            "trendtracker_job_seconds", time.perf_counter() - started,
+            {"phase": "run"}, help_text="Analysis job latency in seconds, by phase"
+        )
+        append_metrics_record({**record, "stages": timer.as_dict()}, Settings.METRICS_LOG_PATH)
+        registry.inc(
+            "trendtracker_analyses_total", {"status": record["status"]},
+            help_text="Number of analyses run, by outcome"
+        )
+
+    if record.get("pending"):
+        try:
+            fill_pending(search_repository, record["search_key"], job.num_results)
+        except Exception as e:
+            # 결과는 이미 저장되었으므로 남은 단계는 main.py fill-pending으로 다시 채울 수 있음
+            logger.warning(f"작업 {job.job_id}의 남은 단계를 채우지 못했습니다: {e}")
+
+
+class JobWorkerPool:
+    """
+    작업 큐에서 작업을 가져와 실행하는 고정 크기 워커 스레드 풀입니다.
+    동시에 실행되는 분석 수는 num_workers로 제한되며, 나머지 작업은 큐에서 대기합니다.
+    """
+
+    def __init__(
+        self,
+        job_repository: JobRepository,
+        search_repository: SearchRepository,
+        num_workers: int,
+        poll_seconds: float = 1.0,
+        name: str = "app"
+    ):
+        self.job_repository = job_repository
+        self.search_repository = search_repository
+        self.num_workers = num_workers
+        self.poll_seconds = poll_seconds
+        self.name = f"{name}-{os.getpid()}"
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def start(self):
+        """중단된 작업을 다시 대기열에 넣고 워커 스레드를 시작합니다."""
+        if self._threads:
+            return
+        self.job_repository.requeue_stale(Settings.JOB_STALE_SECONDS)
+        for i in range(self.num_workers):
+            thread = threading.Thread(
+                target=self._run, args=(f"{self.name}-{i}",), name=f"job-worker-{i}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"작업 워커 {self.num_workers}개 시작 ({self.name})")
+
+    def notify(self):
+        """새 작업이 등록되었음을 알려 대기 중인 워커를 즉시 깨웁니다."""
+        self._wakeup.set()
+
+    def stop(self, timeout: Optional[float] = None):
+        """새 작업 할당을 멈추고 실행 중인 작업이 끝날 때까지 기다립니다."""
+        self._stopping.set()
+        self._wakeup.set()
+        for thread in self._threads:
+            thread.join(timeout)
+
+    def _run(self, worker: str):
+        while not self._stopping.is_set():
+            try:
+                job = self.job_repository.claim(worker)
+            except Exception as e:
+                logger.warning(f"작업 할당 실패: {e}")
+                job = None
+
+            if job is None:
+                # 새 작업이 등록되면 notify()로 깨어나고, 다른 프로세스가 등록한 작업은 주기적으로 확인
+                self._wakeup.wait(self.poll_seconds)
+                self._wakeup.clear()
+                continue
+
+            update_queue_gauges(self.job_repository)
+            process_job(job, self.job_repository, self.search_repository)
+            update_queue_gauges(self.job_repository)
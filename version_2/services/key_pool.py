@@ -0,0 +1,170 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Collection, Dict, Iterator, List, Optional, Tuple
+from config.settings import Settings
+from utils.deadline import remaining
+from utils.exceptions import AppError
+from utils.metrics import registry
+from utils.rate_limiter import RateLimiter
+
+# 제공자 이름 → (키 풀 설정 이름, 키 1개당 분당 요청 수 설정 이름)
+PROVIDER_SETTINGS = {
+    "tavily": ("TAVILY_API_KEYS", "TAVILY_RATE_PER_MINUTE"),
+    "gemini": ("GEMINI_API_KEYS", "GEMINI_RATE_PER_MINUTE"),
+}
+
+# 키 1개에만 해당하는 오류 (해당 키를 쉬게 하고 다른 키로 다시 요청) → 지표에 기록할 결과
+KEY_ERRORS = {"rate_limit_exceeded": "rate_limited", "api_key_invalid": "invalid"}
+
+
+class PooledKey:
+    """
+    풀에 속한 API 키 1개의 가중치, 전용 분당 요청 수 제한기와 사용 현황을 보관합니다.
+    지표와 로그에는 키 대신 label("key1", "key2", ...)을 사용합니다.
+    """
+
+    def __init__(self, provider: str, label: str, api_key: str, weight: float, per_minute: float):
+        self.label = label
+        self.api_key = api_key
+        self.weight = weight
+        self.limiter = RateLimiter(provider, per_minute * weight)
+        self.in_flight = 0
+        self.uses = 0
+        self.cooldown_until = 0.0
+
+
+class ApiKeyPool:
+    """
+    제공자 1개의 API 키 여러 개에 요청을 나누어 보내는 풀입니다.
+
+    요청마다 진행 중인 요청 수(가중치로 나눈 값)가 가장 적은 키를 고르고, 같으면 누적 사용량이 적은 키를 고릅니다.
+    분당 요청 수 제한은 키마다 따로 적용되므로(per_minute × 가중치) 키를 늘리면 전체 처리량도 늘어납니다.
+    할당량 초과(429)나 잘못된 키 응답을 받은 키는 cooldown_seconds 동안 다른 키가 모두 쉬는 중일 때만 사용합니다.
+    여러 스레드가 같은 인스턴스를 공유합니다.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        keys: List[Tuple[str, float]],
+        per_minute: float = 0.0,
+        cooldown_seconds: float = 60.0
+    ):
+        self.provider = provider
+        self.cooldown_seconds = cooldown_seconds
+        self._lock = threading.Lock()
+        self._keys = [
+            PooledKey(provider, f"key{i + 1}", api_key, weight, per_minute)
+            for i, (api_key, weight) in enumerate(keys)
+        ]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def set_rate(self, per_minute: float):
+        """키 1개당 분당 허용 요청 수를 변경합니다. (각 키에는 가중치를 곱한 값이 적용됨)"""
+        for key in self._keys:
+            key.limiter.set_rate(per_minute * key.weight)
+
+    def _choose(self, exclude: Collection[str]) -> PooledKey:
+        """exclude(label)를 뺀 키 중 쉬는 중이 아니면서 가장 한가한 키를 고릅니다. 호출자가 잠금을 잡고 있어야 합니다."""
+        keys = [key for key in self._keys if key.label not in exclude] or self._keys
+        if not keys:
+            raise AppError("api_key_invalid")
+        now = time.monotonic()
+        ready = [key for key in keys if key.cooldown_until <= now]
+        if not ready:
+            # 모두 쉬는 중이면 가장 먼저 풀리는 키를 사용
+            return min(keys, key=lambda key: key.cooldown_until)
+        return min(ready, key=lambda key: ((key.in_flight + 1) / key.weight, key.uses / key.weight))
+
+    @contextmanager
+    def lease(self, exclude: Collection[str] = ()) -> Iterator[PooledKey]:
+        """
+        요청 1건에 사용할 키를 골라 그 키의 분당 요청 수 제한을 기다린 뒤 반환합니다.
+        블록이 끝날 때까지 그 키의 진행 중인 요청으로 계산합니다.
+        분석 마감까지 남은 시간 안에 보낼 수 없으면 기다리지 않고 AppError("timeout")를 발생시킵니다.
+        """
+        with self._lock:
+            key = self._choose(exclude)
+            key.in_flight += 1
+            key.uses += 1
+            in_flight = key.in_flight
+        self._set_in_flight(key, in_flight)
+        try:
+            key.limiter.acquire(max_wait=remaining())
+            yield key
+        finally:
+            with self._lock:
+                key.in_flight -= 1
+                in_flight = key.in_flight
+            self._set_in_flight(key, in_flight)
+
+    def _set_in_flight(self, key: PooledKey, value: int):
+        registry.set_gauge(
+            "trendtracker_api_key_in_flight", value, {"provider": self.provider, "key": key.label},
+            help_text="Requests in flight per API key, by provider and key"
+        )
+
+    def record(self, key: PooledKey, error_type: Optional[str] = None):
+        """
+        키로 보낸 요청 1건의 결과를 기록합니다. (error_type이 None이면 성공)
+        키에만 해당하는 오류(KEY_ERRORS)이면 cooldown_seconds 동안 다른 키를 먼저 사용합니다.
+        """
+        if error_type in KEY_ERRORS:
+            outcome = KEY_ERRORS[error_type]
+            with self._lock:
+                key.cooldown_until = time.monotonic() + self.cooldown_seconds
+            registry.inc(
+                "trendtracker_api_key_cooldowns_total", {"provider": self.provider, "key": key.label, "reason": outcome},
+                help_text="API keys put on cooldown after a rate limit or invalid key response, by provider, key and reason"
+            )
+        else:
+            outcome = "ok" if error_type is None else "error"
+        registry.inc(
+            "trendtracker_api_key_requests_total", {"provider": self.provider, "key": key.label, "outcome": outcome},
+            help_text="Requests sent per API key, by provider, key and outcome"
+        )
+
+    def available(self, exclude: Collection[str] = ()) -> bool:
+        """exclude(label)를 뺀 키 중 쉬는 중이 아닌 키가 있으면 True를 반환합니다."""
+        now = time.monotonic()
+        with self._lock:
+            return any(key.label not in exclude and key.cooldown_until <= now for key in self._keys)
+
+    def snapshot(self) -> Dict[str, dict]:
+        """키(label)별 가중치, 누적 사용량, 진행 중인 요청 수와 남은 대기 시간(초)을 반환합니다. (벤치마크/진단용)"""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                key.label: {
+                    "weight": key.weight,
+                    "uses": key.uses,
+                    "in_flight": key.in_flight,
+                    "cooldown_seconds": round(max(key.cooldown_until - now, 0.0), 1),
+                }
+                for key in self._keys
+            }
+
+
+# 프로세스 전역 제공자별 키 풀 (서비스 계층에서 API 호출 직전에 lease)
+_pools: Dict[str, ApiKeyPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_key_pool(provider: str) -> ApiKeyPool:
+    """설정값(TAVILY_API_KEYS 등)으로 만든 제공자별 ApiKeyPool 싱글톤 인스턴스를 반환합니다."""
+    pool = _pools.get(provider)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(provider)
+            if pool is None:
+                keys_name, rate_name = PROVIDER_SETTINGS[provider]
+                pool = _pools[provider] = ApiKeyPool(
+                    provider,
+                    getattr(Settings, keys_name),
+                    per_minute=getattr(Settings, rate_name),
+                    cooldown_seconds=Settings.API_KEY_COOLDOWN_SECONDS,
+                )
+    return pool
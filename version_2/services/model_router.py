@@ -0,0 +1,202 @@
+import math
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+from config.settings import Settings
+from utils.metrics import registry
+
+# Gemini 호출 결과 분류 (모델별 최근 기록과 지표 라벨에 사용)
+OUTCOME_OK = "ok"
+OUTCOME_ERROR = "error"
+OUTCOME_TIMEOUT = "timeout"
+OUTCOME_RATE_LIMITED = "rate_limited"
+
+# 모델 상태 (candidates()가 첫 모델을 바꾼 이유로 지표에 기록)
+HEALTH_RATE_LIMITED = "rate_limited"
+HEALTH_ERRORS = "errors"
+HEALTH_SLOW = "slow"
+
+# 모델별로 보관하는 최근 호출 기록 수의 상한 (기록 기간 안이라도 오래된 것부터 버림)
+MAX_SAMPLES = 200
+
+# 작업(task) 이름 → 작업별 모델 설정 이름
+TASK_MODEL_SETTINGS = {
+    "summarize": "GEMINI_SUMMARY_MODEL",
+    "update_summary": "GEMINI_SUMMARY_MODEL",
+    "insights": "GEMINI_INSIGHTS_MODEL",
+}
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """최근접 순위(nearest-rank) 방식의 백분위수를 계산합니다. (값이 없으면 0)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered), max(1, math.ceil(pct / 100 * len(ordered)))) - 1]
+
+
+class ModelStats:
+    """모델 1개의 최근 호출 기록(시각, 소요 시간, 결과)과 할당량 초과 후 대기 시각을 보관합니다."""
+
+    def __init__(self):
+        self.samples: Deque[Tuple[float, float, str]] = deque(maxlen=MAX_SAMPLES)
+        self.cooldown_until = 0.0
+
+    def recent(self, now: float, window_seconds: float) -> List[Tuple[float, float, str]]:
+        """기록 기간 안의 호출만 남기고 반환합니다."""
+        while self.samples and now - self.samples[0][0] > window_seconds:
+            self.samples.popleft()
+        return list(self.samples)
+
+
+class ModelRouter:
+    """
+    Gemini 모델별 최근 지연(p95)과 오류율을 추적하여 작업마다 호출할 모델 순서를 정합니다.
+
+    작업별 모델(GEMINI_SUMMARY_MODEL 등, 없으면 GEMINI_MODEL)을 먼저 호출하고, 그 모델이 최근 할당량 초과로
+    대기 중이거나 오류율이 max_error_rate를 넘거나 p95 지연이 slow_seconds를 넘으면 대체 모델을 먼저 호출합니다.
+    상태가 나빠진 모델도 순서의 끝에는 남겨 두며, 기록 기간(window_seconds)이 지나면 다시 첫 모델로 돌아옵니다.
+    여러 스레드가 같은 인스턴스를 공유합니다.
+    """
+
+    def __init__(
+        self,
+        default_model: str,
+        task_models: Dict[str, str],
+        fallback_models: List[str],
+        window_seconds: float = 300.0,
+        min_samples: int = 10,
+        slow_seconds: float = 15.0,
+        max_error_rate: float = 0.5,
+        cooldown_seconds: float = 60.0
+    ):
+        self.default_model = default_model
+        self.task_models = {task: model for task, model in task_models.items() if model}
+        self.fallback_models = fallback_models
+        self.window_seconds = window_seconds
+        self.min_samples = min_samples
+        self.slow_seconds = slow_seconds
+        self.max_error_rate = max_error_rate
+        self.cooldown_seconds = cooldown_seconds
+        self._lock = threading.Lock()
+        self._stats: Dict[str, ModelStats] = {}
+
+    def model_for(self, task: str) -> str:
+        """작업에 설정된 모델을 반환합니다."""
+        return self.task_models.get(task, self.default_model)
+
+    def _stats_for(self, model: str) -> ModelStats:
+        stats = self._stats.get(model)
+        if stats is None:
+            stats = self._stats[model] = ModelStats()
+        return stats
+
+    def health(self, model: str) -> Optional[str]:
+        """
+        모델의 최근 상태를 반환합니다. 정상이거나 판단할 기록이 부족하면 None,
+        아니면 HEALTH_RATE_LIMITED / HEALTH_ERRORS / HEALTH_SLOW 중 하나입니다.
+        """
+        now = time.monotonic()
+        with self._lock:
+            stats = self._stats_for(model)
+            if now < stats.cooldown_until:
+                return HEALTH_RATE_LIMITED
+            samples = stats.recent(now, self.window_seconds)
+        if len(samples) < self.min_samples:
+            return None
+        errors = sum(1 for _, _, outcome in samples if outcome != OUTCOME_OK)
+        if errors / len(samples) > self.max_error_rate:
+            return HEALTH_ERRORS
+        latencies = [seconds for _, seconds, outcome in samples if outcome == OUTCOME_OK]
+        if len(latencies) >= self.min_samples and percentile(latencies, 95) > self.slow_seconds:
+            return HEALTH_SLOW
+        return None
+
+    def candidates(self, task: str) -> List[str]:
+        """
+        작업을 호출할 모델 순서를 반환합니다. (정상 모델 → 상태가 나쁜 모델, 각각 설정 순서)
+        첫 모델과 그 이유를 trendtracker_gemini_route_total에 기록합니다.
+        """
+        primary = self.model_for(task)
+        order = [primary] + [model for model in self.fallback_models if model != primary]
+        health = {model: self.health(model) for model in order}
+        route = [model for model in order if health[model] is None]
+        route += [model for model in order if health[model] is not None]
+        registry.inc(
+            "trendtracker_gemini_route_total",
+            {"task": task, "model": route[0], "reason": "primary" if route[0] == primary else health[primary]},
+            help_text="Gemini requests routed to a model, by task, model and reason"
+        )
+        return route
+
+    def hedge_delay(self, model: str) -> Optional[float]:
+        """
+        다음 모델에 같은 요청을 보내기 전까지 기다릴 시간(모델의 최근 성공 호출 p95, 초)을 반환합니다.
+        판단할 기록이 부족하면 None을 반환합니다. (헤지하지 않음)
+        """
+        now = time.monotonic()
+        with self._lock:
+            samples = self._stats_for(model).recent(now, self.window_seconds)
+        latencies = [seconds for _, seconds, outcome in samples if outcome == OUTCOME_OK]
+        if len(latencies) < self.min_samples:
+            return None
+        return percentile(latencies, 95)
+
+    def record(self, model: str, seconds: float, outcome: str):
+        """호출 1건의 소요 시간과 결과를 기록합니다. 할당량 초과이면 cooldown_seconds 동안 뒤로 미룹니다."""
+        now = time.monotonic()
+        with self._lock:
+            stats = self._stats_for(model)
+            stats.samples.append((now, seconds, outcome))
+            if outcome == OUTCOME_RATE_LIMITED:
+                stats.cooldown_until = now + self.cooldown_seconds
+        registry.inc(
+            "trendtracker_gemini_requests_total", {"model": model, "outcome": outcome},
+            help_text="Gemini requests, by model and outcome"
+        )
+        registry.observe(
+            "trendtracker_gemini_seconds", seconds, {"model": model},
+            help_text="Gemini request latency in seconds, by model"
+        )
+
+    def snapshot(self) -> Dict[str, dict]:
+        """모델별 최근 호출 수, 오류율, p95 지연(초)과 상태를 반환합니다. (벤치마크/진단용)"""
+        now = time.monotonic()
+        with self._lock:
+            recent = {model: stats.recent(now, self.window_seconds) for model, stats in self._stats.items()}
+        report = {}
+        for model, samples in recent.items():
+            latencies = [seconds for _, seconds, outcome in samples if outcome == OUTCOME_OK]
+            errors = sum(1 for _, _, outcome in samples if outcome != OUTCOME_OK)
+            report[model] = {
+                "calls": len(samples),
+                "error_rate": round(errors / len(samples), 3) if samples else 0.0,
+                "p95_seconds": round(percentile(latencies, 95), 3),
+                "health": self.health(model) or "ok",
+            }
+        return report
+
+
+# 프로세스 전역 라우터 (모든 AIService 호출이 같은 기록을 공유)
+_router = None
+_router_lock = threading.Lock()
+
+
+def get_model_router() -> ModelRouter:
+    """설정값으로 만든 ModelRouter 싱글톤 인스턴스를 반환합니다."""
+    global _router
+    if _router is None:
+        with _router_lock:
+            if _router is None:
+                _router = ModelRouter(
+                    Settings.GEMINI_MODEL,
+                    {task: getattr(Settings, name) for task, name in TASK_MODEL_SETTINGS.items()},
+                    Settings.GEMINI_FALLBACK_MODELS,
+                    window_seconds=Settings.GEMINI_ROUTER_WINDOW_SECONDS,
+                    min_samples=Settings.GEMINI_ROUTER_MIN_SAMPLES,
+                    slow_seconds=Settings.GEMINI_SLOW_SECONDS,
+                    max_error_rate=Settings.GEMINI_MAX_ERROR_RATE,
+                    cooldown_seconds=Settings.GEMINI_RATE_LIMIT_COOLDOWN_SECONDS,
+                )
+    return _router
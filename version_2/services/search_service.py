@@ -1,10 +1,43 @@
 import time
-import requests
-from typing import List
-from tavily import TavilyClient
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import List, Optional, Set
 from domain.news_article import NewsArticle
 from config.settings import Settings
+from services.client_pool import get_tavily_client
+from services.key_pool import KEY_ERRORS, get_key_pool
 from utils.exceptions import AppError
+from utils.deadline import stage_timeout
+from utils.metrics import span
+from utils.shared_cache import bypassing, get_shared_cache, make_key
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# Tavily 검색이 요청 1회에 반환하는 최대 결과 수
+TAVILY_MAX_RESULTS = Settings.TAVILY_MAX_RESULTS
+
+def parse_published_date(value: Optional[str]) -> Optional[datetime]:
+    """
+    Tavily의 published_date(RFC 2822 또는 ISO 8601 형식)를 UTC 기준 datetime으로 변환합니다.
+    형식을 알 수 없으면 None을 반환합니다.
+    """
+    if not value:
+        return None
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
 
 class SearchService:
     """
@@ -14,71 +47,107 @@ class SearchService:
     
     def __init__(self):
         """
-        TavilyClient를 초기화합니다. API 키가 없으면 AppError를 발생시킵니다.
+        Tavily API 키 풀을 가져옵니다. API 키가 없으면 AppError를 발생시킵니다.
+        키마다 공유 커넥션 풀을 사용하는 TavilyClient를 따로 사용합니다.
         """
         if not Settings.TAVILY_API_KEY:
             raise AppError("api_key_invalid")
-        self.client = TavilyClient(api_key=Settings.TAVILY_API_KEY)
+        self.keys = get_key_pool("tavily")
 
-    def search_news(self, keyword: str, num_results: int = 5) -> List[NewsArticle]:
+    def _search_raw(
+        self,
+        keyword: str,
+        max_results: int,
+        start_date: Optional[str] = None,
+        include_domains: Optional[List[str]] = None
+    ) -> List[dict]:
         """
-        지정된 키워드로 뉴스를 검색하고 최신순으로 정렬하여 반환합니다.
-        
+        Tavily 뉴스 검색을 호출하고 원본 결과 리스트를 반환합니다.
+        키 풀에서 가장 한가한 키로 요청하며, 그 키가 할당량 초과(429)이거나 잘못된 키이면 쉬는 중이 아닌 다른 키로 다시 요청합니다.
+        같은 요청의 응답은 SEARCH_CACHE_SECONDS 동안 공유 캐시에서 재사용합니다. (다른 프로세스의 응답 포함,
+        bypass_scope 안에서는 캐시를 읽지 않고 새 응답을 저장만 함)
+
         Args:
             keyword (str): 검색할 키워드
-            num_results (int): 반환할 결과 수 (기본값 5)
-            
-        Returns:
-            List[NewsArticle]: 검색된 뉴스 기사 리스트
-            
-        Raises:
-            AppError: API 키 오류, 할당량 초과, 네트워크 오류 등 발생 시
+            max_results (int): 요청할 최대 결과 수
+            start_date (str, optional): 이 날짜(YYYY-MM-DD) 이후 발행된 기사만 요청
+            include_domains (List[str], optional): 검색할 도메인 (없으면 Settings.SEARCH_DOMAINS)
+        """
+        domains = Settings.SEARCH_DOMAINS if include_domains is None else include_domains
+        cache_key = None
+        if Settings.SEARCH_CACHE_SECONDS > 0:
+            # 응답한 서버(실제 API/대체 서버)가 다르면 다른 키 (벤치마크 응답이 실제 앱에 섞이지 않도록)
+            cache_key = make_key("tavily", Settings.TAVILY_BASE_URL, keyword, max_results, start_date, sorted(domains))
+            cached = None if bypassing() else get_shared_cache().get_json("tavily", cache_key)
+            if cached is not None:
+                return cached
+
+        tried = set()
+        while True:
+            with self.keys.lease(exclude=tried) as key:
+                try:
+                    results = self._search_with_key(key.api_key, keyword, max_results, start_date, domains)
+                except AppError as e:
+                    self.keys.record(key, e.error_type)
+                    tried.add(key.label)
+                    if e.error_type in KEY_ERRORS and self.keys.available(tried):
+                        logger.warning(f"Tavily {key.label} 사용 불가({e.error_type}), 다른 키로 다시 요청합니다.")
+                        continue
+                    raise
+                self.keys.record(key)
+            if cache_key is not None:
+                get_shared_cache().set_json("tavily", cache_key, results, Settings.SEARCH_CACHE_SECONDS)
+            return results
+
+    def _search_with_key(
+        self,
+        api_key: str,
+        keyword: str,
+        max_results: int,
+        start_date: Optional[str],
+        domains: List[str]
+    ) -> List[dict]:
+        """
+        API 키 1개로 Tavily 뉴스 검색을 호출합니다.
+        네트워크 오류 시 한 번 재시도하며, 오류 유형을 AppError로 변환합니다.
         """
+        # requests는 실제 검색 시점에만 필요하므로 지연 임포트 (앱 시작 시간 단축)
+        import requests
+        from tavily.errors import (
+            BadRequestError, ForbiddenError, InvalidAPIKeyError, TimeoutError as TavilyTimeoutError,
+            UsageLimitExceededError
+        )
+
+        client = get_tavily_client(api_key)
         retries = 1
         for attempt in range(retries + 1):
             try:
-                # 검색 도메인 리스트 가져오기
-                domains = Settings.SEARCH_DOMAINS
-                
-                # 충분한 기사를 확보하기 위해 더 많이 요청 (최신순 정렬을 위해)
-                max_to_fetch = max(num_results * 3, 20)
-                
-                # Tavily SDK 내부적으로 requests를 사용하므로 직접 timeout 제어는 어려울 수 있으나
-                # SDK가 지원하지 않는 경우 예외 처리에서 타임아웃 유형을 감지합니다.
-                response = self.client.search(
-                    query=keyword,
-                    search_depth="advanced",
-                    include_domains=domains,
-                    max_results=max_to_fetch,
-                    topic="news"
-                )
-                
-                results = response.get('results', [])
-                if not results:
-                    return []
-                
-                # published_date 기준 내림차순(최신순) 정렬
-                # 날짜가 없는 항목은 리스트 끝으로 이동
-                sorted_results = sorted(
-                    results,
-                    key=lambda x: x.get('published_date') or "",
-                    reverse=True
-                )
-                
-                # 상위 num_results 만큼만 추출
-                final_results = sorted_results[:num_results]
-                
-                articles = []
-                for item in final_results:
-                    articles.append(NewsArticle(
-                        title=item.get('title', '제목 없음'),
-                        url=item.get('url', ''),
-                        snippet=item.get('content', ''),
-                        pub_date=item.get('published_date', '날짜 정보 없음')
-                    ))
-                
-                return articles
+                # 요청별 상한과 분석 마감까지 남은 시간 중 짧은 시간만 기다림 (남은 시간이 없으면 AppError("timeout"))
+                timeout = stage_timeout(Settings.TAVILY_TIMEOUT_SECONDS)
+                with span("tavily_search"):
+                    response = client.search(
+                        query=keyword,
+                        search_depth="advanced",
+                        include_domains=domains,
+                        max_results=max_results,
+                        topic="news",
+                        start_date=start_date,
+                        timeout=timeout
+                    )
+                return response.get('results', [])
 
+            except AppError:
+                raise
+            except TavilyTimeoutError:
+                raise AppError("timeout")
+            # 키 풀이 키를 쉬게 하는 오류(api_key_invalid, rate_limit_exceeded)는 키 자체의 문제일 때만 사용
+            except (InvalidAPIKeyError, ForbiddenError):
+                raise AppError("api_key_invalid")
+            except UsageLimitExceededError:
+                raise AppError("rate_limit_exceeded")
+            except BadRequestError:
+                # 요청 자체가 잘못된 경우이므로 다른 키로 다시 보내지 않음
+                raise AppError("network_error")
             except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
                 if attempt < retries:
                     time.sleep(1) # 잠시 대기 후 재시도
@@ -86,9 +155,7 @@ class SearchService:
                 raise AppError("network_error")
             except requests.exceptions.HTTPError as e:
                 status_code = e.response.status_code
-                if status_code == 400:
-                    raise AppError("api_key_invalid") # 혹은 잘못된 요청
-                elif status_code in [401, 403]:
+                if status_code in [401, 403]:
                     raise AppError("api_key_invalid")
                 elif status_code == 429:
                     raise AppError("rate_limit_exceeded")
@@ -98,28 +165,176 @@ class SearchService:
                     raise AppError("network_error")
             except Exception as e:
                 error_msg = str(e).lower()
-                if "invalid" in error_msg or "unauthorized" in error_msg or "401" in error_msg:
+                if "unauthorized" in error_msg or "401" in error_msg:
                     raise AppError("api_key_invalid")
-                elif "limit" in error_msg or "429" in error_msg or "quota" in error_msg:
+                elif "429" in error_msg or "quota" in error_msg:
                     raise AppError("rate_limit_exceeded")
                 else:
                     # 재시도 가능한 일반 오류인 경우
                     if attempt < retries:
                         continue
                     raise AppError("network_error")
+        return []
+
+    @staticmethod
+    def _domain_groups(num_results: int) -> List[List[str]]:
+        """
+        num_results건을 최신순으로 고르기 위한 요청별 검색 도메인 묶음을 만듭니다.
+        Tavily는 요청당 TAVILY_MAX_RESULTS건까지만 반환하므로, 후보 목표(num_results의 2배, 최소 20건)를
+        채울 만큼 SEARCH_DOMAINS를 번갈아 나누어 묶음마다 한 번씩 요청합니다.
+        도메인 수보다 많이 나눌 수는 없으며, 도메인이 없으면 요청 1회로 최대 20건만 가져옵니다.
+        """
+        domains = Settings.SEARCH_DOMAINS
+        target = max(num_results * 2, TAVILY_MAX_RESULTS)
+        requests_needed = min(-(-target // TAVILY_MAX_RESULTS), max(len(domains), 1))
+        return [domains[i::requests_needed] for i in range(requests_needed)]
+
+    def _search_candidates(self, keyword: str, num_results: int, start_date: Optional[str] = None) -> List[dict]:
+        """
+        num_results건을 고를 후보 결과를 가져옵니다. 도메인 묶음이 여러 개면 병렬로 요청하고 URL 기준으로 합칩니다.
+        일부 묶음만 실패하면 나머지 결과를 사용하고, 모두 실패하면 첫 번째 오류를 다시 발생시킵니다.
+        """
+        groups = self._domain_groups(num_results)
+        if len(groups) == 1:
+            return self._search_raw(keyword, TAVILY_MAX_RESULTS, start_date, groups[0])
+
+        # 단계별 소요 시간(span)이 호출한 분석의 타이머에 기록되도록 컨텍스트를 복사하여 실행
+        with ThreadPoolExecutor(max_workers=len(groups), thread_name_prefix="tavily") as executor:
+            futures = [
+                executor.submit(copy_context().run, self._search_raw, keyword, TAVILY_MAX_RESULTS, start_date, group)
+                for group in groups
+            ]
+
+        results, errors, seen = [], [], set()
+        for future in futures:
+            try:
+                batch = future.result()
+            except AppError as e:
+                errors.append(e)
+                continue
+            for item in batch:
+                url = item.get('url', '')
+                if url and url in seen:
+                    continue
+                seen.add(url)
+                results.append(item)
+        if errors:
+            if not results:
+                raise errors[0]
+            logger.warning(f"'{keyword}' 검색 요청 {len(groups)}건 중 {len(errors)}건 실패: {errors[0].error_type}")
+        return results
+
+    @staticmethod
+    def _to_articles(results: List[dict]) -> List[NewsArticle]:
+        """Tavily 결과 항목을 NewsArticle 리스트로 변환합니다."""
+        return [
+            NewsArticle(
+                title=item.get('title', '제목 없음'),
+                url=item.get('url', ''),
+                snippet=item.get('content', ''),
+                pub_date=item.get('published_date', '날짜 정보 없음')
+            )
+            for item in results
+        ]
+
+    def search_news(self, keyword: str, num_results: int = 5) -> List[NewsArticle]:
+        """
+        지정된 키워드로 뉴스를 검색하고 최신순으로 정렬하여 반환합니다.
+        
+        Args:
+            keyword (str): 검색할 키워드
+            num_results (int): 반환할 결과 수 (기본값 5)
+            
+        Returns:
+            List[NewsArticle]: 검색된 뉴스 기사 리스트
+            
+        Raises:
+            AppError: API 키 오류, 할당량 초과, 네트워크 오류 등 발생 시
+        """
+        # 충분한 기사를 확보하기 위해 더 많이 요청 (최신순 정렬을 위해)
+        results = self._search_candidates(keyword, num_results)
+        if not results:
+            return []
+        
+        with span("sort_convert"):
+            # published_date 기준 내림차순(최신순) 정렬
+            # 날짜가 없는 항목은 리스트 끝으로 이동
+            sorted_results = sorted(
+                results,
+                key=lambda x: x.get('published_date') or "",
+                reverse=True
+            )
+            
+            # 상위 num_results 만큼만 추출
+            return self._to_articles(sorted_results[:num_results])
+
+    def search_new_articles(
+        self,
+        keyword: str,
+        num_results: int,
+        since: Optional[datetime] = None,
+        seen_urls: Optional[Set[str]] = None
+    ) -> List[NewsArticle]:
+        """
+        마지막으로 확인한 발행 시각(since) 이후에 나온, 아직 보지 않은 URL의 기사만 최신순으로 반환합니다.
+        워치리스트의 주기적 갱신에서 변경분(delta)만 가져오기 위해 사용합니다.
+
+        Args:
+            keyword (str): 검색할 키워드
+            num_results (int): 반환할 최대 기사 수
+            since (datetime, optional): 이미 확인한 가장 최근 기사의 발행 시각 (UTC)
+            seen_urls (Set[str], optional): 이미 저장한 기사 URL 집합
+
+        Returns:
+            List[NewsArticle]: 새 기사 리스트 (없으면 빈 리스트)
+        """
+        seen_urls = seen_urls or set()
+        start_date = since.strftime("%Y-%m-%d") if since else None
+        results = self._search_candidates(keyword, num_results, start_date=start_date)
+
+        with span("sort_convert"):
+            fresh = []
+            for item in results:
+                if item.get('url', '') in seen_urls:
+                    continue
+                published = parse_published_date(item.get('published_date'))
+                # 발행일을 알 수 없는 기사는 URL이 처음 보는 것이면 새 기사로 취급
+                if since and published and published <= since:
+                    continue
+                fresh.append((published, item))
+
+            fresh.sort(
+                key=lambda pair: pair[0] or datetime.min.replace(tzinfo=timezone.utc),
+                reverse=True
+            )
+            return self._to_articles([item for _, item in fresh[:num_results]])
 
 # 싱글톤 인스턴스 제공을 위한 전역 변수
 _search_service = None
+_search_service_lock = threading.Lock()
+
+def get_search_service() -> SearchService:
+    """
+    SearchService 싱글톤 인스턴스를 반환합니다.
+    여러 세션이 동시에 첫 검색을 수행해도 인스턴스는 한 번만 생성됩니다.
+    """
+    global _search_service
+    if _search_service is None:
+        with _search_service_lock:
+            if _search_service is None:
+                _search_service = SearchService()
+    return _search_service
+
+def count_search_requests(num_results: int) -> int:
+    """num_results건을 검색할 때 보내는 Tavily 요청 수를 반환합니다. (SEARCH_DOMAINS 묶음 수)"""
+    return len(SearchService._domain_groups(num_results))
 
 def search_news(keyword: str, num_results: int = 5) -> List[NewsArticle]:
     """
     편의를 위한 SearchService 래퍼 함수입니다. 
     싱글톤 인스턴스를 사용하여 뉴스 검색을 수행합니다.
     """
-    global _search_service
-    if _search_service is None:
-        _search_service = SearchService()
-    return _search_service.search_news(keyword, num_results)
+    return get_search_service().search_news(keyword, num_results)
 
 def get_google_trends_url(keyword: str) -> str:
     """
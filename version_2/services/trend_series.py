@@ -0,0 +1,53 @@
+from typing import TYPE_CHECKING, Dict
+
+# pandas는 추이를 처음 계산할 때 임포트하여 앱 첫 화면 렌더링을 지연시키지 않습니다.
+if TYPE_CHECKING:
+    import pandas as pd
+
+# 기사 발행일을 집계할 시간대 (국내 뉴스 기준 하루 경계)
+SERIES_TIMEZONE = "Asia/Seoul"
+
+# 집계 주기별 (이동평균 구간 수, 표시할 최근 구간 수)
+VOLUME_FREQUENCIES = {
+    "D": (7, 90),
+    "W": (4, 52),
+}
+
+
+def build_volume_series(published: "pd.Series", freq: str = "D", window: int = 7) -> "pd.DataFrame":
+    """
+    기사 발행일 목록을 주기(freq)별 기사 수와 이동평균으로 변환합니다.
+    반복문 없이 resample/rolling으로 계산하며, 기사가 없는 구간은 0건으로 채웁니다.
+
+    Args:
+        published (pd.Series): UTC 기준 기사 발행일 (datetime64[ns, UTC])
+        freq (str): pandas 리샘플 주기 ("D": 일별, "W": 주별 - 일요일 마감)
+        window (int): 이동평균에 사용할 구간 수
+
+    Returns:
+        pd.DataFrame: 구간 시작일을 인덱스로 하는 [articles, moving_avg] 열
+    """
+    import pandas as pd
+
+    if published.empty:
+        return pd.DataFrame({"articles": [], "moving_avg": []})
+
+    # 기사 단위로 정렬/리샘플하지 않고 날짜별 개수를 먼저 센 뒤 (날짜 수만큼의) 작은 시리즈만 리샘플
+    index = pd.DatetimeIndex(published).tz_convert(SERIES_TIMEZONE).tz_localize(None)
+    daily = index.floor("D").value_counts().sort_index()
+    counts = daily.resample(freq).sum().astype(int)
+    return pd.DataFrame({
+        "articles": counts,
+        "moving_avg": counts.rolling(window, min_periods=1).mean().round(2),
+    })
+
+
+def build_volume_report(published: "pd.Series") -> Dict[str, "pd.DataFrame"]:
+    """
+    통합 리포트에 표시할 일별/주별 기사 수 추이를 계산합니다.
+    이동평균은 전체 기간으로 계산한 뒤 최근 구간만 남겨 앞부분의 값도 정확하게 유지합니다.
+    """
+    report = {}
+    for freq, (window, periods) in VOLUME_FREQUENCIES.items():
+        report[freq] = build_volume_series(published, freq, window).iloc[-periods:]
+    return report
@@ -0,0 +1,159 @@
+import logging
+import threading
+from datetime import datetime
+from typing import Optional
+from config.settings import Settings
+from domain.search_result import SearchResult, SUMMARY_FULL, SUMMARY_INCREMENTAL
+from domain.watch_item import WatchItem
+from repositories.search_repository import SearchRepository
+from repositories.watchlist_repository import WatchlistRepository
+from services.analysis_pipeline import SOURCE_NEWS, SOURCE_AI_INSIGHTS, SOURCE_TRENDS
+from services.search_service import get_search_service, get_google_trends_url, parse_published_date
+from services.ai_service import summarize_news, update_summary, get_ai_insights
+from utils.exceptions import AppError
+from utils.key_generator import generate_search_key
+from utils.metrics import span, registry
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+
+def refresh_watch_item(
+    item: WatchItem, watch_repository: WatchlistRepository, search_repository: SearchRepository
+) -> int:
+    """
+    워치리스트 항목 1건을 갱신합니다. 마지막으로 확인한 발행 시각과 URL 이후의 새 기사만 가져와
+    저장하며, 새 기사가 없으면 Gemini 호출과 저장을 모두 건너뜁니다.
+
+    Returns:
+        int: 새로 저장한 기사 수
+
+    Raises:
+        AppError: 검색, 요약 또는 저장 단계에서 오류 발생 시
+    """
+    articles = get_search_service().search_new_articles(
+        item.keyword, item.num_results, item.last_published_at, set(item.seen_urls)
+    )
+    if not articles:
+        watch_repository.record_run(item.keyword, [], None, None)
+        registry.inc(
+            "trendtracker_watchlist_runs_total", {"outcome": "unchanged"},
+            help_text="Number of watchlist refreshes, by outcome"
+        )
+        return 0
+
+    summary = ""
+    summary_mode = SUMMARY_FULL
+    parent_key = ""
+    insights = ""
+    trends_url = ""
+    if SOURCE_NEWS in item.sources:
+        # 이전 갱신의 요약이 있으면 새 기사만 보내 요약을 갱신
+        previous = None
+        if item.last_search_key and Settings.SUMMARY_MODE == "incremental":
+            previous = search_repository.find_by_key(item.last_search_key)
+        with span("summarize"):
+            if previous is not None and previous.ai_summary:
+                summary = update_summary(previous.ai_summary, articles)
+                summary_mode, parent_key = SUMMARY_INCREMENTAL, previous.search_key
+            else:
+                summary = summarize_news(articles)
+    if SOURCE_AI_INSIGHTS in item.sources:
+        with span("insights"):
+            insights = get_ai_insights(item.keyword)
+    if SOURCE_TRENDS in item.sources:
+        trends_url = get_google_trends_url(item.keyword)
+
+    result = SearchResult(
+        search_key=generate_search_key(item.keyword),
+        search_time=datetime.now(),
+        keyword=item.keyword,
+        articles=articles,
+        ai_summary=summary,
+        ai_insights=insights,
+        trends_url=trends_url,
+        parent_key=parent_key,
+        summary_mode=summary_mode
+    )
+    with span("repository_save"):
+        if not search_repository.save(result):
+            raise AppError("file_error")
+
+    published = [parse_published_date(article.pub_date) for article in articles]
+    latest = max((p for p in published if p), default=None)
+    watch_repository.record_run(item.keyword, [article.url for article in articles], latest, result.search_key)
+
+    registry.inc(
+        "trendtracker_watchlist_runs_total", {"outcome": "updated"},
+        help_text="Number of watchlist refreshes, by outcome"
+    )
+    registry.inc(
+        "trendtracker_watchlist_new_articles_total", value=len(articles),
+        help_text="Number of new articles stored by watchlist refreshes"
+    )
+    return len(articles)
+
+
+class WatchlistScheduler:
+    """
+    워치리스트에서 실행 시각이 된 키워드를 주기적으로 찾아 순서대로 갱신하는 백그라운드 스케줄러입니다.
+    """
+
+    def __init__(
+        self,
+        watch_repository: WatchlistRepository,
+        search_repository: SearchRepository,
+        tick_seconds: float = 30.0
+    ):
+        self.watch_repository = watch_repository
+        self.search_repository = search_repository
+        self.tick_seconds = tick_seconds
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """스케줄러 스레드를 시작합니다. 이미 실행 중이면 아무것도 하지 않습니다."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="watchlist-scheduler", daemon=True)
+        self._thread.start()
+        logger.info("워치리스트 스케줄러 시작")
+
+    def stop(self, timeout: Optional[float] = None):
+        """진행 중인 갱신을 마친 뒤 스케줄러를 종료합니다."""
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def run_due(self) -> int:
+        """
+        실행 시각이 된 항목을 모두 갱신합니다.
+
+        Returns:
+            int: 이번 주기에 저장한 새 기사 수 합계
+        """
+        total = 0
+        for item in self.watch_repository.claim_due():
+            try:
+                total += refresh_watch_item(item, self.watch_repository, self.search_repository)
+            except AppError as e:
+                logger.warning(f"워치리스트 '{item.keyword}' 갱신 실패: {e.error_type}")
+                registry.inc(
+                    "trendtracker_watchlist_runs_total", {"outcome": "error"},
+                    help_text="Number of watchlist refreshes, by outcome"
+                )
+            except Exception:
+                logger.exception(f"워치리스트 '{item.keyword}' 갱신 중 예기치 못한 에러")
+                registry.inc(
+                    "trendtracker_watchlist_runs_total", {"outcome": "error"},
+                    help_text="Number of watchlist refreshes, by outcome"
+                )
+        return total
+
+    def _run(self):
+        while not self._stopping.is_set():
+            try:
+                self.run_due()
+            except Exception as e:
+                logger.warning(f"워치리스트 조회 실패: {e}")
+            self._stopping.wait(self.tick_seconds)
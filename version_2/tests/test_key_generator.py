@@ -0,0 +1,30 @@
+import unittest
+from datetime import datetime
+
+from utils.key_generator import generate_search_key, parse_search_key
+
+
+class SearchKeyTest(unittest.TestCase):
+    def test_generated_keys_are_unique_and_parse_back(self):
+        first, second = generate_search_key("생성형 AI"), generate_search_key("생성형 AI")
+        self.assertNotEqual(first, second)
+        keyword, analyzed_at = parse_search_key(first)
+        self.assertEqual(keyword, "생성형 AI")
+        self.assertLess(abs((datetime.now() - analyzed_at).total_seconds()), 5)
+
+    def test_parses_current_format(self):
+        self.assertEqual(
+            parse_search_key("GPT-4-20260212144148-a1b2c3"), ("GPT-4", datetime(2026, 2, 12, 14, 41, 48))
+        )
+
+    def test_parses_minute_resolution_format(self):
+        self.assertEqual(parse_search_key("바이브코딩 피로감-202602121441"), ("바이브코딩 피로감", datetime(2026, 2, 12, 14, 41)))
+        self.assertEqual(parse_search_key("2026-202602121441"), ("2026", datetime(2026, 2, 12, 14, 41)))
+
+    def test_unknown_format_returns_whole_key(self):
+        for key in ("키워드", "키워드-2026", "키워드-202613321441", "키워드-20260212144148-XYZ"):
+            self.assertEqual(parse_search_key(key), (key, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+import csv
+import os
+import tempfile
+import unittest
+from datetime import datetime
+
+from domain.news_article import NewsArticle
+from domain.search_result import SearchResult
+from repositories.search_repository import SearchRepository
+from repositories.text_codec import decode_text, is_encoded
+from utils.shared_cache import SharedCache
+
+# 처음 배포한 버전의 검색 기록 머리글 (요약 계보, 발행일, 대기 단계 열과 텍스트 압축이 없던 형식)
+LEGACY_HEADER = [
+    "search_key", "search_time", "keyword", "article_index",
+    "title", "url", "snippet", "ai_summary", "ai_insights", "trends_url",
+]
+LEGACY_SNIPPET = "이전 버전에서 압축하지 않고 저장한 기사 스니펫입니다. " * 3
+LEGACY_SUMMARY = "이전 버전에서 저장한 AI 요약입니다. 주요 기업들의 경쟁이 심화되고 있습니다. " * 3
+
+
+def make_result(keyword: str, key: str, count: int = 2, insights: str = "") -> SearchResult:
+    articles = [
+        NewsArticle(
+            f"{keyword} 기사 {i}", f"https://example.com/{key}/{i}",
+            f"{keyword} 관련 최신 동향을 정리한 기사 스니펫입니다. 전문가들은 시장 변화를 주목하고 있습니다. {i}",
+            "Mon, 12 Feb 2026 05:41:00 GMT"
+        )
+        for i in range(count)
+    ]
+    return SearchResult(
+        search_key=key, search_time=datetime(2026, 2, 12, 14, 41, 48), keyword=keyword, articles=articles,
+        ai_summary=f"{keyword}에 대한 AI 요약입니다. 주요 기업들이 자체 모델을 공개하며 경쟁이 심화되고 있습니다.",
+        ai_insights=insights, trends_url="https://trends.google.com/trends/explore?q=x"
+    )
+
+
+class LegacyCsvTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.csv_path = os.path.join(self.directory.name, "data", "search_history.csv")
+        os.makedirs(os.path.dirname(self.csv_path))
+        with open(self.csv_path, "w", encoding="utf-8-sig", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(LEGACY_HEADER)
+            for i in range(2):
+                writer.writerow([
+                    "바이브코딩-202602121441", "2026-02-12 14:41:48.096534", "바이브코딩", i + 1,
+                    f"이전 기사 {i}", f"https://example.com/legacy/{i}", LEGACY_SNIPPET,
+                    LEGACY_SUMMARY, "", "",
+                ])
+
+    def read_header(self) -> list:
+        with open(self.csv_path, encoding="utf-8-sig", newline="") as f:
+            return next(csv.reader(f))
+
+    def test_legacy_rows_are_readable(self):
+        result = SearchRepository(self.csv_path).find_by_key("바이브코딩-202602121441")
+        self.assertEqual(len(result.articles), 2)
+        self.assertEqual(result.articles[0].snippet, LEGACY_SNIPPET)
+        self.assertEqual(result.ai_summary, LEGACY_SUMMARY)
+        self.assertEqual(result.pending, [])
+
+    def test_first_save_rewrites_file_in_current_format(self):
+        repository = SearchRepository(self.csv_path)
+        self.assertTrue(repository.save(make_result("생성형 AI", "생성형 AI-20260212144148-a1b2c3")))
+
+        self.assertEqual(self.read_header(), repository.columns)
+        reread = SearchRepository(self.csv_path)
+        self.assertEqual(
+            set(reread.get_all_keys()), {"바이브코딩-202602121441", "생성형 AI-20260212144148-a1b2c3"}
+        )
+        legacy = reread.find_by_key("바이브코딩-202602121441")
+        self.assertEqual([article.url for article in legacy.articles], [
+            "https://example.com/legacy/0", "https://example.com/legacy/1"
+        ])
+        self.assertEqual(legacy.ai_summary, LEGACY_SUMMARY)
+        saved = reread.find_by_key("생성형 AI-20260212144148-a1b2c3")
+        self.assertEqual(saved.articles[1].url, "https://example.com/생성형 AI-20260212144148-a1b2c3/1")
+        self.assertTrue(saved.ai_summary.startswith("생성형 AI에 대한 AI 요약입니다."))
+
+    def test_later_saves_append_compressed_rows(self):
+        repository = SearchRepository(self.csv_path)
+        repository.save(make_result("생성형 AI", "생성형 AI-20260212144148-a1b2c3"))
+        with open(self.csv_path, "rb") as f:
+            before = f.read()
+        repository.save(make_result("반도체", "반도체-20260212144150-d4e5f6", count=3))
+
+        with open(self.csv_path, "rb") as f:
+            after = f.read()
+        self.assertTrue(after.startswith(before))
+        df = SearchRepository(self.csv_path).load()
+        self.assertEqual(len(df), 2 + 2 + 3)
+        snippets = df.loc[df["search_key"] == "반도체-20260212144150-d4e5f6", "snippet"]
+        self.assertTrue(all(is_encoded(value) for value in snippets))
+        self.assertTrue(decode_text(snippets.iloc[0]).startswith("반도체 관련 최신 동향"))
+
+
+class SharedHistoryTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.csv_path = os.path.join(self.directory.name, "search_history.csv")
+        self.cache = SharedCache(os.path.join(self.directory.name, "shared_cache.sqlite3"), 16 * 1024 * 1024)
+        SearchRepository(self.csv_path).save_many([
+            make_result("생성형 AI", "생성형 AI-20260212144148-a1b2c3"),
+            make_result("반도체", "반도체-20260212144150-d4e5f6", count=3, insights="반도체 인사이트"),
+        ])
+
+    def test_other_process_reads_the_parsed_history(self):
+        expected = SearchRepository(self.csv_path, shared_cache=self.cache).load()
+        other = SearchRepository(self.csv_path, shared_cache=self.cache)
+
+        shared = other._load_shared(other.version())
+        self.assertIsNotNone(shared)
+        self.assertTrue(shared.equals(expected))
+        self.assertTrue(shared.dtypes.equals(expected.dtypes))
+        # 빈 텍스트는 read_csv와 같이 None이 아닌 NaN으로 읽음
+        missing = shared.loc[shared["ai_insights"].isna(), "ai_insights"]
+        self.assertTrue(0 < len(missing) < len(shared))
+        self.assertTrue(all(isinstance(value, float) for value in missing))
+
+    def test_stale_or_unreadable_entries_are_ignored(self):
+        repository = SearchRepository(self.csv_path, shared_cache=self.cache)
+        repository.load()
+        self.assertIsNone(repository._load_shared((1, 2)))
+
+        self.cache.set("history", repository._shared_key(), b"not a history frame")
+        self.assertIsNone(repository._load_shared(repository.version()))
+        self.assertEqual(len(SearchRepository(self.csv_path, shared_cache=self.cache).load()), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
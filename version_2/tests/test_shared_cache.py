@@ -0,0 +1,132 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from utils import shared_cache
+from utils.shared_cache import MemoryCache, SharedCache, bypass_scope, bypassing, make_key
+
+
+class CacheContract:
+    """MemoryCache와 SharedCache가 함께 지켜야 하는 동작입니다. (make_cache를 구현한 TestCase와 함께 상속)"""
+
+    def make_cache(self, max_bytes: int) -> MemoryCache:
+        raise NotImplementedError
+
+    def test_get_returns_stored_value(self):
+        cache = self.make_cache(1024)
+        cache.set("tavily", "k", b"value")
+        self.assertEqual(cache.get("tavily", "k"), b"value")
+        self.assertIsNone(cache.get("gemini", "k"))
+
+    def test_set_overwrites_and_tracks_size(self):
+        cache = self.make_cache(1024)
+        cache.set("tavily", "k", b"12345")
+        cache.set("tavily", "k", b"12")
+        self.assertEqual(cache.get("tavily", "k"), b"12")
+        self.assertEqual(cache.stats()["entries"], 1)
+        self.assertEqual(cache.stats()["bytes"], 2)
+
+    def test_expired_entry_is_a_miss(self):
+        cache = self.make_cache(1024)
+        cache.set("tavily", "k", b"value", ttl=0.01)
+        time.sleep(0.05)
+        self.assertIsNone(cache.get("tavily", "k"))
+
+    def test_evicts_least_recently_used(self):
+        cache = self.make_cache(10)
+        cache.set("tavily", "a", b"aaaa")
+        time.sleep(0.01)
+        cache.set("tavily", "b", b"bbbb")
+        time.sleep(0.01)
+        cache.get("tavily", "a")
+        time.sleep(0.01)
+        cache.set("tavily", "c", b"cccc")
+        self.assertEqual(cache.get("tavily", "a"), b"aaaa")
+        self.assertIsNone(cache.get("tavily", "b"))
+        self.assertEqual(cache.get("tavily", "c"), b"cccc")
+        self.assertLessEqual(cache.stats()["bytes"], 10)
+
+    def test_value_larger_than_cache_is_not_stored(self):
+        cache = self.make_cache(4)
+        cache.set("tavily", "k", b"too large")
+        self.assertIsNone(cache.get("tavily", "k"))
+
+    def test_delete_and_clear(self):
+        cache = self.make_cache(1024)
+        cache.set("tavily", "a", b"a")
+        cache.set("tavily", "b", b"b")
+        cache.delete("tavily", "a")
+        self.assertIsNone(cache.get("tavily", "a"))
+        self.assertEqual(cache.clear(), 1)
+        self.assertEqual(cache.stats()["bytes"], 0)
+
+    def test_json_round_trip(self):
+        cache = self.make_cache(1024)
+        results = [{"title": "생성형 AI", "score": 0.5}]
+        cache.set_json("tavily", "k", results)
+        self.assertEqual(cache.get_json("tavily", "k"), results)
+
+
+class MemoryCacheTest(CacheContract, unittest.TestCase):
+    def make_cache(self, max_bytes: int) -> MemoryCache:
+        return MemoryCache(max_bytes)
+
+
+class SharedCacheTest(CacheContract, unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, "cache", "shared_cache.sqlite3")
+        # 조회할 때마다 최근 사용 시각을 갱신하여 LRU 순서를 정확히 확인
+        patcher = mock.patch.object(shared_cache, "TOUCH_INTERVAL_SECONDS", 0.0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make_cache(self, max_bytes: int) -> SharedCache:
+        return SharedCache(self.path, max_bytes)
+
+    def test_instances_share_the_file(self):
+        writer = self.make_cache(1024)
+        reader = self.make_cache(1024)
+        writer.set("gemini", "k", b"answer")
+        self.assertEqual(reader.get("gemini", "k"), b"answer")
+        reader.delete("gemini", "k")
+        self.assertIsNone(writer.get("gemini", "k"))
+
+    def test_usage_triggers_match_stored_sizes(self):
+        cache = self.make_cache(1024)
+        cache.set("tavily", "a", b"1234")
+        cache.set("tavily", "b", b"12345678")
+        cache.set("tavily", "a", b"12")
+        cache.delete("tavily", "b")
+        self.assertEqual(cache.stats(), {"entries": 1, "bytes": 2, "max_bytes": 1024, "path": self.path})
+
+    def test_expired_entries_are_evicted_first(self):
+        cache = self.make_cache(10)
+        cache.set("tavily", "old", b"oooo")
+        cache.set("tavily", "short", b"ssss", ttl=0.01)
+        time.sleep(0.05)
+        cache.set("tavily", "new", b"nnnn")
+        self.assertEqual(cache.get("tavily", "old"), b"oooo")
+        self.assertEqual(cache.get("tavily", "new"), b"nnnn")
+
+
+class CacheHelpersTest(unittest.TestCase):
+    def test_make_key_depends_on_every_part(self):
+        self.assertEqual(make_key("tavily", "a", ["x", "y"]), make_key("tavily", "a", ["x", "y"]))
+        self.assertNotEqual(make_key("tavily", "a"), make_key("gemini", "a"))
+
+    def test_bypass_scope_is_restored(self):
+        self.assertFalse(bypassing())
+        with bypass_scope(True):
+            self.assertTrue(bypassing())
+            with bypass_scope(False):
+                self.assertFalse(bypassing())
+            self.assertTrue(bypassing())
+        self.assertFalse(bypassing())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+
+from repositories.text_codec import CURRENT_DICTIONARY, decode_text, encode_text, is_encoded
+
+SUMMARY = (
+    "생성형 AI 관련 최신 뉴스에 따르면 주요 기업들이 자체 모델을 공개하며 경쟁이 심화되고 있습니다. "
+    "전문가들은 규제와 데이터 확보가 향후 시장 판도를 결정할 핵심 요인이 될 것이라고 전망했습니다. "
+    "한편 정부는 인공지능 산업 육성을 위한 지원 방안을 발표했습니다."
+)
+
+
+class TextCodecTest(unittest.TestCase):
+    def test_long_text_is_compressed_and_restored(self):
+        encoded = encode_text(SUMMARY)
+        self.assertTrue(encoded.startswith(f"z{CURRENT_DICTIONARY}:"))
+        self.assertLess(len(encoded), len(SUMMARY.encode("utf-8")))
+        self.assertEqual(decode_text(encoded), SUMMARY)
+
+    def test_short_text_is_stored_as_is(self):
+        self.assertEqual(encode_text("AI"), "AI")
+        self.assertEqual(decode_text("AI"), "AI")
+
+    def test_plain_text_that_looks_encoded_round_trips(self):
+        for text in ("z1:", "z1:abc", f"z{CURRENT_DICTIONARY}:생성형 AI"):
+            encoded = encode_text(text)
+            self.assertTrue(is_encoded(encoded))
+            self.assertNotEqual(encoded, text)
+            self.assertEqual(decode_text(encoded), text)
+
+    def test_other_prefixes_are_not_encoded_values(self):
+        for text in ("z", "zebra: 얼룩말", "z99:abc", "1:abc"):
+            self.assertFalse(is_encoded(text))
+            self.assertEqual(decode_text(text), text)
+
+    def test_empty_and_missing_values_pass_through(self):
+        nan = float("nan")
+        self.assertEqual(encode_text(""), "")
+        self.assertIsNone(encode_text(None))
+        self.assertIs(encode_text(nan), nan)
+        self.assertIs(decode_text(nan), nan)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import streamlit as st
+from config.settings import Settings
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from domain.search_result import SearchResult
+from repositories.search_repository import SearchRepository
+from repositories.rollup_repository import RollupRepository
+from repositories.job_repository import JobRepository
+from repositories.watchlist_repository import WatchlistRepository
+from services.job_queue import JobWorkerPool
+from services.watchlist_scheduler import WatchlistScheduler
+from services.trend_series import build_volume_report
+from utils.shared_cache import get_history_cache
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+@st.cache_resource
+def get_repository(csv_path: str) -> SearchRepository:
+    """
+    경로별 SearchRepository를 서버 프로세스 전체에서 하나만 생성하여 공유합니다.
+    리포지토리 내부의 DataFrame 캐시도 rerun과 세션 사이에서 재사용되며, 파싱한 기록은 공유 캐시로 다른 서버 프로세스와도 공유합니다.
+    """
+    return SearchRepository(
+        csv_path, RollupRepository(Settings.ROLLUP_DB_PATH), Settings.HISTORY_COMPRESSION, get_history_cache()
+    )
+
+@st.cache_resource
+def get_job_repository(db_path: str) -> JobRepository:
+    """
+    분석 작업 큐(SQLite)를 서버 프로세스 전체에서 하나만 생성하여 공유합니다.
+    """
+    return JobRepository(db_path)
+
+@st.cache_resource
+def start_job_workers(
+    _job_repository: JobRepository, _search_repository: SearchRepository,
+    db_path: str, csv_path: str, num_workers: int
+) -> JobWorkerPool:
+    """
+    앱 프로세스 안에서 작업 워커 풀을 한 번만 시작합니다.
+    모든 세션이 같은 풀을 공유하므로 동시에 실행되는 분석 수는 num_workers로 제한됩니다.
+    """
+    pool = JobWorkerPool(_job_repository, _search_repository, num_workers, Settings.JOB_POLL_SECONDS)
+    pool.start()
+    return pool
+
+@st.cache_resource
+def get_watchlist_repository(db_path: str) -> WatchlistRepository:
+    """
+    워치리스트 저장소(SQLite)를 서버 프로세스 전체에서 하나만 생성하여 공유합니다.
+    """
+    return WatchlistRepository(db_path, Settings.WATCHLIST_SEEN_URLS_MAX)
+
+@st.cache_resource
+def start_watchlist_scheduler(
+    _watch_repository: WatchlistRepository, _search_repository: SearchRepository,
+    db_path: str, csv_path: str
+) -> WatchlistScheduler:
+    """
+    앱 프로세스 안에서 워치리스트 스케줄러를 한 번만 시작합니다.
+    """
+    scheduler = WatchlistScheduler(_watch_repository, _search_repository, Settings.WATCHLIST_TICK_SECONDS)
+    scheduler.start()
+    return scheduler
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def load_search_keys(_repository: SearchRepository, csv_path: str, version: Tuple[int, int]) -> List[str]:
+    """
+    최신순 검색 키 목록을 캐시합니다.
+    version(리포지토리 파일 버전)이 캐시 키에 포함되므로 저장이 일어나면 자동으로 다시 계산됩니다.
+    """
+    return _repository.get_all_keys()
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+def load_search_result(
+    _repository: SearchRepository, csv_path: str, search_key: str, version: Tuple[int, int]
+) -> Optional[SearchResult]:
+    """
+    과거 검색 결과의 헤더를 캐시합니다. 저장이 일어나면 version이 바뀌어 무효화됩니다.
+    기사와 AI 요약/인사이트는 탭이 처음 접근할 때 읽고 같은 객체에 남으므로 다시 열 때는 읽지 않습니다.
+    (cache_data는 결과를 pickle로 복사하면서 모든 필드를 읽어 버리므로 객체를 그대로 공유하는 cache_resource를 사용)
+    """
+    return _repository.find_lazy_by_key(search_key)
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def load_lineage(
+    _repository: SearchRepository, csv_path: str, search_key: str, version: Tuple[int, int]
+) -> List[Tuple[str, str]]:
+    """
+    검색 결과의 요약 계보 조회를 캐시합니다. 저장이 일어나면 version이 바뀌어 무효화됩니다.
+    """
+    return _repository.get_lineage(search_key)
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def load_article_volume(
+    _repository: SearchRepository, csv_path: str, keyword: str, version: Tuple[int, int]
+) -> Dict[str, "pd.DataFrame"]:
+    """
+    키워드의 일별/주별 기사량 추이 계산을 캐시합니다. 저장이 일어나면 version이 바뀌어 무효화됩니다.
+    """
+    return build_volume_report(_repository.get_article_dates(keyword))
@@ -0,0 +1,45 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+from utils.exceptions import AppError
+
+# 현재 분석의 마감 시각 (time.monotonic 기준, None이면 제한 없음)
+# contextvars를 사용하므로 copy_context()로 실행한 병렬 요청 스레드에도 전달됩니다.
+_deadline: ContextVar[Optional[float]] = ContextVar("trendtracker_deadline", default=None)
+
+
+@contextmanager
+def deadline_scope(seconds: float) -> Iterator[None]:
+    """
+    블록 안의 API 호출이 지금부터 seconds초 안에 끝나도록 마감 시각을 설정합니다. (0 이하이면 제한 없음)
+    이미 더 이른 마감 시각이 설정되어 있으면 그 시각을 유지합니다.
+    """
+    current = _deadline.get()
+    target = time.monotonic() + seconds if seconds > 0 else None
+    if current is not None and (target is None or current < target):
+        target = current
+    token = _deadline.set(target)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """마감까지 남은 시간(초)을 반환합니다. 마감 시각이 없으면 None을 반환합니다."""
+    target = _deadline.get()
+    return None if target is None else target - time.monotonic()
+
+
+def stage_timeout(cap: float, min_seconds: float = 0.5) -> float:
+    """
+    API 호출 1회에 사용할 시간 제한(초)을 반환합니다. 호출별 상한(cap)과 남은 시간 중 짧은 값입니다.
+    남은 시간이 min_seconds보다 적으면 호출해도 끝낼 수 없으므로 AppError("timeout")를 발생시킵니다.
+    """
+    left = remaining()
+    if left is None:
+        return cap
+    if left < min_seconds:
+        raise AppError("timeout")
+    return min(cap, left)
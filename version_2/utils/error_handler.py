@@ -9,7 +9,8 @@ ERROR_MESSAGES = {
     "network_error": "네트워크 연결 또는 서버 응답에 문제가 있습니다. 잠시 후 재시도해주세요.",
     "file_error": "파일 접근 또는 저장 중 오류가 발생했습니다.",
     "empty_input": "검색어를 입력해주세요.",
-    "ai_error": "AI 요약 생성 중 오류가 발생했습니다."
+    "ai_error": "AI 요약 생성 중 오류가 발생했습니다.",
+    "timeout": "응답이 너무 늦어 분석 시간 제한을 넘었습니다. 잠시 후 다시 시도해주세요."
 }
 
 def handle_error(error_type: str, level: str = "error"):
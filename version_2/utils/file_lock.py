@@ -0,0 +1,40 @@
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 간 잠금 없이 같은 프로세스 안의 스레드만 직렬화
+    fcntl = None
+
+# 잠금 파일 경로별 스레드 잠금 (flock은 같은 프로세스의 다른 스레드를 막지 않으므로 함께 사용)
+_thread_locks: Dict[str, threading.Lock] = {}
+_thread_locks_guard = threading.Lock()
+
+
+def _thread_lock(path: str) -> threading.Lock:
+    with _thread_locks_guard:
+        lock = _thread_locks.get(path)
+        if lock is None:
+            lock = _thread_locks[path] = threading.Lock()
+        return lock
+
+
+@contextmanager
+def file_lock(path: str) -> Iterator[None]:
+    """
+    path 파일에 대한 배타적 잠금을 잡습니다. 같은 파일을 쓰는 다른 프로세스(앱, 워커, API 서버, main.py)와
+    같은 프로세스의 다른 스레드가 블록을 동시에 실행하지 않습니다. 잠금 파일은 없으면 만들고 지우지 않습니다.
+    """
+    path = os.path.abspath(path)
+    with _thread_lock(path):
+        if fcntl is None:
+            yield
+            return
+        with open(path, "a") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
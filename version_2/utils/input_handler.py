@@ -1,3 +1,4 @@
+import unicodedata
 from typing import Optional
 
 def preprocess_keyword(raw_input: str) -> Optional[str]:
@@ -24,3 +25,11 @@ def preprocess_keyword(raw_input: str) -> Optional[str]:
         processed = processed[:100]
         
     return processed
+
+def normalize_keyword(keyword: str) -> str:
+    """
+    같은 검색어로 볼 키워드를 하나의 형태로 맞춥니다. (이전 분석 결과 재사용 시 비교용)
+    전각/반각 등 호환 문자를 통일(NFKC)하고 대소문자와 띄어쓰기 차이를 무시합니다.
+    예: "생성형 AI", "생성형AI", "생성형  ai" → "생성형ai"
+    """
+    return "".join(unicodedata.normalize("NFKC", keyword).casefold().split())
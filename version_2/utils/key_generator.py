@@ -1,9 +1,17 @@
+import re
+import uuid
 from datetime import datetime
+from typing import Optional, Tuple
+
+# 검색 키의 시각 부분 (이전 형식은 분 단위 12자리, 현재 형식은 초 단위 14자리 + 중복 방지 접미사)
+_KEY_PATTERN = re.compile(r"^(?P<keyword>.*)-(?P<ts>\d{14}|\d{12})(?:-(?P<suffix>[0-9a-f]+))?$")
 
 def generate_search_key(keyword: str) -> str:
     """
     키워드와 현재 시간을 조합하여 고유한 검색 키를 생성합니다.
-    형식: "키워드-yyyymmddHHMM"
+    형식: "키워드-yyyymmddHHMMSS-xxxxxx"
+    같은 키워드를 같은 초에 여러 번 분석해도(여러 워커, HTTP API, 캐시된 응답) 키가 겹치지 않도록
+    무작위 16진수 6자리를 붙입니다.
     
     Args:
         keyword (str): 검색 키워드
@@ -12,5 +20,19 @@ def generate_search_key(keyword: str) -> str:
         str: 생성된 고유 검색 키
     """
     now = datetime.now()
-    timestamp = now.strftime("%Y%m%d%H%M")
-    return f"{keyword}-{timestamp}"
+    timestamp = now.strftime("%Y%m%d%H%M%S")
+    return f"{keyword}-{timestamp}-{uuid.uuid4().hex[:6]}"
+
+def parse_search_key(key: str) -> Tuple[str, Optional[datetime]]:
+    """
+    검색 키를 (키워드, 검색 시각)으로 나눕니다. 이전 형식("키워드-yyyymmddHHMM")도 읽으며,
+    형식을 알 수 없으면 (키 전체, None)을 반환합니다.
+    """
+    match = _KEY_PATTERN.match(key)
+    if not match:
+        return key, None
+    ts = match.group("ts")
+    try:
+        return match.group("keyword"), datetime.strptime(ts, "%Y%m%d%H%M%S" if len(ts) == 14 else "%Y%m%d%H%M")
+    except ValueError:
+        return key, None
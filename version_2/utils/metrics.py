@@ -0,0 +1,246 @@
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 지연 히스토그램 버킷 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Optional[Dict[str, str]]) -> LabelKey:
+    return tuple(sorted((labels or {}).items()))
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+class MetricsRegistry:
+    """
+    프로세스 전역 카운터/게이지/히스토그램 저장소입니다.
+    Prometheus 텍스트 형식으로 내보낼 수 있으며 여러 세션(스레드)에서 동시에 사용해도 안전합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._help: Dict[str, Tuple[str, str]] = {}
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._gauges: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, List[float]]] = {}
+
+    def _describe(self, name: str, kind: str, help_text: str):
+        if name not in self._help:
+            self._help[name] = (kind, help_text)
+
+    def inc(self, name: str, labels: Optional[Dict[str, str]] = None, value: float = 1.0, help_text: str = ""):
+        """카운터를 증가시킵니다."""
+        with self._lock:
+            self._describe(name, "counter", help_text)
+            series = self._counters.setdefault(name, {})
+            key = _label_key(labels)
+            series[key] = series.get(key, 0.0) + value
+
+    def set_gauge(self, name: str, value: float, labels: Optional[Dict[str, str]] = None, help_text: str = ""):
+        """게이지 값을 설정합니다."""
+        with self._lock:
+            self._describe(name, "gauge", help_text)
+            self._gauges.setdefault(name, {})[_label_key(labels)] = value
+
+    def observe(self, name: str, value: float, labels: Optional[Dict[str, str]] = None, help_text: str = ""):
+        """히스토그램에 관측값(초)을 추가합니다."""
+        with self._lock:
+            self._describe(name, "histogram", help_text)
+            series = self._histograms.setdefault(name, {})
+            # [버킷별 누적 개수..., 합계, 개수]
+            state = series.setdefault(_label_key(labels), [0.0] * (len(LATENCY_BUCKETS) + 2))
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if value <= bound:
+                    state[i] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    def get_counter(self, name: str, labels: Optional[Dict[str, str]] = None) -> float:
+        with self._lock:
+            return self._counters.get(name, {}).get(_label_key(labels), 0.0)
+
+    def get_histogram(self, name: str, labels: Optional[Dict[str, str]] = None) -> Tuple[float, int]:
+        """히스토그램의 (합계, 개수)를 반환합니다."""
+        with self._lock:
+            state = self._histograms.get(name, {}).get(_label_key(labels))
+            return (state[-2], int(state[-1])) if state else (0.0, 0)
+
+    def render_prometheus(self) -> str:
+        """등록된 모든 지표를 Prometheus 텍스트 노출 형식으로 반환합니다."""
+        lines: List[str] = []
+        with self._lock:
+            for name, (kind, help_text) in sorted(self._help.items()):
+                if help_text:
+                    lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                if kind == "counter":
+                    for key, value in self._counters.get(name, {}).items():
+                        lines.append(f"{name}{_format_labels(key)} {value}")
+                elif kind == "gauge":
+                    for key, value in self._gauges.get(name, {}).items():
+                        lines.append(f"{name}{_format_labels(key)} {value}")
+                else:
+                    for key, state in self._histograms.get(name, {}).items():
+                        for i, bound in enumerate(LATENCY_BUCKETS):
+                            lines.append(f"{name}_bucket{_format_labels(key, ('le', str(bound)))} {state[i]}")
+                        lines.append(f"{name}_bucket{_format_labels(key, ('le', '+Inf'))} {state[-1]}")
+                        lines.append(f"{name}_sum{_format_labels(key)} {state[-2]}")
+                        lines.append(f"{name}_count{_format_labels(key)} {state[-1]}")
+        return "\n".join(lines) + "\n"
+
+
+# 프로세스 전역 레지스트리
+registry = MetricsRegistry()
+
+
+class StageTimer:
+    """
+    한 번의 분석(또는 rerun)에서 단계별 소요 시간을 수집합니다.
+    with 문으로 활성화하면 그 안에서 호출된 span()이 이 타이머에 기록됩니다.
+    """
+
+    def __init__(self):
+        self.spans: List[Tuple[str, float, bool]] = []
+        self._token = None
+
+    def __enter__(self) -> "StageTimer":
+        self._token = _current_timer.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _current_timer.reset(self._token)
+        return False
+
+    def record(self, stage: str, seconds: float, ok: bool = True):
+        self.spans.append((stage, seconds, ok))
+
+    def as_dict(self, since: int = 0) -> Dict[str, float]:
+        """
+        단계별 소요 시간(ms)을 반환합니다. 같은 단계가 여러 번 실행되면 합산합니다.
+        since를 지정하면 해당 위치(len(spans)) 이후에 기록된 구간만 집계합니다.
+        """
+        stages: Dict[str, float] = {}
+        for stage, seconds, _ in self.spans[since:]:
+            stages[stage] = round(stages.get(stage, 0.0) + seconds * 1000, 2)
+        return stages
+
+
+_current_timer: ContextVar[Optional[StageTimer]] = ContextVar("stage_timer", default=None)
+
+
+@contextmanager
+def span(stage: str):
+    """
+    코드 블록의 실행 시간을 측정하는 경량 타이밍 구간입니다.
+    활성화된 StageTimer와 전역 히스토그램(trendtracker_stage_seconds)에 함께 기록됩니다.
+
+    Example:
+        with span("summarize"):
+            summary = summarize_news(articles)
+    """
+    start = time.perf_counter()
+    ok = True
+    try:
+        yield
+    except BaseException:
+        ok = False
+        raise
+    finally:
+        elapsed = time.perf_counter() - start
+        timer = _current_timer.get()
+        if timer is not None:
+            timer.record(stage, elapsed, ok)
+        registry.observe(
+            "trendtracker_stage_seconds", elapsed, {"stage": stage},
+            help_text="Duration of each analysis stage in seconds"
+        )
+        if not ok:
+            registry.inc(
+                "trendtracker_stage_errors_total", {"stage": stage},
+                help_text="Number of stage executions that raised an error"
+            )
+
+
+def append_metrics_record(record: dict, log_path: str):
+    """
+    분석 1건의 구조화된 측정 기록을 JSON Lines 파일에 추가합니다.
+    기록 실패는 분석 결과에 영향을 주지 않도록 로그만 남깁니다.
+    """
+    record = {"ts": datetime.now().isoformat(timespec="milliseconds"), **record}
+    try:
+        directory = os.path.dirname(log_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(log_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    except OSError as e:
+        logger.warning(f"측정 기록 저장 실패: {e}")
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """/metrics 경로로 Prometheus 텍스트를 제공하는 핸들러"""
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = registry.render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+_server_lock = threading.Lock()
+_server: Optional[ThreadingHTTPServer] = None
+_server_failed = False
+
+
+def start_metrics_server(port: int, host: str = "127.0.0.1") -> bool:
+    """
+    로컬 /metrics 엔드포인트를 데몬 스레드에서 한 번만 시작합니다.
+    포트가 이미 사용 중이면(다른 프로세스 등) 경고만 남기고 False를 반환합니다.
+    """
+    global _server, _server_failed
+    with _server_lock:
+        if _server is not None:
+            return True
+        if _server_failed:
+            return False
+        try:
+            _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+        except OSError as e:
+            _server_failed = True
+            logger.warning(f"메트릭 엔드포인트 시작 실패 (port={port}): {e}")
+            return False
+        _server.daemon_threads = True
+        threading.Thread(target=_server.serve_forever, name="metrics-server", daemon=True).start()
+        return True
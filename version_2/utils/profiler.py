@@ -0,0 +1,121 @@
+import cProfile
+import io
+import os
+import pstats
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, List, Optional, Tuple
+
+# 할당 통계에서 제외할 내부 모듈
+_ALLOCATION_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+]
+
+
+@dataclass
+class ProfileReport:
+    """
+    한 번의 rerun을 프로파일링한 결과 요약입니다.
+    
+    Attributes:
+        elapsed_seconds (float): rerun 전체 소요 시간
+        peak_bytes (int): tracemalloc 기준 최대 메모리 사용량
+        pstats_path (str): cProfile 결과(.pstats) 파일 경로
+        allocations_path (str): 상위 메모리 할당 보고서 파일 경로
+        top_functions (List[Tuple[str, int, float, float]]): (함수, 호출 수, 자체 시간, 누적 시간)
+        top_allocations (List[Tuple[str, float, int]]): (위치, 크기 KiB, 할당 수)
+    """
+    elapsed_seconds: float
+    peak_bytes: int
+    pstats_path: str
+    allocations_path: str
+    top_functions: List[Tuple[str, int, float, float]] = field(default_factory=list)
+    top_allocations: List[Tuple[str, float, int]] = field(default_factory=list)
+
+
+def _top_functions(profiler: cProfile.Profile, top_n: int) -> List[Tuple[str, int, float, float]]:
+    stats = pstats.Stats(profiler, stream=io.StringIO())
+    entries = []
+    for (filename, line, func), (_, ncalls, tottime, cumtime, _) in stats.stats.items():
+        location = f"{os.path.basename(filename)}:{line}({func})" if filename != "~" else func
+        entries.append((location, ncalls, tottime, cumtime))
+    entries.sort(key=lambda e: e[3], reverse=True)
+    return entries[:top_n]
+
+
+def _top_allocations(snapshot: tracemalloc.Snapshot, top_n: int) -> List[Tuple[str, float, int]]:
+    stats = snapshot.filter_traces(_ALLOCATION_FILTERS).statistics("lineno")
+    entries = []
+    for stat in stats[:top_n]:
+        frame = stat.traceback[0]
+        entries.append((f"{frame.filename}:{frame.lineno}", stat.size / 1024, stat.count))
+    return entries
+
+
+def profile_call(func: Callable[[], None], output_dir: str, top_n: int = 20) -> Optional[ProfileReport]:
+    """
+    함수 한 번의 실행을 cProfile과 tracemalloc으로 감싸 측정하고,
+    output_dir에 .pstats 파일과 상위 메모리 할당 보고서를 저장합니다.
+    
+    func가 예외(Streamlit의 st.rerun/st.stop 포함)로 끝나도 측정 결과는 저장되며
+    예외는 그대로 다시 발생합니다.
+    
+    Returns:
+        Optional[ProfileReport]: 정상 종료 시 측정 결과 요약
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    owns_tracemalloc = not tracemalloc.is_tracing()
+    if owns_tracemalloc:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    profiler.enable()
+    try:
+        func()
+    finally:
+        profiler.disable()
+        elapsed = time.perf_counter() - start
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        if owns_tracemalloc:
+            tracemalloc.stop()
+        report = _write_report(profiler, snapshot, elapsed, peak, output_dir, top_n)
+    return report
+
+
+def _write_report(
+    profiler: cProfile.Profile,
+    snapshot: tracemalloc.Snapshot,
+    elapsed: float,
+    peak: int,
+    output_dir: str,
+    top_n: int
+) -> ProfileReport:
+    """측정 결과를 파일로 저장하고 요약 객체를 만듭니다."""
+    stem = f"rerun-{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}-{os.getpid()}"
+    pstats_path = os.path.join(output_dir, f"{stem}.pstats")
+    allocations_path = os.path.join(output_dir, f"{stem}-alloc.txt")
+
+    profiler.dump_stats(pstats_path)
+    report = ProfileReport(
+        elapsed_seconds=elapsed,
+        peak_bytes=peak,
+        pstats_path=pstats_path,
+        allocations_path=allocations_path,
+        top_functions=_top_functions(profiler, top_n),
+        top_allocations=_top_allocations(snapshot, top_n)
+    )
+
+    with open(allocations_path, "w", encoding="utf-8") as f:
+        f.write(f"# rerun 소요 시간: {elapsed:.3f}s, 최대 메모리: {peak / (1024 * 1024):.2f} MiB\n")
+        f.write(f"# 상위 {top_n}개 할당 위치 (크기 KiB / 할당 수)\n")
+        for location, size_kib, count in report.top_allocations:
+            f.write(f"{size_kib:12.1f} KiB {count:10d}  {location}\n")
+    return report
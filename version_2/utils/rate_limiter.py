@@ -0,0 +1,59 @@
+import threading
+import time
+from typing import Optional
+from utils.exceptions import AppError
+from utils.metrics import registry
+
+
+class RateLimiter:
+    """
+    분당 요청 수를 제한하는 토큰 버킷입니다. 여러 스레드가 같은 인스턴스를 공유하며,
+    허용량을 넘는 호출은 토큰이 채워질 때까지 acquire()에서 대기합니다.
+    분당 요청 수가 0 이하이면 제한하지 않습니다. (API 키마다 하나씩 services.key_pool이 보유)
+    """
+
+    def __init__(self, name: str, per_minute: float):
+        self.name = name
+        self._lock = threading.Lock()
+        self.set_rate(per_minute)
+
+    def set_rate(self, per_minute: float):
+        """분당 허용 요청 수를 변경합니다. 버킷은 가득 찬 상태로 다시 시작합니다."""
+        with self._lock:
+            self.per_minute = per_minute
+            # 최대 1초 분량까지 몰아서 보낼 수 있음 (최소 1건)
+            self._capacity = max(per_minute / 60.0, 1.0)
+            self._tokens = self._capacity
+            self._updated = time.monotonic()
+
+    def acquire(self, max_wait: Optional[float] = None):
+        """
+        요청 1건을 보낼 수 있을 때까지 대기합니다.
+        max_wait초(예: 분석 마감까지 남은 시간) 안에 보낼 수 없으면 기다리지 않고 AppError("timeout")를 발생시킵니다.
+        """
+        if self.per_minute <= 0:
+            return
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self.per_minute / 60.0)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    break
+                delay = (1.0 - self._tokens) * 60.0 / self.per_minute
+            if max_wait is not None and waited + delay > max_wait:
+                registry.inc(
+                    "trendtracker_rate_limit_timeouts_total", {"provider": self.name},
+                    help_text="Requests abandoned because the rate limiter wait exceeded the deadline, by provider"
+                )
+                raise AppError("timeout")
+            time.sleep(delay)
+            waited += delay
+        if waited:
+            registry.observe(
+                "trendtracker_rate_limit_wait_seconds", waited, {"provider": self.name},
+                help_text="Time spent waiting for the client-side rate limiter, by provider"
+            )
+
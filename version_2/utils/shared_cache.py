@@ -0,0 +1,307 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional, Tuple
+from config.settings import Settings
+from utils.metrics import registry
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries (accessed_at);
+-- 전체 크기를 저장/삭제와 같은 트랜잭션에서 트리거로 갱신 (저장할 때마다 SUM으로 전체를 세지 않음)
+CREATE TABLE IF NOT EXISTS usage (id INTEGER PRIMARY KEY CHECK (id = 0), bytes INTEGER NOT NULL);
+INSERT OR IGNORE INTO usage (id, bytes) VALUES (0, 0);
+CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries
+BEGIN UPDATE usage SET bytes = bytes + NEW.size WHERE id = 0; END;
+CREATE TRIGGER IF NOT EXISTS entries_update AFTER UPDATE OF size ON entries
+BEGIN UPDATE usage SET bytes = bytes + NEW.size - OLD.size WHERE id = 0; END;
+CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries
+BEGIN UPDATE usage SET bytes = bytes - OLD.size WHERE id = 0; END;
+"""
+
+# 현재 분석이 API 응답 캐시를 읽지 않고 새로 호출할지 여부 ('새로 분석', HTTP API의 "force": true)
+# contextvars를 사용하므로 copy_context()로 실행한 병렬 요청 스레드에도 전달됩니다.
+_bypass: ContextVar[bool] = ContextVar("trendtracker_cache_bypass", default=False)
+
+# 읽을 때마다 최근 사용 시각을 쓰면 읽기도 쓰기 잠금을 기다리므로, 이 시간(초)이 지난 항목만 갱신 (근사 LRU)
+TOUCH_INTERVAL_SECONDS = 1.0
+
+
+def make_key(*parts: Any) -> str:
+    """요청 인자(JSON으로 직렬화 가능한 값)로 캐시 키(SHA-256 16진수)를 만듭니다."""
+    raw = json.dumps(parts, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+@contextmanager
+def bypass_scope(enabled: bool = True) -> Iterator[None]:
+    """블록 안의 API 호출이 캐시된 응답을 읽지 않도록 합니다. (새 응답은 그대로 저장하여 이후 요청이 재사용)"""
+    token = _bypass.set(enabled)
+    try:
+        yield
+    finally:
+        _bypass.reset(token)
+
+
+def bypassing() -> bool:
+    """현재 분석이 API 응답 캐시를 건너뛰어야 하면 True를 반환합니다."""
+    return _bypass.get()
+
+
+def _count(namespace: str, outcome: str):
+    registry.inc(
+        "trendtracker_shared_cache_total", {"namespace": namespace, "outcome": outcome},
+        help_text="Shared cache lookups, by namespace and outcome"
+    )
+
+
+class MemoryCache:
+    """
+    SharedCache와 같은 인터페이스의 프로세스 내부 LRU 캐시입니다.
+    SHARED_CACHE_PATH를 비우거나 캐시 파일을 열 수 없을 때, 그리고 단일 프로세스 테스트에서 대신 사용합니다.
+    """
+
+    shared = False
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # (namespace, key) -> (값, 만료 시각 또는 None), 오래 사용하지 않은 항목이 앞쪽
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[bytes, Optional[float]]]" = OrderedDict()
+        self._bytes = 0
+
+    def get(self, namespace: str, key: str) -> Optional[bytes]:
+        """저장된 값을 반환합니다. 없거나 만료되었으면 None을 반환합니다."""
+        with self._lock:
+            entry = self._entries.get((namespace, key))
+            if entry is not None and entry[1] is not None and entry[1] <= time.time():
+                self._remove((namespace, key))
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end((namespace, key))
+        _count(namespace, "hit" if entry is not None else "miss")
+        return entry[0] if entry is not None else None
+
+    def set(self, namespace: str, key: str, value: bytes, ttl: Optional[float] = None):
+        """값을 저장합니다. 전체 크기가 max_bytes를 넘으면 오래 사용하지 않은 항목부터 지웁니다."""
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            self._remove((namespace, key))
+            self._entries[(namespace, key)] = (value, time.time() + ttl if ttl else None)
+            self._bytes += len(value)
+            while self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                registry.inc(
+                    "trendtracker_shared_cache_evictions_total",
+                    help_text="Shared cache entries evicted to stay under SHARED_CACHE_MAX_MB"
+                )
+
+    def _remove(self, entry_key: Tuple[str, str]):
+        entry = self._entries.pop(entry_key, None)
+        if entry is not None:
+            self._bytes -= len(entry[0])
+
+    def delete(self, namespace: str, key: str):
+        with self._lock:
+            self._remove((namespace, key))
+
+    def clear(self) -> int:
+        """모든 항목을 지우고 지운 항목 수를 반환합니다."""
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+            self._bytes = 0
+        return count
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self._bytes, "max_bytes": self.max_bytes}
+
+    def get_json(self, namespace: str, key: str) -> Any:
+        value = self.get(namespace, key)
+        return json.loads(value) if value is not None else None
+
+    def set_json(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None):
+        self.set(namespace, key, json.dumps(value, ensure_ascii=False).encode("utf-8"), ttl)
+
+
+class SharedCache(MemoryCache):
+    """
+    같은 호스트의 여러 프로세스(Streamlit 서버, 워커, API 서버)가 공유하는 SQLite 파일 캐시입니다.
+    WAL 모드로 읽기와 쓰기가 서로 막지 않게 하며, 저장과 용량 초과 항목 삭제는 한 쓰기 트랜잭션(BEGIN IMMEDIATE)으로 처리합니다.
+    조회가 잦으므로 호출마다 연결을 열지 않고 스레드별 연결을 재사용합니다. (fork한 자식 프로세스는 새로 연결)
+    캐시 오류(잠금 대기 초과, 파일 손상 등)는 경고만 남기고 캐시가 없는 것처럼 동작합니다.
+    """
+
+    shared = True
+
+    def __init__(self, db_path: str, max_bytes: int, timeout: float = 5.0):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self._local = threading.local()
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """이 스레드의 연결을 반환합니다. 오류가 나면 연결을 닫고 다음 호출에서 다시 엽니다."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.db_path, timeout=self.timeout, isolation_level=None)
+            # 캐시는 잃어도 다시 만들 수 있으므로 커밋마다 fsync하지 않음
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn, self._local.pid = conn, os.getpid()
+        try:
+            yield conn
+        except sqlite3.Error:
+            self._local.conn = None
+            conn.close()
+            raise
+
+    def get(self, namespace: str, key: str) -> Optional[bytes]:
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT value, expires_at, accessed_at FROM entries WHERE namespace = ? AND key = ?",
+                    (namespace, key)
+                ).fetchone()
+                if row is not None and row[1] is not None and row[1] <= now:
+                    conn.execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key))
+                    row = None
+                if row is not None and now - row[2] > TOUCH_INTERVAL_SECONDS:
+                    conn.execute(
+                        "UPDATE entries SET accessed_at = ? WHERE namespace = ? AND key = ?", (now, namespace, key)
+                    )
+        except sqlite3.Error as e:
+            logger.warning(f"공유 캐시 읽기 실패 ({namespace}): {e}")
+            row = None
+        _count(namespace, "hit" if row is not None else "miss")
+        return row[0] if row is not None else None
+
+    def set(self, namespace: str, key: str, value: bytes, ttl: Optional[float] = None):
+        if len(value) > self.max_bytes:
+            return
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    conn.execute(
+                        "INSERT INTO entries (namespace, key, value, size, expires_at, accessed_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (namespace, key) DO UPDATE SET "
+                        "value = excluded.value, size = excluded.size, "
+                        "expires_at = excluded.expires_at, accessed_at = excluded.accessed_at",
+                        (namespace, key, sqlite3.Binary(value), len(value), now + ttl if ttl else None, now)
+                    )
+                    evicted = self._evict(conn, now)
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+        except sqlite3.Error as e:
+            logger.warning(f"공유 캐시 쓰기 실패 ({namespace}): {e}")
+            return
+        if evicted:
+            registry.inc(
+                "trendtracker_shared_cache_evictions_total", value=evicted,
+                help_text="Shared cache entries evicted to stay under SHARED_CACHE_MAX_MB"
+            )
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> int:
+        """전체 크기가 max_bytes 이하가 되도록 만료된 항목, 그다음 오래 사용하지 않은 항목 순으로 지웁니다."""
+        total = conn.execute("SELECT bytes FROM usage WHERE id = 0").fetchone()[0]
+        if total <= self.max_bytes:
+            return 0
+        evicted = conn.execute("DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,)).rowcount
+        total = conn.execute("SELECT bytes FROM usage WHERE id = 0").fetchone()[0]
+        excess = total - self.max_bytes
+        if excess <= 0:
+            return evicted
+        victims = []
+        for namespace, key, size in conn.execute("SELECT namespace, key, size FROM entries ORDER BY accessed_at"):
+            victims.append((namespace, key))
+            excess -= size
+            if excess <= 0:
+                break
+        conn.executemany("DELETE FROM entries WHERE namespace = ? AND key = ?", victims)
+        return evicted + len(victims)
+
+    def delete(self, namespace: str, key: str):
+        try:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key))
+        except sqlite3.Error as e:
+            logger.warning(f"공유 캐시 삭제 실패 ({namespace}): {e}")
+
+    def clear(self) -> int:
+        with self._connect() as conn:
+            count = conn.execute("DELETE FROM entries").rowcount
+            conn.execute("VACUUM")
+        return count
+
+    def stats(self) -> dict:
+        with self._connect() as conn:
+            entries = conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            size = conn.execute("SELECT bytes FROM usage WHERE id = 0").fetchone()[0]
+        return {"entries": entries, "bytes": size, "max_bytes": self.max_bytes, "path": self.db_path}
+
+
+# 프로세스 전역 캐시 (처음 사용할 때 Settings로 생성)
+_cache: Optional[MemoryCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_shared_cache() -> MemoryCache:
+    """
+    API 응답 캐시와 검색 기록 읽기가 사용하는 프로세스 전역 캐시를 반환합니다.
+    SHARED_CACHE_PATH가 있으면 프로세스 간에 공유되는 SQLite 캐시, 비어 있거나 열 수 없으면 프로세스 내부 캐시입니다.
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                max_bytes = int(Settings.SHARED_CACHE_MAX_MB * 1024 * 1024)
+                if Settings.SHARED_CACHE_PATH:
+                    try:
+                        _cache = SharedCache(Settings.SHARED_CACHE_PATH, max_bytes)
+                    except sqlite3.Error as e:
+                        logger.warning(f"공유 캐시 파일을 열 수 없어 프로세스 내부 캐시를 사용합니다: {e}")
+                if _cache is None:
+                    _cache = MemoryCache(max_bytes)
+    return _cache
+
+
+def get_history_cache() -> Optional[MemoryCache]:
+    """
+    SearchRepository가 파싱한 검색 기록을 프로세스 간에 공유할 캐시를 반환합니다.
+    프로세스 내부 캐시는 리포지토리의 DataFrame 캐시와 중복되므로, 공유 캐시가 아니거나 SHARED_CACHE_HISTORY가 꺼져 있으면 None입니다.
+    """
+    if not Settings.SHARED_CACHE_HISTORY:
+        return None
+    cache = get_shared_cache()
+    return cache if cache.shared else None
@@ -1,13 +1,18 @@
 import streamlit as st
 import os
 
+@st.cache_data(show_spinner=False)
+def _read_css(css_file_path: str, mtime_ns: int) -> str:
+    """CSS 파일 내용을 캐시합니다. 파일이 수정되면 mtime이 바뀌어 다시 읽습니다."""
+    with open(css_file_path, "r", encoding="utf-8") as f:
+        return f.read()
+
 def apply_custom_css(css_file_path: str):
     """
     지정된 경로의 CSS 파일을 읽어 Streamlit 앱에 주입합니다.
     """
     if os.path.exists(css_file_path):
-        with open(css_file_path, "r", encoding="utf-8") as f:
-            css_content = f.read()
-            st.markdown(f"<style>{css_content}</style>", unsafe_allow_html=True)
+        css_content = _read_css(css_file_path, os.stat(css_file_path).st_mtime_ns)
+        st.markdown(f"<style>{css_content}</style>", unsafe_allow_html=True)
     else:
         st.warning(f"CSS 파일을 찾을 수 없습니다: {css_file_path}")
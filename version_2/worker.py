@@ -0,0 +1,77 @@
+"""
+분석 작업 큐(SQLite)를 처리하는 별도 워커 프로세스입니다.
+
+앱을 JOB_WORKERS=0으로 실행하면 앱은 작업 등록과 상태 조회만 수행하고,
+실제 검색/요약/저장은 이 프로세스가 담당합니다. 같은 JOB_DB_PATH와 CSV_PATH를 사용해야 합니다.
+
+--watchlist를 지정하면 워치리스트 스케줄러도 함께 실행합니다 (이 경우 앱은 WATCHLIST_SCHEDULER=false).
+
+실행 (version_2 디렉터리에서):
+    python worker.py --workers 4
+    python worker.py --workers 4 --watchlist
+"""
+import argparse
+import logging
+import signal
+import threading
+from config.settings import Settings
+from repositories.job_repository import JobRepository
+from repositories.search_repository import SearchRepository
+from repositories.rollup_repository import RollupRepository
+from repositories.watchlist_repository import WatchlistRepository
+from services.job_queue import JobWorkerPool
+from services.watchlist_scheduler import WatchlistScheduler
+from utils.metrics import start_metrics_server
+from utils.shared_cache import get_history_cache
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TrendTracker 분석 작업 워커")
+    parser.add_argument("--workers", type=int, default=max(Settings.JOB_WORKERS, 1), help="동시에 실행할 분석 수")
+    parser.add_argument("--watchlist", action="store_true", help="워치리스트 스케줄러도 함께 실행")
+    parser.add_argument("--metrics-port", type=int, default=0, help="Prometheus 지표 포트 (0이면 비활성화)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    try:
+        Settings.validate()
+    except ValueError as e:
+        raise SystemExit(str(e))
+
+    if args.metrics_port:
+        start_metrics_server(args.metrics_port)
+
+    search_repository = SearchRepository(
+        Settings.CSV_PATH, RollupRepository(Settings.ROLLUP_DB_PATH), Settings.HISTORY_COMPRESSION, get_history_cache()
+    )
+    pool = JobWorkerPool(
+        JobRepository(Settings.JOB_DB_PATH),
+        search_repository,
+        args.workers,
+        Settings.JOB_POLL_SECONDS,
+        name="worker"
+    )
+    pool.start()
+
+    scheduler = None
+    if args.watchlist:
+        scheduler = WatchlistScheduler(
+            WatchlistRepository(Settings.WATCHLIST_DB_PATH, Settings.WATCHLIST_SEEN_URLS_MAX),
+            search_repository,
+            Settings.WATCHLIST_TICK_SECONDS
+        )
+        scheduler.start()
+
+    # SIGINT/SIGTERM을 받으면 실행 중인 작업을 마친 뒤 종료
+    stopped = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stopped.set())
+    signal.signal(signal.SIGINT, lambda *_: stopped.set())
+    stopped.wait()
+    logging.info("종료 요청을 받았습니다. 실행 중인 작업을 마무리합니다...")
+    if scheduler is not None:
+        scheduler.stop()
+    pool.stop()
+
+
+if __name__ == "__main__":
+    main()